@@ -0,0 +1,313 @@
+#=======================================================================
+# Description:
+# Checks the batch enrichment queue end to end without network access.
+# Every check builds a small library from the application database,
+# with the movies and series of the lookup fixture, and enriches it
+# through utils/enrichhelper.py with the fixture_lookup template, which
+# answers from the responses stored in fixtures/enrich_lookup.json.
+# Checked: the outcome of a run and the saved details, resume after a
+# stopped run, retry of failed lookups up to their attempt limit,
+# queueing the same items under two lookup sources, and an item whose
+# details are only partly saved. The script exits with 1 if any check
+# fails. Run from the repository root:
+#   python -m benchmarks.check_enrichment
+#=======================================================================
+import os
+import sys
+import copy
+import json
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.constants as constants
+import utils.dbhelper as dbhelper
+
+from benchmarks                  import fixture_lookup
+from benchmarks.generate_library import create_library
+from utils.constants             import ENRICH_STATUS, ENRICH_MAX_ATTEMPTS
+
+#=======================================================================
+''' Module path of the lookup template answering from the fixture '''
+FIXTURE_MODULE = 'benchmarks.fixture_lookup'
+
+''' Library built for every check: title and year of its movies and series '''
+MOVIES         = [ ('The Matrix', 1999), ('Heat', 1995), ('Alien', 1979),
+                   ('Home Movies from the Lake', 2004), ('Amelie', 2001) ]
+SERIES         = [ ('Breaking Bad', 2008), ('Sherlock', 2010) ]
+
+''' Expected outcome of a run: status and matched online id per title, empty when nothing matched '''
+EXPECTED       = { 'The Matrix'                : (ENRICH_STATUS.DONE,      '0133093'),
+                   'Heat'                      : (ENRICH_STATUS.DONE,      '0113277'),
+                   'Alien'                     : (ENRICH_STATUS.DONE,      '0078748'),
+                   'Home Movies from the Lake' : (ENRICH_STATUS.NOT_FOUND, ''),
+                   'Amelie'                    : (ENRICH_STATUS.FAILED,    ''),
+                   'Breaking Bad'              : (ENRICH_STATUS.DONE,      '0903747'),
+                   'Sherlock'                  : (ENRICH_STATUS.DONE,      '1475582') }
+
+''' Queued items with the title of their media '''
+QUERY_GET_QUEUE = '''SELECT q.SOURCE, q.STATUS, q.ATTEMPTS, IFNULL(q.ONLINE_ID, '') AS ONLINE_ID, m.TITLE
+                     FROM ENRICH_QUEUE q
+                     INNER JOIN (SELECT 'MOVIE' AS MEDIA_TYPE, ID, TITLE FROM MOVIES
+                                 UNION ALL
+                                 SELECT 'SERIES', ID, TITLE FROM TV_SERIES) m
+                             ON m.MEDIA_TYPE = q.MEDIA_TYPE AND m.ID = q.MEDIA_ID
+                     ORDER BY q.SOURCE, m.TITLE'''
+
+#=======================================================================
+def build_library(path : str, template : str) -> None:
+    """
+    Builds the library of a check from the schema of the application database and makes it
+    the database of the application.
+
+    Parameters:
+    path (str): The path of the library.
+    template (str): The database the schema is copied from.
+    """
+    create_library(path, template)
+    constants.DEFAULT_DB_PATH = path
+
+    import model
+
+    for titles, add, table in [(MOVIES, model.add_new_movies,      'MOVIES'),
+                               (SERIES, model.add_new_series_list, 'TV_SERIES')]:
+        ids = add([title for title, _ in titles])
+        dbhelper.execute_many([(f'UPDATE {table} SET YEAR = ? WHERE ID = ?',
+                                [(year, id) for (_, year), id in zip(titles, ids)])])
+
+
+def run(source : str = 'IMDB', **kwargs) -> dict:
+    """
+    Runs the enrichment queue with the fixture template, without rate limit.
+
+    Parameters:
+    source (str, optional): The lookup source the items are queued for.
+    kwargs: Additional arguments of enrichhelper.run_queue.
+
+    Returns:
+    dict: The throughput report of the run.
+    """
+    import utils.enrichhelper as enrichhelper
+
+    kwargs.setdefault('rate', 0)
+    return enrichhelper.run_queue(FIXTURE_MODULE, source, **kwargs)
+
+
+def get_queue(source : str = None) -> dict:
+    """
+    Returns the queued items of the library.
+
+    Parameters:
+    source (str, optional): Only the items queued for this lookup source.
+
+    Returns:
+    dict: (STATUS, ATTEMPTS, ONLINE_ID) per title, or per (SOURCE, TITLE) without a source.
+    """
+    queue = dbhelper.execute_read(QUERY_GET_QUEUE)
+
+    return { (row['TITLE'] if source else (row['SOURCE'], row['TITLE'])) :
+                 (row['STATUS'], int(row['ATTEMPTS']), row['ONLINE_ID'])
+             for row in queue.to_dict('records') if source is None or row['SOURCE'] == source }
+
+
+def check_run() -> dict:
+    """
+    Enriches the library in one run and checks the status of every item and the saved details:
+    lookup source, genres, cast and the episodes of the series.
+
+    Returns:
+    dict: The outcome of the check.
+    """
+    report   = run()
+    queue    = get_queue('IMDB')
+    statuses = { title : (status, online_id) for title, (status, _, online_id) in queue.items() }
+    saved    = dbhelper.execute_read('''SELECT
+                                          (SELECT COUNT(*) FROM MOVIES    WHERE LOOKUP_SOURCE = 'IMDB') AS MOVIES,
+                                          (SELECT COUNT(*) FROM TV_SERIES WHERE LOOKUP_SOURCE = 'IMDB') AS SERIES,
+                                          (SELECT COUNT(*) FROM TV_SERIES_EPISODES)                    AS EPISODES,
+                                          (SELECT COUNT(*) FROM MOVIE_GENRES)                          AS MOVIE_GENRES,
+                                          (SELECT COUNT(*) FROM MOVIE_CAST)                            AS MOVIE_CAST''').iloc[0].to_dict()
+    saved    = { name : int(value) for name, value in saved.items() }
+
+    return { 'ok'        : statuses == EXPECTED and saved == { 'MOVIES' : 3, 'SERIES' : 2, 'EPISODES' : 8,
+                                                               'MOVIE_GENRES' : 7, 'MOVIE_CAST' : 10 },
+             'statuses'  : { title : status for title, (status, _) in statuses.items() },
+             'mismatches': sorted(title for title in EXPECTED if statuses.get(title) != EXPECTED[title]),
+             'saved'     : saved,
+             'report'    : { name : report[name] for name in ['PROCESSED', ENRICH_STATUS.DONE,
+                                                              ENRICH_STATUS.NOT_FOUND, ENRICH_STATUS.FAILED] } }
+
+
+def check_resume() -> dict:
+    """
+    Stops a run after its first saved batch and runs the queue again, checking that the second
+    run only looks up the items the first one left pending and that every item ends processed.
+
+    Returns:
+    dict: The outcome of the check.
+    """
+    stopped = []
+    first   = run(max_workers=1, batch_size=2, progress=lambda *args: stopped.append(True),
+                  cancelled=lambda: bool(stopped))
+    pending = sum(status == ENRICH_STATUS.PENDING for status, _, _ in get_queue('IMDB').values())
+
+    fixture_lookup.calls.clear()
+    second  = run(max_workers=1, batch_size=2)
+    queue   = get_queue('IMDB')
+
+    return { 'ok'              : 0 < first['PROCESSED'] < len(EXPECTED) and pending > 0
+                                 and first['PROCESSED'] + second['PROCESSED'] == len(EXPECTED)
+                                 and fixture_lookup.calls['search_media'] == second['PROCESSED']
+                                 and { status for status, _, _ in queue.values() } <= set(status for status, _ in EXPECTED.values()),
+             'first_processed' : first['PROCESSED'],
+             'left_pending'    : pending,
+             'second_processed': second['PROCESSED'],
+             'second_searches' : fixture_lookup.calls['search_media'] }
+
+
+def check_retry() -> dict:
+    """
+    Runs the queue repeatedly, checking that a failed lookup is retried on every run until it
+    reaches the attempt limit, and then left alone.
+
+    Returns:
+    dict: The outcome of the check.
+    """
+    attempts = []
+
+    for _ in range(ENRICH_MAX_ATTEMPTS + 1):
+        run()
+        status, count, _ = get_queue('IMDB')['Amelie']
+        attempts.append(count)
+
+    return { 'ok'       : attempts == list(range(1, ENRICH_MAX_ATTEMPTS + 1)) + [ENRICH_MAX_ATTEMPTS]
+                          and status == ENRICH_STATUS.FAILED,
+             'attempts' : attempts,
+             'status'   : status }
+
+
+def check_sources() -> dict:
+    """
+    Queues the same items under two lookup sources, checking that each source gets its own queue
+    row, that a run of one source leaves the queue of the other alone, and that the items not found
+    or failed under the first source are looked up again under the second one, while the items
+    enriched in between are dropped from the queue of the second source.
+
+    Returns:
+    dict: The outcome of the check.
+    """
+    import utils.enrichhelper as enrichhelper
+
+    queued  = { source : enrichhelper.enqueue_unenriched(source) for source in ['IMDB', 'ALT'] }
+    first   = run('IMDB')
+    alt     = get_queue('ALT')
+    second  = run('ALT')
+    queue   = get_queue()
+
+    retried = { title : queue[('ALT', title)][:2] for title, (status, _) in EXPECTED.items() if status != ENRICH_STATUS.DONE }
+    dropped = [title for title, (status, _) in EXPECTED.items() if status == ENRICH_STATUS.DONE and ('ALT', title) in queue]
+
+    return { 'ok'              : queued == { 'IMDB' : len(EXPECTED), 'ALT' : len(EXPECTED) }
+                                 and all(status == ENRICH_STATUS.PENDING for status, _, _ in alt.values())
+                                 and second['PROCESSED'] == len(retried)
+                                 and all(attempts == 1 for _, attempts in retried.values())
+                                 and not dropped,
+             'queued'          : queued,
+             'first_processed' : first['PROCESSED'],
+             'second_processed': second['PROCESSED'],
+             'retried'         : { title : status for title, (status, _) in retried.items() },
+             'not_dropped'     : dropped }
+
+
+def check_partial_save() -> dict:
+    """
+    Runs the queue with an episode of Sherlock the library cannot store, checking that the series
+    is marked FAILED with none of its details saved, while the rest of the batch is saved as usual.
+
+    Returns:
+    dict: The outcome of the check.
+    """
+    episodes = fixture_lookup.FIXTURE['episodes']
+    stored   = episodes['1475582']
+
+    episodes['1475582']                      = copy.deepcopy(stored)
+    episodes['1475582'][0]['ORIGINAL_TITLE'] = None
+
+    try:
+        run()
+    finally:
+        episodes['1475582'] = stored
+
+    queue    = get_queue('IMDB')
+    sherlock = dbhelper.execute_read('''SELECT IFNULL(s.LOOKUP_SOURCE, '') AS LOOKUP_SOURCE, 
+                                                COUNT(e.ID)                 AS EPISODES
+                                         FROM TV_SERIES s
+                                         LEFT JOIN TV_SERIES_EPISODES e ON e.SERIES_ID = s.ID
+                                         WHERE s.TITLE = 'Sherlock'
+                                         GROUP BY s.ID''').iloc[0].to_dict()
+    others   = { title : queue[title][0] for title, (status, _) in EXPECTED.items()
+                 if status == ENRICH_STATUS.DONE and title != 'Sherlock' }
+
+    return { 'ok'       : queue['Sherlock'][0] == ENRICH_STATUS.FAILED
+                          and sherlock['LOOKUP_SOURCE'] == '' and int(sherlock['EPISODES']) == 0
+                          and all(status == ENRICH_STATUS.DONE for status in others.values()),
+             'sherlock' : { 'status' : queue['Sherlock'][0], 'lookup_source' : sherlock['LOOKUP_SOURCE'],
+                            'episodes' : int(sherlock['EPISODES']) },
+             'others'   : others }
+
+
+def run_checks(template : str) -> dict:
+    """
+    Runs every check on a library of its own.
+
+    Parameters:
+    template (str): The database the schema of the libraries is copied from.
+
+    Returns:
+    dict: The outcome of every check.
+    """
+    folder  = tempfile.mkdtemp(prefix='pmm_enrich_')
+    checks  = { 'run'     : check_run,
+                'resume'  : check_resume,
+                'retry'   : check_retry,
+                'sources' : check_sources,
+                'partial' : check_partial_save }
+    results = {}
+
+    try:
+        for name, check in checks.items():
+            build_library(os.path.join(folder, f'{name}.db'), template)
+            fixture_lookup.calls.clear()
+
+            try:
+                results[name] = check()
+            except Exception as e:
+                results[name] = { 'ok' : False, 'error' : repr(e) }
+    finally:
+        for name in os.listdir(folder):
+            os.remove(os.path.join(folder, name))
+        os.rmdir(folder)
+
+    return results
+
+
+def main() -> None:
+    """
+    Parses the command line, runs the checks and prints their outcome as JSON.
+    """
+    parser = argparse.ArgumentParser(description='Checks the batch enrichment queue against a lookup fixture.')
+    parser.add_argument('--template', default=constants.DEFAULT_DB_PATH, help='database the schema is copied from')
+    args   = parser.parse_args()
+
+    report = run_checks(args.template)
+    print(json.dumps(report, indent=4, default=str))
+
+    if not all(check['ok'] for check in report.values()):
+        sys.exit(1)
+
+#=======================================================================
+if __name__ == '__main__':
+    main()
+
+#=======================================================================
@@ -0,0 +1,336 @@
+#=======================================================================
+# Description:
+# Checks the shared HTTP client and the concurrent episode fetch of the
+# IMDb lookup template against a local stub of the OMDb API, so they can
+# be verified without network access. The stub answers with a fixed
+# latency and records the peak number of parallel requests; dedicated
+# paths answer slowly, fail once with 503, return 404 or return an OMDb
+# failure payload. The metrics are also reset while an error response
+# is being counted. Every check is run on a fresh client and an empty
+# lookup cache, and the script exits with 1 if any check fails.
+# Run from the repository root:
+#   python -m benchmarks.check_http_client
+#   python -m benchmarks.check_http_client --seasons 8 --episodes 10
+#=======================================================================
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+
+from contextlib   import contextmanager
+from http.server  import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.cachehelper as cachehelper
+import utils.httphelper as httphelper
+
+from utils.constants import EPISODE_COLUMNS, MEDIA_COLUMNS
+
+#=======================================================================
+class StubServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the OMDb API, answering on a free port of the loopback interface.
+
+    Attributes:
+    latency (float): The number of seconds every request takes.
+    episodes (int): The number of episodes of every season.
+    hits (dict): The number of requests received per path and query.
+    active (int): The number of requests being answered.
+    peak (int): The highest number of requests answered in parallel.
+    """
+    daemon_threads = True
+
+    def __init__(self, latency : float, episodes : int) -> None:
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.latency  = latency
+        self.episodes = episodes
+        self.hits     = {}
+        self.active   = 0
+        self.peak     = 0
+        self.lock     = threading.Lock()
+
+
+    def url(self, path : str = '/') -> str:
+        """
+        Returns the URL of a path on the stub.
+
+        Parameters:
+        path (str): The path and query, e.g. /?i=tt1.
+
+        Returns:
+        str: The absolute URL.
+        """
+        return f'http://127.0.0.1:{self.server_port}{path}'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Request handler of the stub. Paths:
+    /?i=<id>&Season=<n>: a season listing with the configured number of episodes.
+    /?i=<id>: the details of an episode.
+    /slow: answers after two seconds.
+    /flaky: answers 503 on the first request of a query and 200 afterwards.
+    /missing: answers 404.
+    /failed: answers 200 with an OMDb failure payload.
+    """
+
+    def do_GET(self) -> None:
+        server = self.server
+        key    = self.path
+
+        with server.lock:
+            server.hits[key] = server.hits.get(key, 0) + 1
+            server.active   += 1
+            server.peak      = max(server.peak, server.active)
+            count            = server.hits[key]
+
+        try:
+            time.sleep(server.latency)
+            status, body = self.get_answer(count)
+            self.send_json(status, body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+
+    def get_answer(self, count : int) -> tuple:
+        """
+        Returns the status and body answering the request.
+
+        Parameters:
+        count (int): The number of requests received so far for the same path and query.
+
+        Returns:
+        tuple: The HTTP status and the JSON body.
+        """
+        url   = urlsplit(self.path)
+        query = { name : values[0] for name, values in parse_qs(url.query).items() }
+
+        if url.path == '/slow':
+            time.sleep(2)
+            return 200, { 'Response' : 'True' }
+
+        if url.path == '/flaky':
+            return (503, { 'Error' : 'Unavailable' }) if count == 1 else (200, { 'Response' : 'True' })
+
+        if url.path == '/missing':
+            return 404, { 'Error' : 'Not found' }
+
+        if url.path == '/failed':
+            return 200, { 'Response' : 'False', 'Error' : 'Request limit reached!' }
+
+        if 'Season' in query:
+            season = int(query['Season'])
+            return 200, { 'Response' : 'True',
+                          'Episodes' : [{ 'Title'    : f'Episode {season}x{episode}',
+                                          'Released' : '2010-01-01',
+                                          'Episode'  : str(episode),
+                                          'imdbID'   : f'{query["i"]}s{season}e{episode}' }
+                                        for episode in range(1, self.server.episodes + 1)] }
+
+        return 200, { 'Response' : 'True', 'Plot' : f'Plot of {query.get("i")}' }
+
+
+    def send_json(self, status : int, body : dict) -> None:
+        data = json.dumps(body).encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+    def log_message(self, format : str, *args) -> None:
+        pass
+
+#=======================================================================
+def check_concurrency(server : StubServer, seasons : int, host_connections : int) -> dict:
+    """
+    Fetches all the episodes of a series through the IMDb template, checking that the seasons and
+    episodes are fetched in parallel, within the connection limit of the host, and returned in order.
+
+    Parameters:
+    server (StubServer): The stub answering the requests.
+    seasons (int): The number of seasons of the series.
+    host_connections (int): The parallel requests allowed per host.
+
+    Returns:
+    dict: The outcome of the check.
+    """
+    client   = httphelper.HttpClient(host_connections=host_connections)
+    template = httphelper.load_template('templates.lookup.imdbParser', client)
+
+    template.IMDB_SEASON_URL  = server.url('/?i={media_id}&Season={season}')
+    template.IMDB_DETAILS_URL = server.url('/?i={media_id}')
+    server.peak               = 0
+
+    start      = time.perf_counter()
+    episodes   = template.get_series_episodes('0000001', seasons)
+    elapsed    = time.perf_counter() - start
+
+    requests   = seasons * (server.episodes + 1)
+    sequential = requests * server.latency
+    expected   = [(season, episode) for season in range(1, seasons + 1) for episode in range(1, server.episodes + 1)]
+    returned   = list(zip(episodes[EPISODE_COLUMNS.SEASON], episodes[EPISODE_COLUMNS.EPISODE].astype(int)))
+    plots      = episodes[MEDIA_COLUMNS.PLOT].str.startswith('Plot of').all()
+
+    return { 'ok'           : bool(returned == expected and plots and 1 < server.peak <= host_connections
+                                   and elapsed < sequential * 0.75),
+             'requests'     : requests,
+             'episodes'     : len(episodes),
+             'in_order'     : returned == expected,
+             'plots'        : bool(plots),
+             'peak'         : server.peak,
+             'limit'        : host_connections,
+             'elapsed_s'    : round(elapsed, 3),
+             'sequential_s' : round(sequential, 3) }
+
+
+def check_timeouts(server : StubServer) -> dict:
+    """
+    Fetches a slow URL along with a normal one, checking that the slow request times out
+    without holding up the batch and is reported as None and counted as an error.
+
+    Parameters:
+    server (StubServer): The stub answering the requests.
+
+    Returns:
+    dict: The outcome of the check.
+    """
+    client  = httphelper.HttpClient(timeout=0.3, retries=1, backoff=0.05)
+
+    start   = time.perf_counter()
+    results = client.get_json_all([server.url('/slow'), server.url('/?i=tt1')])
+    elapsed = time.perf_counter() - start
+    errors  = client.get_metrics()['ERRORS'].sum()
+
+    return { 'ok'        : bool(results[0] is None and results[1] is not None and elapsed < 1.5 and errors >= 1),
+             'results'   : [result is not None for result in results],
+             'errors'    : int(errors),
+             'elapsed_s' : round(elapsed, 3) }
+
+
+def check_errors(server : StubServer) -> dict:
+    """
+    Checks the handling of error responses: a 503 is retried transparently, a 404 is not retried
+    and reported as None, and an OMDb failure payload is returned without being cached.
+
+    Parameters:
+    server (StubServer): The stub answering the requests.
+
+    Returns:
+    dict: The outcome of the check.
+    """
+    client  = httphelper.HttpClient(retries=2, backoff=0.05)
+    flaky   = client.get_json_all([server.url('/flaky')])[0]
+    missing = client.get_json_all([server.url('/missing')])[0]
+    failed  = [client.get_json(server.url('/failed')) for _ in range(2)]
+
+    outcome = { 'flaky_retried'     : flaky is not None and server.hits.get('/flaky') == 2,
+                'missing_none'      : missing is None and server.hits.get('/missing') == 1,
+                'failed_not_cached' : failed[1].get('Response') == 'False' and server.hits.get('/failed') == 2,
+                'errors'            : int(client.get_metrics()['ERRORS'].sum()) }
+
+    return { 'ok' : all(value for name, value in outcome.items() if name != 'errors'), **outcome }
+
+
+def check_metrics_reset(server : StubServer) -> dict:
+    """
+    Resets the metrics right after a request answered with 404 is recorded, as a new enrichment
+    run may do while other lookups are in flight, checking that the response is returned instead
+    of the request failing on the metrics of its host, and that the error was counted.
+
+    Parameters:
+    server (StubServer): The stub answering the requests.
+
+    Returns:
+    dict: The outcome of the check.
+    """
+    client  = httphelper.HttpClient(retries=0)
+    measure = client.measure
+    errors  = []
+
+    @contextmanager
+    def measure_then_reset(host : str):
+        with measure(host) as outcome:
+            yield outcome
+
+        errors.append(int(client.get_metrics()['ERRORS'].sum()))
+        client.reset_metrics()
+
+    client.measure = measure_then_reset
+
+    try:
+        response = client.get(server.url('/missing'))
+    except Exception as e:
+        return { 'ok' : False, 'error' : repr(e) }
+
+    return { 'ok'     : response.status_code == 404 and errors == [1],
+             'status' : response.status_code,
+             'errors' : errors }
+
+
+def run_checks(seasons : int, episodes : int, latency : float, host_connections : int) -> dict:
+    """
+    Starts the stub and runs every check against it, on an empty lookup cache.
+
+    Parameters:
+    seasons (int): The number of seasons of the series fetched concurrently.
+    episodes (int): The number of episodes per season.
+    latency (float): The number of seconds every request to the stub takes.
+    host_connections (int): The parallel requests allowed per host.
+
+    Returns:
+    dict: The outcome of every check.
+    """
+    folder = tempfile.mkdtemp(prefix='pmm_http_')
+    server = StubServer(latency, episodes)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+
+    cachehelper.LOOKUP_CACHE_PATH = os.path.join(folder, 'lookupcache.db')
+    cachehelper.set_offline(False)
+    thread.start()
+
+    try:
+        return { 'concurrency' : check_concurrency(server, seasons, host_connections),
+                 'timeouts'    : check_timeouts(server),
+                 'errors'      : check_errors(server),
+                 'reset'       : check_metrics_reset(server) }
+    finally:
+        server.shutdown()
+        server.server_close()
+
+        for name in os.listdir(folder):
+            os.remove(os.path.join(folder, name))
+        os.rmdir(folder)
+
+
+def main() -> None:
+    """
+    Parses the command line, runs the checks and prints their outcome as JSON.
+    """
+    parser = argparse.ArgumentParser(description='Checks the HTTP client against a local OMDb stub.')
+    parser.add_argument('--seasons', type=int, default=4, help='seasons of the series fetched concurrently')
+    parser.add_argument('--episodes', type=int, default=10, help='episodes per season')
+    parser.add_argument('--latency', type=float, default=0.05, help='seconds every request to the stub takes')
+    parser.add_argument('--host-connections', type=int, default=httphelper.HTTP_HOST_CONNECTIONS,
+                        help='parallel requests allowed per host')
+    args   = parser.parse_args()
+
+    report = run_checks(args.seasons, args.episodes, args.latency, args.host_connections)
+    print(json.dumps(report, indent=4))
+
+    if not all(check['ok'] for check in report.values()):
+        sys.exit(1)
+
+#=======================================================================
+if __name__ == '__main__':
+    main()
+
+#=======================================================================
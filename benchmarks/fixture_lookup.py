@@ -0,0 +1,125 @@
+#=======================================================================
+# Description:
+# Lookup template standing in for the IMDb template in offline checks.
+# It answers from the responses stored in fixtures/enrich_lookup.json,
+# which follow the output format of imdbParser: search results, media
+# details and episodes keyed by search text and online id. A search
+# stored as an error raises, as a failed request of the real source
+# does, and every call is counted.
+# Mandatory methods to implement:
+# search_media()
+# get_media_details()
+# get_season_episodes()
+# Optional methods:
+# get_series_episodes()
+#=======================================================================
+import os
+import json
+import copy
+import threading
+import pandas as pd
+
+from collections     import Counter
+from utils.constants import MEDIA_COLUMNS, EPISODE_COLUMNS
+
+#=======================================================================
+''' Stored responses of the lookup source, in the format the IMDb template returns '''
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'enrich_lookup.json')
+
+with open(FIXTURE_PATH, encoding='utf-8') as fixture_file:
+    FIXTURE  = json.load(fixture_file)
+
+''' Number of calls per method, e.g. to check that resumed runs do not look items up twice '''
+calls        = Counter()
+_lock        = threading.Lock()
+
+#=======================================================================
+def count_call(method : str) -> None:
+    """
+    Counts a call of a template method.
+
+    Parameters:
+    method (str): The name of the method.
+    """
+    with _lock:
+        calls[method] += 1
+
+
+def search_media(title : str) -> pd.DataFrame:
+    """
+    Returns the stored search results of a title.
+
+    Parameters:
+    title (str): The title searched for, with its year as sent by the enrichment queue.
+
+    Returns:
+    pandas.DataFrame: The results with TITLE, YEAR and ONLINE_ID columns, empty for unknown titles.
+
+    Exceptions:
+    ConnectionError: Raised for the searches stored as failed requests.
+    """
+    count_call('search_media')
+    results = FIXTURE['search'].get(title.strip().lower(), [])
+
+    if isinstance(results, dict):
+        raise ConnectionError(results['error'])
+
+    return pd.DataFrame(results, columns=[MEDIA_COLUMNS.TITLE, MEDIA_COLUMNS.YEAR, MEDIA_COLUMNS.ONLINE_ID])
+
+
+def get_media_details(online_id : str) -> dict:
+    """
+    Returns the stored details of a media, in the format of imdbParser.get_media_details.
+
+    Parameters:
+    online_id (str): The online id of the media.
+
+    Returns:
+    dict: The content, lookup details, genres, languages and cast of the media.
+
+    Exceptions:
+    LookupError: Raised for online ids without stored details.
+    """
+    count_call('get_media_details')
+
+    if online_id not in FIXTURE['details']:
+        raise LookupError(f'No stored details for {online_id}')
+
+    return copy.deepcopy(FIXTURE['details'][online_id])
+
+
+def get_season_episodes(series_id : str, season : int) -> pd.DataFrame:
+    """
+    Returns the stored episodes of a season of a series.
+
+    Parameters:
+    series_id (str): The online id of the series.
+    season (int): The season number.
+
+    Returns:
+    pd.DataFrame: The episodes of the season, see get_series_episodes.
+    """
+    return get_series_episodes(series_id, season, [season])
+
+
+def get_series_episodes(series_id : str, seasons : int, season_list : list = None) -> pd.DataFrame:
+    """
+    Returns the stored episodes of all the seasons of a series.
+
+    Parameters:
+    series_id (str): The online id of the series.
+    seasons (int): The number of seasons of the series.
+    season_list (list, optional): The seasons to return. Defaults to all the seasons.
+
+    Returns:
+    pd.DataFrame: SEASON, EPISODE, ORIGINAL_TITLE, RELEASE_DATE and PLOT of every episode.
+    """
+    count_call('get_series_episodes')
+    season_list = season_list or list(range(1, seasons + 1))
+    episodes    = pd.DataFrame(FIXTURE['episodes'].get(series_id, []),
+                               columns=[EPISODE_COLUMNS.SEASON, EPISODE_COLUMNS.EPISODE, MEDIA_COLUMNS.ORIGINAL_TITLE,
+                                        MEDIA_COLUMNS.RELEASE_DATE, MEDIA_COLUMNS.PLOT])
+
+    return episodes[episodes[EPISODE_COLUMNS.SEASON].isin(season_list)].reset_index(drop=True)
+
+#=======================================================================
@@ -0,0 +1,573 @@
+#=======================================================================
+# Description:
+# Deterministic generator of synthetic libraries, the fixture of the
+# benchmarks. The schema, lookup tables and configuration are copied
+# from a template database (the application database by default) and
+# upgraded, then movies, series, episodes, actors and their genre,
+# language and cast links are bulk inserted with explicit IDs in a
+# single transaction. The journal and statistics triggers are dropped
+# for the load and recreated afterwards, with MEDIA_STATS rebuilt in
+# one pass. The same seed and volumes always produce the same library.
+# Posters can optionally be generated in the layout of posterhelper: a
+# pool of distinct JPEGs in the store, hard linked to every media.
+# Run from the repository root:
+#   python -m benchmarks.generate_library --output /tmp/library.db --preset large
+#   python -m benchmarks.generate_library --output /tmp/library.db --movies 5000 --posters /tmp/posters
+#=======================================================================
+import os
+import sys
+import json
+import math
+import time
+import random
+import sqlite3
+import argparse
+import itertools
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.constants as constants
+import utils.dbhelper as dbhelper
+import utils.dbschema as dbschema
+import utils.backuphelper as backuphelper
+
+from utils.common    import formatSize
+from utils.constants import DEFAULT_DISC_PREFIX, POSTER_STORE_DIR, TIMESTAMP_FORMAT
+
+#=======================================================================
+''' Library volumes per preset: movies, series, episodes across all series and actors '''
+PRESETS         = { 'small'  : { 'movies' : 2_000,   'series' : 200,    'episodes' : 20_000,    'actors' : 5_000 },
+                    'medium' : { 'movies' : 20_000,  'series' : 2_000,  'episodes' : 200_000,   'actors' : 40_000 },
+                    'large'  : { 'movies' : 100_000, 'series' : 10_000, 'episodes' : 1_000_000, 'actors' : 200_000 } }
+
+''' Tables emptied in the copy of the template, children first '''
+DATA_TABLES     = [ 'MOVIE_CAST', 'MOVIE_GENRES', 'MOVIE_LANGUAGES', 'TV_SERIES_CAST', 'TV_SERIES_GENRES',
+                    'TV_SERIES_LANGUAGES', 'TV_SERIES_EPISODES', 'MOVIES', 'TV_SERIES', 'ACTORS',
+                    'CHANGE_JOURNAL', 'EXPORT_WATERMARKS', 'ENRICH_QUEUE', 'MEDIA_STATS' ]
+
+''' Links per media, as (minimum, maximum) '''
+GENRES_PER_MEDIA    = (1, 3)
+LANGUAGES_PER_MEDIA = (1, 2)
+CAST_PER_MOVIE      = (6, 15)
+CAST_PER_SERIES     = (8, 20)
+EPISODES_PER_SEASON = (6, 24)
+
+''' Share of the media backed up to a disc, the others are flagged to burn '''
+BACKED_UP_SHARE = 0.7
+DISC_CAPACITY   = 25_000_000_000
+
+''' Actor popularity follows a power law, the actor of rank r is cast with a weight of 1 / r^ACTOR_SKEW '''
+ACTOR_SKEW      = 0.8
+
+INSERT_CHUNK    = 50_000
+BASE_TIMESTAMP  = 1_577_836_800
+
+WORDS           = [ 'Shadow', 'River', 'Night', 'Empire', 'Last', 'Silent', 'Golden', 'Broken', 'City', 'Storm',
+                    'Winter', 'Secret', 'Iron', 'Lost', 'Dark', 'Blue', 'Fire', 'Glass', 'Hidden', 'Wild',
+                    'Star', 'Ocean', 'Ghost', 'Crimson', 'Distant', 'Falling', 'Black', 'Summer', 'Echo', 'Stone',
+                    'King', 'Garden', 'Road', 'Machine', 'Heart', 'Island', 'Dream', 'War', 'Light', 'House' ]
+
+FIRST_NAMES     = [ 'James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda', 'David', 'Elena',
+                    'Akira', 'Priya', 'Carlos', 'Sofia', 'Wei', 'Amara', 'Lars', 'Ingrid', 'Omar', 'Yuki' ]
+
+LAST_NAMES      = [ 'Smith', 'Johnson', 'Garcia', 'Miller', 'Davis', 'Martinez', 'Tanaka', 'Kumar', 'Nguyen', 'Rossi',
+                    'Muller', 'Dubois', 'Ivanov', 'Kowalski', 'Silva', 'Chen', 'Okafor', 'Hansen', 'Haddad', 'Sato' ]
+
+COUNTRIES       = [ 'United States', 'United Kingdom', 'France', 'Germany', 'Japan', 'India', 'South Korea', 'Spain', 'Canada', 'Italy' ]
+CERTIFICATIONS  = [ 'G', 'PG', 'PG-13', 'R', 'NC-17', 'Not Rated', 'Unknown' ]
+TV_RATINGS      = [ 'TV-Y', 'TV-G', 'TV-PG', 'TV-14', 'TV-MA', 'Unknown' ]
+VIDEO_CODECS    = [ 'H.264', 'H.265', 'AV1', 'VC-1', 'MPEG-2' ]
+AUDIO_CODECS    = [ 'AAC', 'AC3', 'DTS', 'DTS-HD MA', 'TrueHD', 'EAC3' ]
+
+#=======================================================================
+def get_ids(cursor : sqlite3.Cursor, table : str) -> list:
+    """
+    Returns the IDs of a lookup table of the template.
+
+    Parameters:
+    cursor (sqlite3.Cursor): The cursor on the library.
+    table (str): The table to read.
+
+    Returns:
+    list: The IDs, in ascending order.
+    """
+    return [row[0] for row in cursor.execute(f'SELECT ID FROM {table} ORDER BY ID')]
+
+
+def get_timestamp(rng : random.Random, days : int = 1800) -> str:
+    """
+    Returns a random timestamp within a number of days of a fixed base date.
+
+    Parameters:
+    rng (random.Random): The random generator.
+    days (int, optional): The range of the timestamps in days.
+
+    Returns:
+    str: The timestamp in TIMESTAMP_FORMAT.
+    """
+    return time.strftime(TIMESTAMP_FORMAT, time.gmtime(BASE_TIMESTAMP + rng.randrange(days * 86400)))
+
+
+def get_title(rng : random.Random, number : int) -> str:
+    """
+    Returns a random title, numbered so titles are unique.
+
+    Parameters:
+    rng (random.Random): The random generator.
+    number (int): The number of the media.
+
+    Returns:
+    str: The title.
+    """
+    return f'{" ".join(rng.sample(WORDS, rng.randint(1, 4)))} {number}'
+
+
+def get_plot(rng : random.Random) -> str:
+    """
+    Returns a random plot of a few sentences.
+
+    Parameters:
+    rng (random.Random): The random generator.
+
+    Returns:
+    str: The plot.
+    """
+    return ' '.join(f'The {" ".join(rng.choices(WORDS, k=rng.randint(3, 8))).lower()}.' for _ in range(rng.randint(1, 4)))
+
+
+def get_discs(rng : random.Random, sizes : list) -> list:
+    """
+    Assigns media to backup discs: a share of the media is backed up, filling numbered discs in order.
+
+    Parameters:
+    rng (random.Random): The random generator.
+    sizes (list): The size in bytes of each media.
+
+    Returns:
+    list: The disc of each media, None for the media not backed up.
+    """
+    discs, used, number = [], 0, 1
+
+    for size in sizes:
+        if rng.random() >= BACKED_UP_SHARE:
+            discs.append(None)
+            continue
+
+        if used + size > DISC_CAPACITY:
+            number, used = number + 1, 0
+
+        used += size
+        discs.append(f'{DEFAULT_DISC_PREFIX}{number:03d}')
+
+    return discs
+
+
+def get_links(rng : random.Random, media_ids : range, target_ids : list, bounds : tuple, cum_weights : list = None):
+    """
+    Yields links between media and a target table, e.g. genres or actors, a random number per media.
+
+    Parameters:
+    rng (random.Random): The random generator.
+    media_ids (range): The IDs of the media.
+    target_ids (list): The IDs of the target table.
+    bounds (tuple): The minimum and maximum number of links per media.
+    cum_weights (list, optional): The cumulative weights of the targets, uniform when not given.
+
+    Yields:
+    tuple: (media_id, target_id), each pair at most once.
+    """
+    for media_id in media_ids:
+        count = min(rng.randint(*bounds), len(target_ids))
+
+        if cum_weights is None:
+            targets = rng.sample(target_ids, count)
+        else:
+            targets = dict.fromkeys(rng.choices(target_ids, cum_weights=cum_weights, k=count))
+
+        for target_id in targets:
+            yield media_id, target_id
+
+
+def insert_rows(cursor : sqlite3.Cursor, table : str, columns : list, rows) -> int:
+    """
+    Bulk inserts rows into a table, in chunks so the rows are never all held in memory.
+
+    Parameters:
+    cursor (sqlite3.Cursor): The cursor on the library, inside the load transaction.
+    table (str): The table to insert into.
+    columns (list): The columns of the rows.
+    rows (iterable): The rows, as tuples in the order of the columns.
+
+    Returns:
+    int: The number of rows inserted.
+    """
+    query = f'INSERT INTO {table} ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})'
+    rows  = iter(rows)
+    count = 0
+
+    while chunk := list(itertools.islice(rows, INSERT_CHUNK)):
+        cursor.executemany(query, chunk)
+        count += len(chunk)
+
+    return count
+
+
+def create_library(path : str, template : str) -> None:
+    """
+    Creates an empty library from a template: the template is copied with the backup API, upgraded
+    to the latest schema and its media, actors, links, journal and statistics are deleted.
+
+    Parameters:
+    path (str): The path of the library, replaced if it exists.
+    template (str): The database the schema, lookup tables and configuration are copied from.
+    """
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    backuphelper.backup_database(path, compression=None, source=template)
+    dbschema.upgrade_schema(path)
+
+    connection = dbhelper.get_connection(path, isolation_level=None)
+
+    try:
+        connection.execute('BEGIN')
+        triggers = drop_triggers(connection.cursor())
+
+        for table in DATA_TABLES:
+            connection.execute(f'DELETE FROM {table}')
+
+        connection.execute(f'DELETE FROM sqlite_sequence WHERE name IN ({", ".join("?" * len(DATA_TABLES))})', DATA_TABLES)
+
+        for trigger in triggers:
+            connection.execute(trigger)
+
+        connection.execute('COMMIT')
+    finally:
+        connection.close()
+
+
+def drop_triggers(cursor : sqlite3.Cursor) -> list:
+    """
+    Drops all triggers of the library, e.g. for a bulk load.
+
+    Parameters:
+    cursor (sqlite3.Cursor): The cursor on the library.
+
+    Returns:
+    list: The CREATE TRIGGER statements to recreate them.
+    """
+    triggers = cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'").fetchall()
+
+    for name, _ in triggers:
+        cursor.execute(f'DROP TRIGGER "{name}"')
+
+    return [sql for _, sql in triggers]
+
+
+def load_movies(cursor : sqlite3.Cursor, rng : random.Random, count : int, lookups : dict) -> None:
+    """
+    Inserts the movies, with IDs 1 to count.
+
+    Parameters:
+    cursor (sqlite3.Cursor): The cursor on the library, inside the load transaction.
+    rng (random.Random): The random generator.
+    count (int): The number of movies.
+    lookups (dict): The IDs of the sources, qualities and editions.
+    """
+    sizes = [int(rng.lognormvariate(22.5, 0.8)) for _ in range(count)]
+    discs = get_discs(rng, sizes)
+
+    def rows():
+        for id, size, disc in zip(range(1, count + 1), sizes, discs):
+            title   = get_title(rng, id)
+            year    = rng.randint(1930, 2025)
+            runtime = rng.randint(75, 200)
+            online  = f'tt{rng.randrange(10 ** 7):07d}'
+            created = get_timestamp(rng)
+
+            yield (id, title, title, year, f'{runtime} min', runtime, rng.choice(COUNTRIES), int(disc is not None and rng.random() < 0.8),
+                   round(rng.uniform(3, 9.5), 1), rng.randint(0, 10), rng.choice(CERTIFICATIONS),
+                   f'{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}', get_plot(rng), get_plot(rng),
+                   rng.choice(lookups['MEDIA_SOURCE']), rng.choice(lookups['MEDIA_QUALITY']),
+                   rng.choice(lookups['MEDIA_EDITION']) if rng.random() < 0.3 else None,
+                   rng.choice(VIDEO_CODECS), rng.choice(AUDIO_CODECS), formatSize(size), size,
+                   rng.randint(1, 2), int(disc is None), disc, 'IMDB', f'https://www.imdb.com/title/{online}/',
+                   f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}', f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+                   f'https://posters.example.com/movie/{id}.jpg', created, created)
+
+    insert_rows(cursor, 'MOVIES', ['ID', 'TITLE', 'ORIGINAL_TITLE', 'YEAR', 'RUNTIME', 'RUNTIME_MINUTES', 'COUNTRY', 'WATCHED',
+                                   'ONLINE_RATING', 'RATING', 'CERTIFICATION', 'RELEASE_DATE', 'TAGLINE', 'PLOT',
+                                   'SOURCE_ID', 'QUALITY_ID', 'EDITION_ID', 'VIDEO_CODEC', 'AUDIO_CODEC', 'SIZE', 'SIZE_BYTES',
+                                   'DISC_COUNT', 'TO_BURN', 'BACKUP_DISC', 'LOOKUP_SOURCE', 'SOURCE_URL', 'DIRECTOR', 'WRITER',
+                                   'POSTER_URL', 'CREATED_DATE', 'UPDATED_DATE'], rows())
+
+
+def load_series(cursor : sqlite3.Cursor, rng : random.Random, count : int, episodes : int, lookups : dict) -> int:
+    """
+    Inserts the series, with IDs 1 to count, and their episodes. The episodes are spread
+    unevenly across the series and split into seasons of a length specific to each series.
+
+    Parameters:
+    cursor (sqlite3.Cursor): The cursor on the library, inside the load transaction.
+    rng (random.Random): The random generator.
+    count (int): The number of series.
+    episodes (int): The total number of episodes.
+    lookups (dict): The IDs of the sources and qualities.
+
+    Returns:
+    int: The number of episodes inserted.
+    """
+    weights  = [rng.lognormvariate(0, 0.75) for _ in range(count)]
+    total    = sum(weights) or 1
+    counts   = [int(weight / total * episodes) for weight in weights]
+    for index in rng.sample(range(count), min(count, episodes - sum(counts))):
+        counts[index] += 1
+
+    lengths  = [rng.randint(*EPISODES_PER_SEASON) for _ in range(count)]
+
+    def series_rows():
+        for id, episode_count, length in zip(range(1, count + 1), counts, lengths):
+            title   = get_title(rng, id)
+            year    = rng.randint(1960, 2025)
+            online  = f'tt{rng.randrange(10 ** 7):07d}'
+            created = get_timestamp(rng)
+
+            yield (id, title, title, year, max(1, math.ceil(episode_count / length)), rng.choice(COUNTRIES),
+                   int(rng.random() < 0.4), round(rng.uniform(3, 9.5), 1), rng.randint(0, 10),
+                   f'{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}', rng.choice(TV_RATINGS),
+                   rng.choice(lookups['MEDIA_SOURCE']), get_plot(rng), get_plot(rng), 'IMDB',
+                   f'https://www.imdb.com/title/{online}/', f'https://posters.example.com/series/{id}.jpg',
+                   f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}', f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+                   created, created)
+
+    def episode_rows():
+        id = 0
+        for series_id, episode_count, length in zip(range(1, count + 1), counts, lengths):
+            sizes = [int(rng.lognormvariate(20.8, 0.6)) for _ in range(episode_count)]
+
+            for number, size, disc in zip(range(episode_count), sizes, get_discs(rng, sizes)):
+                id     += 1
+                season  = number // length + 1
+                created = get_timestamp(rng)
+
+                yield (id, series_id, season, number % length + 1, f'Episode {number % length + 1}: {rng.choice(WORDS)}',
+                       get_plot(rng), int(disc is not None and rng.random() < 0.7), rng.choice(lookups['MEDIA_QUALITY']),
+                       int(disc is None), disc, formatSize(size), size,
+                       f'{rng.randint(1960, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}', created, created)
+
+    insert_rows(cursor, 'TV_SERIES', ['ID', 'TITLE', 'ORIGINAL_TITLE', 'YEAR', 'SEASONS', 'COUNTRY', 'WATCHED', 'ONLINE_RATING',
+                                      'RATING', 'RELEASE_DATE', 'CERTIFICATION', 'SOURCE_ID', 'TAGLINE', 'PLOT', 'LOOKUP_SOURCE',
+                                      'SOURCE_URL', 'POSTER_URL', 'DIRECTOR', 'WRITER', 'CREATED_DATE', 'UPDATED_DATE'], series_rows())
+
+    return insert_rows(cursor, 'TV_SERIES_EPISODES', ['ID', 'SERIES_ID', 'SEASON', 'EPISODE', 'TITLE', 'PLOT', 'WATCHED', 'QUALITY_ID',
+                                                      'TO_BURN', 'BACKUP_DISC', 'SIZE', 'SIZE_BYTES', 'RELEASE_DATE',
+                                                      'CREATED_DATE', 'UPDATED_DATE'], episode_rows())
+
+
+def load_actors(cursor : sqlite3.Cursor, rng : random.Random, count : int) -> None:
+    """
+    Inserts the actors, with IDs 1 to count and unique online IDs.
+
+    Parameters:
+    cursor (sqlite3.Cursor): The cursor on the library, inside the load transaction.
+    rng (random.Random): The random generator.
+    count (int): The number of actors.
+    """
+    created = get_timestamp(rng)
+    rows    = ((id, f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}', f'nm{id:07d}', 'IMDB',
+                f'https://www.imdb.com/name/nm{id:07d}/', created) for id in range(1, count + 1))
+
+    insert_rows(cursor, 'ACTORS', ['ID', 'NAME', 'ONLINE_ID', 'LOOKUP_SOURCE', 'SOURCE_URL', 'CREATED_DATE'], rows)
+
+
+def load_links(cursor : sqlite3.Cursor, rng : random.Random, volumes : dict, lookups : dict) -> dict:
+    """
+    Inserts the genres, languages and cast of the movies and series.
+
+    Parameters:
+    cursor (sqlite3.Cursor): The cursor on the library, inside the load transaction.
+    rng (random.Random): The random generator.
+    volumes (dict): The number of movies, series and actors.
+    lookups (dict): The IDs of the genres and languages.
+
+    Returns:
+    dict: The number of rows inserted per table.
+    """
+    created = get_timestamp(rng)
+    actors  = list(range(1, volumes['actors'] + 1))
+    weights = list(itertools.accumulate(1 / rank ** ACTOR_SKEW for rank in range(1, len(actors) + 1)))
+    movies  = range(1, volumes['movies'] + 1)
+    series  = range(1, volumes['series'] + 1)
+    counts  = {}
+
+    links   = [('MOVIE_GENRES',        ['MOVIE_ID', 'GENRE_ID'],     movies, lookups['GENRES'],    GENRES_PER_MEDIA,    None),
+               ('MOVIE_LANGUAGES',     ['MOVIE_ID', 'LANGUAGE_ID'],  movies, lookups['LANGUAGES'], LANGUAGES_PER_MEDIA, None),
+               ('TV_SERIES_GENRES',    ['SERIES_ID', 'GENRE_ID'],    series, lookups['GENRES'],    GENRES_PER_MEDIA,    None),
+               ('TV_SERIES_LANGUAGES', ['SERIES_ID', 'LANGUAGE_ID'], series, lookups['LANGUAGES'], LANGUAGES_PER_MEDIA, None)]
+
+    for table, columns, media_ids, target_ids, bounds, cum_weights in links:
+        rows = (link + (created,) for link in get_links(rng, media_ids, target_ids, bounds, cum_weights))
+        counts[table] = insert_rows(cursor, table, columns + ['CREATED_DATE'], rows)
+
+    if actors:
+        rows = ((movie_id, actor_id, f'{rng.choice(FIRST_NAMES)} {rng.choice(WORDS)}', created)
+                for movie_id, actor_id in get_links(rng, movies, actors, CAST_PER_MOVIE, weights))
+        counts['MOVIE_CAST'] = insert_rows(cursor, 'MOVIE_CAST', ['MOVIE_ID', 'ACTOR_ID', 'CHARACTER', 'CREATED_DATE'], rows)
+
+        rows = ((series_id, actor_id, f'{rng.choice(FIRST_NAMES)} {rng.choice(WORDS)}', f'{rng.randint(1, 80)} episodes', created)
+                for series_id, actor_id in get_links(rng, series, actors, CAST_PER_SERIES, weights))
+        counts['TV_SERIES_CAST'] = insert_rows(cursor, 'TV_SERIES_CAST', ['SERIES_ID', 'ACTOR_ID', 'CHARACTER', 'EPISODES', 'CREATED_DATE'], rows)
+
+    return counts
+
+
+def generate_posters(path : str, rng : random.Random, volumes : dict, pool : int) -> int:
+    """
+    Generates the posters of the library in the layout of posterhelper: a pool of distinct
+    JPEGs of random noise in the store, each media poster a hard link to one of them.
+
+    Parameters:
+    path (str): The poster folder.
+    rng (random.Random): The random generator.
+    volumes (dict): The number of movies and series.
+    pool (int): The number of distinct posters.
+
+    Returns:
+    int: The number of posters linked.
+    """
+    import hashlib
+    import numpy as np
+    import utils.posterhelper as posterhelper
+
+    from PySide6.QtCore import QBuffer, QByteArray
+    from PySide6.QtGui  import QImage
+
+    store = os.path.join(path, POSTER_STORE_DIR)
+    os.makedirs(store, exist_ok=True)
+
+    noise = np.random.default_rng(rng.randrange(2 ** 32))
+    blobs = []
+
+    for _ in range(pool):
+        pixels = noise.integers(0, 256, size=(450, 300, 3), dtype=np.uint8)
+        image  = QImage(pixels.tobytes(), 300, 450, 900, QImage.Format.Format_RGB888)
+        data   = QByteArray()
+        buffer = QBuffer(data)
+        image.save(buffer, 'JPG', 85)
+
+        content   = bytes(data)
+        blob_path = os.path.join(store, f'{hashlib.sha256(content).hexdigest()}.jpg')
+        with open(blob_path, 'wb') as f:
+            f.write(content)
+        blobs.append(blob_path)
+
+    count = 0
+    for media_type in ('movies', 'series'):
+        folder = 'movie' if media_type == 'movies' else 'series'
+
+        for media_id in range(1, volumes[media_type] + 1):
+            posterhelper.link_poster(rng.choice(blobs), os.path.join(path, folder, f'{media_id}.jpg'))
+            count += 1
+
+    return count
+
+
+def generate_library(path : str, movies : int, series : int, episodes : int, actors : int, seed : int = 0,
+                     posters : str = None, poster_pool : int = 64, template : str = None) -> dict:
+    """
+    Generates a synthetic library. See the description of the module.
+
+    Parameters:
+    path (str): The path of the library, replaced if it exists.
+    movies (int): The number of movies.
+    series (int): The number of series.
+    episodes (int): The number of episodes across all series.
+    actors (int): The number of actors.
+    seed (int, optional): The seed of the random generator. Defaults to 0.
+    posters (str, optional): The poster folder to generate, also set as the poster path of the library.
+    poster_pool (int, optional): The number of distinct posters. Defaults to 64.
+    template (str, optional): The database the schema is copied from. Defaults to the application database.
+
+    Returns:
+    dict: The number of rows per table, the posters linked and the generation time in seconds.
+    """
+    start   = time.perf_counter()
+    rng     = random.Random(seed)
+    volumes = { 'movies' : movies, 'series' : series, 'episodes' : episodes if series else 0, 'actors' : actors }
+
+    create_library(path, template or constants.DEFAULT_DB_PATH)
+
+    connection = dbhelper.get_connection(path, isolation_level=None)
+    cursor     = connection.cursor()
+
+    try:
+        cursor.execute('PRAGMA synchronous = OFF')
+        cursor.execute('BEGIN')
+
+        triggers = drop_triggers(cursor)
+        lookups  = { table : get_ids(cursor, table) for table in ('MEDIA_SOURCE', 'MEDIA_QUALITY', 'MEDIA_EDITION', 'GENRES', 'LANGUAGES') }
+
+        load_movies(cursor, rng, movies, lookups)
+        load_series(cursor, rng, series, volumes['episodes'], lookups)
+        load_actors(cursor, rng, actors)
+        load_links(cursor, rng, volumes, lookups)
+
+        for trigger in triggers:
+            cursor.execute(trigger)
+
+        for statement in dbschema.stats_rebuild():
+            cursor.execute(statement)
+
+        if posters:
+            cursor.execute('UPDATE APP_CONFIG SET DEFAULT_POSTER_PATH = ?', (posters,))
+
+        cursor.execute('COMMIT')
+
+        report = { table : cursor.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                   for table in DATA_TABLES if table not in ('EXPORT_WATERMARKS', 'ENRICH_QUEUE', 'CHANGE_JOURNAL') }
+    except Exception:
+        if connection.in_transaction:
+            cursor.execute('ROLLBACK')
+        raise
+    finally:
+        connection.close()
+
+    dbhelper.checkpoint('TRUNCATE', path)
+
+    if posters:
+        report['POSTERS'] = generate_posters(posters, rng, volumes, poster_pool)
+
+    report['SECONDS'] = round(time.perf_counter() - start, 2)
+    return report
+
+
+def main() -> None:
+    """
+    Parses the command line, generates the library and prints the number of rows per table as JSON.
+    """
+    parser = argparse.ArgumentParser(description='Generate a deterministic synthetic library for benchmarking.')
+    parser.add_argument('--output', required=True, help='path of the library to generate, replaced if it exists')
+    parser.add_argument('--preset', choices=PRESETS.keys(), default='small', help='default volumes')
+    parser.add_argument('--movies', type=int, help='number of movies')
+    parser.add_argument('--series', type=int, help='number of series')
+    parser.add_argument('--episodes', type=int, help='number of episodes across all series')
+    parser.add_argument('--actors', type=int, help='number of actors')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random generator')
+    parser.add_argument('--posters', help='poster folder to generate')
+    parser.add_argument('--poster-pool', type=int, default=64, help='number of distinct posters')
+    parser.add_argument('--template', default=constants.DEFAULT_DB_PATH, help='database the schema is copied from')
+    args    = parser.parse_args()
+
+    volumes = { key : getattr(args, key) if getattr(args, key) is not None else value
+                for key, value in PRESETS[args.preset].items() }
+
+    report  = generate_library(args.output, seed=args.seed, posters=args.posters, poster_pool=args.poster_pool,
+                               template=args.template, **volumes)
+    print(json.dumps(report, indent=4))
+
+#=======================================================================
+if __name__ == '__main__':
+    main()
+
+#=======================================================================
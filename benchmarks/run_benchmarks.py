@@ -0,0 +1,547 @@
+#=======================================================================
+# Description:
+# Benchmark suite of the model, import / export and publish hot paths,
+# run headless against a library generated with generate_library (or a
+# copy of an existing database). Each benchmark is timed a number of
+# runs within a time budget, asv style, with an untimed setup before
+# every run when needed. Results are written to JSON, one file per
+# commit, and compared to a baseline with a threshold on the median to
+# report regressions. A plain runner, not collected by pytest:
+#   python -m benchmarks.run_benchmarks run --preset medium
+#   python -m benchmarks.run_benchmarks run --filter get_media --baseline benchmarks/results/abc1234.json
+#   python -m benchmarks.run_benchmarks compare benchmarks/results/abc1234.json benchmarks/results/def5678.json
+#=======================================================================
+import io
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import datetime
+import tempfile
+import importlib
+import contextlib
+import subprocess
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.constants as constants
+import utils.backuphelper as backuphelper
+
+from benchmarks.stress_concurrency import percentile
+from benchmarks.generate_library   import PRESETS, generate_library
+
+#=======================================================================
+RESULTS_FOLDER  = os.path.join('benchmarks', 'results')
+
+''' Runs of each benchmark: at least MIN_RUNS, then more until MAX_RUNS or the time budget in seconds is spent '''
+MIN_RUNS        = 3
+MAX_RUNS        = 20
+TIME_BUDGET     = 2.0
+
+''' A benchmark regresses when its median grows by more than the threshold (a ratio) and by more than
+    the minimum delta in milliseconds, so sub-millisecond noise is never reported '''
+THRESHOLD       = 0.15
+MIN_DELTA       = 0.5
+
+''' Media updated per bulk update and imported per import run '''
+BULK_SIZE       = 1000
+IMPORT_ROWS     = 100
+
+''' Export columns the importers cannot read back, per media type: the series importer expects the
+    lookup source with a series ID and the episode quality by its own column name '''
+IMPORT_SKIP     = { constants.MEDIA_TYPE.SERIES : ['LOOKUP_SOURCE', 'SOURCE_URL', 'EPISODE_QUALITY'] }
+
+''' Number of media the detail and update benchmarks cycle through '''
+SAMPLE_SIZE     = 50
+
+''' Export and import templates, by module, with the file extension they read and write '''
+EXPORT_REGISTRY = os.path.join('templates', 'exportdata', 'registry.json')
+IMPORT_REGISTRY = os.path.join('templates', 'importdata', 'registry.json')
+FILE_TYPES      = { 'exportCSV' : 'csv', 'exportXLSX' : 'xlsx', 'exportJSON' : 'json' }
+
+#=======================================================================
+def quiet(func):
+    """
+    Wraps a function so the output it prints is discarded, e.g. the progress of the publishers.
+
+    Parameters:
+    func (callable): The function to wrap.
+
+    Returns:
+    callable: The wrapped function.
+    """
+    def call(*args, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func(*args, **kwargs)
+
+    return call
+
+
+def cycle(values : list):
+    """
+    Returns a callable returning the values in turn, so repeated runs do not hit the same rows.
+
+    Parameters:
+    values (list): The values.
+
+    Returns:
+    callable: Returns the next value on every call.
+    """
+    state = { 'index' : -1 }
+
+    def next_value():
+        state['index'] = (state['index'] + 1) % len(values)
+        return values[state['index']]
+
+    return next_value
+
+
+def get_exporter(module) -> callable:
+    """
+    Returns the export function of an export template: export, or the only export_ function
+    of the templates that name it after their format.
+
+    Parameters:
+    module (module): The export template.
+
+    Returns:
+    callable: The function called with (media_type, path).
+    """
+    if hasattr(module, 'export'):
+        return module.export
+
+    return next(getattr(module, name) for name in dir(module) if name.startswith('export_'))
+
+
+def get_filters(dbhelper, media_type : str) -> dict:
+    """
+    Returns a value for every filter of get_media supported by a media type, taken from the library
+    so the filters match rows of any library.
+
+    Parameters:
+    dbhelper (module): The database helper.
+    media_type (str): MOVIE or SERIES.
+
+    Returns:
+    dict: The filter value per filter column.
+    """
+    from utils.constants import FILTER_COLUMNS, MEDIA_FILTER_COLUMNS, MEDIA_TYPE
+
+    table, discs, cast, genres, languages = ('MOVIES', 'MOVIES', 'MOVIE_CAST', 'MOVIE_GENRES', 'MOVIE_LANGUAGES') \
+                                            if media_type == MEDIA_TYPE.MOVIE \
+                                       else ('TV_SERIES', 'TV_SERIES_EPISODES', 'TV_SERIES_CAST', 'TV_SERIES_GENRES', 'TV_SERIES_LANGUAGES')
+
+    def first(query : str, default=None):
+        df = dbhelper.execute_read(query)
+        return default if df.empty or df.iloc[0, 0] is None else df.iloc[0, 0]
+
+    def sample(column : str, default, source : str = table):
+        return first(f'SELECT {column} FROM {source} WHERE {column} IS NOT NULL ORDER BY ID '
+                     f'LIMIT 1 OFFSET (SELECT COUNT(*) / 2 FROM {source} WHERE {column} IS NOT NULL)', default)
+
+    title   = str(sample('TITLE', 'a'))
+    release = str(sample('RELEASE_DATE', '2000-01-01'))
+    filters = { FILTER_COLUMNS.TITLE         : title.split()[0],
+                FILTER_COLUMNS.WATCHED       : 1,
+                FILTER_COLUMNS.TO_BURN       : 1,
+                FILTER_COLUMNS.GENRE         : first(f'SELECT GENRE_ID FROM {genres} GROUP BY 1 ORDER BY COUNT(*) DESC LIMIT 1', 1),
+                FILTER_COLUMNS.LANGUAGE      : first(f'SELECT LANGUAGE_ID FROM {languages} GROUP BY 1 ORDER BY COUNT(*) DESC LIMIT 1', 1),
+                FILTER_COLUMNS.ACTOR         : str(first(f'SELECT a.NAME FROM {cast} c INNER JOIN ACTORS a ON a.ID = c.ACTOR_ID '
+                                                         'GROUP BY 1 ORDER BY COUNT(*) DESC LIMIT 1', 'a')).split()[-1],
+                FILTER_COLUMNS.DIRECTOR      : str(sample('DIRECTOR', 'a')).split()[-1],
+                FILTER_COLUMNS.BACKUP_DISC   : sample('BACKUP_DISC', constants.DEFAULT_DISC_PREFIX, discs),
+                FILTER_COLUMNS.YEAR          : sample('YEAR', 2000),
+                FILTER_COLUMNS.SOURCE        : sample('SOURCE_ID', 1),
+                FILTER_COLUMNS.ADDED_SINCE   : str(sample('CREATED_DATE', '2020-01-01'))[:10],
+                FILTER_COLUMNS.RELEASED_FROM : release[:10],
+                FILTER_COLUMNS.RELEASED_TO   : release[:10] }
+
+    if media_type == MEDIA_TYPE.MOVIE:
+        filters[FILTER_COLUMNS.QUALITY] = sample('QUALITY_ID', 1)
+        filters[FILTER_COLUMNS.EDITION] = sample('EDITION_ID', 1)
+
+    supported = set(MEDIA_FILTER_COLUMNS[media_type]) | { FILTER_COLUMNS.GENRE, FILTER_COLUMNS.LANGUAGE, FILTER_COLUMNS.ACTOR }
+    return { key : value for key, value in filters.items() if key in supported }
+
+
+def get_benchmarks(folder : str, seed : int) -> list:
+    """
+    Builds the benchmarks against the library set as the application database.
+
+    Parameters:
+    folder (str): A scratch folder for the files written by the benchmarks.
+    seed (int): The seed picking the media the benchmarks run on.
+
+    Returns:
+    list: The benchmarks as (name, function, setup) tuples, setup is None or called untimed before every run.
+    """
+    import model
+    import utils.dbhelper as dbhelper
+    import templates.publish.firebasePublisher as firebasePublisher
+
+    from utils.constants import MEDIA_TYPE, MEDIA_COLUMNS, SERIES_COLUMNS
+
+    rng        = random.Random(seed)
+    movie_ids  = [int(id) for id in dbhelper.execute_read('SELECT ID FROM MOVIES ORDER BY ID')['ID']]
+    series_ids = [int(id) for id in dbhelper.execute_read('SELECT ID FROM TV_SERIES ORDER BY ID')['ID']]
+    genres     = list(dbhelper.execute_read('SELECT GENRE FROM GENRES ORDER BY ID')['GENRE'])
+    languages  = list(dbhelper.execute_read('SELECT LANGUAGE FROM LANGUAGES ORDER BY ID')['LANGUAGE'])
+    actors     = dbhelper.execute_read('SELECT ONLINE_ID, NAME FROM ACTORS WHERE ONLINE_ID IS NOT NULL ORDER BY ID LIMIT 500')
+    movies     = cycle(rng.sample(movie_ids, min(SAMPLE_SIZE, len(movie_ids))) or [0])
+    series     = cycle(rng.sample(series_ids, min(SAMPLE_SIZE, len(series_ids))) or [0])
+    toggle     = cycle([0, 1])
+    metas      = cycle([(genres[:2], languages[:1]), (genres[2:4], languages[1:2])])
+    benchmarks = []
+
+    for media_type in (MEDIA_TYPE.MOVIE, MEDIA_TYPE.SERIES):
+        prefix = f'model.get_media.{media_type.lower()}'
+        benchmarks.append((f'{prefix}.all', lambda media_type=media_type: model.get_media(media_type, {}), None))
+
+        for column, value in get_filters(dbhelper, media_type).items():
+            benchmarks.append((f'{prefix}.{column.lower()}',
+                               lambda media_type=media_type, filters={ column : value }: model.get_media(media_type, filters), None))
+
+    benchmarks.append(('model.get_movie_details', lambda: model.get_movie_details(movies()), None))
+    benchmarks.append(('model.get_series_details', lambda: model.get_series_details(series()), None))
+
+    def update_movie() -> bool:
+        movie_genres, movie_languages = metas()
+        return model.update_movie({ MEDIA_COLUMNS.ID : movies(), MEDIA_COLUMNS.RATING : rng.randint(0, 10),
+                                    MEDIA_COLUMNS.PLOT : f'Benchmark plot {rng.random()}' },
+                                  None, movie_genres, movie_languages)
+
+    def update_series() -> bool:
+        series_genres, series_languages = metas()
+        return model.update_series({ MEDIA_COLUMNS.ID : series(), MEDIA_COLUMNS.RATING : rng.randint(0, 10),
+                                     MEDIA_COLUMNS.PLOT : f'Benchmark plot {rng.random()}' },
+                                   None, None, series_genres, series_languages)
+
+    def update_media_actors() -> bool:
+        sample = actors.sample(min(12, len(actors)), random_state=rng.randrange(2 ** 32))
+        cast   = { row.ONLINE_ID : { MEDIA_COLUMNS.NAME      : row.NAME,
+                                     MEDIA_COLUMNS.CHARACTER : 'Benchmark',
+                                     SERIES_COLUMNS.EPISODES : '' } for row in sample.itertuples() }
+
+        for _ in range(2):
+            online_id       = f'nm9{rng.randrange(10 ** 8):08d}'
+            cast[online_id] = { MEDIA_COLUMNS.NAME : f'Benchmark {online_id}', MEDIA_COLUMNS.CHARACTER : 'Benchmark',
+                                SERIES_COLUMNS.EPISODES : '' }
+
+        return model.update_media_actors(MEDIA_TYPE.MOVIE, movies(), cast, 'IMDB')
+
+    benchmarks.append(('model.update_movie', update_movie, None))
+    benchmarks.append(('model.update_series', update_series, None))
+    benchmarks.append(('model.update_media_actors', update_media_actors, None))
+    benchmarks.append(('model.bulk_update_movies',
+                       lambda: model.bulk_update_movies(rng.sample(movie_ids, min(BULK_SIZE, len(movie_ids))),
+                                                        { MEDIA_COLUMNS.WATCHED : toggle() }), None))
+
+    with open(EXPORT_REGISTRY) as f:
+        exporters = [entry['Module'] for entry in json.load(f)['data']]
+
+    exports = {}
+    for module_name in exporters:
+        module    = importlib.import_module(module_name)
+        extension = FILE_TYPES.get(module_name.rsplit('.', 1)[-1], 'out')
+
+        for media_type in (MEDIA_TYPE.MOVIE, MEDIA_TYPE.SERIES):
+            path = os.path.join(folder, f'export_{media_type.lower()}.{extension}')
+            exports[(extension, media_type)] = path
+            benchmarks.append((f'export.{module_name.rsplit(".", 1)[-1]}.{media_type.lower()}',
+                               lambda export=quiet(get_exporter(module)), media_type=media_type, path=path: export(media_type, path), None))
+
+    with open(IMPORT_REGISTRY) as f:
+        importers = [(entry['Type'], entry['Module']) for entry in json.load(f)['data']]
+
+    for extension, module_name in importers:
+        module = importlib.import_module(module_name)
+
+        for media_type in (MEDIA_TYPE.MOVIE, MEDIA_TYPE.SERIES):
+            path = os.path.join(folder, f'import_{media_type.lower()}.{extension}')
+            benchmarks.append((f'import.{module_name.rsplit(".", 1)[-1]}.{media_type.lower()}',
+                               lambda import_media=quiet(module.import_media), media_type=media_type, path=path:
+                                   import_media(media_type, path, get_import_map(path, media_type)),
+                               lambda media_type=media_type, path=path, extension=extension:
+                                   write_import_file(dbhelper, path, extension, media_type)))
+
+    web_app  = os.path.join(folder, 'webapp')
+    manifest = os.path.join(folder, 'firebaseManifest.json')
+
+    def reset_firebase() -> None:
+        shutil.rmtree(web_app, ignore_errors=True)
+        if os.path.exists(manifest):
+            os.remove(manifest)
+
+    generate = quiet(lambda: firebasePublisher.generateContent(web_app, manifest))
+    benchmarks.append(('publish.firebase.generate_content', generate, reset_firebase))
+    benchmarks.append(('publish.firebase.generate_content_unchanged', generate, None))
+
+    return benchmarks
+
+
+def write_import_file(dbhelper, path : str, extension : str, media_type : str) -> None:
+    """
+    Writes the input of an import benchmark: the first IMPORT_ROWS rows of the export of the library,
+    one per movie or per episode, with new titles so every run imports new media.
+
+    Parameters:
+    dbhelper (module): The database helper.
+    path (str): The path of the file.
+    extension (str): csv, xlsx or json.
+    media_type (str): MOVIE or SERIES.
+    """
+    from utils.constants import MEDIA_TYPE
+    from templates.exportdata.exportQueries import QUERY_EXPORT_MOVIES, QUERY_EXPORT_SERIES
+
+    query = QUERY_EXPORT_MOVIES if media_type == MEDIA_TYPE.MOVIE else QUERY_EXPORT_SERIES
+    df    = dbhelper.execute_read(f'{query.format(where="")} LIMIT {IMPORT_ROWS}').drop(columns=['ID'])
+
+    df['TITLE'] = df['TITLE'] + f' (import {time.perf_counter_ns()})'
+
+    if extension == 'csv':
+        df.to_csv(path, index=False)
+    elif extension == 'xlsx':
+        df.to_excel(path, index=False)
+    else:
+        df.to_json(path, orient='records')
+
+
+def get_import_map(path : str, media_type : str) -> dict:
+    """
+    Returns the column map of an import benchmark: every column of the file imported into the column
+    of the same name, but for the columns in IMPORT_SKIP.
+
+    Parameters:
+    path (str): The path of the file, written by write_import_file.
+    media_type (str): MOVIE or SERIES.
+
+    Returns:
+    dict: The file column per database column.
+    """
+    import pandas as pd
+
+    reader  = pd.read_csv if path.endswith('.csv') else pd.read_excel if path.endswith('.xlsx') else pd.read_json
+    columns = reader(path, nrows=1).columns if not path.endswith('.json') else reader(path).columns
+
+    return { column : column for column in columns if column not in IMPORT_SKIP.get(media_type, []) }
+
+
+def run_benchmark(func, setup = None, min_runs : int = MIN_RUNS, max_runs : int = MAX_RUNS, budget : float = TIME_BUDGET) -> dict:
+    """
+    Times a benchmark: at least min_runs runs, then more until max_runs runs or the time budget is spent.
+
+    Parameters:
+    func (callable): The benchmark, a False return is an error.
+    setup (callable, optional): Called untimed before every run.
+    min_runs (int, optional): The minimum number of runs. Defaults to MIN_RUNS.
+    max_runs (int, optional): The maximum number of runs. Defaults to MAX_RUNS.
+    budget (float, optional): The time budget in seconds. Defaults to TIME_BUDGET.
+
+    Returns:
+    dict: The number of runs and errors, and the min, median, mean, p95 and max run time in milliseconds.
+    """
+    timings = []
+    errors  = 0
+    start   = time.perf_counter()
+
+    while len(timings) < max_runs and (len(timings) < min_runs or time.perf_counter() - start < budget):
+        if setup:
+            setup()
+
+        begin  = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - begin)
+
+        if result is False:
+            errors += 1
+
+    timings = [timing * 1000 for timing in timings]
+
+    return { 'runs'   : len(timings),
+             'errors' : errors,
+             'min'    : round(min(timings), 3),
+             'median' : round(statistics.median(timings), 3),
+             'mean'   : round(statistics.mean(timings), 3),
+             'p95'    : round(percentile(timings, 95), 3),
+             'max'    : round(max(timings), 3) }
+
+
+def get_commit() -> str:
+    """
+    Returns the short hash of the checked out commit, suffixed with + when the tree has local changes.
+
+    Returns:
+    str: The commit, unknown outside of a git repository.
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+        dirty  = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+    return commit + ('+' if dirty else '')
+
+
+def run_suite(db_path : str = None, preset : str = 'small', seed : int = 0, name_filter : str = None,
+              min_runs : int = MIN_RUNS, max_runs : int = MAX_RUNS, budget : float = TIME_BUDGET) -> dict:
+    """
+    Runs the suite on a copy of a database, or on a library generated for the run.
+
+    Parameters:
+    db_path (str, optional): The database to copy, a library is generated when not given.
+    preset (str, optional): The volumes of the generated library, see generate_library.PRESETS. Defaults to small.
+    seed (int, optional): The seed of the generated library and of the media picked. Defaults to 0.
+    name_filter (str, optional): Only runs the benchmarks whose name contains it.
+    min_runs (int, optional): The minimum number of runs per benchmark. Defaults to MIN_RUNS.
+    max_runs (int, optional): The maximum number of runs per benchmark. Defaults to MAX_RUNS.
+    budget (float, optional): The time budget per benchmark in seconds. Defaults to TIME_BUDGET.
+
+    Returns:
+    dict: The environment, the library and the results per benchmark.
+    """
+    folder = tempfile.mkdtemp(prefix='pmm_bench_')
+    path   = os.path.join(folder, 'library.db')
+
+    try:
+        if db_path:
+            backuphelper.backup_database(path, compression=None, source=db_path)
+            library = { 'source' : db_path }
+        else:
+            library = { 'preset' : preset, 'seed' : seed, **quiet(generate_library)(path, seed=seed, **PRESETS[preset]) }
+
+        constants.DEFAULT_DB_PATH = path
+
+        results = {}
+        for name, func, setup in get_benchmarks(folder, seed):
+            if name_filter and name_filter not in name:
+                continue
+
+            results[name] = run_benchmark(func, setup, min_runs, max_runs, budget)
+            print(f'{name:<55} {results[name]["median"]:>10.3f} ms  ({results[name]["runs"]} runs'
+                  f'{", " + str(results[name]["errors"]) + " errors" if results[name]["errors"] else ""})', file=sys.stderr)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    return { 'commit'     : get_commit(),
+             'timestamp'  : datetime.datetime.now().strftime(constants.TIMESTAMP_FORMAT),
+             'python'     : platform.python_version(),
+             'platform'   : platform.platform(),
+             'library'    : library,
+             'benchmarks' : results }
+
+
+def compare_results(baseline : dict, current : dict, threshold : float = THRESHOLD, min_delta : float = MIN_DELTA) -> tuple:
+    """
+    Compares the medians of two runs of the suite.
+
+    Parameters:
+    baseline (dict): The results of the baseline run.
+    current (dict): The results of the current run.
+    threshold (float, optional): The ratio a median may grow by. Defaults to THRESHOLD.
+    min_delta (float, optional): The milliseconds a median may grow by regardless of the ratio. Defaults to MIN_DELTA.
+
+    Returns:
+    tuple: The report lines and the names of the benchmarks that regressed.
+    """
+    lines       = [f'{"benchmark":<55} {"baseline":>10} {"current":>10} {"change":>8}',
+                   f'{baseline["commit"]:>66} {current["commit"]:>10}']
+    regressions = []
+
+    for name in sorted(set(baseline['benchmarks']) | set(current['benchmarks'])):
+        before, after = baseline['benchmarks'].get(name), current['benchmarks'].get(name)
+
+        if before is None or after is None:
+            lines.append(f'{name:<55} {"-" if before is None else before["median"]:>10} {"-" if after is None else after["median"]:>10}')
+            continue
+
+        change = (after['median'] - before['median']) / before['median'] if before['median'] else 0
+        status = ''
+
+        if after['errors']:
+            status = 'ERRORS'
+            regressions.append(name)
+        elif change > threshold and after['median'] - before['median'] > min_delta:
+            status = 'REGRESSION'
+            regressions.append(name)
+        elif change < -threshold and before['median'] - after['median'] > min_delta:
+            status = 'improved'
+
+        lines.append(f'{name:<55} {before["median"]:>10.3f} {after["median"]:>10.3f} {change:>+8.1%}  {status}')
+
+    lines.append(f'{len(regressions)} regression(s) above {threshold:.0%}' + (f': {", ".join(regressions)}' if regressions else ''))
+
+    return lines, regressions
+
+
+def load_results(path : str) -> dict:
+    """
+    Loads the results of a run of the suite.
+
+    Parameters:
+    path (str): The path of the results.
+
+    Returns:
+    dict: The results.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def main() -> None:
+    """
+    Parses the command line: run runs the suite and writes its results, compare reports the
+    regressions between two results. Exits with 1 when a benchmark regressed or failed.
+    """
+    parser   = argparse.ArgumentParser(description='Benchmark suite of the model, import / export and publish hot paths.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run      = commands.add_parser('run', help='run the suite and write its results')
+    run.add_argument('--db', help='database to copy for the run, a library is generated when not given')
+    run.add_argument('--preset', choices=PRESETS.keys(), default='small', help='volumes of the generated library')
+    run.add_argument('--seed', type=int, default=0, help='seed of the generated library and of the media picked')
+    run.add_argument('--filter', help='only run the benchmarks whose name contains this text')
+    run.add_argument('--min-runs', type=int, default=MIN_RUNS, help='minimum runs per benchmark')
+    run.add_argument('--max-runs', type=int, default=MAX_RUNS, help='maximum runs per benchmark')
+    run.add_argument('--budget', type=float, default=TIME_BUDGET, help='seconds per benchmark before stopping at min runs')
+    run.add_argument('--output', help='path of the results, benchmarks/results/<commit>.json by default')
+    run.add_argument('--baseline', help='results to compare the run to')
+    run.add_argument('--threshold', type=float, default=THRESHOLD, help='ratio a median may grow by')
+
+    compare  = commands.add_parser('compare', help='compare two results')
+    compare.add_argument('baseline', help='results of the baseline')
+    compare.add_argument('current', help='results to compare')
+    compare.add_argument('--threshold', type=float, default=THRESHOLD, help='ratio a median may grow by')
+
+    args     = parser.parse_args()
+
+    if args.command == 'run':
+        current = run_suite(args.db, args.preset, args.seed, args.filter, args.min_runs, args.max_runs, args.budget)
+        output  = args.output or os.path.join(RESULTS_FOLDER, f'{current["commit"]}.json')
+
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+        with open(output, 'w') as f:
+            json.dump(current, f, indent=4)
+        print(f'Results written to {output}')
+
+        if not args.baseline:
+            sys.exit(1 if any(result['errors'] for result in current['benchmarks'].values()) else 0)
+
+        baseline = load_results(args.baseline)
+    else:
+        baseline, current = load_results(args.baseline), load_results(args.current)
+
+    lines, regressions = compare_results(baseline, current, args.threshold)
+    print('\n'.join(lines))
+
+    sys.exit(1 if regressions else 0)
+
+#=======================================================================
+if __name__ == '__main__':
+    main()
+
+#=======================================================================
@@ -0,0 +1,199 @@
+#=======================================================================
+# Description:
+# Concurrency stress test of the database connection layer. N reader
+# threads run the point and count reads of the UI through dbhelper
+# connections while one writer thread applies bulk updates, the write
+# pattern of imports, lookups and bulk edits, on a copy of the database.
+# Reports the read latency percentiles, overall and for the reads that
+# overlapped a write transaction, and the "database is locked" errors.
+# Run from the repository root, e.g. to compare journal modes:
+#   python -m benchmarks.stress_concurrency --readers 8 --duration 10
+#   python -m benchmarks.stress_concurrency --journal-mode DELETE
+#=======================================================================
+import os
+import sys
+import json
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.constants as constants
+import utils.dbhelper as dbhelper
+import utils.dbqueries as dbqueries
+import utils.backuphelper as backuphelper
+
+from utils.constants import MEDIA_COLUMNS
+
+#=======================================================================
+def percentile(values : list, q : float) -> float:
+    """
+    Returns a percentile of a list of values, by the nearest rank.
+
+    Parameters:
+    values (list): The values.
+    q (float): The percentile, between 0 and 100.
+
+    Returns:
+    float: The value at the percentile, None for an empty list.
+    """
+    if not values:
+        return None
+
+    values = sorted(values)
+    return values[min(len(values) - 1, max(0, int(round(q / 100 * len(values))) - 1))]
+
+
+def summarize(latencies : list) -> dict:
+    """
+    Summarizes read latencies in milliseconds.
+
+    Parameters:
+    latencies (list): The latencies in seconds.
+
+    Returns:
+    dict: The count and the p50, p95, p99 and maximum latency in milliseconds.
+    """
+    summary = { 'count' : len(latencies) }
+
+    for name, q in (('p50', 50), ('p95', 95), ('p99', 99), ('max', 100)):
+        value         = percentile(latencies, q)
+        summary[name] = None if value is None else round(value * 1000, 3)
+
+    return summary
+
+
+def run_stress(db_path : str, readers : int, duration : float, batch : int, interval : float, journal_mode : str) -> dict:
+    """
+    Runs the stress test on a copy of a database.
+
+    Parameters:
+    db_path (str): The database copied for the test.
+    readers (int): The number of reader threads.
+    duration (float): The number of seconds the test runs for.
+    batch (int): The number of movies updated per write transaction.
+    interval (float): The number of seconds the writer waits between transactions.
+    journal_mode (str): The journal mode of the copy, WAL or DELETE.
+
+    Returns:
+    dict: The configuration, the read latencies overall and during writes, and the error counts.
+    """
+    folder = tempfile.mkdtemp(prefix='pmm_stress_')
+    copy   = backuphelper.backup_database(os.path.join(folder, 'stress.db'), compression=None, source=db_path)
+
+    constants.DEFAULT_DB_PATH = copy
+    constants.DB_JOURNAL_MODE = journal_mode
+    dbhelper.enable_wal()
+
+    import model
+
+    ids       = [int(id) for id in dbhelper.execute_read('SELECT ID FROM MOVIES')['ID']]
+    stop      = threading.Event()
+    writing   = threading.Event()
+    lock      = threading.Lock()
+    all_reads = []
+    hot_reads = []
+    stats     = { 'read_errors' : 0, 'write_errors' : 0, 'writes' : 0 }
+
+    def reader() -> None:
+        local   = []
+        hot     = []
+        errors  = 0
+
+        while not stop.is_set():
+            query   = random.choice([dbqueries.QUERY_GET_MOVIE.format(id=random.choice(ids)),
+                                     dbqueries.QUERY_GET_TOTAL_MOVIE_COUNT])
+            overlap = writing.is_set()
+            start   = time.perf_counter()
+
+            try:
+                connection = dbhelper.get_connection()
+                try:
+                    connection.execute(query).fetchall()
+                finally:
+                    connection.close()
+            except sqlite3.OperationalError:
+                errors += 1
+                continue
+
+            elapsed = time.perf_counter() - start
+            local.append(elapsed)
+            if overlap or writing.is_set():
+                hot.append(elapsed)
+
+        with lock:
+            all_reads.extend(local)
+            hot_reads.extend(hot)
+            stats['read_errors'] += errors
+
+    def writer() -> None:
+        watched = 1
+
+        while not stop.is_set():
+            writing.set()
+            try:
+                ok = model.bulk_update_movies(random.sample(ids, min(batch, len(ids))),
+                                              { MEDIA_COLUMNS.WATCHED : watched })
+            finally:
+                writing.clear()
+
+            stats['writes' if ok else 'write_errors'] += 1
+            watched = 1 - watched
+            stop.wait(interval)
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)] + [threading.Thread(target=writer)]
+
+    for thread in threads:
+        thread.start()
+
+    time.sleep(duration)
+    stop.set()
+
+    for thread in threads:
+        thread.join()
+
+    dbhelper.checkpoint('TRUNCATE')
+
+    for name in os.listdir(folder):
+        os.remove(os.path.join(folder, name))
+    os.rmdir(folder)
+
+    return { 'journal_mode'  : journal_mode,
+             'readers'       : readers,
+             'duration'      : duration,
+             'batch'         : batch,
+             'interval'      : interval,
+             'movies'        : len(ids),
+             'reads'         : summarize(all_reads),
+             'reads_writing' : summarize(hot_reads),
+             **stats }
+
+
+def main() -> None:
+    """
+    Parses the command line, runs the stress test and prints its report as JSON.
+    """
+    parser = argparse.ArgumentParser(description='Concurrency stress test: N readers and 1 writer.')
+    parser.add_argument('--db', default=constants.DEFAULT_DB_PATH, help='database to copy for the test')
+    parser.add_argument('--readers', type=int, default=8, help='number of reader threads')
+    parser.add_argument('--duration', type=float, default=10, help='seconds to run for')
+    parser.add_argument('--batch', type=int, default=500, help='movies updated per write transaction')
+    parser.add_argument('--interval', type=float, default=0.05, help='seconds between write transactions')
+    parser.add_argument('--journal-mode', default=constants.DB_JOURNAL_MODE, choices=['WAL', 'DELETE'])
+    args   = parser.parse_args()
+
+    report = run_stress(args.db, args.readers, args.duration, args.batch, args.interval, args.journal_mode)
+    print(json.dumps(report, indent=4))
+
+    if report['read_errors'] or report['write_errors']:
+        sys.exit(1)
+
+#=======================================================================
+if __name__ == '__main__':
+    main()
+
+#=======================================================================
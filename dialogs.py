@@ -4,11 +4,17 @@
 #=======================================================================
 import os
 import model
-import requests
 import pandas as pd
+import utils.backuphelper as backuphelper
+import utils.dbhelper as dbhelper
+import utils.dbschema as dbschema
+import utils.dischelper as dischelper
+import utils.enrichhelper as enrichhelper
+import utils.httphelper as httphelper
 import utils.metahelper as metahelper
+import utils.posterhelper as posterhelper
 
-from PySide6.QtCore     import Signal, QThreadPool, QRunnable, Slot, Qt, QRect
+from PySide6.QtCore     import Signal, QThreadPool, QRunnable, Slot, Qt, QRect, QTimer
 from PySide6.QtGui      import QPixmap, QImage
 from PySide6.QtWidgets  import (
     QDialog, 
@@ -19,7 +25,8 @@ from PySide6.QtWidgets  import (
     QVBoxLayout, 
     QHBoxLayout, 
     QPushButton,
-    QMessageBox
+    QMessageBox,
+    QDialogButtonBox
 )
 
 from ui.ui_about        import Ui_AboutDialog
@@ -27,6 +34,9 @@ from ui.ui_addmedia     import Ui_AddNewMedia
 from ui.ui_addepisode   import Ui_AddNewEpisode
 from ui.ui_bulkupdate   import Ui_BulkUpdateDialog
 from ui.ui_backup       import Ui_BackupDialog
+from ui.ui_dbactivity   import Ui_DBActivityDialog
+from ui.ui_discplanner  import Ui_DiscPlannerDialog
+from ui.ui_enrich       import Ui_EnrichDialog
 from ui.ui_export       import Ui_ExportDialog
 from ui.ui_faqs         import Ui_FAQDialog
 from ui.ui_fetchdetails import Ui_FetchDetailsDialog
@@ -34,10 +44,11 @@ from ui.ui_filters      import Ui_FiltersDialog
 from ui.ui_import       import Ui_ImportDialog
 from ui.ui_preferences  import Ui_PreferencesDialog
 from ui.ui_publish      import Ui_PublishDialog
+from ui.ui_stats        import Ui_StatsDialog
 
 from tablemodel         import TableModel
 
-from utils.common       import getColIndexinTableView, isNumeric, getStatusStyleSheet
+from utils.common       import getColIndexinTableView, isNumeric, getStatusStyleSheet, toISODate, formatSize
 from utils.constants    import (
     MEDIA_TYPE,
     MEDIA_COLUMNS,
@@ -49,8 +60,14 @@ from utils.constants    import (
     FILTER_COLUMNS,
     APP_CONFIG,
     MESSAGE_TYPE,
+    STATS_DIMENSION,
+    STATS_VIEWS,
+    DISC_CAPACITIES,
+    DEFAULT_DISC_PREFIX,
+    ENRICH_STATUS,
     DEFAULT_POSTER,
-    DEFAULT_DB_PATH
+    BACKUP_FOLDER,
+    DB_ACTIVITY_REFRESH
 )
 
 #=======================================================================
@@ -197,26 +214,44 @@ class BulkUpdateDialog(QDialog):
         
         updateMedia():
             Updates the selected media entries based on the user's selections in the dialog.
+
+        saveUpdates(media_ids, updates):
+            Applies the updates to the selected media in a background thread.
+
+        updateComplete(response):
+            Closes the dialog and refreshes the media once the updates are applied.
     """
+    progressChanged = Signal(int)
+    updateFinished  = Signal(bool)
 
     def __init__(self, clsUi=None, parent=None) -> None:
         """
-        Initializes the BulkUpdateDialog.
+        Initializes the BulkUpdateDialog for the movies or the series, depending on the tab shown in the parent.
 
         Parameters:
             clsUi (optional): The UI class for the dialog. Defaults to None.
             parent (QWidget, optional): The parent widget of the dialog. Defaults to None.
         """
         super().__init__(parent)
-        self.parent = parent
-        self.ui     = Ui_BulkUpdateDialog()
+        self.parent     = parent
+        self.ui         = Ui_BulkUpdateDialog()
         self.ui.setupUi(self)
+        self.threadpool = QThreadPool()
+        self.media_type = MEDIA_TYPE.MOVIE if self.parent.ui.tbSummary.currentIndex() == 0 else MEDIA_TYPE.SERIES
+        self.table      = self.parent.ui.tblMovies if self.media_type == MEDIA_TYPE.MOVIE else self.parent.ui.tblSeries
 
         self.setGenreComboBox()
         self.setSourceComboBox()
         self.setEditionComboBox()
         self.setQualityComboBox()
 
+        if self.media_type == MEDIA_TYPE.SERIES:
+            for field in [self.ui.txtBulkCodec, self.ui.cbBulkQuality, self.ui.cbBulkEdition, 
+                          self.ui.chkBulkToBurn, self.ui.txtBulkDisc, self.ui.txtBulkTag]:
+                self.ui.formLayout.setRowVisible(field, False)
+
+        self.progressChanged.connect(self.ui.prgProgress.setValue)
+        self.updateFinished.connect(self.updateComplete)
         self.ui.btnSave.clicked.connect(self.updateMedia)
         self.ui.btnCancel.clicked.connect(self.close)
 
@@ -290,36 +325,34 @@ class BulkUpdateDialog(QDialog):
 
     def updateMedia(self) -> None:
         """
-        Updates the media information for selected movies in the UI table.
+        Updates the media information for the selected movies or series in the UI table.
 
-        This method collects the selected movie IDs from the table and updates their attributes based on the user's input
-        in various UI components. The updates are then applied in bulk to the movie model, and the media view is refreshed.
+        This method collects the selected media IDs from the table and updates their attributes based on the user's input
+        in various UI components. The updates are then applied in bulk in a background thread, reporting the progress,
+        and the media view is refreshed.
 
         Parameters:
         - self: The instance of the class containing this method.
 
         Functionality:
-        - Collects selected movie IDs from the UI table.
+        - Collects selected media IDs from the UI table.
         - Gathers updates from various UI components (checkboxes, text fields, combo boxes).
         - Updates include source ID, video codec, quality ID, edition ID, watched status, burn status, backup disc number,
-        tag, and genre.
-        - Applies the updates to the movie model in bulk.
-        - Refreshes the media view to reflect the changes.
+        tag, and genre. Series only support the source, watched status and genre.
+        - Applies the updates to the model in bulk.
         """
         try:
-            if self.parent.ui.tblMovies.selectionModel():
+            if self.table.selectionModel():
                 updates   = {}
-                movie_ids = set()
-                for selected in self.parent.ui.tblMovies.selectedIndexes():
-                    movie_ids.add(
+                media_ids = set()
+                for selected in self.table.selectedIndexes():
+                    media_ids.add(
                         selected.sibling(
                             selected.row(), 
-                            getColIndexinTableView(self.parent.ui.tblMovies, MEDIA_COLUMNS.ID)
+                            getColIndexinTableView(self.table, MEDIA_COLUMNS.ID)
                         ).data()
                     )
 
-                updates[MEDIA_COLUMNS.ID] = ','.join(movie_ids)
-
                 if self.ui.chkSource.isChecked():
                     updates[MOVIE_COLUMNS.SOURCE_ID]   = self.ui.cbBulkSource.currentData()
 
@@ -347,13 +380,47 @@ class BulkUpdateDialog(QDialog):
                 if self.ui.chkGenre.isChecked():
                     updates[META_COLUMNS.GENRE]        = self.ui.cbBulkGenre.currentData()
 
-            model.bulk_update_movies(updates)
+                self.ui.btnSave.setEnabled(False)
+                self.writeStatus(f'Updating {len(media_ids)} entries...')
+
+                self.worker = Worker(lambda: self.saveUpdates(list(media_ids), updates))
+                self.threadpool.start(self.worker)
+        except Exception as e:
+            self.writeStatus(f'updateMedia: {e}', MESSAGE_TYPE.ERROR)
+
+
+    def saveUpdates(self, media_ids : list, updates : dict) -> None:
+        """
+        Applies the updates to the selected media in a single transaction, reporting the progress.
+
+        Parameters:
+            media_ids (list): The IDs of the selected media.
+            updates (dict): The new value per column name.
+        """
+        def progress(processed : int, total : int) -> None:
+            self.progressChanged.emit(int(processed * 100 / total))
+
+        try:
+            self.updateFinished.emit(model.bulk_update_media(self.media_type, media_ids, updates, progress))
+        except Exception as e:
+            print(f'saveUpdates: {e}')
+            self.updateFinished.emit(False)
+
+
+    def updateComplete(self, response : bool) -> None:
+        """
+        Closes the dialog and refreshes the media once the updates are applied.
 
+        Parameters:
+            response (bool): True if the updates were applied.
+        """
+        if response:
             self.close()
             self.parent.writeStatus('Entries updated successfully...', MESSAGE_TYPE.INFO)
             self.parent.refreshMedia()
-        except Exception as e:
-            self.writeStatus(f'updateMedia: {e}', MESSAGE_TYPE.ERROR)
+        else:
+            self.ui.btnSave.setEnabled(True)
+            self.writeStatus('There was an error updating the entries', MESSAGE_TYPE.ERROR)
 
 
 #=======================================================================
@@ -442,7 +509,8 @@ class ExportDialog(QDialog):
             module     = self.templates.loc[self.templates['Title'] == selected, 'Module'].values[0]
 
             exporter   = importlib.import_module(module)
-            response   = exporter.export(media_type, self.ui.txtDestination.text())
+            response   = exporter.export(media_type, self.ui.txtDestination.text(), delta=True) if self.ui.chkDelta.isChecked() \
+                    else exporter.export(media_type, self.ui.txtDestination.text())
 
             if response:
                 self.close()
@@ -581,6 +649,7 @@ class FetchDetailsDialog(QDialog):
                          else self.parent.ui.tblSeries
         self.selected       = self.tblParent.selectedIndexes()
         self.selectedMedia  = None
+        self.posterContent  = None
 
         self.currentSelectedIndex = 0
 
@@ -710,7 +779,6 @@ class FetchDetailsDialog(QDialog):
         - writeStatus: A method to update the status message in the UI.
         - progressChanged: A signal to emit progress updates.
         """
-        import importlib
         from PySide6.QtWidgets import QHeaderView
 
         try:
@@ -719,7 +787,7 @@ class FetchDetailsDialog(QDialog):
             self.progressChanged.emit(0)
 
             module  = self.templates.loc[self.templates['Source'] == self.ui.cbSearchSource.currentText(), 'Module'].values[0]
-            scraper = importlib.import_module(module)
+            scraper = httphelper.load_template(module)
 
             self.progressChanged.emit(25)
 
@@ -793,15 +861,14 @@ class FetchDetailsDialog(QDialog):
         3. Updates various UI elements with the fetched media details, including title, year, plot, genres, and director.
         4. Loads the media poster image from a URL and updates the UI with the image.
         """
-        import importlib
-
         try:
             self.sendStatus.emit('Fetching details...', MESSAGE_TYPE.INFO)
             self.threadUpdates.emit(True, False, False)
             self.progressChanged.emit(0)
+            self.posterContent = None
 
             module  = self.templates.loc[self.templates['Source'] == self.ui.cbSearchSource.currentText(), 'Module'].values[0]
-            scraper = importlib.import_module(module)
+            scraper = httphelper.load_template(module)
 
             self.selectedMedia = scraper.get_media_details(self.getColumnValue(MEDIA_COLUMNS.ONLINE_ID))
 
@@ -817,8 +884,9 @@ class FetchDetailsDialog(QDialog):
             if poster == None:
                 poster_image = QPixmap(DEFAULT_POSTER)
             else:
+                self.posterContent = httphelper.get_client().get_content(poster)
                 p_image = QImage()
-                p_image.loadFromData(requests.get(poster).content)
+                p_image.loadFromData(self.posterContent)
                 poster_image = QPixmap().fromImage(p_image)
             
             self.ui.lblPoster.setScaledContents(True)
@@ -886,8 +954,6 @@ class FetchDetailsDialog(QDialog):
         5. For series, retrieves and updates episode information.
         6. Updates the media actors in the database.
         """
-        import importlib
-
         try:
             self.sendStatus.emit('Saving...', MESSAGE_TYPE.INFO)
             self.threadUpdates.emit(True, False, False)
@@ -895,7 +961,7 @@ class FetchDetailsDialog(QDialog):
 
             module     = self.templates.loc[self.templates['Source'] == self.ui.cbSearchSource.currentText(), 
                                             'Module'].values[0]
-            scraper    = importlib.import_module(module)
+            scraper    = httphelper.load_template(module)
             online_id  = self.getColumnValue(MEDIA_COLUMNS.ONLINE_ID)            
 
             self.progressChanged.emit(25)
@@ -920,40 +986,15 @@ class FetchDetailsDialog(QDialog):
                     self.selectedMedia[MEDIA_DETAILS.GENRES], 
                     self.selectedMedia[MEDIA_DETAILS.LANGUAGES] )
                 
-                if self.selectedMedia[MEDIA_DETAILS.CONTENT][SERIES_COLUMNS.SEASONS] > 0:
-                    episodes = []
-                    for season in range(1, self.selectedMedia[MEDIA_DETAILS.CONTENT][SERIES_COLUMNS.SEASONS] + 1):
-                        episodes.append(scraper.get_season_episodes(online_id, season))
-
-                    episodes = pd.concat(episodes, ignore_index=True)
-                    episodes[EPISODE_COLUMNS.EPISODE] = episodes[EPISODE_COLUMNS.EPISODE].astype('int64')
-
-                    existing_episodes = model.get_series_episodes(self.media_id)
-                    existing_episodes = existing_episodes[[EPISODE_COLUMNS.ID, 
-                                                        EPISODE_COLUMNS.SEASON, 
-                                                        EPISODE_COLUMNS.EPISODE]]
-
-                    df = episodes.merge( 
-                            existing_episodes, 
-                            how='left', 
-                            on=[EPISODE_COLUMNS.SEASON, EPISODE_COLUMNS.EPISODE] )
-
-                    for _, row in df.iterrows():
-                        if str(row[MEDIA_COLUMNS.ID]) == 'nan':
-                            model.add_new_episode(
-                                row[EPISODE_COLUMNS.SEASON],
-                                row[EPISODE_COLUMNS.EPISODE],
-                                row[MEDIA_COLUMNS.ORIGINAL_TITLE],
-                                row[MEDIA_COLUMNS.PLOT],
-                                row[MEDIA_COLUMNS.RELEASE_DATE],
-                                self.media_id )
-                        else:
-                            episode_details = {}
-                            episode_details[MEDIA_COLUMNS.TITLE]        = row[MEDIA_COLUMNS.ORIGINAL_TITLE]
-                            episode_details[MEDIA_COLUMNS.PLOT]         = row[MEDIA_COLUMNS.PLOT]
-                            episode_details[MEDIA_COLUMNS.ID]           = row[MEDIA_COLUMNS.ID]
-                            episode_details[MEDIA_COLUMNS.RELEASE_DATE] = row[MEDIA_COLUMNS.RELEASE_DATE] 
-                            model.update_episode(episode_details)
+                seasons = self.selectedMedia[MEDIA_DETAILS.CONTENT][SERIES_COLUMNS.SEASONS]
+                if seasons > 0:
+                    if hasattr(scraper, 'get_series_episodes'):
+                        episodes = scraper.get_series_episodes(online_id, seasons)
+                    else:
+                        episodes = pd.concat([scraper.get_season_episodes(online_id, season) 
+                                              for season in range(1, seasons + 1)], ignore_index=True)
+
+                    model.save_series_episodes(self.media_id, episodes)
 
             model.update_media_actors(
                 self.media_type, 
@@ -964,9 +1005,7 @@ class FetchDetailsDialog(QDialog):
             
             poster = self.selectedMedia[MEDIA_DETAILS.CONTENT][MEDIA_COLUMNS.POSTER_URL]
             if poster:
-                poster_path  = f'{metahelper.get_app_config(APP_CONFIG.POSTER_PATH)}/{self.media_type.lower()}/{str(self.media_id)}.jpg'
-                with open(poster_path, 'wb') as f:
-                    f.write(requests.get(poster).content)
+                posterhelper.save_poster(self.media_type, self.media_id, poster, self.posterContent)
 
             self.progressChanged.emit(100)
             self.saveFinished.emit(True)
@@ -1787,6 +1826,10 @@ class FiltersDialog(QDialog):
 
                 index = 0 if FILTER_COLUMNS.TO_BURN not in filters else 1 if filters[FILTER_COLUMNS.TO_BURN] == 1 else 2
                 self.ui.cbToBurn.setCurrentIndex(index)
+
+                self.ui.txtAddedSince.setText(filters[FILTER_COLUMNS.ADDED_SINCE] if FILTER_COLUMNS.ADDED_SINCE in filters else '')
+                self.ui.txtReleasedFrom.setText(filters[FILTER_COLUMNS.RELEASED_FROM] if FILTER_COLUMNS.RELEASED_FROM in filters else '')
+                self.ui.txtReleasedTo.setText(filters[FILTER_COLUMNS.RELEASED_TO] if FILTER_COLUMNS.RELEASED_TO in filters else '')
         except Exception as e:
             self.writeStatus(f'showExistingFilters: {e}', message_type=MESSAGE_TYPE.ERROR)
 
@@ -1807,6 +1850,9 @@ class FiltersDialog(QDialog):
             self.ui.txtActor.setText('')
             self.ui.txtDirector.setText('')
             self.ui.txtDirector.setText('')
+            self.ui.txtAddedSince.setText('')
+            self.ui.txtReleasedFrom.setText('')
+            self.ui.txtReleasedTo.setText('')
         except Exception as e:
             self.writeStatus(f'resetForm: {e}', message_type=MESSAGE_TYPE.ERROR)
 
@@ -1886,6 +1932,16 @@ class FiltersDialog(QDialog):
             if self.ui.cbToBurn.currentIndex() > 0:
                 filters[FILTER_COLUMNS.TO_BURN] = 1 if self.ui.cbToBurn.currentIndex() == 1 else 0
 
+            for filter, txtDate in [(FILTER_COLUMNS.ADDED_SINCE,   self.ui.txtAddedSince),
+                                    (FILTER_COLUMNS.RELEASED_FROM, self.ui.txtReleasedFrom),
+                                    (FILTER_COLUMNS.RELEASED_TO,   self.ui.txtReleasedTo)]:
+                date = toISODate(txtDate.text())
+                if date != '':
+                    if not date[:4].isdigit():
+                        self.writeStatus(f'Invalid date: {txtDate.text()}', MESSAGE_TYPE.ERROR)
+                        return
+                    filters[filter] = date
+
             self.parent.additional_filters = filters
             self.parent.refreshMedia()
             self.close()
@@ -1895,6 +1951,19 @@ class FiltersDialog(QDialog):
 
 #=======================================================================
 class BackupDialog(QDialog):
+    """
+    A dialog class to backup the database to, or restore it from, a local file. Backups are
+    taken online and restores are swapped in atomically by backuphelper, on a worker thread
+    reporting its progress so the UI stays responsive. A folder as location takes a timestamped
+    snapshot into it, keeping the most recent ones only.
+
+    Signals:
+        progressChanged (int): Emitted to update the progress bar value.
+        saveFinished (bool): Emitted once the backup or restore is complete, True if successful.
+    """
+
+    progressChanged = Signal(int)
+    saveFinished    = Signal(bool)
 
     def __init__(self, clsUi=None, parent=None, mode='backup') -> None:
         """
@@ -1910,11 +1979,19 @@ class BackupDialog(QDialog):
         self.ui = Ui_BackupDialog()
         self.ui.setupUi(self)
         self.mode = mode
+        self.threadpool = QThreadPool()
+        self.error      = None
+
+        if self.mode == 'backup':
+            self.ui.txtPath.setText(BACKUP_FOLDER)
 
         self.ui.btnSave.clicked.connect(self.backupRestore)
         self.ui.btnCancel.clicked.connect(self.close)
         self.ui.btnSelect.clicked.connect(self.selectPath)
 
+        self.progressChanged.connect(self.ui.prgProgress.setValue)
+        self.saveFinished.connect(self.backupRestoreComplete)
+
     
     def writeStatus(self, message : str, message_type=MESSAGE_TYPE.INFO) -> None:
         """
@@ -1930,38 +2007,82 @@ class BackupDialog(QDialog):
 
     def backupRestore(self) -> None:
         """
-        Performs a backup or restore operation on the database file based on the current mode.
+        Starts a backup or restore of the database based on the current mode.
 
-        If the mode is 'backup', the method copies the database file from the default path to the path specified in the UI.
-        If the mode is not 'backup', it prompts the user for confirmation before restoring the database from the specified path.
+        In restore mode the user is asked for confirmation first, as the existing database is replaced.
+        The operation itself runs in a background thread, see runBackupRestore.
         """
-        import shutil
-        
+        path = self.ui.txtPath.text().strip()
+
+        if not path:
+            self.writeStatus('Please select a location', MESSAGE_TYPE.ERROR)
+            return
+
+        if self.mode != 'backup':
+            msg_box = QMessageBox(self)
+            msg_box.setWindowTitle('Restore Confirmation')
+            msg_box.setText('Are you sure? This will overwrite the existing database.')
+            msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+            msg_box.setDefaultButton(QMessageBox.No)
+            custom_icon = QPixmap('images/icons/pmm-256.png')
+            msg_box.setIconPixmap(custom_icon)
+            
+            if msg_box.exec() != QMessageBox.Yes:
+                return
+
+        self.ui.btnSave.setEnabled(False)
+        self.writeStatus('Backing up...' if self.mode == 'backup' else 'Restoring...')
+
+        self.worker = Worker(lambda: self.runBackupRestore(path))
+        self.threadpool.start(self.worker)
+
+
+    def runBackupRestore(self, path : str) -> None:
+        """
+        Backs up the database to the given path, a file or a snapshot folder, or restores
+        it from the given backup and upgrades its schema. Runs in a background thread.
+
+        Parameters:
+            path (str): The location of the backup.
+        """
+        def progress(done : int, total : int) -> None:
+            self.progressChanged.emit(int(done * 100 / total) if total else 100)
+
         try:
             if self.mode == 'backup':
-                if os.path.exists(self.ui.txtPath.text().strip()):
-                    os.remove(self.ui.txtPath.text().strip())
-                shutil.copyfile(DEFAULT_DB_PATH, self.ui.txtPath.text().strip())
-                self.parent.writeStatus('Backup successful...')
+                if os.path.isdir(path) or not os.path.splitext(path)[1]:
+                    backuphelper.create_snapshot(path, progress)
+                else:
+                    backuphelper.backup_database(path, progress, backuphelper.get_path_compression(path))
             else:
-                msg_box = QMessageBox(self)
-                msg_box.setWindowTitle('Restore Confirmation')
-                msg_box.setText('Are you sure? This will overwrite the existing database.')
-                msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-                msg_box.setDefaultButton(QMessageBox.No)
-                custom_icon = QPixmap('images/icons/pmm-256.png')
-                msg_box.setIconPixmap(custom_icon)
-                
-                reply = msg_box.exec()
-
-                if reply == QMessageBox.Yes:
-                    shutil.copyfile(self.ui.txtPath.text().strip(), DEFAULT_DB_PATH)
-                    self.parent.refreshMedia()
-                    self.parent.writeStatus('Restore successful...')
+                backuphelper.restore_database(path, progress)
+                dbschema.upgrade_schema()
 
-            self.close()
+            self.saveFinished.emit(True)
         except Exception as e:
-            self.writeStatus(f'backupRestore: {e}', MESSAGE_TYPE.ERROR)
+            self.error = f'backupRestore: {e}'
+            self.saveFinished.emit(False)
+
+
+    def backupRestoreComplete(self, response : bool) -> None:
+        """
+        Closes the dialog once the backup or restore is complete, refreshing the media after a restore.
+
+        Parameters:
+            response (bool): True if the backup or restore was successful.
+        """
+        if not response:
+            self.ui.btnSave.setEnabled(True)
+            self.writeStatus(self.error, MESSAGE_TYPE.ERROR)
+            return
+
+        if self.mode == 'backup':
+            self.parent.writeStatus('Backup successful...')
+        else:
+            self.parent.refreshMedia()
+            self.parent.writeStatus('Restore successful...')
+
+        self.close()
 
 
     def selectPath(self) -> None:
@@ -1974,14 +2095,520 @@ class BackupDialog(QDialog):
         if self.mode == 'backup':
             file_dialog = QFileDialog.getSaveFileName(self, 
                                                       'Save Backup File', 
-                                                      'moviedb.db', 
-                                                      'SQLite Database (*.db)')
+                                                      'moviedb.db.gz', 
+                                                      'Compressed Backup (*.db.gz *.db.zst);;SQLite Database (*.db)')
         else:
             file_dialog = QFileDialog.getOpenFileName(self, 
                                                       'Select Restore File', 
-                                                      '', 
-                                                      'SQLite Database (*.db)')
+                                                      BACKUP_FOLDER, 
+                                                      'SQLite Backup (*.db *.db.gz *.db.zst)')
         
         if file_dialog[0]:
             self.ui.txtPath.setText(file_dialog[0])
 
+
+
+#=======================================================================
+class StatsDialog(QDialog):
+    """
+    A dialog class for displaying the library statistics. All figures are read from the
+    MEDIA_STATS aggregate table, which is kept up to date by database triggers, so the
+    dialog opens instantly regardless of the size of the library.
+
+    Attributes:
+    ui (Ui_StatsDialog): An instance of the Ui_StatsDialog class responsible for setting up the UI components of the dialog.
+    stats (pd.DataFrame): The aggregated statistics as returned by model.get_media_stats.
+    """
+
+    def __init__(self, clsUi=None, parent=None) -> None:
+        """
+        Initializes the StatsDialog with optional UI class and parent widget.
+
+        Parameters:
+        clsUi (optional): A class responsible for the UI setup. Defaults to None.
+        parent (QWidget, optional): The parent widget of this dialog. Defaults to None.
+        """
+        super().__init__(parent)
+        self.ui = Ui_StatsDialog()
+        self.ui.setupUi(self)
+        self.stats = model.get_media_stats()
+
+        self.showSummary()
+
+        self.ui.cbView.addItems(STATS_VIEWS.keys())
+        self.ui.cbView.currentTextChanged.connect(self.showBreakdown)
+        self.showBreakdown(self.ui.cbView.currentText())
+
+
+    def getTotals(self, media_type : str) -> dict:
+        """
+        Returns the overall totals of a media type from the loaded statistics.
+
+        Parameters:
+        media_type (str): The media type (MOVIE, SERIES or EPISODE).
+
+        Returns:
+        dict: COUNT, WATCHED, TO_BURN and SIZE_BYTES of the media type.
+        """
+        totals = self.stats[(self.stats['MEDIA_TYPE'] == media_type) & 
+                            (self.stats['DIMENSION']  == STATS_DIMENSION.TOTAL)]
+        
+        return totals.iloc[0].to_dict() if not totals.empty else { 'COUNT'      : 0, 
+                                                                   'WATCHED'    : 0, 
+                                                                   'TO_BURN'    : 0, 
+                                                                   'SIZE_BYTES' : 0 }
+
+
+    def showSummary(self) -> None:
+        """
+        Displays the overall counts, watched percentage and size of movies, series and episodes.
+        """
+        labels = { MEDIA_TYPE.MOVIE   : self.ui.lblMovies,
+                   MEDIA_TYPE.SERIES  : self.ui.lblSeries,
+                   MEDIA_TYPE.EPISODE : self.ui.lblEpisodes }
+
+        for media_type, label in labels.items():
+            totals  = self.getTotals(media_type)
+            count   = int(totals['COUNT'])
+            watched = (int(totals['WATCHED']) / count * 100) if count else 0
+            summary = f'{count}  |  {watched:.1f}% watched'
+
+            if media_type != MEDIA_TYPE.SERIES:
+                summary += f'  |  {int(totals["TO_BURN"])} to burn  |  {formatSize(totals["SIZE_BYTES"])}'
+
+            label.setText(summary)
+
+
+    def showBreakdown(self, view : str) -> None:
+        """
+        Displays the breakdown of the selected view in the statistics table.
+
+        Parameters:
+        view (str): The name of the breakdown, one of STATS_VIEWS.
+        """
+        try:
+            dimension, media_types = STATS_VIEWS[view]
+
+            data = self.stats[(self.stats['DIMENSION'] == dimension) & 
+                              (self.stats['MEDIA_TYPE'].isin(media_types))]
+            
+            data = data.groupby('NAME', as_index=False, sort=False)[
+                        ['COUNT', 'WATCHED', 'TO_BURN', 'SIZE_BYTES']].sum()
+
+            data['WATCHED %'] = (data['WATCHED'] / data['COUNT'] * 100).round(1)
+            data = data[['NAME', 'COUNT', 'WATCHED', 'WATCHED %', 'TO_BURN', 'SIZE_BYTES']].rename(
+                        columns={ 'SIZE_BYTES' : MEDIA_COLUMNS.SIZE })
+
+            # Genre links only aggregate the number of titles
+            if dimension == STATS_DIMENSION.GENRE:
+                data = data[['NAME', 'COUNT']]
+
+            self.ui.tblStats.setModel(TableModel(data))
+            self.ui.tblStats.resizeColumnsToContents()
+        except Exception as e:
+            print(f'showBreakdown: {e}')
+
+
+#=======================================================================
+class DBActivityDialog(QDialog):
+    """
+    A non modal dialog class for watching the SQL statements run by the application, as recorded
+    by the dbhelper instrumentation: the statistics per statement fingerprint, the most recent
+    statements and the slow queries with their query plan. The dialog only reads the in-memory
+    snapshots, it runs no statement itself, so it can stay open while the UI actions it traces run.
+
+    Attributes:
+    ui (Ui_DBActivityDialog): An instance of the Ui_DBActivityDialog class responsible for setting up the UI components of the dialog.
+    data (pd.DataFrame): The snapshot of the selected view currently displayed.
+    timer (QTimer): The timer refreshing the displayed snapshot.
+    """
+
+    ''' Snapshot getter of each view '''
+    VIEWS        = { 'Statements'   : dbhelper.get_query_stats,
+                     'Recent'       : dbhelper.get_recent_queries,
+                     'Slow Queries' : dbhelper.get_slow_queries }
+
+    ''' Columns only shown in the details of the selected row, and long columns shown last '''
+    HIDDEN_COLS  = ['PLAN']
+    LONG_COLS    = ['FINGERPRINT', 'QUERY']
+
+    def __init__(self, clsUi=None, parent=None) -> None:
+        """
+        Initializes the DBActivityDialog with optional UI class and parent widget.
+
+        Parameters:
+        clsUi (optional): A class responsible for the UI setup. Defaults to None.
+        parent (QWidget, optional): The parent widget of this dialog. Defaults to None.
+        """
+        super().__init__(parent)
+        self.ui   = Ui_DBActivityDialog()
+        self.ui.setupUi(self)
+        self.data = pd.DataFrame()
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(DB_ACTIVITY_REFRESH)
+        self.timer.timeout.connect(self.refresh)
+
+        self.ui.cbView.addItems(self.VIEWS.keys())
+        self.ui.cbView.currentTextChanged.connect(self.refresh)
+        self.ui.chkAutoRefresh.toggled.connect(self.onAutoRefreshToggled)
+        self.ui.buttonBox.button(QDialogButtonBox.StandardButton.Reset).clicked.connect(self.onResetClicked)
+
+        self.refresh()
+        self.onAutoRefreshToggled(self.ui.chkAutoRefresh.isChecked())
+
+
+    def onAutoRefreshToggled(self, checked : bool) -> None:
+        """
+        Starts or stops the periodic refresh of the displayed snapshot.
+
+        Parameters:
+        checked (bool): Whether the view refreshes automatically.
+        """
+        if checked:
+            self.timer.start()
+        else:
+            self.timer.stop()
+
+
+    def onResetClicked(self) -> None:
+        """
+        Clears the recorded statements and refreshes the view.
+        """
+        dbhelper.reset_query_stats()
+        self.ui.txtDetails.clear()
+        self.refresh()
+
+
+    def refresh(self) -> None:
+        """
+        Displays the current snapshot of the selected view, keeping the selected row and the column widths.
+        """
+        try:
+            view      = self.ui.cbView.currentText()
+            data      = self.VIEWS[view]()
+            selection = self.ui.tblActivity.selectionModel()
+            selected  = selection.selectedRows() if selection else []
+            key       = self.getRowKey(selected[0].row()) if selected else None
+            resize    = self.data.empty or list(self.data.columns) != list(data.columns)
+
+            self.data = data.reset_index(drop=True)
+            columns   = [col for col in data.columns if col not in self.HIDDEN_COLS + self.LONG_COLS] \
+                      + [col for col in self.LONG_COLS if col in data.columns]
+
+            self.ui.tblActivity.setModel(TableModel(self.data[columns]))
+            self.ui.tblActivity.selectionModel().selectionChanged.connect(self.showDetails)
+            self.ui.tblActivity.horizontalHeader().setStretchLastSection(True)
+
+            if resize:
+                self.ui.tblActivity.resizeColumnsToContents()
+
+            if key is not None:
+                matches = [row for row in range(len(self.data)) if self.getRowKey(row) == key]
+                if matches:
+                    self.ui.tblActivity.selectRow(matches[0])
+
+            self.showSummary(view)
+        except Exception as e:
+            print(f'refresh: {e}')
+
+
+    def getRowKey(self, row : int) -> tuple:
+        """
+        Returns the values identifying a row of the displayed snapshot across refreshes.
+
+        Parameters:
+        row (int): The row of the displayed snapshot.
+
+        Returns:
+        tuple: The fingerprint or query of the row, with its timestamp for the recent and slow statements.
+        """
+        values = self.data.iloc[row]
+        return tuple(values[col] for col in ['TIMESTAMP'] + self.LONG_COLS if col in self.data.columns)
+
+
+    def showSummary(self, view : str) -> None:
+        """
+        Displays the totals of the selected view.
+
+        Parameters:
+        view (str): The name of the view, one of VIEWS.
+        """
+        if 'COUNT' in self.data.columns:
+            summary = f'{len(self.data)} statements  |  {int(self.data["COUNT"].sum())} runs  |  ' \
+                      f'{self.data["TOTAL_MS"].sum():.1f} ms'
+        else:
+            summary = f'{len(self.data)} {view.lower()}'
+
+        self.ui.lblSummary.setText(summary)
+
+
+    def showDetails(self) -> None:
+        """
+        Displays every value of the selected row, including the full statement and its query plan.
+        """
+        selected = self.ui.tblActivity.selectionModel().selectedRows()
+        if not selected:
+            return
+
+        values  = self.data.iloc[selected[0].row()]
+        details = [f'{col}: {values[col]}' for col in self.data.columns
+                   if col not in self.HIDDEN_COLS + self.LONG_COLS]
+
+        for col in self.LONG_COLS + self.HIDDEN_COLS:
+            if col in self.data.columns:
+                details.append(f'\n{col}:\n{values[col]}')
+
+        self.ui.txtDetails.setPlainText('\n'.join(details))
+
+
+#=======================================================================
+class DiscPlannerDialog(QDialog):
+    """
+    A dialog class for planning the backup discs of all media flagged TO_BURN. The plan is
+    computed for the selected disc capacity and only written to the database on Apply.
+
+    Attributes:
+    ui (Ui_DiscPlannerDialog): An instance of the Ui_DiscPlannerDialog class responsible for setting up the UI components of the dialog.
+    parent (QWidget): The parent widget of the dialog.
+    plan (pd.DataFrame): The current disc plan as returned by dischelper.plan_discs.
+    """
+
+    def __init__(self, clsUi=None, parent=None) -> None:
+        """
+        Initializes the DiscPlannerDialog with optional UI class and parent widget.
+
+        Parameters:
+        clsUi (optional): A class responsible for the UI setup. Defaults to None.
+        parent (QWidget, optional): The parent widget of this dialog. Defaults to None.
+        """
+        super().__init__(parent)
+        self.parent = parent
+        self.ui = Ui_DiscPlannerDialog()
+        self.ui.setupUi(self)
+        self.plan = None
+
+        self.ui.cbCapacity.addItems(DISC_CAPACITIES.keys())
+        self.ui.txtPrefix.setText(DEFAULT_DISC_PREFIX)
+
+        self.ui.btnPlan.clicked.connect(self.planDiscs)
+        self.ui.btnSave.clicked.connect(self.applyPlan)
+        self.ui.btnCancel.clicked.connect(self.close)
+
+
+    def writeStatus(self, message : str, message_type=MESSAGE_TYPE.INFO) -> None:
+        """
+        Updates the status label with a given message and style.
+        
+        Parameters:
+            message (str): The status message to display.
+            message_type (str, optional): The type of message (MESSAGE_TYPE.INFO or MESSAGE_TYPE.ERROR) to determine the style.
+        """
+        self.ui.lblStatus.setStyleSheet(getStatusStyleSheet(message_type))
+        self.ui.lblStatus.setText(message)
+
+
+    def planDiscs(self) -> None:
+        """
+        Packs all the media flagged TO_BURN onto discs of the selected capacity and
+        lists the planned discs with their contents and free space.
+        """
+        try:
+            capacity  = DISC_CAPACITIES[self.ui.cbCapacity.currentText()]
+            prefix    = self.ui.txtPrefix.text().strip() or DEFAULT_DISC_PREFIX
+
+            self.plan = dischelper.plan_discs(capacity, prefix)
+            summary   = dischelper.get_plan_summary(self.plan, capacity)
+
+            self.ui.tblDiscs.setModel(TableModel(summary, formatters={ 'FREE' : formatSize }))
+            self.ui.tblDiscs.resizeColumnsToContents()
+            self.ui.btnSave.setEnabled(not summary.empty)
+
+            unplaced = self.plan['BACKUP_DISC'].isna().to_numpy()
+            unsized  = int((unplaced & ~dischelper.get_sized_items(self.plan)).sum())
+            oversize = int(unplaced.sum()) - unsized
+            message  = f'{len(self.plan) - int(unplaced.sum())} items on {len(summary)} discs'
+
+            if oversize:
+                message += f', {oversize} larger than a disc'
+            if unsized:
+                message += f', {unsized} without a size'
+
+            self.writeStatus(message, MESSAGE_TYPE.WARNING if unplaced.any() else MESSAGE_TYPE.INFO)
+        except Exception as e:
+            self.writeStatus(f'planDiscs: {e}', MESSAGE_TYPE.ERROR)
+
+
+    def applyPlan(self) -> None:
+        """
+        Saves the planned backup discs of all the items and refreshes the media list.
+        """
+        try:
+            if dischelper.apply_plan(self.plan):
+                self.parent.refreshMedia()
+                self.parent.writeStatus('Backup discs assigned...')
+                self.close()
+            else:
+                self.writeStatus('Backup discs could not be assigned', MESSAGE_TYPE.ERROR)
+        except Exception as e:
+            self.writeStatus(f'applyPlan: {e}', MESSAGE_TYPE.ERROR)
+
+
+#=======================================================================
+class EnrichDialog(QDialog):
+    """
+    A dialog class for enriching the whole library unattended from a lookup source. All the movies and
+    series without lookup details are queued and looked up in the background, the queue being persisted
+    so a stopped run resumes where it left off.
+
+    Signals:
+        progressChanged (int): Emitted to update the progress bar with the current progress percentage.
+        sendStatus (str, str): Emitted to display a status message with its message type.
+        runFinished (bool): Emitted when the run is finished, indicating whether it completed or was stopped.
+
+    Attributes:
+    ui (Ui_EnrichDialog): An instance of the Ui_EnrichDialog class responsible for setting up the UI components of the dialog.
+    parent (QWidget): The parent widget of the dialog.
+    templates (pd.DataFrame): The registered lookup templates.
+    cancelled (bool): Set when the user stops the run, checked by the lookup workers.
+    """
+    progressChanged = Signal(int)
+    sendStatus      = Signal(str, str)
+    runFinished     = Signal(bool)
+
+    def __init__(self, clsUi=None, parent=None) -> None:
+        """
+        Initializes the EnrichDialog with optional UI class and parent widget.
+
+        Parameters:
+        clsUi (optional): A class responsible for the UI setup. Defaults to None.
+        parent (QWidget, optional): The parent widget of this dialog. Defaults to None.
+        """
+        super().__init__(parent)
+        self.parent = parent
+        self.ui = Ui_EnrichDialog()
+        self.ui.setupUi(self)
+
+        self.templates  = metahelper.get_templates(APP_CONFIG.LOOKUP_TEMPLATES)
+        self.threadpool = QThreadPool()
+        self.cancelled  = False
+
+        self.ui.cbSource.addItems(self.templates['Source'].tolist())
+        self.ui.cbStatus.addItems([ENRICH_STATUS.FAILED, ENRICH_STATUS.NOT_FOUND, ENRICH_STATUS.DONE, ENRICH_STATUS.PENDING])
+
+        self.ui.btnStart.clicked.connect(self.startEnrichment)
+        self.ui.btnStop.clicked.connect(self.stopEnrichment)
+        self.ui.cbStatus.currentIndexChanged.connect(self.showItems)
+
+        self.progressChanged.connect(self.ui.prgProgress.setValue)
+        self.sendStatus.connect(self.writeStatus)
+        self.runFinished.connect(self.enrichmentComplete)
+
+        self.showQueue()
+
+
+    def writeStatus(self, message : str, message_type=MESSAGE_TYPE.INFO) -> None:
+        """
+        Updates the status label with a given message and style.
+        
+        Parameters:
+            message (str): The status message to display.
+            message_type (str, optional): The type of message (MESSAGE_TYPE.INFO or MESSAGE_TYPE.ERROR) to determine the style.
+        """
+        self.ui.lblStatus.setStyleSheet(getStatusStyleSheet(message_type))
+        self.ui.lblStatus.setText(message)
+
+
+    def showQueue(self) -> None:
+        """
+        Displays the queue summary per status and the items of the selected status.
+        """
+        try:
+            self.ui.tblSummary.setModel(TableModel(enrichhelper.get_queue_summary()))
+            self.ui.tblSummary.resizeColumnsToContents()
+            self.showItems()
+        except Exception as e:
+            self.writeStatus(f'showQueue: {e}', MESSAGE_TYPE.ERROR)
+
+
+    def showItems(self) -> None:
+        """
+        Displays the queued items with the selected status.
+        """
+        try:
+            items = enrichhelper.get_queue_items([self.ui.cbStatus.currentText()])
+            self.ui.tblItems.setModel(TableModel(items.drop(columns=['ID', 'MEDIA_ID'])))
+            self.ui.tblItems.resizeColumnsToContents()
+        except Exception as e:
+            self.writeStatus(f'showItems: {e}', MESSAGE_TYPE.ERROR)
+
+
+    def startEnrichment(self) -> None:
+        """
+        Starts processing the queue of the selected lookup source in a background thread.
+        """
+        self.cancelled = False
+        self.ui.btnStart.setEnabled(False)
+        self.ui.btnStop.setEnabled(True)
+        self.ui.cbSource.setEnabled(False)
+        self.ui.prgProgress.setValue(0)
+        self.writeStatus('Queueing titles...')
+
+        self.worker = Worker(self.runEnrichment)
+        self.threadpool.start(self.worker)
+
+
+    def stopEnrichment(self) -> None:
+        """
+        Stops the run once the lookups in progress are saved. The remaining items stay queued.
+        """
+        self.cancelled = True
+        self.ui.btnStop.setEnabled(False)
+        self.writeStatus('Stopping...', MESSAGE_TYPE.WARNING)
+
+
+    def runEnrichment(self) -> None:
+        """
+        Processes the queue of the selected lookup source, reporting the progress and throughput after every saved batch.
+        """
+        def progress(processed : int, total : int, report : dict) -> None:
+            self.progressChanged.emit(int(processed * 100 / total) if total else 100)
+            self.sendStatus.emit(enrichhelper.format_report(report), MESSAGE_TYPE.INFO)
+
+        try:
+            source = self.ui.cbSource.currentText()
+            module = self.templates.loc[self.templates['Source'] == source, 'Module'].values[0]
+            report = enrichhelper.run_queue(module, source, progress=progress, cancelled=lambda: self.cancelled)
+
+            self.sendStatus.emit(enrichhelper.format_report(report), 
+                                 MESSAGE_TYPE.WARNING if report[ENRICH_STATUS.FAILED] else MESSAGE_TYPE.INFO)
+            self.runFinished.emit(not self.cancelled)
+        except Exception as e:
+            self.sendStatus.emit(f'runEnrichment: {e}', MESSAGE_TYPE.ERROR)
+            self.runFinished.emit(False)
+
+
+    def enrichmentComplete(self, isComplete : bool) -> None:
+        """
+        Restores the controls after a run, refreshes the queue and the media list.
+
+        Parameters:
+        isComplete (bool): True if the queue was drained, False if the run was stopped or failed.
+        """
+        self.ui.btnStart.setEnabled(True)
+        self.ui.btnStop.setEnabled(False)
+        self.ui.cbSource.setEnabled(True)
+
+        if isComplete:
+            self.progressChanged.emit(100)
+
+        self.showQueue()
+        self.parent.refreshMedia()
+
+
+    def reject(self) -> None:
+        """
+        Stops a run in progress when the dialog is closed.
+        """
+        self.cancelled = True
+        super().reject()
@@ -3,6 +3,8 @@
 # Entry point for the application
 #=======================================================================
 import sys
+import utils.dbhelper as dbhelper
+import utils.dbschema as dbschema
 
 from PySide6.QtGui     import QIcon, QPixmap
 from PySide6.QtCore    import QSize, Qt, QTimer, QThread, Signal
@@ -52,6 +54,10 @@ if __name__ == "__main__":
     splash.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
     splash.show()
 
+    dbschema.upgrade_schema()
+    dbhelper.start_checkpoint_scheduler()
+    app.aboutToQuit.connect(dbhelper.stop_checkpoint_scheduler)
+
     widget = MainWindow()
 
     thread = InitializationThread()
@@ -4,13 +4,14 @@
 #=======================================================================
 import model
 import utils.metahelper as metahelper
+import utils.posterhelper as posterhelper
 
 from tablemodel        import TableModel
 from ui.ui_form        import Ui_MainWindow
-from utils.common      import getColIndexinTableView, getStatusStyleSheet
+from utils.common      import getColIndexinTableView, getSourceModel, getStatusStyleSheet, formatSize, formatRuntime
 
 from PySide6.QtGui     import QPixmap
-from PySide6.QtCore    import Qt, QSortFilterProxyModel
+from PySide6.QtCore    import Qt
 from PySide6.QtWidgets import QMainWindow, QMessageBox, QHeaderView, QLabel, QFileDialog
 
 from dialogs import (
@@ -19,6 +20,9 @@ from dialogs import (
     AddNewMediaDialog,
     BackupDialog,
     BulkUpdateDialog,
+    DBActivityDialog,
+    DiscPlannerDialog,
+    EnrichDialog,
     ExportDialog,
     FAQsDialog,
     FetchDetailsDialog,
@@ -26,7 +30,8 @@ from dialogs import (
     ImagePopup,
     ImportDialog,
     PreferencesDialog,
-    PublishDialog
+    PublishDialog,
+    StatsDialog
 )
 
 from utils.constants import (
@@ -38,7 +43,6 @@ from utils.constants import (
     SERIES_COLUMNS,
     EPISODE_COLUMNS,
     FILTER_COLUMNS,
-    APP_CONFIG,
     MESSAGE_TYPE,
     MOVIE_SUMMARY_DISPLAY_COLS,
     MOVIE_CUSTOM_COL_WIDTHS,
@@ -176,6 +180,7 @@ class MainWindow(QMainWindow):
         self.ui.actionAbout.triggered.connect(self.onAboutDialogTriggered)
         self.ui.actionAddNew.triggered.connect(self.onAddNewMediaTriggered)
         self.ui.actionBulkUpdate.triggered.connect(self.onBulkUpdateTriggered)
+        self.ui.actionDBActivity.triggered.connect(self.onDBActivityTriggered)
         self.ui.actionDelete.triggered.connect(self.onDeleteTriggered)
         self.ui.actionExportData.triggered.connect(self.onExportTriggered)
         self.ui.actionFAQs.triggered.connect(self.onFAQsTriggered)
@@ -186,6 +191,9 @@ class MainWindow(QMainWindow):
         self.ui.actionUpdate.triggered.connect(self.updateMediaTriggered)
         self.ui.actionBackup.triggered.connect(self.onBackupTriggered)
         self.ui.actionRestore.triggered.connect(self.onRestoreTriggered)
+        self.ui.actionStats.triggered.connect(self.onStatsTriggered)
+        self.ui.actionDiscPlanner.triggered.connect(self.onDiscPlannerTriggered)
+        self.ui.actionEnrich.triggered.connect(self.onEnrichTriggered)
 
 
     def setupFilters(self) -> None:
@@ -244,8 +252,9 @@ class MainWindow(QMainWindow):
         self.ui.txtSeasons.setVisible(False)
         self.ui.btnAddNewEpisode.clicked.connect(self.onAddNewEpisodeTriggered)
         self.ui.btnDeleteEpisode.clicked.connect(self.onDeleteEpisodeTriggered)
-        self.ui.btnWatched.clicked.connect(self.onWatchedEpisodeTriggered)
+        self.ui.btnWatched.clicked.connect(lambda: self.onWatchedEpisodeTriggered(1))
         self.ui.btnNotWatched.clicked.connect(self.onNotWatchedEpisodeTriggered)
+        self.ui.chkWatchedSeason.clicked.connect(self.onWatchedSeasonTriggered)
 
 
     def writeStatus(self, message : str, message_type=MESSAGE_TYPE.INFO) -> None:
@@ -270,15 +279,25 @@ class MainWindow(QMainWindow):
     
     def writeStats(self, visible : int, total : int, media_type=MEDIA_TYPE.MOVIE) -> None:
         '''
-        Updates the statistics label with the number of visible and total media items.
+        Updates the statistics label with the number of visible and total media items, along with
+        the total size and average runtime aggregated in SQL.
 
         Parameters:
         visible (int): The number of media items currently visible.
         total (int): The total number of media items.
         media_type (MEDIA_TYPE, optional): The type of media, default is MEDIA_TYPE.MOVIE.
         '''
-        media = media_type.title() + ('s' if media_type == MEDIA_TYPE.MOVIE else '')
-        self.lblStats.setText(f'              Showing {visible}/{total} {media}')
+        media  = media_type.title() + ('s' if media_type == MEDIA_TYPE.MOVIE else '')
+        totals = model.get_media_totals(media_type)
+        stats  = f'              Showing {visible}/{total} {media}'
+
+        if totals.get(MEDIA_COLUMNS.SIZE_BYTES):
+            stats += f'  |  {formatSize(totals[MEDIA_COLUMNS.SIZE_BYTES])}'
+
+        if totals.get(MOVIE_COLUMNS.AVG_RUNTIME_MINUTES):
+            stats += f'  |  Avg. Runtime {formatRuntime(totals[MOVIE_COLUMNS.AVG_RUNTIME_MINUTES])}'
+
+        self.lblStats.setText(stats)
 
 
     def setGenreComboBoxes(self) -> None:
@@ -432,10 +451,7 @@ class MainWindow(QMainWindow):
             df, total    = model.get_media(MEDIA_TYPE.MOVIE, self.get_filters())
             tableModel   = TableModel(df)
 
-            proxy_model = QSortFilterProxyModel()
-            proxy_model.setSourceModel(tableModel)
-
-            self.ui.tblMovies.setModel(proxy_model)
+            self.ui.tblMovies.setModel(tableModel)
             self.ui.tblMovies.setSortingEnabled(True)
             self.ui.tblMovies.verticalHeader().hide()
             
@@ -486,10 +502,7 @@ class MainWindow(QMainWindow):
 
             df, total    = model.get_media(MEDIA_TYPE.SERIES, self.get_filters(True))
             tableModel   = TableModel(df, MEDIA_TYPE.SERIES)
-            proxy_model  = QSortFilterProxyModel()
-            proxy_model.setSourceModel(tableModel)
-
-            self.ui.tblSeries.setModel(proxy_model)
+            self.ui.tblSeries.setModel(tableModel)
             self.ui.tblSeries.setSortingEnabled(True)
             self.ui.tblSeries.verticalHeader().hide()
             
@@ -533,7 +546,7 @@ class MainWindow(QMainWindow):
 
         try:
             details      = data[MEDIA_DETAILS.CONTENT]
-            poster_path  = f'{metahelper.get_app_config(APP_CONFIG.POSTER_PATH)}/{media_type.lower()}/{str(details[MEDIA_COLUMNS.ID][0])}.jpg'
+            poster_path  = posterhelper.get_poster_path(media_type, details[MEDIA_COLUMNS.ID][0])
             self.current_poster = poster_path if os.path.isfile(poster_path) else DEFAULT_POSTER
             
             self.ui.lblPoster.setPixmap(QPixmap(self.current_poster))
@@ -657,10 +670,7 @@ class MainWindow(QMainWindow):
             h_scroll_pos = self.ui.tblEpisodes.horizontalScrollBar().value()
 
             tableModel   = TableModel(data)
-            proxy_model  = QSortFilterProxyModel()
-            proxy_model.setSourceModel(tableModel)
-
-            self.ui.tblEpisodes.setModel(proxy_model)
+            self.ui.tblEpisodes.setModel(tableModel)
             self.ui.tblEpisodes.setSortingEnabled(True)
             self.ui.tblEpisodes.verticalHeader().hide()
 
@@ -918,7 +928,6 @@ class MainWindow(QMainWindow):
             self.ui.lblRuntime.setVisible(i == 0)
             self.ui.txtRuntime.setVisible(i == 0)
             self.ui.cbSource.setEnabled(i == 0)
-            self.ui.actionBulkUpdate.setEnabled(i == 0)
 
             self.ui.tabWidget.setTabVisible(2, i == 1)
             self.ui.lblSeasons.setVisible(i == 1)
@@ -1124,6 +1133,15 @@ class MainWindow(QMainWindow):
         widget.open()
 
 
+    def onDBActivityTriggered(self) -> None:
+        '''
+        Displays the DB Activity Dialog Box, non modal so the UI actions it traces can run
+        '''
+        widget = DBActivityDialog(parent=self)
+        widget.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        widget.show()
+
+
     def onFAQsTriggered(self) -> None:
         '''
         Displays the FAQs Dialog Box
@@ -1164,6 +1182,30 @@ class MainWindow(QMainWindow):
         widget.open()
 
 
+    def onDiscPlannerTriggered(self) -> None:
+        '''
+        Displays the Disc Planner Dialog Box
+        '''
+        widget = DiscPlannerDialog(parent=self)
+        widget.open()
+
+
+    def onEnrichTriggered(self) -> None:
+        '''
+        Displays the Batch Enrichment Dialog Box
+        '''
+        widget = EnrichDialog(parent=self)
+        widget.open()
+
+
+    def onStatsTriggered(self) -> None:
+        '''
+        Displays the Statistics Dialog Box
+        '''
+        widget = StatsDialog(parent=self)
+        widget.open()
+
+
     def getMovieUpdatedDetails(self, movie_id : int) -> dict:
         """
         Retrieves updated movie details from the user interface and returns them as a dictionary.
@@ -1447,48 +1489,29 @@ class MainWindow(QMainWindow):
     def onWatchedEpisodeTriggered(self, value=1) -> None:
         """
         Sets the selected episode(s) as watched or not watched based on the value parameter.
+        The episodes are updated in a single statement and only their rows are refreshed.
 
         Parameters:
             value (int): 1 for watched, 0 for not watched. Defaults to 1.
         """
         try:
-            curr_idx = self.ui.tblEpisodes.selectionModel().currentIndex().row() \
-                    if self.ui.tblEpisodes.selectionModel() and self.ui.tblEpisodes.selectionModel().currentIndex() \
-                  else 0
-
             episode_ids = set()
             for selected in self.ui.tblEpisodes.selectedIndexes():
                 episode_ids.add(
-                    selected.sibling(
+                    int(selected.sibling(
                         selected.row(), 
                         getColIndexinTableView(self.ui.tblEpisodes, MEDIA_COLUMNS.ID)
-                    ).data()
+                    ).data())
                 )
                 
             if len(episode_ids) > 0:
-                for episode in episode_ids:
-                    model.update_episode(episode_details={
-                        MEDIA_COLUMNS.ID      : episode,
-                        MEDIA_COLUMNS.WATCHED : value
-                    })
-
-                self.displaySeriesDetails()
-                if self.ui.chkWatchedSeason.isChecked():
-                    index    = self.ui.tblSeries.selectionModel().currentIndex()
-                    media_id = index.sibling(index.row(), 
-                                             getColIndexinTableView(self.ui.tblSeries, MEDIA_COLUMNS.ID)).data()
-                    model.update_series(
-                        series_details  = {
-                            MEDIA_COLUMNS.ID      : media_id,
-                            MEDIA_COLUMNS.WATCHED : 1
-                        },
-                        lookup_details  = None,
-                        episode_details = None,
-                        genres          = None,
-                        languages       = None)
-                    self.displaySeries()
+                if model.update_episode_state(self.getSelectedSeriesId(), 
+                                              {MEDIA_COLUMNS.WATCHED : value}, 
+                                              episode_ids=list(episode_ids)):
+                    self.refreshEpisodeState({MEDIA_COLUMNS.WATCHED : bool(value)}, episode_ids)
+                else:
+                    self.writeStatus('There was an error updating the episode(s)', MESSAGE_TYPE.ERROR)
 
-                self.ui.tblEpisodes.selectRow(curr_idx)
                 self.ui.tblEpisodes.setFocus()
             else:   
                 self.writeStatus('No episode(s) selected!', MESSAGE_TYPE.WARNING)
@@ -1496,6 +1519,61 @@ class MainWindow(QMainWindow):
             self.writeStatus(f'onWatchedEpisode: {e}', MESSAGE_TYPE.ERROR)
 
 
+    def onWatchedSeasonTriggered(self, checked : bool) -> None:
+        """
+        Sets all the episodes of the season shown, or of the whole series if all seasons 
+        are shown, as watched or not watched.
+
+        Parameters:
+            checked (bool): The state of the Watched Season checkbox.
+        """
+        try:
+            season = None if self.ui.cbSeason.currentIndex() <= 0 else self.ui.cbSeason.currentText()
+
+            if model.update_episode_state(self.getSelectedSeriesId(), 
+                                          {MEDIA_COLUMNS.WATCHED : int(checked)}, 
+                                          season=season):
+                self.refreshEpisodeState({MEDIA_COLUMNS.WATCHED : checked})
+            else:
+                self.writeStatus('There was an error updating the episode(s)', MESSAGE_TYPE.ERROR)
+        except Exception as e:
+            self.writeStatus(f'onWatchedSeason: {e}', MESSAGE_TYPE.ERROR)
+
+
+    def getSelectedSeriesId(self) -> int:
+        """
+        Returns the ID of the series selected in the series table.
+        """
+        index = self.ui.tblSeries.selectionModel().currentIndex()
+        return int(index.sibling(index.row(), 
+                                 getColIndexinTableView(self.ui.tblSeries, MEDIA_COLUMNS.ID)).data())
+
+
+    def refreshEpisodeState(self, values : dict, episode_ids : set = None) -> None:
+        """
+        Applies new episode values to the rows of the episode table in place, instead of reloading
+        the series, then refreshes the episode shown, the Watched Season checkbox and the watched state
+        of the series in the series table: watched once all the episodes are watched, not watched as
+        soon as one of them is not.
+
+        Parameters:
+            values (dict): The new value per column name.
+            episode_ids (set, optional): The IDs of the updated episodes. Defaults to all the episodes shown.
+        """
+        episodes = getSourceModel(self.ui.tblEpisodes)
+        episodes.updateRows(values, MEDIA_COLUMNS.ID if episode_ids else None, episode_ids)
+
+        watched  = bool(episodes.getData()[MEDIA_COLUMNS.WATCHED].all())
+        self.ui.chkWatchedSeason.setChecked(watched)
+
+        if MEDIA_COLUMNS.WATCHED in values and (not watched or self.ui.cbSeason.currentIndex() <= 0):
+            getSourceModel(self.ui.tblSeries).updateRows({MEDIA_COLUMNS.WATCHED : watched}, 
+                                                         MEDIA_COLUMNS.ID, [self.getSelectedSeriesId()])
+
+        if self.ui.tblEpisodes.selectionModel().currentIndex().isValid():
+            self.displayEpisodeDetails()
+
+
     def onNotWatchedEpisodeTriggered(self) -> None:
         '''
         Sets the selected episode(s) as not watched
@@ -5,23 +5,41 @@
 import pandas as pd
 import utils.dbqueries as dbqueries
 import utils.metahelper as metahelper
+import utils.posterhelper as posterhelper
 
-from datetime          import datetime
-from utils.dbhelper    import execute_read, execute_query
-from utils.common      import isNumeric
+from utils.dbhelper    import execute_read, execute_query, execute_many, execute_insert, execute_insert_many, execute_bulk
+from utils.common      import isNumeric, getTimestamp, toISODate, parseSize, parseRuntime
 from utils.constants   import (
     MEDIA_TYPE, 
     MEDIA_DETAILS,
     MEDIA_COLUMNS,
+    MOVIE_COLUMNS,
     SERIES_COLUMNS,
     FILTER_COLUMNS,
     EPISODE_COLUMNS,
     META_COLUMNS,
-    APP_CONFIG,
     MEDIA_BOOLEAN_COLUMNS,
     MEDIA_FILTER_COLUMNS
 )
 
+#=======================================================================
+''' Table, columns open to bulk updates and genre query per media type, see bulk_update_media '''
+BULK_COLUMNS = {
+    MEDIA_TYPE.MOVIE   : ('MOVIES',
+                          [MOVIE_COLUMNS.SOURCE_ID, MOVIE_COLUMNS.VIDEO_CODEC, MEDIA_COLUMNS.QUALITY_ID, MOVIE_COLUMNS.EDITION_ID,
+                           MEDIA_COLUMNS.WATCHED, MEDIA_COLUMNS.TO_BURN, MEDIA_COLUMNS.BACKUP_DISC, MEDIA_COLUMNS.TAG],
+                          dbqueries.QUERY_BULK_ADD_MOVIE_GENRE),
+    MEDIA_TYPE.SERIES  : ('TV_SERIES',
+                          [MOVIE_COLUMNS.SOURCE_ID, MEDIA_COLUMNS.WATCHED],
+                          dbqueries.QUERY_BULK_ADD_SERIES_GENRE),
+    MEDIA_TYPE.EPISODE : ('TV_SERIES_EPISODES',
+                          [MEDIA_COLUMNS.QUALITY_ID, MEDIA_COLUMNS.WATCHED, MEDIA_COLUMNS.TO_BURN, MEDIA_COLUMNS.BACKUP_DISC, MEDIA_COLUMNS.TAG],
+                          None)
+}
+
+''' Episode columns that can be set for a list of episodes, a season or a series, see update_episode_state '''
+EPISODE_STATE_COLUMNS = [MEDIA_COLUMNS.WATCHED, MEDIA_COLUMNS.TO_BURN, MEDIA_COLUMNS.BACKUP_DISC]
+
 #=======================================================================
 def convert_bool_cols(media : pd.DataFrame) -> pd.DataFrame:
     """
@@ -54,6 +72,38 @@ def get_media_count(media_type : MEDIA_TYPE) -> int:
       else execute_read(dbqueries.QUERY_GET_TOTAL_SERIES_COUNT)['COUNT'][0]
 
 
+def get_media_totals(media_type : MEDIA_TYPE) -> dict:
+    """
+    Returns the SQL aggregated totals for the specified media type, without loading
+    the individual media rows.
+
+    Parameters:
+    media_type (MEDIA_TYPE): The type of media (MOVIE or SERIES).
+
+    Returns:
+    dict: COUNT and SIZE_BYTES, plus RUNTIME_MINUTES and AVG_RUNTIME_MINUTES for movies or 
+          AVG_SIZE_BYTES for series. Counts and sizes of series are based on their episodes.
+    """
+    query  = dbqueries.QUERY_GET_MOVIE_TOTALS if media_type == MEDIA_TYPE.MOVIE \
+        else dbqueries.QUERY_GET_SERIES_TOTALS
+    
+    totals = execute_read(query)
+    return totals.iloc[0].to_dict() if not totals.empty else {}
+
+
+def get_media_stats() -> pd.DataFrame:
+    """
+    Retrieves the library statistics from the MEDIA_STATS aggregate table. The aggregates are
+    maintained by triggers on every insert, update and delete, so reading them does not depend
+    on the size of the library.
+
+    Returns:
+    pd.DataFrame: One row per media type, dimension and key with the resolved display NAME,
+                  the COUNT of media and the WATCHED, TO_BURN and SIZE_BYTES totals.
+    """
+    return execute_read(dbqueries.QUERY_GET_MEDIA_STATS)
+
+
 def get_media(media_type : MEDIA_TYPE, filters : dict) -> tuple:
     """
     Retrieves media information based on the specified media type and filters.
@@ -78,6 +128,11 @@ def get_media(media_type : MEDIA_TYPE, filters : dict) -> tuple:
             MEDIA_TYPE.SERIES : dbqueries.QUERY_FILTER_SERIES_LANGUAGE
         }
     }
+    date_query_mapping = {
+        FILTER_COLUMNS.ADDED_SINCE   : dbqueries.QUERY_FILTER_ADDED_SINCE,
+        FILTER_COLUMNS.RELEASED_FROM : dbqueries.QUERY_FILTER_RELEASED_FROM,
+        FILTER_COLUMNS.RELEASED_TO   : dbqueries.QUERY_FILTER_RELEASED_TO
+    }
     where_clause = ''
 
     for filter in filters:
@@ -97,6 +152,10 @@ def get_media(media_type : MEDIA_TYPE, filters : dict) -> tuple:
         elif filter == FILTER_COLUMNS.TO_BURN:
             where_clause += '{} = {}'.format(MEDIA_FILTER_COLUMNS[media_type][filter], filters[filter])
 
+        elif filter in date_query_mapping:
+            where_clause += date_query_mapping[filter].format(column=MEDIA_FILTER_COLUMNS[media_type][filter], 
+                                                              date=filters[filter])
+
         else:
             where_clause += '{} = "{}"'.format(MEDIA_FILTER_COLUMNS[media_type][filter], filters[filter])
 
@@ -161,7 +220,7 @@ def get_series_episodes(series_id : int, season=None) -> pd.DataFrame:
 
     Returns:
     DataFrame: A list of episodes for the specified series and season, with boolean columns converted 
-          appropriately.
+          appropriately. SEASON and EPISODE are kept as integers, the table model pads them for display.
     """
     if season and season != 'All Seasons':
         where_clause = ' AND t.SEASON = {}'.format(season)
@@ -170,13 +229,7 @@ def get_series_episodes(series_id : int, season=None) -> pd.DataFrame:
 
     query = dbqueries.QUERY_GET_SERIES_EPISODES.format(id=series_id, where_clause=where_clause)
 
-    df_episodes = convert_bool_cols(execute_read(query))
-
-    for col in [EPISODE_COLUMNS.EPISODE, EPISODE_COLUMNS.SEASON]:
-        df_episodes[col] = df_episodes[col].astype(str)
-        df_episodes[col] = df_episodes[col].apply(lambda x: f'0{x}' if len(x) == 1 else x)
-
-    return df_episodes
+    return convert_bool_cols(execute_read(query))
 
 
 def get_episode_details(episode_id : int) -> pd.DataFrame:
@@ -209,48 +262,67 @@ def get_discs(media_type : MEDIA_TYPE) -> pd.DataFrame:
     return execute_read(query)
 
 
+def get_disc_sizes() -> pd.DataFrame:
+    """
+    Retrieves the number of items and the total size in bytes stored on each backup disc,
+    across movies and episodes.
+
+    Returns:
+    DataFrame: BACKUP_DISC, COUNT and SIZE_BYTES per disc.
+    """
+    return execute_read(dbqueries.QUERY_GET_DISC_SIZES)
+
+
 def create_new_media(**kwargs) -> int:
     """
     Creates a new media entry in the database using the provided keyword arguments.
 
     Parameters:
     - kwargs (dict): A dictionary of keyword arguments that includes:
-        - 'query' (str): The SQL query template for inserting a new media entry.
+        - 'query' (str): The parameterized SQL query for inserting a new media entry.
         - 'season' (str/int): The season number of the media, if applicable.
         - 'episode' (str/int): The episode number of the media, if applicable.
         - 'title' (str): The title of the media.
         - 'parent_id' (str/int, optional): The ID of the parent media, if applicable.
         - 'plot' (str): The plot description of the media.
         - 'release' (str): The release date of the media.
-        - 'max_query' (str): The SQL query to retrieve the maximum ID of the media entries.
 
     Returns:
     - int: The ID of the newly created media entry if successful, otherwise -1.
 
-    The function formats the SQL query with the provided arguments and executes it.
-    If the query execution is successful, it retrieves and returns the new media ID.
-    If the query execution fails, it returns -1.
-    """
-    timestamp = datetime.now().strftime('%d-%m-%Y %H:%M:%S')
-    query     = kwargs['query'].format( kwargs['season'],
-                                        kwargs['episode'],
-                                        kwargs['title'], 
-                                        kwargs['parent_id'],
-                                        kwargs['plot'], 
-                                        kwargs['release'],
-                                        timestamp, 
-                                        timestamp ) \
+    The ID is the rowid reported by the inserting statement itself, so it is not affected
+    by rows inserted concurrently by other writers.
+    """
+    timestamp = getTimestamp()
+    params    = ( kwargs['season'],
+                  kwargs['episode'],
+                  kwargs['title'], 
+                  int(kwargs['parent_id']),
+                  kwargs['plot'], 
+                  toISODate(kwargs['release']),
+                  timestamp, 
+                  timestamp ) \
            if 'parent_id' in kwargs \
-           else kwargs['query'].format( kwargs['title'], 
-                                        timestamp, 
-                                        timestamp )
+           else ( kwargs['title'], 
+                  timestamp, 
+                  timestamp )
     
-    response  = execute_query(query)
-    if response:
-        new_media_id = execute_read(kwargs['max_query'])
-        return new_media_id[MEDIA_COLUMNS.ID][0]
-    
-    return -1
+    return execute_insert(kwargs['query'], params)
+
+
+def create_new_media_list(query : str, params : list) -> list:
+    """
+    Creates several media entries in the database in a single transaction.
+
+    Parameters:
+    - query (str): The parameterized SQL query for inserting a new media entry.
+    - params (list): The parameter tuples of the entries, without the created and updated dates.
+
+    Returns:
+    - list: The consecutive IDs of the new entries in the order of the parameters, empty if the insert failed.
+    """
+    timestamp = getTimestamp()
+    return execute_insert_many(query, [tuple(param) + (timestamp, timestamp) for param in params])
 
 
 def add_new_movie(title : str) -> int:
@@ -264,8 +336,20 @@ def add_new_movie(title : str) -> int:
     - ID from the database for the new movie
     """
     return create_new_media(title     = title, 
-                            query     = dbqueries.QUERY_ADD_NEW_MOVIE, 
-                            max_query = dbqueries.QUERY_GET_MAX_MOVIE_ID)
+                            query     = dbqueries.QUERY_ADD_NEW_MOVIE)
+
+
+def add_new_movies(titles : list) -> list:
+    """
+    Adds several new movies in the database at once.
+
+    Parameters:
+    - titles (list): The titles of the movies.
+
+    Returns:
+    - list: The IDs from the database for the new movies, in the order of the titles.
+    """
+    return create_new_media_list(dbqueries.QUERY_ADD_NEW_MOVIE, [(title,) for title in titles])
 
 
 def add_new_series(title : str) -> int:
@@ -279,8 +363,20 @@ def add_new_series(title : str) -> int:
     - ID from the database for the new series
     """
     return create_new_media(title     = title, 
-                            query     = dbqueries.QUERY_ADD_NEW_SERIES, 
-                            max_query = dbqueries.QUERY_GET_MAX_SERIES_ID)
+                            query     = dbqueries.QUERY_ADD_NEW_SERIES)
+
+
+def add_new_series_list(titles : list) -> list:
+    """
+    Adds several new series in the database at once.
+
+    Parameters:
+    - titles (list): The titles of the series.
+
+    Returns:
+    - list: The IDs from the database for the new series, in the order of the titles.
+    """
+    return create_new_media_list(dbqueries.QUERY_ADD_NEW_SERIES, [(title,) for title in titles])
 
 
 def add_new_episode(season : int, episode : int, title : str, plot : str, release_date : str, series_id : int) -> int:
@@ -304,10 +400,25 @@ def add_new_episode(season : int, episode : int, title : str, plot : str, releas
                             plot      = plot,
                             release   = release_date,
                             query     = dbqueries.QUERY_ADD_NEW_EPISODE, 
-                            max_query = dbqueries.QUERY_GET_MAX_EPISODE_ID, 
                             parent_id = series_id)
 
 
+def add_new_episodes(series_id : int, episodes : list) -> list:
+    """
+    Adds several new episodes to a series in the database at once.
+
+    Parameters:
+    - series_id (int): The unique identifier of the series to which the episodes belong.
+    - episodes (list): Tuples of (season, episode, title, plot, release_date).
+
+    Returns:
+    - list: The IDs from the database for the new episodes, in the order of the episodes.
+    """
+    return create_new_media_list(dbqueries.QUERY_ADD_NEW_EPISODE,
+                                 [(season, episode, title, int(series_id), plot, toISODate(release_date))
+                                  for season, episode, title, plot, release_date in episodes])
+
+
 def delete_media(media_type : MEDIA_TYPE, media_id : int) -> bool:
     """
     Deletes media records from the database based on the media type and media ID.
@@ -331,7 +442,7 @@ def delete_media(media_type : MEDIA_TYPE, media_id : int) -> bool:
         execute_query(dbqueries.QUERY_DELETE_SERIES_EPISODES.format(id=media_id))
         execute_query(dbqueries.QUERY_DELETE_SERIES.format(id=media_id))
 
-    poster_path  = f'{metahelper.get_app_config(APP_CONFIG.POSTER_PATH)}/{media_type.lower()}/{str(media_id)}.jpg'
+    poster_path  = posterhelper.get_poster_path(media_type, media_id)
     import os
     if os.path.exists(poster_path):
         os.remove(poster_path)
@@ -355,6 +466,33 @@ def delete_series_episodes(episode_ids : list) -> bool:
     return True
 
 
+def normalize_content(content_details : dict) -> dict:
+    """
+    Normalizes the content details in place before they are stored: release dates are converted 
+    to ISO-8601, SIZE / RUNTIME are mirrored into their numeric SIZE_BYTES / RUNTIME_MINUTES columns 
+    and UPDATED_DATE is stamped with the current time unless provided.
+
+    Parameters:
+    content_details (dict): The column names and values of the content to be stored.
+
+    Returns:
+    dict: The normalized content details.
+    """
+    if MEDIA_COLUMNS.RELEASE_DATE in content_details:
+        content_details[MEDIA_COLUMNS.RELEASE_DATE] = toISODate(content_details[MEDIA_COLUMNS.RELEASE_DATE])
+
+    if MEDIA_COLUMNS.SIZE in content_details:
+        content_details[MEDIA_COLUMNS.SIZE_BYTES] = parseSize(content_details[MEDIA_COLUMNS.SIZE])
+
+    if MOVIE_COLUMNS.RUNTIME in content_details:
+        content_details[MOVIE_COLUMNS.RUNTIME_MINUTES] = parseRuntime(content_details[MOVIE_COLUMNS.RUNTIME])
+
+    if MEDIA_COLUMNS.UPDATED_DATE not in content_details:
+        content_details[MEDIA_COLUMNS.UPDATED_DATE] = getTimestamp()
+
+    return content_details
+
+
 def update_content(content_details : dict, update_query : str) -> None:
     """
     Updates the content in a database or data structure based on the provided details and query.
@@ -367,7 +505,12 @@ def update_content(content_details : dict, update_query : str) -> None:
     update_query (str): A string representing the SQL update query template. It should contain placeholders 
                         for the update clause and the ID, which will be filled in by this function.
 
+    Release dates are normalized to ISO-8601 before being stored, SIZE / RUNTIME are mirrored
+    into their numeric SIZE_BYTES / RUNTIME_MINUTES columns and UPDATED_DATE is stamped with 
+    the current time unless provided.
     """
+    normalize_content(content_details)
+
     update_clause = ''
     for detail in content_details:
         if detail != MEDIA_COLUMNS.ID:
@@ -382,41 +525,118 @@ def update_content(content_details : dict, update_query : str) -> None:
     execute_query(update_query)
 
 
-def update_meta(**kwargs) -> None:
+def get_meta_statements(**kwargs) -> list:
     """
-    Updates metadata for a given media item by removing outdated metadata and adding new metadata.
+    Returns the statements updating the metadata of a given media item, removing outdated metadata
+    and adding new metadata, see update_meta.
 
     Parameters:
     - get_query (str): A query string to retrieve existing metadata for the media item.
     - media_id (int): The identifier for the media item whose metadata is being updated.
     - meta_column_name (str): The name of the column containing metadata.
     - meta_data (list): A list of new metadata values to be associated with the media item.
-    - remove_query (str): A query string to remove outdated metadata from the media item.
-    - add_new_query (str): A query string to add new metadata to the media item.
-
-    The function performs the following steps:
-    1. Retrieves existing metadata for the specified media item.
-    2. Identifies metadata to be removed and metadata to be added.
-    3. Removes outdated metadata using the provided remove_query.
-    4. Retrieves all possible metadata values if there are new metadata to add.
-    5. Adds new metadata using the provided add_new_query, creating new metadata entries if necessary.
-    """
-    existing_meta  = execute_read(kwargs['get_query'].format(id=kwargs['media_id']))
-    meta_to_remove = [x for x in existing_meta[kwargs['meta_column_name']].tolist() if x not in kwargs['meta_data']]
-    meta_to_add    = [x for x in kwargs['meta_data'] if x not in existing_meta[kwargs['meta_column_name']].tolist()]
-
-    for meta in meta_to_remove:
-        execute_query(kwargs['remove_query'].format(meta, kwargs['media_id']))
-    
-    all_meta = metahelper.get_meta_values(kwargs['meta_column_name']) if len(meta_to_add) > 0 else None
+    - remove_query (str): A parameterized query removing a metadata ID from the media item.
+    - add_new_query (str): A parameterized query adding a metadata ID to the media item.
+
+    Returns:
+    - list: The (query, params) tuples of the update, empty if the metadata is unchanged.
+
+    The difference between the existing and the new metadata is computed with sets and resolved
+    to IDs through the cached maps of metahelper.get_meta_ids. Values missing from the database
+    are created first, then the removals and additions are returned as two batched statements.
+    """
+    media_id       = int(kwargs['media_id'])
+    column         = kwargs['meta_column_name']
+    existing_meta  = set(execute_read(kwargs['get_query'].format(id=media_id))[column])
+    meta_data      = list(dict.fromkeys(kwargs['meta_data']))
+    meta_to_remove = existing_meta - set(meta_data)
+    meta_to_add    = [meta for meta in meta_data if meta not in existing_meta]
+
+    if not meta_to_remove and not meta_to_add:
+        return []
+
+    meta_ids = metahelper.get_meta_ids(column)
     for meta in meta_to_add:
-        meta_id = all_meta.loc[all_meta[kwargs['meta_column_name']] == meta, MEDIA_COLUMNS.ID]
-        meta_id = metahelper.add_meta(kwargs['meta_column_name'], meta) if len(meta_id) == 0 else int(meta_id.values[0])
-        
-        execute_query(kwargs['add_new_query'].format(
-                        kwargs['media_id'], 
-                        meta_id, 
-                        datetime.now().strftime('%d-%m-%Y %H:%M:%S')))
+        if meta not in meta_ids:
+            metahelper.add_meta(column, meta)
+
+    if not meta_to_remove.union(meta_to_add).issubset(meta_ids):
+        meta_ids = metahelper.get_meta_ids(column, reload=True)
+
+    timestamp = getTimestamp()
+    return [(kwargs['remove_query'],  [(media_id, meta_ids[meta]) for meta in meta_to_remove]),
+            (kwargs['add_new_query'], [(media_id, meta_ids[meta], timestamp) for meta in meta_to_add if meta in meta_ids])]
+
+
+def update_meta(**kwargs) -> bool:
+    """
+    Updates metadata for a given media item in a single transaction, see get_meta_statements.
+
+    Returns:
+    - bool: True if the metadata was updated, False otherwise.
+    """
+    statements = get_meta_statements(**kwargs)
+
+    return execute_many(statements) if statements else True
+
+
+def get_media_meta_statements(media_type : MEDIA_TYPE, media_id : int, genres : list, languages : list) -> list:
+    """
+    Returns the statements updating the genres and languages of a movie or series, see update_media_meta.
+
+    Parameters:
+    - media_type (MEDIA_TYPE): The type of media, either a movie or a series.
+    - media_id (int): The unique identifier for the media item.
+    - genres (list): A list of genres associated with the media.
+    - languages (list): A list of languages associated with the media.
+
+    Returns:
+    - list: The (query, params) tuples of the update.
+    """
+    statements = []
+    queries    = { MEDIA_TYPE.MOVIE  : { META_COLUMNS.GENRE    : (dbqueries.QUERY_GET_MOVIE_GENRES, 
+                                                                  dbqueries.QUERY_REMOVE_MOVIE_GENRE, 
+                                                                  dbqueries.QUERY_ADD_MOVIE_GENRE),
+                                         META_COLUMNS.LANGUAGE : (dbqueries.QUERY_GET_MOVIE_LANGUAGES, 
+                                                                  dbqueries.QUERY_REMOVE_MOVIE_LANGUAGE, 
+                                                                  dbqueries.QUERY_ADD_MOVIE_LANGUAGE) },
+                   MEDIA_TYPE.SERIES : { META_COLUMNS.GENRE    : (dbqueries.QUERY_GET_SERIES_GENRES, 
+                                                                  dbqueries.QUERY_REMOVE_SERIES_GENRE, 
+                                                                  dbqueries.QUERY_ADD_SERIES_GENRE),
+                                         META_COLUMNS.LANGUAGE : (dbqueries.QUERY_GET_SERIES_LANGUAGES, 
+                                                                  dbqueries.QUERY_REMOVE_SERIES_LANGUAGE, 
+                                                                  dbqueries.QUERY_ADD_SERIES_LANGUAGE) } }
+
+    for meta_column, meta_data in [(META_COLUMNS.GENRE, genres), (META_COLUMNS.LANGUAGE, languages)]:
+        if meta_data:
+            get_query, remove_query, add_new_query = queries[media_type][meta_column]
+            statements += get_meta_statements(get_query        = get_query, 
+                                              media_id         = media_id, 
+                                              meta_data        = meta_data, 
+                                              meta_column_name = meta_column, 
+                                              remove_query     = remove_query, 
+                                              add_new_query    = add_new_query)
+
+    return statements
+
+
+def update_media_meta(media_type : MEDIA_TYPE, media_id : int, genres : list, languages : list) -> bool:
+    """
+    Updates the genres and languages of a movie or series in a single transaction. Empty lists leave 
+    the existing values untouched.
+
+    Parameters:
+    - media_type (MEDIA_TYPE): The type of media, either a movie or a series.
+    - media_id (int): The unique identifier for the media item.
+    - genres (list): A list of genres associated with the media.
+    - languages (list): A list of languages associated with the media.
+
+    Returns:
+    - bool: True if the genres and languages were updated, False otherwise.
+    """
+    statements = get_media_meta_statements(media_type, media_id, genres, languages)
+
+    return execute_many(statements) if statements else True
 
 
 def update_movie(movie_details : dict, lookup_details : dict, genres : list, languages : list) -> bool:
@@ -440,52 +660,135 @@ def update_movie(movie_details : dict, lookup_details : dict, genres : list, lan
                         source     = lookup_details[MEDIA_COLUMNS.LOOKUP_SOURCE],
                         source_url = lookup_details[MEDIA_COLUMNS.SOURCE_URL]))
         
-    if genres:
-        update_meta(get_query        = dbqueries.QUERY_GET_MOVIE_GENRES, 
-                    media_id         = movie_details[MEDIA_COLUMNS.ID], 
-                    meta_data        = genres, 
-                    meta_column_name = META_COLUMNS.GENRE, 
-                    remove_query     = dbqueries.QUERY_REMOVE_MOVIE_GENRE, 
-                    add_new_query    = dbqueries.QUERY_ADD_MOVIE_GENRE)
-
-    if languages:
-        update_meta(get_query        = dbqueries.QUERY_GET_MOVIE_LANGUAGES, 
-                    media_id         = movie_details[MEDIA_COLUMNS.ID], 
-                    meta_data        = languages, 
-                    meta_column_name = META_COLUMNS.LANGUAGE, 
-                    remove_query     = dbqueries.QUERY_REMOVE_MOVIE_LANGUAGE, 
-                    add_new_query    = dbqueries.QUERY_ADD_MOVIE_LANGUAGE)
+    update_media_meta(MEDIA_TYPE.MOVIE, movie_details[MEDIA_COLUMNS.ID], genres, languages)
         
     return True
 
 
-def bulk_update_movies(updates : dict) -> None:
+def bulk_update_media(media_type : MEDIA_TYPE, media_ids : list, updates : dict, progress = None) -> bool:
     """
-    Updates multiple movie records in the database with the provided information.
+    Applies the same updates to many movies, series or episodes in a single transaction, see
+    dbhelper.execute_bulk. Only the columns listed in BULK_COLUMNS for the media type are updated.
 
     Parameters:
+    media_type (MEDIA_TYPE): The type of the media, MOVIE, SERIES or EPISODE.
+    media_ids (list): The IDs of the media to update.
+    updates (dict): The new value per column name. A GENRE key adds the genre with that ID to 
+                    movies and series, leaving the genres they already have untouched.
+    progress (callable, optional): Called with (processed, total) media as the update progresses.
+
+    Returns:
+    bool: True if the media were updated, False otherwise.
+    """
+    table, columns, genre_query = BULK_COLUMNS[media_type]
+    timestamp  = getTimestamp()
+    values     = { column : None if value in ['', 'None'] else value 
+                   for column, value in updates.items() if column in columns }
+    statements = []
+
+    if values:
+        statements.append((dbqueries.QUERY_BULK_UPDATE.format(table   = table, 
+                                                              updates = ', '.join(f'{column} = ?' for column in values)),
+                           tuple(values.values()) + (timestamp,)))
+
+    if genre_query and updates.get(META_COLUMNS.GENRE) is not None:
+        statements.append((genre_query, (int(updates[META_COLUMNS.GENRE]), timestamp)))
+
+    if not media_ids or not statements:
+        return True
+
+    return execute_bulk(media_ids, statements, progress)
+
+
+def bulk_update_movies(movie_ids : list, updates : dict, progress = None) -> bool:
+    """
+    Updates multiple movie records in the database with the provided information. See bulk_update_media.
+
+    Parameters:
+    movie_ids (list): The IDs of the movies to update.
+    updates (dict): A dictionary containing the update information. The keys are column names, and the values are the new values for those columns.
+    progress (callable, optional): Called with (processed, total) movies as the update progresses.
+
+    Returns:
+    bool: True if the movies were updated, False otherwise.
+    """
+    return bulk_update_media(MEDIA_TYPE.MOVIE, movie_ids, updates, progress)
+
+
+def bulk_update_series(series_ids : list, updates : dict, progress = None) -> bool:
+    """
+    Updates multiple series records in the database with the provided information. See bulk_update_media.
+
+    Parameters:
+    series_ids (list): The IDs of the series to update.
+    updates (dict): A dictionary containing the update information. The keys are column names, and the values are the new values for those columns.
+    progress (callable, optional): Called with (processed, total) series as the update progresses.
+
+    Returns:
+    bool: True if the series were updated, False otherwise.
+    """
+    return bulk_update_media(MEDIA_TYPE.SERIES, series_ids, updates, progress)
+
+
+def bulk_update_episodes(episode_ids : list, updates : dict, progress = None) -> bool:
+    """
+    Updates multiple episode records in the database with the provided information, e.g. to mark
+    them as watched. See bulk_update_media.
+
+    Parameters:
+    episode_ids (list): The IDs of the episodes to update.
     updates (dict): A dictionary containing the update information. The keys are column names, and the values are the new values for those columns.
+    progress (callable, optional): Called with (processed, total) episodes as the update progresses.
+
+    Returns:
+    bool: True if the episodes were updated, False otherwise.
     """
-    if len(updates[MEDIA_COLUMNS.ID]) > 0:
-        query = ''
+    return bulk_update_media(MEDIA_TYPE.EPISODE, episode_ids, updates, progress)
+
+
+def update_episode_state(series_id : int, updates : dict, episode_ids : list = None, season : int = None) -> bool:
+    """
+    Sets the watched, to burn and backup disc state of the episodes of a series in a single transaction.
+    The episodes are selected by ID, else by season, else all the episodes of the series are updated.
+    Episodes already in the requested state are left untouched. When the watched state of episodes
+    changes, the series is marked as watched if all its episodes are watched, and as not watched otherwise.
+
+    Parameters:
+    series_id (int): The unique identifier of the series.
+    updates (dict): The new value per column name, limited to EPISODE_STATE_COLUMNS.
+    episode_ids (list, optional): The IDs of the episodes to update.
+    season (int, optional): The season to update when no episode IDs are given.
 
-        for key in updates:
-            if key not in [MEDIA_COLUMNS.ID, META_COLUMNS.GENRE]:
-                query += '{} = {}, '.format(key, updates[key]) if isNumeric(updates[key]) \
-                    else '{} = "{}", '.format(key, updates[key])
+    Returns:
+    bool: True if the episodes were updated, False otherwise.
+    """
+    values = { column : None if value in ['', 'None'] else value 
+               for column, value in updates.items() if column in EPISODE_STATE_COLUMNS }
+
+    if not values or episode_ids is not None and len(episode_ids) == 0:
+        return True
+
+    timestamp = getTimestamp()
+    series_id = int(series_id)
+    state     = tuple(values.values())
+    query     = dbqueries.QUERY_UPDATE_EPISODE_STATE.format(
+                    updates      = ', '.join(f'{column} = ?' for column in values),
+                    unchanged    = ' AND '.join(f'{column} IS ?' for column in values),
+                    where_clause = 'AND ID = ?' if episode_ids is not None else 'AND SEASON = ?' if season else '')
+
+    if episode_ids is not None:
+        params = [state + (timestamp, series_id, int(episode_id)) + state for episode_id in set(episode_ids)]
+    elif season:
+        params = [state + (timestamp, series_id, int(season)) + state]
+    else:
+        params = [state + (timestamp, series_id) + state]
 
-        query = query[:-2]
+    statements = [(query, params)]
 
-        execute_query(dbqueries.QUERY_UPDATE_MOVIE_BULK.format(
-                        updates=query, 
-                        id=updates[MEDIA_COLUMNS.ID]))
+    if MEDIA_COLUMNS.WATCHED in values:
+        statements.append((dbqueries.QUERY_SET_SERIES_WATCHED, [(timestamp, series_id)]))
 
-        if META_COLUMNS.GENRE in updates:
-            for movie_id in updates[MEDIA_COLUMNS.ID].split(','):
-                execute_query(dbqueries.QUERY_ADD_MOVIE_GENRE.format(
-                                movie_id, 
-                                updates[META_COLUMNS.GENRE], 
-                                datetime.now().strftime('%d-%m-%Y %H:%M:%S')))
+    return execute_many(statements)
 
 
 def update_episode(episode_details : dict) -> None:
@@ -523,28 +826,149 @@ def update_series(series_details : dict, lookup_details : dict, episode_details
     if episode_details:
         update_episode(episode_details)
 
-    if genres:
-        update_meta(get_query        = dbqueries.QUERY_GET_SERIES_GENRES, 
-                    media_id         = series_details[MEDIA_COLUMNS.ID], 
-                    meta_data        = genres, 
-                    meta_column_name = META_COLUMNS.GENRE, 
-                    remove_query     = dbqueries.QUERY_REMOVE_SERIES_GENRE, 
-                    add_new_query    = dbqueries.QUERY_ADD_SERIES_GENRE)
-
-    if languages:
-        update_meta(get_query        = dbqueries.QUERY_GET_SERIES_LANGUAGES, 
-                    media_id         = series_details[MEDIA_COLUMNS.ID], 
-                    meta_data        = languages, 
-                    meta_column_name = META_COLUMNS.LANGUAGE, 
-                    remove_query     = dbqueries.QUERY_REMOVE_SERIES_LANGUAGE, 
-                    add_new_query    = dbqueries.QUERY_ADD_SERIES_LANGUAGE)
+    update_media_meta(MEDIA_TYPE.SERIES, series_details[MEDIA_COLUMNS.ID], genres, languages)
         
     return True
 
 
-def update_media_actors(media_type : MEDIA_TYPE, media_id : int, cast : dict, source : str, url='') -> bool:
+def get_content_statements(content_list : list, update_query : str) -> list:
+    """
+    Returns the statements updating the content of several media. The updates are parameterized
+    and grouped by the set of columns they change, so each group is sent as one executemany.
+
+    Parameters:
+    content_list (list): Dictionaries of column names and values, each including the MEDIA_COLUMNS.ID
+                         of the record to update. See update_content.
+    update_query (str): The SQL update query template with {updates} and {id} placeholders.
+
+    Returns:
+    list: The (query, params) tuples of the updates.
+    """
+    groups = {}
+    for content_details in content_list:
+        content = normalize_content(dict(content_details))
+        columns = tuple(col for col in content if col != MEDIA_COLUMNS.ID)
+        values  = [None if content[col] in ['', 'None'] else content[col] for col in columns]
+
+        groups.setdefault(columns, []).append(tuple(values) + (int(content[MEDIA_COLUMNS.ID]),))
+
+    return [(update_query.format(updates=', '.join(f'{col} = ?' for col in columns), id='?'), params)
+            for columns, params in groups.items()]
+
+
+def bulk_update_content(content_list : list, update_query : str) -> bool:
     """
-    Updates the cast information for a given media item (movie or series) in the database.
+    Updates the content of several media in a single transaction, see get_content_statements.
+
+    Parameters:
+    content_list (list): Dictionaries of column names and values, each including the MEDIA_COLUMNS.ID
+                         of the record to update. See update_content.
+    update_query (str): The SQL update query template with {updates} and {id} placeholders.
+
+    Returns:
+    bool: True if all the updates were saved, False otherwise.
+    """
+    return execute_many(get_content_statements(content_list, update_query))
+
+
+def get_episode_statements(series_id : int, episodes : pd.DataFrame) -> list:
+    """
+    Returns the statements saving the episodes fetched for a series. Episodes already in the 
+    library, matched on season and episode number, have their title, plot and release date 
+    updated, the others are added.
+
+    Parameters:
+    series_id (int): The unique identifier of the series.
+    episodes (pd.DataFrame): The episodes with SEASON, EPISODE, ORIGINAL_TITLE, PLOT and RELEASE_DATE columns,
+                             as returned by the lookup templates.
+
+    Returns:
+    list: The (query, params) tuples of the episodes, empty if there are none.
+    """
+    if episodes.empty:
+        return []
+
+    timestamp = getTimestamp()
+    existing  = execute_read(dbqueries.QUERY_GET_EPISODE_KEYS.format(id=series_id))
+    keys      = { (int(row.SEASON), int(row.EPISODE)) : int(row.ID) for row in existing.itertuples() }
+
+    new_episodes, updated_episodes = [], []
+    for row in episodes.itertuples(index=False):
+        episode      = row._asdict()
+        key          = (int(episode[EPISODE_COLUMNS.SEASON]), int(episode[EPISODE_COLUMNS.EPISODE]))
+        release_date = toISODate(episode[MEDIA_COLUMNS.RELEASE_DATE])
+
+        if key in keys:
+            updated_episodes.append((episode[MEDIA_COLUMNS.ORIGINAL_TITLE], episode[MEDIA_COLUMNS.PLOT], 
+                                     release_date, timestamp, keys[key]))
+        else:
+            new_episodes.append(key + (episode[MEDIA_COLUMNS.ORIGINAL_TITLE], int(series_id), episode[MEDIA_COLUMNS.PLOT], 
+                                       release_date, timestamp, timestamp))
+
+    return [(dbqueries.QUERY_INSERT_SERIES_EPISODES, new_episodes),
+            (dbqueries.QUERY_UPDATE_EPISODE_DETAILS, updated_episodes)]
+
+
+def save_series_episodes(series_id : int, episodes : pd.DataFrame) -> bool:
+    """
+    Saves the episodes fetched for a series in a single transaction, see get_episode_statements.
+
+    Parameters:
+    series_id (int): The unique identifier of the series.
+    episodes (pd.DataFrame): The episodes with SEASON, EPISODE, ORIGINAL_TITLE, PLOT and RELEASE_DATE columns,
+                             as returned by the lookup templates.
+
+    Returns:
+    bool: True if the episodes were saved, False otherwise.
+    """
+    statements = get_episode_statements(series_id, episodes)
+
+    return execute_many(statements) if statements else True
+
+
+def save_media_details(media_type : MEDIA_TYPE, media_list : list, source : str) -> list:
+    """
+    Bulk write path for media details fetched from a lookup source. The content, lookup source, 
+    genres, languages, cast and, for series, episodes of all the media are written in one transaction.
+    If it fails, the media are saved one transaction each, so that a single failing item does not
+    fail the others.
+
+    Parameters:
+    media_type (MEDIA_TYPE): The type of the media, MOVIE or SERIES.
+    media_list (list): Tuples of (media_id, details, episodes) where details is the dictionary returned 
+                       by get_media_details of a lookup template and episodes a DataFrame or None.
+    source (str): The name of the lookup source.
+
+    Returns:
+    list: The IDs of the media whose details could not be saved, empty if all were saved.
+    """
+    update_query = dbqueries.QUERY_UPDATE_MOVIE if media_type == MEDIA_TYPE.MOVIE else dbqueries.QUERY_UPDATE_SERIES
+    contents     = {}
+    statements   = {}
+
+    for media_id, details, episodes in media_list:
+        content = dict(details[MEDIA_DETAILS.CONTENT])
+        content[MEDIA_COLUMNS.ID]            = media_id
+        content[MEDIA_COLUMNS.LOOKUP_SOURCE] = details[MEDIA_DETAILS.OTHERS][MEDIA_COLUMNS.LOOKUP_SOURCE]
+        content[MEDIA_COLUMNS.SOURCE_URL]    = details[MEDIA_DETAILS.OTHERS][MEDIA_COLUMNS.SOURCE_URL]
+
+        contents[media_id]   = content
+        statements[media_id] = get_media_meta_statements(media_type, media_id, details[MEDIA_DETAILS.GENRES], details[MEDIA_DETAILS.LANGUAGES]) \
+                             + (get_episode_statements(media_id, episodes) if episodes is not None else []) \
+                             + get_cast_statements(media_type, media_id, details[MEDIA_DETAILS.CAST], source, None)
+
+    if execute_many(get_content_statements(list(contents.values()), update_query) + sum(statements.values(), [])):
+        return []
+
+    return [media_id for media_id in contents
+            if not execute_many(get_content_statements([contents[media_id]], update_query) + statements[media_id])]
+
+
+def get_cast_statements(media_type : MEDIA_TYPE, media_id : int, cast : dict, source : str, url='') -> list:
+    """
+    Returns the statements replacing the cast of a given media item (movie or series). The actors are
+    resolved at once on their online id, or on their name for actors saved without one, the missing
+    actors are added and the cast links written in bulk.
 
     Parameters:
     - media_type (MEDIA_TYPE): The type of media, either a movie or a series.
@@ -554,43 +978,62 @@ def update_media_actors(media_type : MEDIA_TYPE, media_id : int, cast : dict, so
     - url (str, optional): The URL of the source. Defaults to an empty string.
 
     Returns:
-    - bool: Returns True if the update process is completed successfully.
+    - list: The (query, params) tuples replacing the cast.
     """
-    delete_query = dbqueries.QUERY_DELETE_MOVIE_CAST.format(id=media_id) if media_type == MEDIA_TYPE.MOVIE \
-              else dbqueries.QUERY_DELETE_SERIES_CAST.format(id=media_id)
-    execute_query(delete_query)
+    timestamp  = getTimestamp()
+    online_ids = list(cast.keys())
+    names      = [cast[online_id][MEDIA_COLUMNS.NAME] for online_id in online_ids]
+    actors     = execute_read(dbqueries.QUERY_RESOLVE_ACTORS.format(online_ids = ', '.join('?' * len(online_ids)),
+                                                                    names      = ', '.join('?' * len(names))),
+                              online_ids + names) if cast else pd.DataFrame()
+
+    by_online_id, by_name = {}, {}
+    for actor in actors.itertuples():
+        if pd.isna(actor.ONLINE_ID):
+            by_name.setdefault(actor.NAME, int(actor.ID))
+        else:
+            by_online_id[actor.ONLINE_ID] = int(actor.ID)
 
-    for actor_id in cast:
-        df = execute_read(dbqueries.QUERY_GET_ACTOR.format(
-                            name=cast[actor_id][MEDIA_COLUMNS.NAME], 
-                            online_id=actor_id))
-        
-        if df.empty or len(df) == 0:
-            execute_query(dbqueries.QUERY_ADD_ACTOR.format(
-                            name          = cast[actor_id][MEDIA_COLUMNS.NAME],
-                            online_id     = actor_id,
-                            lookup_source = source,
-                            source_url    = url,
-                            created_date  = datetime.now().strftime('%d-%m-%Y %H:%M:%S')))
-            
-            df = execute_read(dbqueries.QUERY_GET_ACTOR.format(
-                                name=cast[actor_id][MEDIA_COLUMNS.NAME], 
-                                online_id=actor_id))
-
-        if media_type == MEDIA_TYPE.MOVIE:
-            execute_query(dbqueries.QUERY_ADD_MOVIE_CAST.format(
-                            media_id, 
-                            int(df.values[0]), 
-                            cast[actor_id][MEDIA_COLUMNS.CHARACTER],
-                            datetime.now().strftime('%d-%m-%Y %H:%M:%S')))
+    new_actors, links, new_links = [], [], []
+    for online_id, name in zip(online_ids, names):
+        details  = [cast[online_id][MEDIA_COLUMNS.CHARACTER], timestamp] if media_type == MEDIA_TYPE.MOVIE \
+              else [cast[online_id][MEDIA_COLUMNS.CHARACTER], cast[online_id][SERIES_COLUMNS.EPISODES], timestamp]
+        actor_id = by_online_id.get(online_id, by_name.get(name))
+
+        if actor_id is None:
+            new_actors.append((name, online_id, source, url, timestamp))
+            new_links.append(tuple([int(media_id)] + details + [online_id]))
         else:
-            execute_query(dbqueries.QUERY_ADD_SERIES_CAST.format(
-                            media_id, 
-                            int(df.values[0]),
-                            cast[actor_id][MEDIA_COLUMNS.CHARACTER],
-                            cast[actor_id][SERIES_COLUMNS.EPISODES],
-                            datetime.now().strftime('%d-%m-%Y %H:%M:%S')))
-        
-    return True
+            links.append(tuple([int(media_id), actor_id] + details))
+
+    if media_type == MEDIA_TYPE.MOVIE:
+        statements = [(dbqueries.QUERY_DELETE_MOVIE_CAST.format(id=media_id), [()]),
+                      (dbqueries.QUERY_INSERT_ACTORS, new_actors),
+                      (dbqueries.QUERY_INSERT_MOVIE_CAST, links),
+                      (dbqueries.QUERY_INSERT_MOVIE_CAST_BY_ONLINE_ID, new_links)]
+    else:
+        statements = [(dbqueries.QUERY_DELETE_SERIES_CAST.format(id=media_id), [()]),
+                      (dbqueries.QUERY_INSERT_ACTORS, new_actors),
+                      (dbqueries.QUERY_INSERT_SERIES_CAST, links),
+                      (dbqueries.QUERY_INSERT_SERIES_CAST_BY_ONLINE_ID, new_links)]
+
+    return statements
+
+
+def update_media_actors(media_type : MEDIA_TYPE, media_id : int, cast : dict, source : str, url='') -> bool:
+    """
+    Replaces the cast of a given media item (movie or series) in a single transaction, see get_cast_statements.
+
+    Parameters:
+    - media_type (MEDIA_TYPE): The type of media, either a movie or a series.
+    - media_id (int): The unique identifier for the media item.
+    - cast (dict): A dictionary containing actor information, where keys are actor IDs and values are dictionaries with actor details.
+    - source (str): The source from which the actor information is retrieved.
+    - url (str, optional): The URL of the source. Defaults to an empty string.
+
+    Returns:
+    - bool: Returns True if the cast was saved, False otherwise.
+    """
+    return execute_many(get_cast_statements(media_type, media_id, cast, source, url))
 
 #=======================================================================
\ No newline at end of file
@@ -8,24 +8,43 @@ import pandas as pd
 from PySide6.QtCore    import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtGui     import QIcon
 from PySide6.QtWidgets import QApplication, QStyle
+from utils.common      import formatSize, formatRuntime
 from utils.constants   import (
     MEDIA_CENTER_ALIGN_COLUMNS, 
     HEADER_ICON_COLUMNS,
-    MEDIA_TYPE
+    MEDIA_TYPE,
+    MEDIA_COLUMNS,
+    MOVIE_COLUMNS,
+    EPISODE_COLUMNS
 )
 
+''' Formatters converting the numeric values of a column to display text '''
+DISPLAY_FORMATTERS = { MEDIA_COLUMNS.SIZE             : formatSize,
+                       MEDIA_COLUMNS.SIZE_BYTES       : formatSize,
+                       MOVIE_COLUMNS.RUNTIME_MINUTES  : formatRuntime }
+
+''' Formatters converting a whole column to display text at once '''
+COLUMN_FORMATTERS  = { EPISODE_COLUMNS.SEASON         : lambda values: values.astype(str).str.zfill(2),
+                       EPISODE_COLUMNS.EPISODE        : lambda values: values.astype(str).str.zfill(2) }
+
+''' Role returning the raw value of a cell, numbers and booleans unformatted, used to sort '''
+SORT_ROLE          = Qt.UserRole
+
 #=======================================================================
 class TableModel(QAbstractTableModel):
     """
     A custom table model for displaying data in a QTableView. This model supports displaying
-    data with icons for boolean values and custom header icons.
+    data with icons for boolean values, custom header icons and display formatters for numeric columns.
+    The data keeps its types: the display text of a column is computed once, on first paint, while
+    SORT_ROLE returns the raw values so that numeric columns sort numerically. The model sorts itself,
+    in one vectorized sort, when used directly by a table view with sorting enabled.
 
     Attributes:
         _data (DataFrame): The data to be displayed in the table.
         _media_type (MEDIA_TYPE): The type of media being represented, default is MEDIA_TYPE.MOVIE.
 
     Methods:
-        __init__(data, media_type=MEDIA_TYPE.MOVIE):
+        __init__(data, media_type=MEDIA_TYPE.MOVIE, formatters=None):
             Initializes the TableModel with the given data and media type.
 
         rowCount(parent=None):
@@ -42,6 +61,21 @@ class TableModel(QAbstractTableModel):
             Returns the header data for the given column, orientation, and role. Supports displaying
             icons for specific columns in the header.
 
+        getDisplayColumn(col):
+            Returns the display text of a whole column, computed once.
+
+        getSortColumn(col):
+            Returns the sort values of a whole column, computed once.
+
+        sort(column, order):
+            Sorts the rows by a column in one vectorized sort.
+
+        getData():
+            Returns the data displayed by the model.
+
+        updateRows(values, key_column=None, keys=None):
+            Sets the values of some columns in place for the rows matching the keys, or all rows.
+
     Parameters:
         data (DataFrame): The data to be displayed in the table.
         media_type (MEDIA_TYPE, optional): The type of media being represented. Defaults to MEDIA_TYPE.MOVIE.
@@ -52,7 +86,7 @@ class TableModel(QAbstractTableModel):
         - data and headerData return QVariant, representing the data or header information for the given index.
     """
 
-    def __init__(self, data : pd.DataFrame, media_type=MEDIA_TYPE.MOVIE) -> None:
+    def __init__(self, data : pd.DataFrame, media_type=MEDIA_TYPE.MOVIE, formatters : dict = None) -> None:
         """
         Initializes the TableModel with the provided data and media type.
 
@@ -61,10 +95,18 @@ class TableModel(QAbstractTableModel):
             The data to be displayed in the table. This is expected to be a pandas DataFrame.
         - media_type: MEDIA_TYPE, optional
             The type of media being represented in the table. Defaults to MEDIA_TYPE.MOVIE.
+        - formatters: dict, optional
+            Additional display formatters by column name, on top of DISPLAY_FORMATTERS.
         """
         super(TableModel, self).__init__()
         self._data       = data
         self._media_type = media_type
+        formatters       = { **DISPLAY_FORMATTERS, **(formatters or {}) }
+        self._formatters = { idx : formatters[col] for idx, col in enumerate(data.columns) 
+                             if col in formatters }
+        self._bool_cols  = { idx for idx, dtype in enumerate(data.dtypes) if dtype == bool }
+        self._display    = {}
+        self._sort       = {}
 
 
     def rowCount(self, parent=None) -> int:
@@ -109,22 +151,27 @@ class TableModel(QAbstractTableModel):
             Returns a QVariant containing the data for the given index and role.
             If the role is Qt.DecorationRole and the value is a boolean, it returns
             a QIcon representing the boolean state. If the role is Qt.DisplayRole,
-            it returns the string representation of the value. If the role is
+            it returns the string representation of the value, formatted through
+            DISPLAY_FORMATTERS for numeric columns like SIZE. If the role is SORT_ROLE,
+            it returns the raw value for numeric and boolean columns, and the display
+            text otherwise. If the role is
             Qt.TextAlignmentRole and the column is in MEDIA_CENTER_ALIGN_COLUMNS,
             it returns the alignment flags for center alignment. Returns None if
             the index is invalid or the role is not handled.
         """
         if index.isValid():
-            value = self._data.iloc[index.row(), index.column()]
-            if isinstance(value, np.bool_):
+            if role == SORT_ROLE:
+                return self.getSortColumn(index.column())[index.row()]
+
+            if index.column() in self._bool_cols:
                 if role == Qt.DecorationRole:
-                    if value:
+                    if self.getSortColumn(index.column())[index.row()]:
                         return QIcon(QApplication.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton))
 
                     return QIcon(QApplication.style().standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton))
             else:
                 if role == Qt.DisplayRole:
-                    return str(value)
+                    return self.getDisplayColumn(index.column())[index.row()]
                 
                 if role == Qt.TextAlignmentRole:
                     cols = (x for x in MEDIA_CENTER_ALIGN_COLUMNS)
@@ -157,5 +204,139 @@ class TableModel(QAbstractTableModel):
                 return self._data.columns[col].replace('_', ' ').title()
         
         return None
+
+
+    def getDisplayColumn(self, col : int) -> np.ndarray:
+        """
+        Returns the display text of a whole column, computed on first use and cached until the
+        column is updated. Columns in COLUMN_FORMATTERS are formatted in one vectorized call,
+        columns in DISPLAY_FORMATTERS value by value, others are converted to strings.
+
+        Parameters:
+        - col (int): The index of the column.
+
+        Returns:
+        - ndarray: The display text of every row of the column.
+        """
+        if col not in self._display:
+            values = self._data.iloc[:, col]
+            name   = self._data.columns[col]
+
+            if name in COLUMN_FORMATTERS:
+                display = COLUMN_FORMATTERS[name](values)
+            elif col in self._formatters:
+                display = values.map(self._formatters[col])
+            else:
+                display = values.astype(str)
+
+            self._display[col] = display.to_numpy(dtype=object)
+
+        return self._display[col]
+
+
+    def getSortColumn(self, col : int) -> np.ndarray:
+        """
+        Returns the sort values of a whole column, computed on first use and cached until the
+        column is updated: the raw values of numeric and boolean columns, None for missing values,
+        and the display text of other columns.
+
+        Parameters:
+        - col (int): The index of the column.
+
+        Returns:
+        - ndarray: The sort value of every row of the column.
+        """
+        if col not in self._sort:
+            values = self._data.iloc[:, col]
+
+            if pd.api.types.is_numeric_dtype(values):
+                self._sort[col] = values.astype(object).where(values.notna(), None).to_numpy()
+            else:
+                self._sort[col] = self.getDisplayColumn(col)
+
+        return self._sort[col]
+
+
+    def sort(self, column : int, order : Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """
+        Sorts the rows by a column in one vectorized, stable sort on the sort values of the column,
+        so the table view can sort without a proxy model calling back into data() per comparison.
+        Missing values are kept last and the selection follows the rows.
+
+        Parameters:
+        - column (int): The index of the column to sort by.
+        - order (Qt.SortOrder, optional): The sort order. Defaults to Qt.AscendingOrder.
+        """
+        if column < 0 or column >= self._data.shape[1]:
+            return
+
+        values = self._data.iloc[:, column].reset_index(drop=True)
+        if not pd.api.types.is_numeric_dtype(values):
+            values = pd.Series(self.getSortColumn(column))
+
+        rows   = values.sort_values(ascending=order == Qt.AscendingOrder, kind='stable', na_position='last').index.to_numpy()
+
+        self.layoutAboutToBeChanged.emit()
+
+        moved          = np.empty(len(rows), dtype=int)
+        moved[rows]    = np.arange(len(rows))
+        persistent     = self.persistentIndexList()
+
+        self._data     = self._data.iloc[rows].reset_index(drop=True)
+        self._display  = { col : display[rows] for col, display in self._display.items() }
+        self._sort     = { col : values[rows] for col, values in self._sort.items() }
+
+        self.changePersistentIndexList(persistent, [self.index(int(moved[index.row()]), index.column()) 
+                                                    for index in persistent])
+        self.layoutChanged.emit()
+
+
+    def getData(self) -> pd.DataFrame:
+        """
+        Returns the data displayed by the model.
+
+        Returns:
+        - DataFrame: The data of the model, not a copy.
+        """
+        return self._data
+
+
+    def updateRows(self, values : dict, key_column : str = None, keys : list = None) -> int:
+        """
+        Sets the values of some columns in place for the rows whose key column is in the keys,
+        or for all rows if no keys are given, and notifies the views of the changed range only,
+        so the table keeps its selection and scroll position.
+
+        Parameters:
+        - values (dict): The new value per column name. Columns not in the data are ignored.
+        - key_column (str, optional): The column identifying the rows, e.g. ID.
+        - keys (list, optional): The values of the key column of the rows to update.
+
+        Returns:
+        - int: The number of rows updated.
+        """
+        if key_column is None:
+            mask = np.ones(self._data.shape[0], dtype=bool)
+        else:
+            column = self._data[key_column]
+            mask   = column.isin(pd.Series(list(keys)).astype(column.dtype)).to_numpy()
+
+        rows    = np.flatnonzero(mask)
+        columns = [col for col in values if col in self._data.columns]
+
+        if len(rows) == 0 or len(columns) == 0:
+            return 0
+
+        for col in columns:
+            self._data.loc[mask, col] = pd.Series([values[col]] * len(rows)).astype(self._data[col].dtype).to_numpy()
+
+        cols = [self._data.columns.get_loc(col) for col in columns]
+        for col in cols:
+            self._display.pop(col, None)
+            self._sort.pop(col, None)
+
+        self.dataChanged.emit(self.index(int(rows.min()), min(cols)), self.index(int(rows.max()), max(cols)))
+
+        return len(rows)
     
 #=======================================================================
\ No newline at end of file
@@ -6,29 +6,29 @@
 #=======================================================================
 
 import utils.constants as constants
-import utils.dbhelper as dbhelper
-
-from templates.exportdata.exportQueries import QUERY_EXPORT_MOVIES, QUERY_EXPORT_SERIES
+import templates.exportdata.exportTools as exportTools
 
 
 #=======================================================================
-def export(media_type : constants.MEDIA_TYPE, path : str) -> bool:
+def export(media_type : constants.MEDIA_TYPE, path : str, delta=False) -> bool:
     """
     Export media data to a CSV file based on the specified media type.
     
     Args:
         media_type (constants.MEDIA_TYPE): Type of media (MOVIE or SERIES).
         path (str): File path for the exported CSV file.
+        delta (bool, optional): Only export the changes since the last delta export.
     
     Returns:
         bool: True if export is successful, False otherwise.
     """
     try:
-        query    = QUERY_EXPORT_MOVIES if media_type == constants.MEDIA_TYPE.MOVIE \
-              else QUERY_EXPORT_SERIES
-        
-        df_media = dbhelper.execute_read(query)
+        exporter         = exportTools.get_exporter_key(__name__, media_type) if delta else None
+        df_media, to_seq = exportTools.get_export_data(media_type, exporter)
         df_media.to_csv(path, index=False)
+
+        if delta:
+            exportTools.save_watermark(exporter, to_seq)
     except Exception as e:
         print(f"Error occurred while exporting data: {e}")
         return False
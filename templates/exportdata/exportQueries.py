@@ -42,6 +42,7 @@ QUERY_EXPORT_MOVIES = '''SELECT m.ID,
                         	LEFT JOIN MEDIA_SOURCE ms ON m.SOURCE_ID = ms.ID
                             LEFT JOIN MEDIA_QUALITY mq ON m.QUALITY_ID = mq.ID
                             LEFT JOIN MEDIA_EDITION me ON m.EDITION_ID = me.ID
+                        {where}
                         ORDER BY m.TITLE'''
 
 
@@ -83,6 +84,42 @@ QUERY_EXPORT_SERIES = '''SELECT s.ID,
                         FROM TV_SERIES s
                             LEFT JOIN TV_SERIES_EPISODES se ON s.ID = se.SERIES_ID
                             LEFT JOIN MEDIA_QUALITY q ON se.QUALITY_ID = q.ID
+                        {where}
                         ORDER BY s.TITLE, se.SEASON, se.EPISODE'''
 
+#=======================================================================
+# DELTA EXPORT QUERIES
+#=======================================================================
+QUERY_EXPORT_LAST_SEQ       = '''SELECT IFNULL(MAX(SEQ), 0) AS SEQ FROM CHANGE_JOURNAL'''
+
+QUERY_EXPORT_CHANGED_MOVIES = '''WHERE m.ID IN (SELECT MEDIA_ID
+                                                FROM CHANGE_JOURNAL
+                                                WHERE MEDIA_TYPE = 'MOVIE'
+                                                  AND SEQ >  {from_seq}
+                                                  AND SEQ <= {to_seq})'''
+
+QUERY_EXPORT_CHANGED_SERIES = '''WHERE s.ID IN (SELECT MEDIA_ID
+                                                FROM CHANGE_JOURNAL
+                                                WHERE MEDIA_TYPE = 'SERIES'
+                                                  AND SEQ >  {from_seq}
+                                                  AND SEQ <= {to_seq})'''
+
+QUERY_EXPORT_DELETED_MEDIA  = '''SELECT DISTINCT j.MEDIA_ID AS ID
+                                 FROM CHANGE_JOURNAL j
+                                 WHERE j.MEDIA_TYPE = '{media_type}'
+                                   AND j.OPERATION  = 'D'
+                                   AND j.SEQ >  {from_seq}
+                                   AND j.SEQ <= {to_seq}
+                                   AND j.MEDIA_ID NOT IN (SELECT ID FROM {table})'''
+
+QUERY_GET_EXPORT_WATERMARK  = '''SELECT LAST_SEQ FROM EXPORT_WATERMARKS WHERE EXPORTER = "{exporter}"'''
+
+QUERY_SET_EXPORT_WATERMARK  = '''INSERT INTO EXPORT_WATERMARKS (EXPORTER, LAST_SEQ, UPDATED_DATE)
+                                 VALUES ("{exporter}", {seq}, "{updated_date}")
+                                 ON CONFLICT(EXPORTER) DO UPDATE SET LAST_SEQ     = excluded.LAST_SEQ,
+                                                                     UPDATED_DATE = excluded.UPDATED_DATE'''
+
+QUERY_PRUNE_CHANGE_JOURNAL  = '''DELETE FROM CHANGE_JOURNAL
+                                 WHERE SEQ <= (SELECT MIN(LAST_SEQ) FROM EXPORT_WATERMARKS)'''
+
 #=======================================================================
\ No newline at end of file
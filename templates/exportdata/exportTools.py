@@ -0,0 +1,136 @@
+#=======================================================================
+# Description:
+# Common utility methods used by the exporter scripts to fetch the data
+# to be exported. Supports full exports as well as delta exports which
+# only contain the media changed since the last run of an exporter,
+# based on the trigger-fed CHANGE_JOURNAL table
+#=======================================================================
+import pandas as pd
+import utils.constants as constants
+import utils.dbhelper as dbhelper
+
+from utils.common import getTimestamp
+
+from templates.exportdata.exportQueries import (
+    QUERY_EXPORT_MOVIES,
+    QUERY_EXPORT_SERIES,
+    QUERY_EXPORT_LAST_SEQ,
+    QUERY_EXPORT_CHANGED_MOVIES,
+    QUERY_EXPORT_CHANGED_SERIES,
+    QUERY_EXPORT_DELETED_MEDIA,
+    QUERY_GET_EXPORT_WATERMARK,
+    QUERY_SET_EXPORT_WATERMARK,
+    QUERY_PRUNE_CHANGE_JOURNAL
+)
+
+''' Column added to delta exports to identify the type of change '''
+CHANGE_TYPE_COLUMN = 'CHANGE_TYPE'
+CHANGE_UPSERT      = 'UPSERT'
+CHANGE_DELETE      = 'DELETE'
+
+#=======================================================================
+def get_watermark(exporter : str) -> int:
+    """
+    Retrieves the journal sequence up to which the exporter has already exported changes.
+
+    Args:
+        exporter (str): Unique name of the exporter and media type, see get_exporter_key.
+
+    Returns:
+        int: The last exported journal sequence, or -1 if the exporter never ran a delta export.
+    """
+    df_watermark = dbhelper.execute_read(QUERY_GET_EXPORT_WATERMARK.format(exporter=exporter))
+
+    return -1 if df_watermark.empty else int(df_watermark['LAST_SEQ'][0])
+
+
+def save_watermark(exporter : str, seq : int) -> bool:
+    """
+    Stores the journal sequence exported by the exporter and prunes the journal
+    entries that have been exported by all known exporters.
+
+    Args:
+        exporter (str): Unique name of the exporter and media type, see get_exporter_key.
+        seq (int): The last journal sequence included in the export.
+
+    Returns:
+        bool: True if the watermark was saved, False otherwise.
+    """
+    response = dbhelper.execute_query(QUERY_SET_EXPORT_WATERMARK.format(
+                    exporter     = exporter,
+                    seq          = seq,
+                    updated_date = getTimestamp()))
+
+    if response:
+        dbhelper.execute_query(QUERY_PRUNE_CHANGE_JOURNAL)
+
+    return response
+
+
+def get_exporter_key(exporter : str, media_type : constants.MEDIA_TYPE) -> str:
+    """
+    Builds the key under which the watermark of an exporter is stored.
+
+    Args:
+        exporter (str): Name of the exporter, usually the module name.
+        media_type (constants.MEDIA_TYPE): Type of media (MOVIE or SERIES).
+
+    Returns:
+        str: The watermark key.
+    """
+    return f'{exporter}:{media_type}'
+
+
+def get_export_data(media_type : constants.MEDIA_TYPE, exporter=None) -> tuple:
+    """
+    Fetches the data to be exported for the given media type. When an exporter is
+    passed, only the media changed since its stored watermark are returned together
+    with the IDs of deleted media, flagged in the CHANGE_TYPE column. An exporter
+    without a watermark gets all media as UPSERT rows as a baseline.
+
+    Args:
+        media_type (constants.MEDIA_TYPE): Type of media (MOVIE or SERIES).
+        exporter (str, optional): Watermark key of the exporter for a delta export.
+
+    Returns:
+        tuple: The data to be exported and the journal sequence to store as the
+               new watermark once the export has been written.
+    """
+    if media_type not in [constants.MEDIA_TYPE.MOVIE, constants.MEDIA_TYPE.SERIES]:
+        raise ValueError(f"Invalid media type: {media_type}")
+
+    query = QUERY_EXPORT_MOVIES if media_type == constants.MEDIA_TYPE.MOVIE \
+       else QUERY_EXPORT_SERIES
+
+    if not exporter:
+        return dbhelper.execute_read(query.format(where='')), None
+
+    # Read the journal head before the data so that changes made during
+    # the export are picked up again by the next run
+    to_seq   = int(dbhelper.execute_read(QUERY_EXPORT_LAST_SEQ)['SEQ'][0])
+    from_seq = get_watermark(exporter)
+
+    if from_seq < 0:
+        df_media = dbhelper.execute_read(query.format(where=''))
+        df_media[CHANGE_TYPE_COLUMN] = CHANGE_UPSERT
+        return df_media, to_seq
+
+    where    = QUERY_EXPORT_CHANGED_MOVIES if media_type == constants.MEDIA_TYPE.MOVIE \
+          else QUERY_EXPORT_CHANGED_SERIES
+
+    df_media = dbhelper.execute_read(query.format(where=where.format(from_seq=from_seq, to_seq=to_seq)))
+    df_media[CHANGE_TYPE_COLUMN] = CHANGE_UPSERT
+
+    df_deleted = dbhelper.execute_read(QUERY_EXPORT_DELETED_MEDIA.format(
+                    media_type = media_type,
+                    table      = 'MOVIES' if media_type == constants.MEDIA_TYPE.MOVIE else 'TV_SERIES',
+                    from_seq   = from_seq,
+                    to_seq     = to_seq))
+    df_deleted[CHANGE_TYPE_COLUMN] = CHANGE_DELETE
+
+    if not df_deleted.empty:
+        df_media = pd.concat([df_media, df_deleted], ignore_index=True)
+
+    return df_media, to_seq
+
+#=======================================================================
@@ -5,31 +5,28 @@
 # created and an entry made in registry.json to use in the app.
 #=======================================================================
 import utils.constants as constants
-import utils.dbhelper as dbhelper
-
-from templates.exportdata.exportQueries import QUERY_EXPORT_MOVIES, QUERY_EXPORT_SERIES
+import templates.exportdata.exportTools as exportTools
 
 #=======================================================================
-def export_to_excel(media_type: constants.MEDIA_TYPE, path : str) -> bool:
+def export_to_excel(media_type: constants.MEDIA_TYPE, path : str, delta=False) -> bool:
     """
     Export media data to an Excel file based on the specified media type.
 
     Args:
         media_type (constants.MEDIA_TYPE): The type of media to export (MOVIE or SERIES).
         path (str): The file path where the Excel output will be saved.
+        delta (bool, optional): Only export the changes since the last delta export.
 
     Returns:
         bool: True if the export is successful, False otherwise.
     """
     try:
-        if media_type not in [constants.MEDIA_TYPE.MOVIE, constants.MEDIA_TYPE.SERIES]:
-            raise ValueError(f"Invalid media type: {media_type}")
-
-        query = QUERY_EXPORT_MOVIES if media_type == constants.MEDIA_TYPE.MOVIE \
-           else QUERY_EXPORT_SERIES
-
-        df_media = dbhelper.execute_read(query)
+        exporter         = exportTools.get_exporter_key(__name__, media_type) if delta else None
+        df_media, to_seq = exportTools.get_export_data(media_type, exporter)
         df_media.to_excel(path, index=False)
+
+        if delta:
+            exportTools.save_watermark(exporter, to_seq)
         
         return True
     except ValueError as ve:
@@ -7,13 +7,13 @@ import model
 import pandas as pd
 import utils.metahelper as metahelper
 
-from datetime     import datetime
-from utils.common import isNumeric
+from utils.common import isNumeric, getTimestamp
 
 from utils.constants import (
     MEDIA_DETAILS,
     MEDIA_COLUMNS, 
     MOVIE_COLUMNS, 
+    EPISODE_COLUMNS,
     META_COLUMNS
 )
 
@@ -59,8 +59,11 @@ def save_movies(data : pd.DataFrame, column_map : dict) -> bool:
         bool: True if successful, False otherwise.
     """
     try:   
-        for _, row in data.iterrows():
-            movie_id       = model.add_new_movie(row[column_map[MEDIA_COLUMNS.TITLE]])
+        movie_ids = model.add_new_movies(data[column_map[MEDIA_COLUMNS.TITLE]].to_list())
+        if len(movie_ids) != len(data):
+            return False
+
+        for movie_id, (_, row) in zip(movie_ids, data.iterrows()):
             movie_details  = {}
             source_details = {}
 
@@ -84,7 +87,7 @@ def save_movies(data : pd.DataFrame, column_map : dict) -> bool:
                 movie_details[MEDIA_COLUMNS.WATCHED] = 1 if movie_details[MEDIA_COLUMNS.WATCHED] == True else 0
 
             movie_details[MEDIA_COLUMNS.ID]           = movie_id
-            movie_details[MEDIA_COLUMNS.UPDATED_DATE] = datetime.now().strftime('%d-%m-%Y %H:%M:%S')
+            movie_details[MEDIA_COLUMNS.UPDATED_DATE] = getTimestamp()
 
             genres    = row[column_map[MEDIA_DETAILS.GENRES]].split(',') \
                             if MEDIA_DETAILS.GENRES in column_map and not isNumeric(row[column_map[MEDIA_DETAILS.GENRES]]) \
@@ -141,7 +144,7 @@ def save_series(data : pd.DataFrame, column_map : dict) -> bool:
                 
             if series_title != prev_title:
                 series_details[MEDIA_COLUMNS.ID]           = series_id
-                series_details[MEDIA_COLUMNS.UPDATED_DATE] = datetime.now().strftime('%d-%m-%Y %H:%M:%S')
+                series_details[MEDIA_COLUMNS.UPDATED_DATE] = getTimestamp()
 
                 genres    = row[column_map[MEDIA_DETAILS.GENRES]].split(',') \
                                 if MEDIA_DETAILS.GENRES in column_map and not isNumeric(row[column_map[MEDIA_DETAILS.GENRES]]) \
@@ -156,9 +159,14 @@ def save_series(data : pd.DataFrame, column_map : dict) -> bool:
                                     genres,
                                     languages)
 
-            episode_id = model.add_new_episode(episode_details[MEDIA_COLUMNS.TITLE], series_id) 
+            episode_id = model.add_new_episode(episode_details.get(EPISODE_COLUMNS.SEASON),
+                                               episode_details.get(EPISODE_COLUMNS.EPISODE),
+                                               episode_details.get(MEDIA_COLUMNS.TITLE),
+                                               episode_details.get(MEDIA_COLUMNS.PLOT),
+                                               episode_details.get(MEDIA_COLUMNS.RELEASE_DATE),
+                                               series_id) 
             episode_details[MEDIA_COLUMNS.ID]           = episode_id
-            episode_details[MEDIA_COLUMNS.UPDATED_DATE] = datetime.now().strftime('%d-%m-%Y %H:%M:%S')
+            episode_details[MEDIA_COLUMNS.UPDATED_DATE] = getTimestamp()
 
             if MEDIA_COLUMNS.TO_BURN in episode_details:
                 episode_details[MEDIA_COLUMNS.TO_BURN] = 1 if episode_details[MEDIA_COLUMNS.TO_BURN] == True else 0
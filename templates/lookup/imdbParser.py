@@ -5,18 +5,23 @@
 # search_media()
 # get_media_details() 
 # get_season_episodes()
+# Optional methods:
+# get_series_episodes() - all seasons at once, used instead of calling
+#                         get_season_episodes() season by season
+# Optional variables:
+# http                  - HTTP client injected by httphelper.load_template
 #=======================================================================
-import json
-import requests
 import pandas as pd
+import utils.cachehelper as cachehelper
+import utils.httphelper as httphelper
 
-from imdb import Cinemagoer
 from utils.constants import (
     MEDIA_COLUMNS, 
     MEDIA_DETAILS,
     MOVIE_COLUMNS,
     SERIES_COLUMNS, 
-    EPISODE_COLUMNS
+    EPISODE_COLUMNS,
+    POSTER_MAX_BYTES
 )
 
 #=======================================================================
@@ -32,10 +37,29 @@ COL_MAPPING       = {
 
 MOVIE_TYPES       = ['movie', 'short', 'video movie', 'tv special', 'tv movie']
 
+''' HTTP client used for all requests, replaced by the application client when loaded through httphelper.load_template '''
+http              = httphelper.get_client()
+
 #=======================================================================
 def search_media(title : str) -> pd.DataFrame:
     """
     Searches for movies based on the given title and returns a DataFrame containing the results.
+    Results are served from the lookup cache when the same title was searched before, searches
+    without results are not cached so a failed search is retried.
+
+    Parameters:
+    title (str): The title of the movie to search for.
+
+    Returns:
+    pandas.DataFrame: A DataFrame containing the search results with columns 'Title', 'Year', and 'imdbID'.
+    """
+    return cachehelper.cached(f'imdb:search:{title.strip().lower()}', lambda: fetch_search_results(title),
+                              validate=lambda results: not results.empty)
+
+
+def fetch_search_results(title : str) -> pd.DataFrame:
+    """
+    Searches IMDb for movies and series matching the given title.
 
     Parameters:
     title (str): The title of the movie to search for.
@@ -43,8 +67,9 @@ def search_media(title : str) -> pd.DataFrame:
     Returns:
     pandas.DataFrame: A DataFrame containing the search results with columns 'Title', 'Year', and 'imdbID'.
     """
-    ia     = Cinemagoer()
-    movies = ia.search_movie(title=title)
+    with http.measure('cinemagoer'):
+        movies = http.get_cinemagoer().search_movie(title=title)
+
     data   = []
 
     for movie in movies:
@@ -58,6 +83,22 @@ def search_media(title : str) -> pd.DataFrame:
 
 
 def get_media_details(online_id : str):
+    """
+    Retrieves the media information for an IMDb identifier, served from the lookup cache
+    when the same media was looked up before. Details without a title are not cached.
+    See fetch_media_details for the details returned.
+
+    Parameters:
+    online_id (str): The IMDb identifier for the media.
+
+    Returns:
+    dict: The media details as returned by fetch_media_details.
+    """
+    return cachehelper.cached(f'imdb:details:{online_id}', lambda: fetch_media_details(online_id),
+                              validate=lambda details: bool(details[MEDIA_DETAILS.CONTENT][MEDIA_COLUMNS.ORIGINAL_TITLE]))
+
+
+def fetch_media_details(online_id : str):
     """
     Retrieves a summary of media information from the IMDb database using the Cinemagoer library.
 
@@ -73,8 +114,9 @@ def get_media_details(online_id : str):
         - 'languages': A string of comma-separated languages of the media.
         - 'cast': A dictionary of actors with their IMDb IDs as keys, containing their name, character, and episodes.
     """
-    ia        = Cinemagoer()
-    media     = ia.get_movie(online_id)
+    with http.measure('cinemagoer'):
+        media = http.get_cinemagoer().get_movie(online_id)
+
     rating    = 'Unknown' if 'certificates' not in media \
                 else [c for c in media['certificates'] if c.startswith('United States:')]
     if isinstance(rating, list):
@@ -98,8 +140,8 @@ def get_media_details(online_id : str):
     }
 
     if data[MEDIA_COLUMNS.POSTER_URL]:
-        size = requests.get(data[MEDIA_COLUMNS.POSTER_URL], stream = True).headers['Content-length']
-        if size and int(size) > 4000000 and '@' in data[MEDIA_COLUMNS.POSTER_URL]:
+        size = http.head(data[MEDIA_COLUMNS.POSTER_URL]).headers.get('Content-Length')
+        if size and int(size) > POSTER_MAX_BYTES and '@' in data[MEDIA_COLUMNS.POSTER_URL]:
             cover_url = media.get('cover url', None)
             url_split = cover_url.split('@')
             url_parts = ['@']
@@ -127,8 +169,8 @@ def get_media_details(online_id : str):
         data[MEDIA_COLUMNS.RELEASE_DATE] = release
         data[MOVIE_COLUMNS.RUNTIME]      = media.get('runtimes', [''])[0]
     else:
-        sdata  = requests.get(IMDB_SEASON_URL.format(media_id=f'tt{online_id}', season=1)).json()
-        epdata = requests.get(IMDB_DETAILS_URL.format(media_id=sdata['Episodes'][0]['imdbID'])).json()\
+        sdata  = http.get_json(IMDB_SEASON_URL.format(media_id=f'tt{online_id}', season=1))
+        epdata = http.get_json(IMDB_DETAILS_URL.format(media_id=sdata['Episodes'][0]['imdbID']))\
                     if 'Episodes' in sdata else None
         
         data[MEDIA_COLUMNS.DIRECTOR]     = epdata['Director'] if epdata else ''
@@ -167,22 +209,59 @@ def get_season_episodes(series_id : str, season : int) -> pd.DataFrame:
     Returns:
     pd.DataFrame: A DataFrame containing details of the episodes in the specified season, including the plot.
     """
-    data = requests.get(IMDB_SEASON_URL.format(media_id=f'tt{series_id}', season=season))
-    df   = pd.json_normalize(data.json())
+    return get_episodes(series_id, [season])
 
-    if 'Episodes' in df.columns:
-        df_episodes = pd.DataFrame(df.Episodes[0])
-        for idx, row in df_episodes.iterrows():
-            data = requests.get(IMDB_DETAILS_URL.format(media_id=row['imdbID']))
-            df_episodes.loc[idx, 'Plot'] = json.loads(data.content)['Plot']
 
-        df_episodes.drop([col for col in df_episodes.columns if col not in COL_MAPPING], axis=1, inplace=True)
-        df_episodes.rename(columns=COL_MAPPING, inplace=True)
-        df_episodes[EPISODE_COLUMNS.SEASON] = season
+def get_series_episodes(series_id : str, seasons : int) -> pd.DataFrame:
+    """
+    Retrieves episode information for all the seasons of a TV series from the IMDB database.
 
-        return df_episodes
-    
-    return pd.DataFrame()
+    Parameters:
+    series_id (str): The unique identifier for the TV series.
+    seasons (int): The number of seasons of the series.
+
+    Returns:
+    pd.DataFrame: A DataFrame containing details of the episodes of all seasons, including the plot.
+    """
+    return get_episodes(series_id, list(range(1, seasons + 1)))
+
+
+def get_episodes(series_id : str, seasons : list) -> pd.DataFrame:
+    """
+    Retrieves episode information for the given seasons of a TV series. The season listings are
+    fetched concurrently, followed by the details of all their episodes to fill in the plots.
+
+    Parameters:
+    series_id (str): The unique identifier for the TV series.
+    seasons (list): The season numbers for which the episodes are to be retrieved.
+
+    Returns:
+    pd.DataFrame: A DataFrame containing details of the episodes in the specified seasons, including the plot.
+    """
+    season_data = http.get_json_all([IMDB_SEASON_URL.format(media_id=f'tt{series_id}', season=season) 
+                                           for season in seasons])
+    df_seasons  = []
+
+    for season, data in zip(seasons, season_data):
+        if data and 'Episodes' in data:
+            df_season = pd.DataFrame(data['Episodes'])
+            df_season[EPISODE_COLUMNS.SEASON] = season
+            df_seasons.append(df_season)
+
+    if len(df_seasons) == 0:
+        return pd.DataFrame()
+
+    df_episodes = pd.concat(df_seasons, ignore_index=True)
+    details     = http.get_json_all([IMDB_DETAILS_URL.format(media_id=imdb_id) 
+                                           for imdb_id in df_episodes['imdbID']])
+
+    df_episodes['Plot'] = [detail.get('Plot', '') if detail else '' for detail in details]
+
+    df_episodes.drop([col for col in df_episodes.columns if col not in COL_MAPPING and col != EPISODE_COLUMNS.SEASON], 
+                     axis=1, inplace=True)
+    df_episodes.rename(columns=COL_MAPPING, inplace=True)
+
+    return df_episodes
 
 
 # def test():
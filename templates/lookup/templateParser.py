@@ -1,6 +1,6 @@
 import json
-import requests
 import pandas as pd
+import utils.httphelper as httphelper
 
 # Import your relevant libraries IMDb, TMDb, etc
 from utils.constants import (
@@ -12,6 +12,9 @@ from utils.constants import (
     DEFAULT_POSTER_PATH
 )
 
+# HTTP client for all outbound requests, injected by the application when the template is loaded
+http = httphelper.get_client()
+
 def search_media(title : str) -> pd.DataFrame:
     """
     Searches for movies based on the given title and returns a DataFrame containing the results.
@@ -72,7 +75,7 @@ def get_media_summary(media_id : str, online_id : str):
     if media.get('cover url', '') != '':
         poster_path = DEFAULT_POSTER_PATH.format(media.get('kind').replace('tv ', '')) + str(media_id) + '.jpg'
         with open(poster_path, 'wb') as f:
-            f.write(requests.get(media.get('cover url')).content)
+            f.write(http.get_content(media.get('cover url')))
 
     # Add runtime or season count basis movie or tv series
     if media.get('kind') == 'movie':
@@ -7,119 +7,175 @@
 #
 # The only mandatory methods to implement are generateContent() and
 # publishContent()
+#
+# Files are published incrementally: a manifest of the content hash of
+# every generated file is kept between runs, only the files whose hash
+# changed are rewritten and the deployment is skipped when nothing
+# changed, so the cost scales with the edits rather than the library
 #=======================================================================
+import os
+import model
 import pandas as pd
+import utils.dbhelper as dbhelper
+import templates.publish.publishTools as publishTools
 
-from json import loads, dumps
-
-from utils.constants import MEDIA_TYPE, MEDIA_COLUMNS, MEDIA_DETAILS, EPISODE_COLUMNS
-from templates.exportdata.exportCSV import export
+from utils.constants import MEDIA_TYPE, STATS_DIMENSION
+from templates.publish.publishQueries import QUERY_PUBLISH_MOVIES, QUERY_PUBLISH_EPISODES
 
 #=======================================================================
 FIREBASE_SITE_ID    = 'personal-mdb'
 WEB_APP_LOCATION    = '/Users/shahidkazi/Downloads/Apps'
 
 INDEX_TEMPLATE      = f'{WEB_APP_LOCATION}/movies/templates/index_template.html'
-RES_MOVIE_SUMMARY   = f'{WEB_APP_LOCATION}/movies/data/results_summary.txt'
+RES_MOVIE_SUMMARY   = '{0}/movies/data/results_summary.txt'
 RES_MOVIE_DASHBOARD = '{0}/movies/data/results_{1}.txt'
 RES_MOVIE_DETAIL    = '{0}/movies/data/{1}.txt'
-RES_SHOW_SUMNMARY   = f'{WEB_APP_LOCATION}/movies/data/results_shows.txt'
+RES_SHOW_SUMNMARY   = '{0}/movies/data/results_shows.txt'
 RES_SHOW_DETAIL     = '{0}/movies/data/{1}.txt'
 
-col_rename      = {
-    MEDIA_COLUMNS.ID               : 'TMDBID',
-    MEDIA_COLUMNS.TITLE            : 'Title',
-    MEDIA_COLUMNS.YEAR             : 'Year',
-    MEDIA_DETAILS.GENRES           : 'Genre',
-    MEDIA_COLUMNS.WATCHED          : 'Watched',
-    MEDIA_COLUMNS.TO_BURN          : 'ToBurn',
-    MEDIA_COLUMNS.ONLINE_RATING    : 'Rating',
-    MEDIA_COLUMNS.RATING           : 'UserRating',
-    MEDIA_COLUMNS.BACKUP_DISC      : 'Note',
-    MEDIA_COLUMNS.SIZE             : 'Size',
-    MEDIA_COLUMNS.POSTER_URL       : 'Poster',
-    MEDIA_COLUMNS.PLOT             : 'Plot',
-    EPISODE_COLUMNS.EPISODE_SEASON : 'EpSeason',
-    EPISODE_COLUMNS.EPISODE        : 'Episode',
-    EPISODE_COLUMNS.EPISODE_TITLE  : 'EpTitle',
-    EPISODE_COLUMNS.EPISODE_PLOT   : 'EpPlot'
-}
+QUALITY_4K          = '4K (2160p)'
+
+''' Content hash of every file generated by the last run, relative to the web app location '''
+MANIFEST_PATH       = os.path.join('templates', 'publish', 'temp', 'firebaseManifest.json')
+
+''' Files written and removed by the last call to generateContent(), None until content is generated '''
+last_changes        = None
 
 #=======================================================================
-def write_results(df_json, save_to):
+def get_results(df_json : pd.DataFrame) -> bytes:
     """
-    Save DataFrame results to a JSON file.
+    Serialise DataFrame results to the JSON content of a file.
 
     Args:
         df_json (pd.DataFrame): DataFrame to be saved.
-        save_to (str): Path to save the JSON output.
-    """
-    result = df_json.to_json(orient='table', index=None)
-    parsed = loads(result)
-    res    = dumps(parsed, indent=4)
 
-    with open (save_to, 'w') as f:
-        f.write(res)
+    Returns:
+        bytes: The encoded JSON.
+    """
+    return publishTools.to_table_json(df_json)
 
 
-def calc_percent(df_main : pd.DataFrame, df_subset : pd.DataFrame) -> str:
+def calc_percent(total : int, subset : int) -> str:
     """
-    Calculate the percentage of rows in df_subset compared to df_main.
+    Calculate the percentage of subset compared to total.
 
     Args:
-        df_main (pd.DataFrame): The main DataFrame.
-        df_subset (pd.DataFrame): The subset DataFrame.
+        total (int): The total count.
+        subset (int): The count of the subset.
 
     Returns:
         str: The percentage as a string.
     """
-    return '0' if len(df_main) == 0 else str((len(df_subset)/len(df_main))*100)
+    return '0' if total == 0 else str((subset/total)*100)
 
 
-def generate_summary(df_4k : pd.DataFrame, df_hd : pd.DataFrame):
+def generate_summary(location : str = WEB_APP_LOCATION) -> dict:
     """
-    Generate summary statistics for 4K and HD media and write results to a file.
+    Generate summary statistics for 4K and HD movies.
+    The figures are read from the MEDIA_STATS aggregate table rather than counted
+    from the exported rows; everything that is not 4K is reported as HD.
 
     Args:
-        df_4k (pd.DataFrame): DataFrame containing 4K media entries.
-        df_hd (pd.DataFrame): DataFrame containing HD media entries.
+        location (str, optional): The web app folder. Defaults to WEB_APP_LOCATION.
+
+    Returns:
+        dict: The content of the summary file by path.
     """
     print('----- Creating Dashboard Files ------')
 
-    to_burn_4k = df_4k[df_4k['ToBurn']  == True]
-    unseen_4k  = df_4k[df_4k['Watched'] == False]
-    to_burn_hd = df_hd[df_hd['ToBurn']  == True]
-    unseen_hd  = df_hd[df_hd['Watched'] == False]
+    df_stats = model.get_media_stats()
+    df_stats = df_stats[df_stats['MEDIA_TYPE'] == MEDIA_TYPE.MOVIE]
+
+    total    = df_stats[df_stats['DIMENSION'] == STATS_DIMENSION.TOTAL][['COUNT', 'WATCHED', 'TO_BURN']].sum()
+    total_4k = df_stats[(df_stats['DIMENSION'] == STATS_DIMENSION.QUALITY) & 
+                        (df_stats['NAME']      == QUALITY_4K)][['COUNT', 'WATCHED', 'TO_BURN']].sum()
+    total_hd = total - total_4k
 
-    df_stats = pd.DataFrame({'Total'    : [str(len(df_4k)), str(len(df_hd))],
-                             'ToBurn'   : [str(len(to_burn_4k)), str(len(to_burn_hd))],
-                             'ToBurnPC' : [calc_percent(df_4k, to_burn_4k), calc_percent(df_hd, to_burn_hd)],
-                             'Unseen'   : [str(len(unseen_4k)), str(len(unseen_hd))],
-                             'UnseenPC' : [calc_percent(df_4k, unseen_4k), calc_percent(df_hd, unseen_hd)]})
+    df_stats = pd.DataFrame({'Total'    : [str(total_4k['COUNT']), str(total_hd['COUNT'])],
+                             'ToBurn'   : [str(total_4k['TO_BURN']), str(total_hd['TO_BURN'])],
+                             'ToBurnPC' : [calc_percent(total_4k['COUNT'], total_4k['TO_BURN']),
+                                           calc_percent(total_hd['COUNT'], total_hd['TO_BURN'])],
+                             'Unseen'   : [str(total_4k['COUNT'] - total_4k['WATCHED']), 
+                                           str(total_hd['COUNT'] - total_hd['WATCHED'])],
+                             'UnseenPC' : [calc_percent(total_4k['COUNT'], total_4k['COUNT'] - total_4k['WATCHED']), 
+                                           calc_percent(total_hd['COUNT'], total_hd['COUNT'] - total_hd['WATCHED'])]})
 
-    write_results(df_stats, RES_MOVIE_SUMMARY)
+    return { RES_MOVIE_SUMMARY.format(location) : get_results(df_stats) }
 
 
-def generate_movie_results(df : pd.DataFrame, df_4k : pd.DataFrame, df_hd : pd.DataFrame):
+def get_imdb_ids(source_urls : pd.Series) -> pd.Series:
+    """
+    Extract the IMDB identifiers from the lookup source URLs, e.g. tt0133093 from
+    https://www.imdb.com/title/tt0133093/, in one vectorized operation.
+
+    Args:
+        source_urls (pd.Series): The SOURCE_URL of each media.
+
+    Returns:
+        pd.Series: The identifiers, empty for media without a source URL.
+    """
+    return source_urls.str.rsplit('/', n=2).str[1].fillna('')
+
+
+def get_movie_content() -> pd.DataFrame:
+    """
+    Read the movies in the shape of the published data. The projection already carries
+    the published column names, prefixed IDs and genres, only the IMDB identifiers and
+    the flags are derived here, column by column.
+
+    Returns:
+        pd.DataFrame: One row per movie, ordered by title.
+    """
+    df = dbhelper.execute_read(QUERY_PUBLISH_MOVIES)
+
+    df['IMDBID']  = get_imdb_ids(df.pop('SOURCE_URL'))
+    df['Watched'] = df['Watched'].astype(bool)
+    df['ToBurn']  = df['ToBurn'].astype(bool)
+
+    return df
+
+
+def get_series_content() -> pd.DataFrame:
+    """
+    Read the episodes of all series in the shape of the published data, one row per
+    episode and a single row without episode for series that have none.
+
+    Returns:
+        pd.DataFrame: One row per episode, ordered by title, season and episode.
     """
-    Generates and writes movie results for 4K and 1080p quality, 
+    df = dbhelper.execute_read(QUERY_PUBLISH_EPISODES)
+
+    df['IMDBID'] = get_imdb_ids(df.pop('SOURCE_URL'))
+
+    return df
+
+
+def generate_movie_results(df : pd.DataFrame, df_4k : pd.DataFrame, df_hd : pd.DataFrame, 
+                           location : str = WEB_APP_LOCATION) -> dict:
+    """
+    Generates movie results for 4K and 1080p quality, 
     along with detailed movie data.
 
     Args:
         df (pd.DataFrame): DataFrame containing all movie data.
         df_4k (pd.DataFrame): DataFrame filtered for 4K quality movies.
         df_hd (pd.DataFrame): DataFrame filtered for non-4K (1080p) movies.
+        location (str, optional): The web app folder. Defaults to WEB_APP_LOCATION.
+
+    Returns:
+        dict: The content of each file by path, the details as callables encoding them on demand.
     """
     print('----- Generating Results ---------')
 
     # Columns to include in the summary results
     results_cols = ['TMDBID', 'Title', 'Year', 'Genre', 'Watched', 'ToBurn', 'Note']
     config       = {'4K': df_4k, '1080p': df_hd}
+    files        = {}
 
-    # Generate and write dashboard results for each quality level
+    # Generate dashboard results for each quality level
     for quality, df_quality in config.items():
         df_summary = df_quality[results_cols].copy()
-        write_results(df_summary, RES_MOVIE_DASHBOARD.format(WEB_APP_LOCATION, quality))
+        files[RES_MOVIE_DASHBOARD.format(location, quality)] = get_results(df_summary)
 
     print('----- Creating Detail Data ------')
 
@@ -129,27 +185,31 @@ def generate_movie_results(df : pd.DataFrame, df_4k : pd.DataFrame, df_hd : pd.D
         'Rating', 'UserRating', 'Note', 'Size', 'Poster', 'Plot'
     ]
 
-    # Generate and write detailed results for each movie
-    df_details = df[results_cols].copy()
-    for _, row in df_details.iterrows():
-        write_results(row.to_frame().T, RES_MOVIE_DETAIL.format(WEB_APP_LOCATION, str(row['TMDBID'])))
+    # Generate detailed results for each movie, encoded on the thread pool that publishes them
+    details = publishTools.split_table_json(df[results_cols], 'TMDBID')
+    files.update({ RES_MOVIE_DETAIL.format(location, media_id) : content 
+                   for media_id, content in details.items() })
 
+    return files
 
-def generate_series_results(df : pd.DataFrame):
+
+def generate_series_results(df : pd.DataFrame, location : str = WEB_APP_LOCATION) -> dict:
     """
     Generates results for TV series from the provided dataframe, creating
     summaries of episodes, seasons, and individual series.
 
     Args:
         df (pd.DataFrame): DataFrame containing series data.
-    """
-    df['TMDBID'] = df['TMDBID'].apply(lambda x: f's{x}' if pd.notnull(x) else '')
+        location (str, optional): The web app folder. Defaults to WEB_APP_LOCATION.
 
+    Returns:
+        dict: The content of each file by path, the details as callables encoding them on demand.
+    """
     df_shows = (
-        df.groupby(by=['TMDBID', 'IMDBID', 'Title', 'EpSeason'])['Watched']
+        df.groupby(by=['TMDBID', 'IMDBID', 'Title', 'EpSeason'], dropna=False)['Episode']
         .count()
         .reset_index()
-        .rename(columns={'Watched': 'Episodes'})
+        .rename(columns={'Episode': 'Episodes'})
     )
 
     df_seasons = (
@@ -169,63 +229,83 @@ def generate_series_results(df : pd.DataFrame):
     episode_cols = ['TMDBID', 'IMDBID', 'Title', 'Rating', 'Poster', 'Plot', 'EpSeason', 'Episode', 'EpTitle', 'EpPlot']
     df_episodes  = df[episode_cols].merge(df_shows, on=['TMDBID', 'IMDBID', 'Title'], how="left")
 
-    for _, row in df_shows.iterrows():
-        filtered_df = df_episodes[df_episodes['TMDBID'] == row['TMDBID']]
-        write_results(filtered_df, RES_SHOW_DETAIL.format(WEB_APP_LOCATION, row['TMDBID']))
+    details = publishTools.split_table_json(df_episodes, 'TMDBID')
+    files   = { RES_SHOW_DETAIL.format(location, media_id) : content 
+                for media_id, content in details.items() }
 
-    write_results(df_shows, RES_SHOW_SUMNMARY)
+    files[RES_SHOW_SUMNMARY.format(location)] = get_results(df_shows)
 
+    return files
 
-def generate_media_content(media_type : MEDIA_TYPE) -> None:
+
+def generate_media_content(media_type : MEDIA_TYPE, location : str = WEB_APP_LOCATION) -> dict:
     """
-    Generates content based on the specified media type by exporting data, 
-    processing it, and generating summaries and results.
+    Generates content based on the specified media type by reading the published
+    projection of the library straight from the database, and generating summaries and results.
 
     Args:
         media_type (MEDIA_TYPE): The type of media (e.g., movie or series).
-    """
-    export_path = 'templates/publish/temp/mediaExport.csv'
-    export(media_type=media_type, path=export_path)
-
-    df = pd.read_csv(export_path, keep_default_na=False)
-    df.rename(columns=col_rename, inplace=True)
-    
-    df['IMDBID'] = df['SOURCE_URL'].apply(lambda x: x.rsplit('/', 2)[1] if len(x) > 0 else '')
+        location (str, optional): The web app folder. Defaults to WEB_APP_LOCATION.
 
+    Returns:
+        dict: The content of each file by path.
+    """
     if media_type == MEDIA_TYPE.MOVIE:
-        df['TMDBID'] = df['TMDBID'].apply(lambda x: 'm' + str(x))
-        df['Genre']  = df['Genre'].apply(lambda x: x.replace('Science Fiction', 'SciFi'))
+        df    = get_movie_content()
+        df_4k = df[df['QUALITY'] == QUALITY_4K]
+        df_hd = df[df['QUALITY'] != QUALITY_4K]
 
-        df_4k = df[df['QUALITY'] == '4K (2160p)']
-        df_hd = df[df['QUALITY'] != '4K (2160p)']
-
-        generate_summary(df_4k, df_hd)
-        generate_movie_results(df, df_4k, df_hd)
+        files = generate_summary(location)
+        files.update(generate_movie_results(df, df_4k, df_hd, location))
     else:
         print('----- Generating TV Series Data ------')
-        generate_series_results(df)
+        files = generate_series_results(get_series_content(), location)
 
-    print('----- Complete ------')
+    return files
 
 
-def generateContent() -> None:
+def generateContent(location : str = WEB_APP_LOCATION, manifest_path : str = MANIFEST_PATH) -> tuple:
     """
-    Generates content for both movies and TV series.
+    Generates content for both movies and TV series and writes the files whose content
+    changed since the last run, removing the files no longer generated. Only the local
+    web app folder is touched, the deployment is left to publishContent().
+
+    Args:
+        location (str, optional): The web app folder. Defaults to WEB_APP_LOCATION.
+        manifest_path (str, optional): The manifest of the last run. Defaults to MANIFEST_PATH.
+
+    Returns:
+        tuple: The paths of the files written and of the files removed, relative to the web app folder.
     """
-    generate_media_content(MEDIA_TYPE.MOVIE)
-    generate_media_content(MEDIA_TYPE.SERIES)
+    global last_changes
+
+    files = generate_media_content(MEDIA_TYPE.MOVIE, location)
+    files.update(generate_media_content(MEDIA_TYPE.SERIES, location))
+
+    print('----- Writing Changed Files ------')
+    last_changes = publishTools.publish_files(files, location, manifest_path)
+
+    changed, removed = last_changes
+    print(f'{len(changed)} of {len(files)} files changed, {len(removed)} removed')
+    print('----- Complete ------')
+
+    return last_changes
 
 
 def publishContent() -> bool:
     """
     Deploys content to Firebase Hosting for the specified website.
+    The deployment is skipped when the last generated content left every file unchanged.
 
     Returns:
         bool: True if deployment is successful, False otherwise.
     """
-    import os
     import subprocess
 
+    if last_changes is not None and not any(last_changes):
+        print('----- No Changes To Deploy ------')
+        return True
+
     env = os.environ.copy()
     env["PATH"] = "/usr/local/bin:/usr/bin:/bin:/usr/sbin:/sbin"
 
@@ -9,10 +9,13 @@
 # The mandatory methods to implement are 
 # publishDatabase()
 # publishDat()
+#
+# The database is backed up online with the SQLite backup API and
+# compressed, see utils.backuphelper, rather than zipping the raw files
 #=======================================================================
 
 import os
-import shutil
+import utils.backuphelper as backuphelper
 
 from googleapiclient.http          import MediaFileUpload
 from googleapiclient.discovery     import build
@@ -25,23 +28,20 @@ UPLOAD_FOLDER_ID     = '1S5E0vJnggpckQXtCO6F8VmMMuvDzUEaX'
 CREDENTIALS          = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
 SERVICE              = build('drive', 'v3', credentials=CREDENTIALS)
 
-SOURCE_DIRECTORY     = 'data/'
-BACKUP_FILENAME      = 'pmm_db_backup.zip'
+BACKUP_FILENAME      = 'pmm_db_backup'
 BACKUP_PATH          = os.path.join('templates', 'publish', 'temp', BACKUP_FILENAME)
 
+''' Path of the backup written by the last call to generateContent(), with the extension of its compression '''
+backup_file          = None
+
 #=======================================================================
 def generateContent() -> None:
     """
-    Create a backup file (e.g., zip file)
+    Create a consistent, compressed and integrity checked backup of the database.
     """
-    if os.path.exists(BACKUP_PATH):
-        os.remove(BACKUP_PATH)
+    global backup_file
 
-    shutil.make_archive(
-        os.path.splitext(BACKUP_PATH)[0],
-        'zip',
-        SOURCE_DIRECTORY
-    )
+    backup_file = backuphelper.backup_database(BACKUP_PATH)
 
 
 def publishContent() -> bool:
@@ -53,10 +53,10 @@ def publishContent() -> bool:
     :param folder_id: Optional Google Drive folder ID to upload the file into.
     :return: ID of the uploaded file.
     """
-    file_metadata            = {'name': os.path.basename(BACKUP_PATH)}
+    file_metadata            = {'name': os.path.basename(backup_file)}
     file_metadata['parents'] = [UPLOAD_FOLDER_ID]
 
-    media = MediaFileUpload(BACKUP_PATH, resumable=True)
+    media = MediaFileUpload(backup_file, resumable=True)
     
     SERVICE.files().create(body=file_metadata, media_body=media, fields='id').execute()
     
@@ -6,61 +6,134 @@
 # Use Prompt:
 # can i get details on how to set up google drive api credentials
 #
-# The mandatory methods to implement are 
+# The mandatory methods to implement are
 # publishDatabase()
 # publishDat()
+#
+# Posters are synced incrementally: a manifest of the (path, size, mtime,
+# hash) of every poster is kept between runs and each run archives only
+# the posters new or changed since the last publish, stored without
+# recompression. The first archive holds all posters and each following
+# delta archive lists the posters removed since the previous one, so the
+# folder is restored by extracting the archives in order. Archives are
+# uploaded to Google Drive, or moved to LOCAL_TARGET when set
 #=======================================================================
 
 import os
 import shutil
+import datetime
+import templates.publish.publishTools as publishTools
 
-from utils.metahelper              import get_app_config
-from googleapiclient.http          import MediaFileUpload
-from googleapiclient.discovery     import build
-from google.oauth2.service_account import Credentials
+from utils.constants  import APP_CONFIG, POSTER_STORE_DIR
+from utils.metahelper import get_app_config
 
 #=======================================================================
 SERVICE_ACCOUNT_FILE = 'templates/publish/key.json'
 SCOPES               = ['https://www.googleapis.com/auth/drive.file']
 UPLOAD_FOLDER_ID     = '1S5E0vJnggpckQXtCO6F8VmMMuvDzUEaX'
-CREDENTIALS          = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-SERVICE              = build('drive', 'v3', credentials=CREDENTIALS)
 
-SOURCE_DIRECTORY     = get_app_config('DEFAULT_POSTER_PATH')
-BACKUP_FILENAME      = 'pmm_poster_backup.zip'
-BACKUP_PATH          = os.path.join('templates', 'publish', 'temp', BACKUP_FILENAME)
+SOURCE_DIRECTORY     = get_app_config(APP_CONFIG.POSTER_PATH)
+BACKUP_FILENAME      = 'pmm_poster_backup_{0}_{1}.zip'
+BACKUP_FOLDER        = os.path.join('templates', 'publish', 'temp')
+MANIFEST_PATH        = os.path.join(BACKUP_FOLDER, 'posterManifest.json')
+REMOVED_ENTRY        = '.removed.json'
+
+''' Folder the archives are moved to instead of being uploaded to Google Drive, e.g. to publish offline '''
+LOCAL_TARGET         = None
+
+''' Files and folders never archived: the poster store, whose files are hard linked to the posters
+    of the media and archived through them, and Finder metadata '''
+EXCLUDE              = (POSTER_STORE_DIR, '.DS_Store')
+
+''' Archive generated by the last call to generateContent(), with the manifest to save once it is published '''
+pending              = None
 
 #=======================================================================
-def generateContent() -> None:
+def get_service():
     """
-    Create a backup file (e.g., zip file)
+    Build the Google Drive client from the service account credentials.
+
+    Returns:
+        Resource: The Google Drive v3 service.
     """
-    if os.path.exists(BACKUP_PATH):
-        os.remove(BACKUP_PATH)
+    from googleapiclient.discovery     import build
+    from google.oauth2.service_account import Credentials
 
-    shutil.make_archive(
-        os.path.splitext(BACKUP_PATH)[0],
-        'zip',
-        SOURCE_DIRECTORY
-    )
+    credentials = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
+    return build('drive', 'v3', credentials=credentials)
 
 
-def publishContent() -> bool:
+def generateContent(source : str = SOURCE_DIRECTORY, manifest_path : str = MANIFEST_PATH) -> str:
     """
-    Upload a file to Google Drive.
-    
-    :param file_path: Path to the file to be uploaded.
-    :param file_name: Desired name of the file on Google Drive.
-    :param folder_id: Optional Google Drive folder ID to upload the file into.
-    :return: ID of the uploaded file.
+    Create the archive of the posters new or changed since the last publish, a full
+    archive on the first run. Nothing is archived when no poster changed.
+
+    Args:
+        source (str, optional): The poster folder. Defaults to SOURCE_DIRECTORY.
+        manifest_path (str, optional): The manifest of the last publish. Defaults to MANIFEST_PATH.
+
+    Returns:
+        str: The path of the archive, None if no poster changed.
     """
-    file_metadata            = {'name': os.path.basename(BACKUP_PATH)}
-    file_metadata['parents'] = [UPLOAD_FOLDER_ID]
+    global pending
+
+    previous         = publishTools.load_manifest(manifest_path)
+    current          = publishTools.scan_files(source, previous, EXCLUDE)
+    changed, removed = publishTools.diff_manifest(previous, current)
+    pending          = None
+
+    print(f'{len(changed)} of {len(current)} posters changed, {len(removed)} removed')
+
+    if not changed and not removed:
+        return None
+
+    kind         = 'delta' if previous else 'full'
+    archive_path = os.path.join(BACKUP_FOLDER,
+                                BACKUP_FILENAME.format(kind, datetime.datetime.now().strftime('%Y%m%d%H%M%S%f')))
+
+    publishTools.write_archive(archive_path, source, changed,
+                               { REMOVED_ENTRY : publishTools.encode_json(removed) } if removed else None)
+
+    pending = (archive_path, current, manifest_path)
+    return archive_path
+
+
+def publishContent(target : str = None) -> bool:
+    """
+    Upload the archive of the last generateContent() to Google Drive, or move it to a local
+    folder, and record the published posters in the manifest.
+
+    Args:
+        target (str, optional): The local folder to publish to. Defaults to LOCAL_TARGET, Google Drive when not set.
+
+    Returns:
+        bool: True once published, also when there was nothing to publish.
+    """
+    global pending
+
+    if pending is None:
+        return True
+
+    archive_path, manifest, manifest_path = pending
+    target                                = target or LOCAL_TARGET
+
+    if target:
+        os.makedirs(target, exist_ok=True)
+        shutil.move(archive_path, os.path.join(target, os.path.basename(archive_path)))
+    else:
+        from googleapiclient.http import MediaFileUpload
+
+        file_metadata            = {'name': os.path.basename(archive_path)}
+        file_metadata['parents'] = [UPLOAD_FOLDER_ID]
+
+        media = MediaFileUpload(archive_path, resumable=True)
+
+        get_service().files().create(body=file_metadata, media_body=media, fields='id').execute()
+        os.remove(archive_path)
+
+    publishTools.save_manifest(manifest_path, manifest)
+    pending = None
 
-    media = MediaFileUpload(BACKUP_PATH, resumable=True)
-    
-    SERVICE.files().create(body=file_metadata, media_body=media, fields='id').execute()
-    
     return True
 
-#=======================================================================
\ No newline at end of file
+#=======================================================================
@@ -0,0 +1,43 @@
+#=======================================================================
+# Description:
+# Queries projecting the library in the shape of the data published by
+# the publishers, so no intermediate export file is needed
+#=======================================================================
+
+QUERY_PUBLISH_MOVIES = '''SELECT 'm' || m.ID AS TMDBID,
+                                 IFNULL(m.SOURCE_URL, '') AS SOURCE_URL,
+                                 IFNULL(m.TITLE, '') AS Title,
+                                 m.YEAR AS Year,
+                                 IFNULL(REPLACE((SELECT GROUP_CONCAT(g.GENRE)
+                                                 FROM MOVIE_GENRES mg
+                                                     INNER JOIN GENRES g ON mg.GENRE_ID = g.ID
+                                                 WHERE mg.MOVIE_ID = m.ID), 'Science Fiction', 'SciFi'), '') AS Genre,
+                                 IFNULL(m.WATCHED, 0) AS Watched,
+                                 IFNULL(m.TO_BURN, 0) AS ToBurn,
+                                 m.ONLINE_RATING AS Rating,
+                                 m.RATING AS UserRating,
+                                 IFNULL(m.BACKUP_DISC, '') AS Note,
+                                 IFNULL(m.SIZE, '') AS Size,
+                                 IFNULL(m.POSTER_URL, '') AS Poster,
+                                 IFNULL(m.PLOT, '') AS Plot,
+                                 IFNULL(mq.QUALITY, '') AS QUALITY
+                          FROM MOVIES m
+                              LEFT JOIN MEDIA_QUALITY mq ON m.QUALITY_ID = mq.ID
+                          ORDER BY m.TITLE'''
+
+
+QUERY_PUBLISH_EPISODES = '''SELECT 's' || s.ID AS TMDBID,
+                                   IFNULL(s.SOURCE_URL, '') AS SOURCE_URL,
+                                   IFNULL(s.TITLE, '') AS Title,
+                                   s.ONLINE_RATING AS Rating,
+                                   IFNULL(s.POSTER_URL, '') AS Poster,
+                                   IFNULL(s.PLOT, '') AS Plot,
+                                   se.SEASON AS EpSeason,
+                                   se.EPISODE AS Episode,
+                                   IFNULL(se.TITLE, '') AS EpTitle,
+                                   IFNULL(se.PLOT, '') AS EpPlot
+                            FROM TV_SERIES s
+                                LEFT JOIN TV_SERIES_EPISODES se ON s.ID = se.SERIES_ID
+                            ORDER BY s.TITLE, se.SEASON, se.EPISODE'''
+
+#=======================================================================
@@ -0,0 +1,310 @@
+#=======================================================================
+# Description:
+# Common utility methods used by the publishers to generate their files.
+# Frames are serialised in the pandas "table" JSON layout straight from
+# their records, without the to_json / loads / dumps round trip, split
+# per key with a single groupby, and written on a thread pool. orjson
+# is used to encode when installed, the json module otherwise.
+# A manifest of the content hash of every file is kept between runs so
+# that only the files whose content changed are rewritten, and files no
+# longer generated are removed. Folders published as archives are synced
+# the same way from a manifest of (path, size, mtime, hash), only new or
+# changed files are hashed and archived
+#=======================================================================
+import os
+import json
+import hashlib
+import zipfile
+import pandas as pd
+
+from concurrent.futures import ThreadPoolExecutor
+from pandas.io.json     import build_table_schema
+from utils.constants    import PUBLISH_MAX_WORKERS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+#=======================================================================
+def encode_json(payload : dict) -> bytes:
+    """
+    Encode a payload to compact JSON.
+
+    Args:
+        payload (dict): The payload, made of JSON compatible Python values.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON.
+    """
+    if orjson:
+        return orjson.dumps(payload)
+
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+def get_records(df : pd.DataFrame) -> list:
+    """
+    Convert a frame to records including its index, as in the pandas "table" layout.
+    Values are converted to Python types in one pass and missing values to None.
+
+    Args:
+        df (pd.DataFrame): The frame to convert.
+
+    Returns:
+        list: One dict per row, keyed by column name.
+    """
+    df = df.reset_index()
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+
+def to_table_json(df : pd.DataFrame) -> bytes:
+    """
+    Serialise a frame in the pandas "table" JSON layout, i.e. its schema and its records.
+
+    Args:
+        df (pd.DataFrame): The frame to serialise.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON.
+    """
+    return encode_json({ 'schema' : build_table_schema(df, index=True), 'data' : get_records(df) })
+
+
+def split_table_json(df : pd.DataFrame, key_column : str) -> dict:
+    """
+    Split a frame by the values of a column and serialise each part in the pandas "table" layout.
+    The schema and the records are built once for the whole frame and the parts are taken with
+    a single groupby, so the cost grows with the number of rows rather than rows times keys.
+    Each part is indexed from 0, so its content does not change when other parts are added or removed.
+
+    Args:
+        df (pd.DataFrame): The frame to split.
+        key_column (str): The column whose values identify the parts.
+
+    Returns:
+        dict: A callable per key returning the encoded JSON of its part, see publish_files.
+    """
+    schema  = build_table_schema(df, index=True)
+    records = get_records(df.reset_index(drop=True))
+    index   = schema['primaryKey'][0]
+
+    def encode(rows) -> bytes:
+        return encode_json({ 'schema' : schema, 
+                             'data'   : [{ **records[row], index : i } for i, row in enumerate(rows)] })
+
+    return { key : (lambda rows=rows: encode(rows))
+             for key, rows in df.groupby(key_column, sort=False).indices.items() }
+
+
+def get_digest(content : bytes) -> str:
+    """
+    Compute the content hash of a generated file.
+
+    Args:
+        content (bytes): The content of the file.
+
+    Returns:
+        str: The SHA-256 of the content.
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def load_manifest(path : str) -> dict:
+    """
+    Load the publish manifest of a publisher, i.e. the content hash of every file written by its last run.
+
+    Args:
+        path (str): The path of the manifest.
+
+    Returns:
+        dict: The content hash per file path relative to the output folder, empty if there is no manifest yet.
+    """
+    if not path or not os.path.exists(path):
+        return {}
+
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def save_manifest(path : str, manifest : dict) -> None:
+    """
+    Save the publish manifest of a publisher. The manifest is written to a temp file and
+    renamed, so an interrupted run leaves the previous manifest in place.
+
+    Args:
+        path (str): The path of the manifest.
+        manifest (dict): The content hash per file path relative to the output folder.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    with open(f'{path}.tmp', 'wb') as f:
+        f.write(encode_json(manifest))
+
+    os.replace(f'{path}.tmp', path)
+
+
+def publish_files(files : dict, root : str, manifest_path : str = None, max_workers : int = PUBLISH_MAX_WORKERS) -> tuple:
+    """
+    Write the generated files of a publisher incrementally. Each file is encoded and hashed on
+    a thread pool and only written if its hash differs from the manifest of the previous run,
+    or if it is missing from the output folder. Files of the previous run that were not generated
+    again are deleted. Without a manifest path every file is written.
+
+    Args:
+        files (dict): The content per path, either the encoded bytes or a callable returning them.
+        root (str): The output folder, the manifest stores the paths relative to it.
+        manifest_path (str, optional): The path of the manifest kept between runs.
+        max_workers (int, optional): The maximum number of parallel writes. Defaults to PUBLISH_MAX_WORKERS.
+
+    Returns:
+        tuple: The relative paths of the files written and of the files removed.
+    """
+    previous = load_manifest(manifest_path)
+
+    def publish(item : tuple) -> tuple:
+        path, content = item
+        content       = content() if callable(content) else content
+        key           = os.path.relpath(path, root)
+        digest        = get_digest(content)
+
+        if previous.get(key) == digest and os.path.exists(path):
+            return key, digest, False
+
+        with open(path, 'wb') as f:
+            f.write(content)
+
+        return key, digest, True
+
+    for folder in { os.path.dirname(path) or '.' for path in files }:
+        os.makedirs(folder, exist_ok=True)
+
+    manifest = {}
+    changed  = []
+
+    if files:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+            for key, digest, written in executor.map(publish, files.items()):
+                manifest[key] = digest
+                if written:
+                    changed.append(key)
+
+    removed = sorted(key for key in previous if key not in manifest)
+    for key in removed:
+        if os.path.exists(os.path.join(root, key)):
+            os.remove(os.path.join(root, key))
+
+    if manifest_path:
+        save_manifest(manifest_path, manifest)
+
+    return sorted(changed), removed
+
+
+def get_file_digest(path : str, chunk_size : int = 1024 * 1024) -> str:
+    """
+    Compute the content hash of a file, read in chunks.
+
+    Args:
+        path (str): The path of the file.
+        chunk_size (int, optional): The number of bytes read at a time.
+
+    Returns:
+        str: The SHA-256 of the file.
+    """
+    digest = hashlib.sha256()
+
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def scan_files(root : str, previous : dict = None, exclude : tuple = (), max_workers : int = PUBLISH_MAX_WORKERS) -> dict:
+    """
+    Build the manifest of a folder: the size, modification time and content hash of every file.
+    Files whose size and modification time match the previous manifest keep their hash, only
+    new or modified files are read, on a thread pool.
+
+    Args:
+        root (str): The folder to scan.
+        previous (dict, optional): The manifest of the previous scan.
+        exclude (tuple, optional): The names of the files and folders to skip, at any depth.
+        max_workers (int, optional): The maximum number of files hashed in parallel. Defaults to PUBLISH_MAX_WORKERS.
+
+    Returns:
+        dict: The size, mtime (in ns) and hash per file path relative to the folder, with / separators.
+    """
+    previous = previous or {}
+    manifest = {}
+    pending  = []
+
+    for folder, dirs, names in os.walk(root):
+        dirs[:] = sorted(name for name in dirs if name not in exclude)
+
+        for name in sorted(names):
+            if name in exclude:
+                continue
+
+            path  = os.path.join(folder, name)
+            key   = os.path.relpath(path, root).replace(os.sep, '/')
+            stat  = os.stat(path)
+            entry = { 'size' : stat.st_size, 'mtime' : stat.st_mtime_ns, 'hash' : None }
+
+            known = previous.get(key)
+            if known and known['size'] == entry['size'] and known['mtime'] == entry['mtime']:
+                entry['hash'] = known['hash']
+            else:
+                pending.append((key, path))
+
+            manifest[key] = entry
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            for (key, _), digest in zip(pending, executor.map(get_file_digest, [path for _, path in pending])):
+                manifest[key]['hash'] = digest
+
+    return manifest
+
+
+def diff_manifest(previous : dict, current : dict) -> tuple:
+    """
+    Compare two manifests of a folder by content hash.
+
+    Args:
+        previous (dict): The manifest of the previous scan.
+        current (dict): The manifest of the current scan.
+
+    Returns:
+        tuple: The paths of the files new or changed since the previous scan and of the files removed.
+    """
+    changed = [key for key, entry in current.items() if key not in previous or previous[key]['hash'] != entry['hash']]
+    removed = sorted(key for key in previous if key not in current)
+
+    return changed, removed
+
+
+def write_archive(path : str, root : str, files : list, extra : dict = None) -> None:
+    """
+    Write files of a folder to a zip archive without compression, for content such as
+    JPEG images that is already compressed. The archive is written to a temp file and
+    renamed, so an interrupted run never leaves a partial archive.
+
+    Args:
+        path (str): The path of the archive.
+        root (str): The folder the files are relative to.
+        files (list): The paths of the files to archive, relative to the folder.
+        extra (dict, optional): Additional entries as bytes per name, e.g. a list of removed files.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    with zipfile.ZipFile(f'{path}.tmp', 'w', compression=zipfile.ZIP_STORED) as archive:
+        for key in files:
+            archive.write(os.path.join(root, key), key)
+
+        for name, content in (extra or {}).items():
+            archive.writestr(name, content)
+
+    os.replace(f'{path}.tmp', path)
+
+#=======================================================================
@@ -10,6 +10,7 @@ from PySide6.QtWidgets import (
     QLabel, 
     QLayout, 
     QLineEdit, 
+    QProgressBar,
     QPushButton,
     QSizePolicy, 
     QSpacerItem, 
@@ -42,7 +43,7 @@ class Ui_BackupDialog(object):
         if not BackupDialog.objectName():
             BackupDialog.setObjectName(u"BackupDialog")
         BackupDialog.setWindowModality(Qt.WindowModality.ApplicationModal)
-        BackupDialog.resize(500, 125)
+        BackupDialog.resize(500, 150)
         
         sizePolicy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         sizePolicy.setHorizontalStretch(0)
@@ -79,6 +80,11 @@ class Ui_BackupDialog(object):
 
         self.verticalLayout_2.addLayout(self.horizontalLayout)
 
+        self.prgProgress = QProgressBar(self.groupBox)
+        self.prgProgress.setObjectName(u"prgProgress")
+        self.prgProgress.setValue(0)
+        self.verticalLayout_2.addWidget(self.prgProgress)
+
         self.horizontalLayout_2 = QHBoxLayout()
         self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
         
@@ -14,6 +14,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout, 
     QLabel,
     QLineEdit, 
+    QProgressBar,
     QPushButton,
     QSizePolicy,
     QSpacerItem,
@@ -43,7 +44,7 @@ class Ui_BulkUpdateDialog(object):
         if not BulkUpdateDialog.objectName():
             BulkUpdateDialog.setObjectName(u"BulkUpdateDialog")
         BulkUpdateDialog.setWindowModality(Qt.WindowModality.ApplicationModal)
-        BulkUpdateDialog.resize(600, 380)
+        BulkUpdateDialog.resize(600, 410)
 
         sizePolicy = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.MinimumExpanding)
         sizePolicy.setHorizontalStretch(0)
@@ -51,8 +52,8 @@ class Ui_BulkUpdateDialog(object):
         sizePolicy.setHeightForWidth(BulkUpdateDialog.sizePolicy().hasHeightForWidth())
         
         BulkUpdateDialog.setSizePolicy(sizePolicy)
-        BulkUpdateDialog.setMinimumSize(QSize(500, 380))
-        BulkUpdateDialog.setMaximumSize(QSize(16777215, 380))
+        BulkUpdateDialog.setMinimumSize(QSize(500, 410))
+        BulkUpdateDialog.setMaximumSize(QSize(16777215, 410))
         BulkUpdateDialog.setBaseSize(QSize(600, 403))
         BulkUpdateDialog.setModal(True)
         
@@ -176,6 +177,11 @@ class Ui_BulkUpdateDialog(object):
 
         self.verticalLayout.addLayout(self.formLayout)
 
+        self.prgProgress = QProgressBar(self.groupBox)
+        self.prgProgress.setObjectName(u"prgProgress")
+        self.prgProgress.setValue(0)
+        self.verticalLayout.addWidget(self.prgProgress)
+
         self.horizontalLayout = QHBoxLayout()
         self.horizontalLayout.setObjectName(u"horizontalLayout")
         self.lblStatus = QLabel(self.groupBox)
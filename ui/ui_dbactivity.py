@@ -0,0 +1,135 @@
+#=======================================================================
+# Description:
+# UI component declaration for the DB Activity Dialog box
+#=======================================================================
+from PySide6.QtCore import QCoreApplication, QMetaObject, QSize, Qt
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QCheckBox,
+    QComboBox,
+    QDialogButtonBox,
+    QGroupBox,
+    QHBoxLayout,
+    QLabel,
+    QPlainTextEdit,
+    QSizePolicy,
+    QSpacerItem,
+    QTableView,
+    QVBoxLayout
+)
+
+#=======================================================================
+class Ui_DBActivityDialog(object):
+    """
+    This class is responsible for setting up the user interface of the DB Activity dialog window.
+    It defines the view selector, the table of recorded statements and the details of the selected row.
+
+    Methods:
+    --------
+    setupUi(DBActivityDialog):
+        Sets up the user interface for the DBActivityDialog window, including layout, widgets, and connections.
+
+    retranslateUi(DBActivityDialog):
+        Updates the user interface elements of the DBActivityDialog with translated text.
+    """
+
+    def setupUi(self, DBActivityDialog):
+        """
+        Sets up the user interface for the DBActivityDialog window.
+
+        Parameters:
+        DBActivityDialog (QDialog): The dialog window that displays the database activity.
+        """
+        if not DBActivityDialog.objectName():
+            DBActivityDialog.setObjectName(u"DBActivityDialog")
+        DBActivityDialog.setWindowModality(Qt.WindowModality.NonModal)
+        DBActivityDialog.resize(900, 600)
+        DBActivityDialog.setModal(False)
+
+        self.verticalLayout = QVBoxLayout(DBActivityDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+
+        self.groupBox = QGroupBox(DBActivityDialog)
+        self.groupBox.setObjectName(u"groupBox")
+
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+        self.horizontalLayout.addWidget(self.label)
+
+        self.cbView = QComboBox(self.groupBox)
+        self.cbView.setObjectName(u"cbView")
+        self.cbView.setMinimumSize(QSize(200, 0))
+        self.horizontalLayout.addWidget(self.cbView)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.lblSummary = QLabel(self.groupBox)
+        self.lblSummary.setObjectName(u"lblSummary")
+        self.horizontalLayout.addWidget(self.lblSummary)
+
+        self.chkAutoRefresh = QCheckBox(self.groupBox)
+        self.chkAutoRefresh.setObjectName(u"chkAutoRefresh")
+        self.chkAutoRefresh.setChecked(True)
+        self.horizontalLayout.addWidget(self.chkAutoRefresh)
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+
+        self.tblActivity = QTableView(self.groupBox)
+        self.tblActivity.setObjectName(u"tblActivity")
+        self.tblActivity.setMinimumSize(QSize(850, 325))
+        self.tblActivity.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.tblActivity.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.tblActivity.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.tblActivity.verticalHeader().setVisible(False)
+        self.tblActivity.horizontalHeader().setResizeContentsPrecision(100)
+        self.verticalLayout_2.addWidget(self.tblActivity)
+
+        self.txtDetails = QPlainTextEdit(self.groupBox)
+        self.txtDetails.setObjectName(u"txtDetails")
+        self.txtDetails.setMaximumSize(QSize(16777215, 150))
+        self.txtDetails.setReadOnly(True)
+        self.txtDetails.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
+        font = QFont(u"Monospace")
+        font.setStyleHint(QFont.StyleHint.TypeWriter)
+        self.txtDetails.setFont(font)
+        self.verticalLayout_2.addWidget(self.txtDetails)
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.buttonBox = QDialogButtonBox(DBActivityDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.StandardButton.Reset | QDialogButtonBox.StandardButton.Close)
+        self.verticalLayout.addWidget(self.buttonBox)
+
+        self.buttonBox.rejected.connect(DBActivityDialog.reject)
+
+        self.retranslateUi(DBActivityDialog)
+
+        QMetaObject.connectSlotsByName(DBActivityDialog)
+    # setupUi
+
+    def retranslateUi(self, DBActivityDialog):
+        """
+        Updates the user interface elements of the DBActivityDialog with translated text.
+
+        Parameters:
+        DBActivityDialog (QDialog): The dialog window that displays the database activity.
+        """
+        DBActivityDialog.setWindowTitle(QCoreApplication.translate("DBActivityDialog", u"DB Activity", None))
+        self.groupBox.setTitle("")
+        self.label.setText(QCoreApplication.translate("DBActivityDialog", u"View", None))
+        self.chkAutoRefresh.setText(QCoreApplication.translate("DBActivityDialog", u"Auto refresh", None))
+        self.lblSummary.setText("")
+        self.txtDetails.setPlaceholderText(QCoreApplication.translate("DBActivityDialog", u"Select a row to see the full statement, its callers and its query plan", None))
+    # retranslateUi
+
+#=======================================================================
@@ -0,0 +1,154 @@
+#=======================================================================
+# Description:
+# UI Component declaration for the Backup Disc Planner Dialog box
+#=======================================================================
+from PySide6.QtCore    import QCoreApplication, QMetaObject, QSize, Qt
+from PySide6.QtGui     import QIcon
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QGroupBox,
+    QHBoxLayout,
+    QLabel,
+    QLayout,
+    QLineEdit,
+    QPushButton,
+    QSizePolicy,
+    QSpacerItem,
+    QTableView,
+    QVBoxLayout
+)
+
+#=======================================================================
+class Ui_DiscPlannerDialog(object):
+    """
+    This class is responsible for setting up the user interface of the Disc Planner Dialog.
+    It defines the disc capacity and label inputs, the table listing the planned discs and the action buttons.
+
+    Methods:
+    --------
+    setupUi(DiscPlannerDialog):
+        Configures the UI components and layout for the DiscPlannerDialog.
+
+    retranslateUi(DiscPlannerDialog):
+        Updates the text of various UI components within the DiscPlannerDialog to support internationalization.
+    """
+
+    def setupUi(self, DiscPlannerDialog):
+        """
+        Configures the UI components and layout for the DiscPlannerDialog.
+
+        Parameters:
+        DiscPlannerDialog (QDialog): The dialog window to be set up.
+        """
+        if not DiscPlannerDialog.objectName():
+            DiscPlannerDialog.setObjectName(u"DiscPlannerDialog")
+        DiscPlannerDialog.setWindowModality(Qt.WindowModality.ApplicationModal)
+        DiscPlannerDialog.resize(600, 450)
+        DiscPlannerDialog.setModal(True)
+
+        self.verticalLayout = QVBoxLayout(DiscPlannerDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
+
+        self.groupBox = QGroupBox(DiscPlannerDialog)
+        self.groupBox.setObjectName(u"groupBox")
+
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+        self.horizontalLayout.addWidget(self.label)
+
+        self.cbCapacity = QComboBox(self.groupBox)
+        self.cbCapacity.setObjectName(u"cbCapacity")
+        self.cbCapacity.setMinimumSize(QSize(175, 0))
+        self.horizontalLayout.addWidget(self.cbCapacity)
+
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+        self.horizontalLayout.addWidget(self.label_2)
+
+        self.txtPrefix = QLineEdit(self.groupBox)
+        self.txtPrefix.setObjectName(u"txtPrefix")
+        self.txtPrefix.setMaximumSize(QSize(100, 16777215))
+        self.horizontalLayout.addWidget(self.txtPrefix)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.btnPlan = QPushButton(self.groupBox)
+        self.btnPlan.setObjectName(u"btnPlan")
+        self.btnPlan.setAutoDefault(False)
+        self.horizontalLayout.addWidget(self.btnPlan)
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+
+        self.tblDiscs = QTableView(self.groupBox)
+        self.tblDiscs.setObjectName(u"tblDiscs")
+        self.tblDiscs.setMinimumSize(QSize(575, 325))
+        self.tblDiscs.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.tblDiscs.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.tblDiscs.verticalHeader().setVisible(False)
+        self.tblDiscs.horizontalHeader().setStretchLastSection(True)
+        self.tblDiscs.horizontalHeader().setResizeContentsPrecision(100)
+        self.verticalLayout_2.addWidget(self.tblDiscs)
+
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+
+        self.lblStatus = QLabel(self.groupBox)
+        self.lblStatus.setObjectName(u"lblStatus")
+        self.horizontalLayout_2.addWidget(self.lblStatus)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.btnCancel = QPushButton(self.groupBox)
+        self.btnCancel.setObjectName(u"btnCancel")
+        icon = QIcon()
+        icon.addFile(u"images/icons/circle-xmark-solid.svg", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.btnCancel.setIcon(icon)
+        self.btnCancel.setIconSize(QSize(13, 13))
+        self.btnCancel.setAutoDefault(False)
+        self.horizontalLayout_2.addWidget(self.btnCancel)
+
+        self.btnSave = QPushButton(self.groupBox)
+        self.btnSave.setObjectName(u"btnSave")
+        icon1 = QIcon()
+        icon1.addFile(u"images/icons/circle-check-solid.svg", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.btnSave.setIcon(icon1)
+        self.btnSave.setIconSize(QSize(13, 13))
+        self.btnSave.setEnabled(False)
+        self.horizontalLayout_2.addWidget(self.btnSave)
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.retranslateUi(DiscPlannerDialog)
+
+        QMetaObject.connectSlotsByName(DiscPlannerDialog)
+    # setupUi
+
+    def retranslateUi(self, DiscPlannerDialog):
+        """
+        Updates the text of various UI components within the DiscPlannerDialog to support internationalization.
+
+        Parameters:
+        DiscPlannerDialog (QDialog): The dialog window whose UI components are being updated.
+        """
+        DiscPlannerDialog.setWindowTitle(QCoreApplication.translate("DiscPlannerDialog", u"Disc Planner", None))
+        self.groupBox.setTitle("")
+        self.lblStatus.setText("")
+        self.label.setText(QCoreApplication.translate("DiscPlannerDialog", u"Disc", None))
+        self.label_2.setText(QCoreApplication.translate("DiscPlannerDialog", u"Label", None))
+        self.btnPlan.setText(QCoreApplication.translate("DiscPlannerDialog", u"Plan", None))
+        self.btnCancel.setText(QCoreApplication.translate("DiscPlannerDialog", u"Cancel", None))
+        self.btnSave.setText(QCoreApplication.translate("DiscPlannerDialog", u"Apply", None))
+    # retranslateUi
+
+#=======================================================================
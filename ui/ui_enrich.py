@@ -0,0 +1,167 @@
+#=======================================================================
+# Description:
+# UI Component declaration for the Batch Enrichment Dialog box
+#=======================================================================
+from PySide6.QtCore    import QCoreApplication, QMetaObject, QSize, Qt
+from PySide6.QtGui     import QIcon
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QGroupBox,
+    QHBoxLayout,
+    QLabel,
+    QLayout,
+    QProgressBar,
+    QPushButton,
+    QSizePolicy,
+    QSpacerItem,
+    QTableView,
+    QVBoxLayout
+)
+
+#=======================================================================
+class Ui_EnrichDialog(object):
+    """
+    This class is responsible for setting up the user interface of the Batch Enrichment Dialog.
+    It defines the lookup source selector, the queue summary, the list of queued items by status,
+    the progress bar and the action buttons.
+
+    Methods:
+    --------
+    setupUi(EnrichDialog):
+        Configures the UI components and layout for the EnrichDialog.
+
+    retranslateUi(EnrichDialog):
+        Updates the text of various UI components within the EnrichDialog to support internationalization.
+    """
+
+    def setupUi(self, EnrichDialog):
+        """
+        Configures the UI components and layout for the EnrichDialog.
+
+        Parameters:
+        EnrichDialog (QDialog): The dialog window to be set up.
+        """
+        if not EnrichDialog.objectName():
+            EnrichDialog.setObjectName(u"EnrichDialog")
+        EnrichDialog.setWindowModality(Qt.WindowModality.ApplicationModal)
+        EnrichDialog.resize(650, 550)
+        EnrichDialog.setModal(True)
+
+        self.verticalLayout = QVBoxLayout(EnrichDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
+
+        self.groupBox = QGroupBox(EnrichDialog)
+        self.groupBox.setObjectName(u"groupBox")
+
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+        self.horizontalLayout.addWidget(self.label)
+
+        self.cbSource = QComboBox(self.groupBox)
+        self.cbSource.setObjectName(u"cbSource")
+        self.cbSource.setMinimumSize(QSize(150, 0))
+        self.horizontalLayout.addWidget(self.cbSource)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.btnStart = QPushButton(self.groupBox)
+        self.btnStart.setObjectName(u"btnStart")
+        icon = QIcon()
+        icon.addFile(u"images/icons/circle-check-solid.svg", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.btnStart.setIcon(icon)
+        self.btnStart.setIconSize(QSize(13, 13))
+        self.btnStart.setAutoDefault(False)
+        self.horizontalLayout.addWidget(self.btnStart)
+
+        self.btnStop = QPushButton(self.groupBox)
+        self.btnStop.setObjectName(u"btnStop")
+        icon1 = QIcon()
+        icon1.addFile(u"images/icons/circle-xmark-solid.svg", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.btnStop.setIcon(icon1)
+        self.btnStop.setIconSize(QSize(13, 13))
+        self.btnStop.setAutoDefault(False)
+        self.btnStop.setEnabled(False)
+        self.horizontalLayout.addWidget(self.btnStop)
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+
+        self.tblSummary = QTableView(self.groupBox)
+        self.tblSummary.setObjectName(u"tblSummary")
+        self.tblSummary.setMinimumSize(QSize(625, 125))
+        self.tblSummary.setMaximumSize(QSize(16777215, 125))
+        self.tblSummary.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.tblSummary.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.tblSummary.verticalHeader().setVisible(False)
+        self.tblSummary.horizontalHeader().setStretchLastSection(True)
+        self.verticalLayout_2.addWidget(self.tblSummary)
+
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+        self.horizontalLayout_2.addWidget(self.label_2)
+
+        self.cbStatus = QComboBox(self.groupBox)
+        self.cbStatus.setObjectName(u"cbStatus")
+        self.cbStatus.setMinimumSize(QSize(150, 0))
+        self.horizontalLayout_2.addWidget(self.cbStatus)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+
+        self.tblItems = QTableView(self.groupBox)
+        self.tblItems.setObjectName(u"tblItems")
+        self.tblItems.setMinimumSize(QSize(625, 250))
+        self.tblItems.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.tblItems.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.tblItems.verticalHeader().setVisible(False)
+        self.tblItems.horizontalHeader().setStretchLastSection(True)
+        self.tblItems.horizontalHeader().setResizeContentsPrecision(100)
+        self.verticalLayout_2.addWidget(self.tblItems)
+
+        self.prgProgress = QProgressBar(self.groupBox)
+        self.prgProgress.setObjectName(u"prgProgress")
+        self.prgProgress.setValue(0)
+        self.verticalLayout_2.addWidget(self.prgProgress)
+
+        self.lblStatus = QLabel(self.groupBox)
+        self.lblStatus.setObjectName(u"lblStatus")
+        self.lblStatus.setWordWrap(True)
+        self.verticalLayout_2.addWidget(self.lblStatus)
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.retranslateUi(EnrichDialog)
+
+        QMetaObject.connectSlotsByName(EnrichDialog)
+    # setupUi
+
+    def retranslateUi(self, EnrichDialog):
+        """
+        Updates the text of various UI components within the EnrichDialog to support internationalization.
+
+        Parameters:
+        EnrichDialog (QDialog): The dialog window whose UI components are being updated.
+        """
+        EnrichDialog.setWindowTitle(QCoreApplication.translate("EnrichDialog", u"Batch Enrichment", None))
+        self.groupBox.setTitle("")
+        self.lblStatus.setText("")
+        self.label.setText(QCoreApplication.translate("EnrichDialog", u"Source", None))
+        self.label_2.setText(QCoreApplication.translate("EnrichDialog", u"Show", None))
+        self.btnStart.setText(QCoreApplication.translate("EnrichDialog", u"Start", None))
+        self.btnStop.setText(QCoreApplication.translate("EnrichDialog", u"Stop", None))
+    # retranslateUi
+
+#=======================================================================
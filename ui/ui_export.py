@@ -5,6 +5,7 @@
 from PySide6.QtCore    import QCoreApplication, QMetaObject, QSize
 from PySide6.QtGui     import QIcon
 from PySide6.QtWidgets import (
+    QCheckBox,
     QDialogButtonBox,
     QHBoxLayout, 
     QGroupBox,
@@ -84,6 +85,10 @@ class Ui_ExportDialog(object):
         self.horizontalLayout_2.addWidget(self.btnBrowse)
         self.verticalLayout.addLayout(self.horizontalLayout_2)
 
+        self.chkDelta = QCheckBox(self.groupBox)
+        self.chkDelta.setObjectName(u"chkDelta")
+        self.verticalLayout.addWidget(self.chkDelta)
+
         self.horizontalLayout = QHBoxLayout()
         self.horizontalLayout.setObjectName(u"horizontalLayout")
         self.horizontalLayout.setContentsMargins(-1, 0, -1, -1)
@@ -131,6 +136,7 @@ class Ui_ExportDialog(object):
         ExportDialog.setWindowTitle(QCoreApplication.translate("ExportDialog", u"Dialog", None))
         self.label_2.setText(QCoreApplication.translate("ExportDialog", u"Select Export Template", None))
         self.label.setText(QCoreApplication.translate("ExportDialog", u"Destination", None))
+        self.chkDelta.setText(QCoreApplication.translate("ExportDialog", u"Only export changes since the last delta export", None))
         self.btnCancel.setText(QCoreApplication.translate("ExportDialog", u"Cancel", None))
         self.btnCancel.setAutoDefault(False)
         self.btnSave.setText(QCoreApplication.translate("ExportDialog", u"Export", None))
@@ -23,7 +23,7 @@ class Ui_FiltersDialog(object):
     def setupUi(self, FiltersDialog):
         if not FiltersDialog.objectName():
             FiltersDialog.setObjectName(u"FiltersDialog")
-        FiltersDialog.resize(493, 324)
+        FiltersDialog.resize(493, 420)
         
         self.verticalLayout_2 = QVBoxLayout(FiltersDialog)
         self.verticalLayout_2.setObjectName(u"verticalLayout_2")
@@ -115,6 +115,33 @@ class Ui_FiltersDialog(object):
         sizePolicy.setHeightForWidth(self.cbToBurn.sizePolicy().hasHeightForWidth())
         self.cbToBurn.setSizePolicy(sizePolicy)
         self.formLayout.setWidget(6, QFormLayout.FieldRole, self.cbToBurn)
+
+        self.addedSinceLabel = QLabel(self.groupBox)
+        self.addedSinceLabel.setObjectName(u"addedSinceLabel")
+        self.formLayout.setWidget(7, QFormLayout.LabelRole, self.addedSinceLabel)
+
+        self.txtAddedSince = QLineEdit(self.groupBox)
+        self.txtAddedSince.setObjectName(u"txtAddedSince")
+        self.txtAddedSince.setMinimumSize(QSize(350, 0))
+        self.formLayout.setWidget(7, QFormLayout.FieldRole, self.txtAddedSince)
+
+        self.releasedFromLabel = QLabel(self.groupBox)
+        self.releasedFromLabel.setObjectName(u"releasedFromLabel")
+        self.formLayout.setWidget(8, QFormLayout.LabelRole, self.releasedFromLabel)
+
+        self.txtReleasedFrom = QLineEdit(self.groupBox)
+        self.txtReleasedFrom.setObjectName(u"txtReleasedFrom")
+        self.txtReleasedFrom.setMinimumSize(QSize(350, 0))
+        self.formLayout.setWidget(8, QFormLayout.FieldRole, self.txtReleasedFrom)
+
+        self.releasedToLabel = QLabel(self.groupBox)
+        self.releasedToLabel.setObjectName(u"releasedToLabel")
+        self.formLayout.setWidget(9, QFormLayout.LabelRole, self.releasedToLabel)
+
+        self.txtReleasedTo = QLineEdit(self.groupBox)
+        self.txtReleasedTo.setObjectName(u"txtReleasedTo")
+        self.txtReleasedTo.setMinimumSize(QSize(350, 0))
+        self.formLayout.setWidget(9, QFormLayout.FieldRole, self.txtReleasedTo)
         self.verticalLayout.addLayout(self.formLayout)
 
         self.horizontalLayout_2 = QHBoxLayout()
@@ -182,6 +209,13 @@ class Ui_FiltersDialog(object):
         self.cbToBurn.setItemText(1, QCoreApplication.translate("FiltersDialog", u"To Burn", None))
         self.cbToBurn.setItemText(2, QCoreApplication.translate("FiltersDialog", u"To Not Burn", None))
 
+        self.addedSinceLabel.setText(QCoreApplication.translate("FiltersDialog", u"Added Since", None))
+        self.txtAddedSince.setPlaceholderText(QCoreApplication.translate("FiltersDialog", u"YYYY-MM-DD", None))
+        self.releasedFromLabel.setText(QCoreApplication.translate("FiltersDialog", u"Released From", None))
+        self.txtReleasedFrom.setPlaceholderText(QCoreApplication.translate("FiltersDialog", u"YYYY-MM-DD", None))
+        self.releasedToLabel.setText(QCoreApplication.translate("FiltersDialog", u"Released To", None))
+        self.txtReleasedTo.setPlaceholderText(QCoreApplication.translate("FiltersDialog", u"YYYY-MM-DD", None))
+
         self.btnClose.setText(QCoreApplication.translate("FiltersDialog", u"Cancel", None))
         self.btnClose.setAutoDefault(False)
         self.btnReset.setText(QCoreApplication.translate("FiltersDialog", u"Reset", None))
@@ -133,6 +133,14 @@ class Ui_MainWindow(object):
         self.actionFAQs.setIconVisibleInMenu(True)
         self.actionFAQs.setShortcutVisibleInContextMenu(True)
         
+        self.actionDBActivity = QAction(MainWindow)
+        self.actionDBActivity.setObjectName(u"actionDBActivity")
+        icon17 = QIcon()
+        icon17.addFile(u"images/icons/magnifying-glass-solid.svg", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.actionDBActivity.setIcon(icon17)
+        self.actionDBActivity.setIconVisibleInMenu(True)
+        self.actionDBActivity.setShortcutVisibleInContextMenu(True)
+        
         self.actionAbout = QAction(MainWindow)
         self.actionAbout.setObjectName(u"actionAbout")
         icon8 = QIcon()
@@ -174,6 +182,30 @@ class Ui_MainWindow(object):
         self.actionFetchDetails.setIconVisibleInMenu(True)
         self.actionFetchDetails.setShortcutVisibleInContextMenu(True)
         
+        self.actionStats = QAction(MainWindow)
+        self.actionStats.setObjectName(u"actionStats")
+        icon13 = QIcon()
+        icon13.addFile(u"images/icons/rectangle-list-regular.svg", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.actionStats.setIcon(icon13)
+        self.actionStats.setIconVisibleInMenu(True)
+        self.actionStats.setShortcutVisibleInContextMenu(True)
+        
+        self.actionDiscPlanner = QAction(MainWindow)
+        self.actionDiscPlanner.setObjectName(u"actionDiscPlanner")
+        icon14 = QIcon()
+        icon14.addFile(u"images/icons/compact-disc-solid.svg", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.actionDiscPlanner.setIcon(icon14)
+        self.actionDiscPlanner.setIconVisibleInMenu(True)
+        self.actionDiscPlanner.setShortcutVisibleInContextMenu(True)
+
+        self.actionEnrich = QAction(MainWindow)
+        self.actionEnrich.setObjectName(u"actionEnrich")
+        icon16 = QIcon()
+        icon16.addFile(u"images/icons/photo-film-solid.svg", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.actionEnrich.setIcon(icon16)
+        self.actionEnrich.setIconVisibleInMenu(True)
+        self.actionEnrich.setShortcutVisibleInContextMenu(True)
+        
         self.centralwidget = QWidget(MainWindow)
         self.centralwidget.setObjectName(u"centralwidget")
         
@@ -1092,8 +1124,12 @@ class Ui_MainWindow(object):
         self.menuMedia.addAction(self.actionBulkUpdate)
         self.menuMedia.addSeparator()
         self.menuMedia.addAction(self.actionFetchDetails)
+        self.menuMedia.addAction(self.actionEnrich)
+        self.menuMedia.addAction(self.actionStats)
+        self.menuMedia.addAction(self.actionDiscPlanner)
         
         self.menuHelp.addAction(self.actionFAQs)
+        self.menuHelp.addAction(self.actionDBActivity)
         self.menuHelp.addSeparator()
         self.menuHelp.addAction(self.actionAbout)
         
@@ -1103,7 +1139,10 @@ class Ui_MainWindow(object):
         self.toolBar.addAction(self.actionDelete)
         self.toolBar.addSeparator()
         self.toolBar.addAction(self.actionFetchDetails)
+        self.toolBar.addAction(self.actionEnrich)
         self.toolBar.addAction(self.actionPublish)
+        self.toolBar.addAction(self.actionStats)
+        self.toolBar.addAction(self.actionDiscPlanner)
         self.toolBar.addSeparator()
         self.toolBar.addAction(self.actionImportData)
         self.toolBar.addAction(self.actionExportData)
@@ -1191,12 +1230,24 @@ class Ui_MainWindow(object):
         self.actionFAQs.setText(QCoreApplication.translate("MainWindow", u"&FAQs", None))
         self.actionFAQs.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+H", None))
 
+        self.actionDBActivity.setText(QCoreApplication.translate("MainWindow", u"&DB Activity", None))
+        self.actionDBActivity.setToolTip(QCoreApplication.translate("MainWindow", u"Statements run on the database, with their timings and callers", None))
+
         self.actionAbout.setText(QCoreApplication.translate("MainWindow", u"&About", None))
         
         self.actionUpdate.setText(QCoreApplication.translate("MainWindow", u"&Update", None))
         self.actionUpdate.setToolTip(QCoreApplication.translate("MainWindow", u"Update", None))
         self.actionUpdate.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+U, Ctrl+M", None))
 
+        self.actionStats.setText(QCoreApplication.translate("MainWindow", u"&Statistics", None))
+        self.actionStats.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+T", None))
+
+        self.actionDiscPlanner.setText(QCoreApplication.translate("MainWindow", u"Disc P&lanner", None))
+        self.actionDiscPlanner.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+L", None))
+
+        self.actionEnrich.setText(QCoreApplication.translate("MainWindow", u"&Enrich Library...", None))
+        self.actionEnrich.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+F, Ctrl+E", None))
+
         self.actionDelete.setText(QCoreApplication.translate("MainWindow", u"&Delete", None))
         self.actionDelete.setToolTip(QCoreApplication.translate("MainWindow", u"Delete", None))
         self.actionDelete.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+D, Ctrl+M", None))
@@ -0,0 +1,148 @@
+#=======================================================================
+# Description:
+# UI component declaration for the Library Statistics Dialog box
+#=======================================================================
+from PySide6.QtCore import QCoreApplication, QMetaObject, QSize, Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QDialogButtonBox,
+    QFormLayout,
+    QGroupBox,
+    QHBoxLayout,
+    QLabel,
+    QLayout,
+    QSizePolicy,
+    QSpacerItem,
+    QTableView,
+    QVBoxLayout
+)
+
+#=======================================================================
+class Ui_StatsDialog(object):
+    """
+    This class is responsible for setting up the user interface of the Library Statistics dialog window.
+    It defines the summary labels, the breakdown selector and the table showing the selected breakdown.
+
+    Methods:
+    --------
+    setupUi(StatsDialog):
+        Sets up the user interface for the StatsDialog window, including layout, widgets, and connections.
+
+    retranslateUi(StatsDialog):
+        Updates the user interface elements of the StatsDialog with translated text.
+    """
+
+    def setupUi(self, StatsDialog):
+        """
+        Sets up the user interface for the StatsDialog window.
+
+        Parameters:
+        StatsDialog (QDialog): The dialog window that displays the library statistics.
+        """
+        if not StatsDialog.objectName():
+            StatsDialog.setObjectName(u"StatsDialog")
+        StatsDialog.setWindowModality(Qt.WindowModality.ApplicationModal)
+        StatsDialog.resize(600, 500)
+        StatsDialog.setModal(True)
+
+        self.verticalLayout = QVBoxLayout(StatsDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
+
+        self.groupBox = QGroupBox(StatsDialog)
+        self.groupBox.setObjectName(u"groupBox")
+
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+
+        self.formLayout = QFormLayout()
+        self.formLayout.setObjectName(u"formLayout")
+
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.lblMovies = QLabel(self.groupBox)
+        self.lblMovies.setObjectName(u"lblMovies")
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.lblMovies)
+
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.lblSeries = QLabel(self.groupBox)
+        self.lblSeries.setObjectName(u"lblSeries")
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.lblSeries)
+
+        self.label_3 = QLabel(self.groupBox)
+        self.label_3.setObjectName(u"label_3")
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.lblEpisodes = QLabel(self.groupBox)
+        self.lblEpisodes.setObjectName(u"lblEpisodes")
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.lblEpisodes)
+
+        self.verticalLayout_2.addLayout(self.formLayout)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+
+        self.label_4 = QLabel(self.groupBox)
+        self.label_4.setObjectName(u"label_4")
+        self.horizontalLayout.addWidget(self.label_4)
+
+        self.cbView = QComboBox(self.groupBox)
+        self.cbView.setObjectName(u"cbView")
+        self.cbView.setMinimumSize(QSize(200, 0))
+        self.horizontalLayout.addWidget(self.cbView)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+
+        self.tblStats = QTableView(self.groupBox)
+        self.tblStats.setObjectName(u"tblStats")
+        self.tblStats.setMinimumSize(QSize(575, 325))
+        self.tblStats.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.tblStats.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.tblStats.verticalHeader().setVisible(False)
+        self.tblStats.horizontalHeader().setStretchLastSection(True)
+        self.tblStats.horizontalHeader().setResizeContentsPrecision(100)
+        self.verticalLayout_2.addWidget(self.tblStats)
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.buttonBox = QDialogButtonBox(StatsDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.StandardButton.Close)
+        self.verticalLayout.addWidget(self.buttonBox)
+
+        self.buttonBox.rejected.connect(StatsDialog.reject)
+
+        self.retranslateUi(StatsDialog)
+
+        QMetaObject.connectSlotsByName(StatsDialog)
+    # setupUi
+
+    def retranslateUi(self, StatsDialog):
+        """
+        Updates the user interface elements of the StatsDialog with translated text.
+
+        Parameters:
+        StatsDialog (QDialog): The dialog window that displays the library statistics.
+        """
+        StatsDialog.setWindowTitle(QCoreApplication.translate("StatsDialog", u"Statistics", None))
+        self.groupBox.setTitle("")
+        self.label.setText(QCoreApplication.translate("StatsDialog", u"Movies", None))
+        self.label_2.setText(QCoreApplication.translate("StatsDialog", u"TV Series", None))
+        self.label_3.setText(QCoreApplication.translate("StatsDialog", u"Episodes", None))
+        self.label_4.setText(QCoreApplication.translate("StatsDialog", u"Breakdown", None))
+        self.lblMovies.setText("")
+        self.lblSeries.setText("")
+        self.lblEpisodes.setText("")
+    # retranslateUi
+
+#=======================================================================
@@ -0,0 +1,379 @@
+#=======================================================================
+# Description:
+# Backup and restore of the application database. Backups are taken
+# online with the SQLite backup API, a few pages per step so writers are
+# never locked out for long, into a temp file that is checked with
+# PRAGMA integrity_check and streamed through zstd (when the zstandard
+# package is installed) or gzip compression. Timestamped snapshots are
+# kept in the backup folder up to a retention count. Restores decompress
+# and check the backup next to the database, snapshot the database they
+# replace, then copy the backup into it in a single write transaction
+#=======================================================================
+import os
+import gzip
+import sqlite3
+import datetime
+import tempfile
+import utils.constants as constants
+import utils.dbhelper as dbhelper
+import utils.metahelper as metahelper
+
+from utils.constants import (
+    BACKUP_CHUNK_SIZE,
+    BACKUP_COMPRESSION,
+    BACKUP_FOLDER,
+    BACKUP_PAGES_PER_STEP,
+    BACKUP_RETENTION
+)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+#=======================================================================
+''' File extension per compression, None for an uncompressed copy of the database '''
+COMPRESSION_EXTENSIONS = { None : '.db', 'gzip' : '.db.gz', 'zstd' : '.db.zst' }
+
+''' Leading bytes identifying a compressed backup '''
+GZIP_MAGIC             = b'\x1f\x8b'
+ZSTD_MAGIC             = b'\x28\xb5\x2f\xfd'
+
+''' Snapshot names, timed to the microsecond so that snapshots taken within a second do not overwrite each other '''
+SNAPSHOT_PREFIX        = 'moviedb_'
+SNAPSHOT_FORMAT        = '%Y%m%d_%H%M%S_%f'
+
+#=======================================================================
+def get_compression(compression : str = BACKUP_COMPRESSION) -> str:
+    """
+    Returns the compression actually used for a requested one, zstd falls back
+    to gzip when the zstandard package is not installed.
+
+    Parameters:
+    compression (str, optional): gzip, zstd or None. Defaults to BACKUP_COMPRESSION.
+
+    Returns:
+    str: The compression to use.
+    """
+    if compression == 'zstd' and zstandard is None:
+        return 'gzip'
+
+    if compression not in COMPRESSION_EXTENSIONS:
+        raise ValueError(f'Unsupported compression: {compression}')
+
+    return compression
+
+
+def get_path_compression(path : str) -> str:
+    """
+    Returns the compression matching the extension of a backup path.
+
+    Parameters:
+    path (str): The path of the backup.
+
+    Returns:
+    str: gzip, zstd or None for an uncompressed backup.
+    """
+    if path.endswith('.gz'):
+        return 'gzip'
+
+    if path.endswith('.zst'):
+        return get_compression('zstd')
+
+    return None
+
+
+def open_writer(path : str, compression : str):
+    """
+    Opens a file for writing through the given compression.
+
+    Parameters:
+    path (str): The path of the file.
+    compression (str): gzip, zstd or None.
+
+    Returns:
+    file: A binary file object, closing it finishes the compressed stream.
+    """
+    if compression == 'gzip':
+        return gzip.open(path, 'wb', compresslevel=6)
+
+    if compression == 'zstd':
+        return zstandard.ZstdCompressor(threads=-1).stream_writer(open(path, 'wb'), closefd=True)
+
+    return open(path, 'wb')
+
+
+def open_reader(f):
+    """
+    Wraps a backup opened for reading in the decompression matching its leading bytes.
+
+    Parameters:
+    f (file): The backup opened in binary mode, positioned at its start.
+
+    Returns:
+    file: A binary file object returning the database pages, the backup itself when uncompressed.
+    """
+    magic = f.read(4)
+    f.seek(0)
+
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.GzipFile(fileobj=f, mode='rb')
+
+    if magic.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError('The zstandard package is required to restore this backup')
+        return zstandard.ZstdDecompressor().stream_reader(f, closefd=False)
+
+    return f
+
+
+def check_integrity(path : str) -> None:
+    """
+    Runs PRAGMA integrity_check on a database file.
+
+    Parameters:
+    path (str): The path of the database.
+
+    Exceptions:
+    sqlite3.DatabaseError: Raised if the file is not a database or the check reports errors.
+    """
+    connection = sqlite3.connect(path)
+
+    try:
+        result = [row[0] for row in connection.execute('PRAGMA integrity_check')]
+    finally:
+        connection.close()
+
+    if result != ['ok']:
+        raise sqlite3.DatabaseError(f'Integrity check failed: {"; ".join(result[:5])}')
+
+
+def copy_stream(source, target, chunk_size : int = BACKUP_CHUNK_SIZE) -> None:
+    """
+    Copies a file object to another in chunks.
+
+    Parameters:
+    source (file): The binary file object read from.
+    target (file): The binary file object written to.
+    chunk_size (int, optional): The number of bytes copied at a time. Defaults to BACKUP_CHUNK_SIZE.
+    """
+    while chunk := source.read(chunk_size):
+        target.write(chunk)
+
+
+def backup_database(path : str, progress = None, compression : str = BACKUP_COMPRESSION,
+                    pages : int = BACKUP_PAGES_PER_STEP, source : str = None) -> str:
+    """
+    Takes an online backup of the database. The pages are copied with the SQLite backup API,
+    a step at a time, to a temp file which is checked for integrity, then compressed into a
+    second temp file renamed over the target once complete. A failed backup never leaves a
+    partial file behind. The source connection holds a single read transaction for the whole
+    copy: a backup whose source is written by another connection between steps would start
+    over, possibly forever under steady writes. In WAL mode writers carry on meanwhile and the
+    backup is the snapshot of the database when it started.
+
+    Parameters:
+    path (str): The path of the backup, its extension is replaced by the one of the compression.
+    progress (callable, optional): Called with (copied, total) pages after every step.
+    compression (str, optional): gzip, zstd or None. Defaults to BACKUP_COMPRESSION.
+    pages (int, optional): The number of pages copied per step. Defaults to BACKUP_PAGES_PER_STEP.
+    source (str, optional): The database to back up. Defaults to the application database.
+
+    Returns:
+    str: The path of the backup written.
+
+    Exceptions:
+    sqlite3.Error: Raised if the database cannot be read or the copy fails its integrity check.
+    """
+    compression = get_compression(compression)
+    path        = get_backup_path(path, compression)
+    folder      = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+
+    fd, temp_db = tempfile.mkstemp(suffix='.db', dir=folder)
+    os.close(fd)
+    temp_path   = f'{path}.tmp'
+
+    def step(status : int, remaining : int, total : int) -> None:
+        if progress:
+            progress(total - remaining, total)
+
+    try:
+        connection = dbhelper.get_connection(source, isolation_level=None)
+        target     = sqlite3.connect(temp_db)
+
+        try:
+            connection.execute('BEGIN')
+            connection.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()
+            connection.backup(target, pages=pages, progress=step)
+            connection.execute('ROLLBACK')
+        finally:
+            target.close()
+            connection.close()
+
+        check_integrity(temp_db)
+
+        with open(temp_db, 'rb') as f, open_writer(temp_path, compression) as writer:
+            copy_stream(f, writer)
+
+        os.replace(temp_path, path)
+    finally:
+        for leftover in (temp_db, temp_path):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+
+    return path
+
+
+def get_backup_path(path : str, compression : str) -> str:
+    """
+    Returns the path of a backup with the extension of its compression.
+
+    Parameters:
+    path (str): The requested path, with or without extension.
+    compression (str): gzip, zstd or None.
+
+    Returns:
+    str: The path ending with .db, .db.gz or .db.zst.
+    """
+    for extension in sorted(COMPRESSION_EXTENSIONS.values(), key=len, reverse=True):
+        if path.endswith(extension):
+            path = path[:-len(extension)]
+            break
+
+    return path + COMPRESSION_EXTENSIONS[compression]
+
+
+def list_snapshots(folder : str = BACKUP_FOLDER) -> list:
+    """
+    Returns the snapshots of the backup folder.
+
+    Parameters:
+    folder (str, optional): The backup folder. Defaults to BACKUP_FOLDER.
+
+    Returns:
+    list: The paths of the snapshots, oldest first.
+    """
+    if not os.path.isdir(folder):
+        return []
+
+    return sorted(os.path.join(folder, name) for name in os.listdir(folder)
+                  if name.startswith(SNAPSHOT_PREFIX) and not name.endswith('.tmp'))
+
+
+def prune_snapshots(folder : str = BACKUP_FOLDER, keep : int = BACKUP_RETENTION) -> list:
+    """
+    Removes the oldest snapshots of the backup folder beyond the retention count.
+
+    Parameters:
+    folder (str, optional): The backup folder. Defaults to BACKUP_FOLDER.
+    keep (int, optional): The number of snapshots to keep. Defaults to BACKUP_RETENTION.
+
+    Returns:
+    list: The paths of the snapshots removed.
+    """
+    snapshots = list_snapshots(folder)
+    removed   = snapshots[:max(len(snapshots) - keep, 0)]
+
+    for path in removed:
+        os.remove(path)
+
+    return removed
+
+
+def create_snapshot(folder : str = BACKUP_FOLDER, progress = None, keep : int = BACKUP_RETENTION,
+                    compression : str = BACKUP_COMPRESSION, source : str = None) -> str:
+    """
+    Takes a timestamped backup of the database into the backup folder and prunes the
+    snapshots beyond the retention count. See backup_database.
+
+    Parameters:
+    folder (str, optional): The backup folder. Defaults to BACKUP_FOLDER.
+    progress (callable, optional): Called with (copied, total) pages after every step.
+    keep (int, optional): The number of snapshots to keep. Defaults to BACKUP_RETENTION.
+    compression (str, optional): gzip, zstd or None. Defaults to BACKUP_COMPRESSION.
+    source (str, optional): The database to back up. Defaults to the application database.
+
+    Returns:
+    str: The path of the snapshot.
+    """
+    name = SNAPSHOT_PREFIX + datetime.datetime.now().strftime(SNAPSHOT_FORMAT)
+    path = backup_database(os.path.join(folder, name), progress, compression, source=source)
+
+    prune_snapshots(folder, keep)
+
+    return path
+
+
+def restore_database(path : str, progress = None, snapshot : bool = True, target : str = None) -> str:
+    """
+    Restores the database from a backup, compressed or not. The backup is decompressed next
+    to the database and checked for integrity, then the current database is snapshotted and
+    the backup copied into it with the SQLite backup API, in a single step. The copy runs as
+    one write transaction on the live database, its write-ahead log included, so the database
+    is either fully replaced or left untouched and no write of another connection is lost in
+    between or replayed onto the restored pages. The restore runs as an exclusive background
+    job with the checkpoint scheduler stopped, and is refused while an enrichment run is saving.
+
+    Parameters:
+    path (str): The path of the backup.
+    progress (callable, optional): Called with (read, total) bytes of the backup while decompressing.
+    snapshot (bool, optional): Whether to snapshot the current database first. Defaults to True.
+    target (str, optional): The database to replace. Defaults to the application database.
+
+    Returns:
+    str: The path of the snapshot of the replaced database, None if none was taken.
+
+    Exceptions:
+    sqlite3.DatabaseError: Raised if the backup is not a valid database.
+    RuntimeError: Raised if another background job is writing to the database.
+    """
+    target = target or constants.DEFAULT_DB_PATH
+    total  = max(os.path.getsize(path), 1)
+
+    with dbhelper.background_job('restore', exclusive=True):
+        scheduler     = dbhelper.stop_checkpoint_scheduler()
+        fd, temp_path = tempfile.mkstemp(suffix='.db', dir=os.path.dirname(os.path.abspath(target)))
+
+        try:
+            with open(path, 'rb') as raw, os.fdopen(fd, 'wb') as f:
+                reader = open_reader(raw)
+
+                while chunk := reader.read(BACKUP_CHUNK_SIZE):
+                    f.write(chunk)
+                    if progress:
+                        progress(min(raw.tell(), total), total)
+
+            check_integrity(temp_path)
+
+            replaced   = create_snapshot(source=target) if snapshot and os.path.exists(target) else None
+            backup     = sqlite3.connect(temp_path, isolation_level=None)
+            connection = dbhelper.get_connection(target, isolation_level=None)
+
+            try:
+                # A database in WAL mode only accepts a copy with its own page size
+                page_size = connection.execute('PRAGMA page_size').fetchone()[0]
+
+                if backup.execute('PRAGMA page_size').fetchone()[0] != page_size:
+                    backup.execute('PRAGMA journal_mode = DELETE')
+                    backup.execute(f'PRAGMA page_size = {page_size}')
+                    backup.execute('VACUUM')
+
+                backup.backup(connection)
+            finally:
+                backup.close()
+                connection.close()
+
+            dbhelper.checkpoint('TRUNCATE', target)
+            metahelper.clear_meta_ids(db_path=target)
+        finally:
+            for leftover in (temp_path, f'{temp_path}-wal', f'{temp_path}-shm'):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+
+            if scheduler:
+                dbhelper.start_checkpoint_scheduler()
+
+    return replaced
+
+#=======================================================================
@@ -0,0 +1,232 @@
+#=======================================================================
+# Description:
+# Persistent cache for the lookup templates, stored in its own SQLite
+# file next to the application database. Entries are keyed by URL or by
+# any template specific key (e.g. source and online id), expire after a
+# time to live and are evicted least recently used first once the cache
+# grows beyond its size cap. The cache runs in WAL mode, like the
+# application database, so concurrent lookups read it without waiting
+# for each other. In offline mode lookups are served from the cache
+# only, regardless of the age of the entries
+#=======================================================================
+import os
+import time
+import pickle
+import sqlite3
+import threading
+
+from utils.constants import (
+    LOOKUP_CACHE_PATH,
+    LOOKUP_CACHE_TTL,
+    LOOKUP_CACHE_MAX_BYTES,
+    LOOKUP_CACHE_TOUCH_INTERVAL,
+    LOOKUP_OFFLINE_ENV,
+    DB_BUSY_TIMEOUT,
+    DB_SYNCHRONOUS
+)
+
+#=======================================================================
+QUERY_CREATE_CACHE  = '''CREATE TABLE IF NOT EXISTS LOOKUP_CACHE (
+                            KEY      TEXT PRIMARY KEY,
+                            VALUE    BLOB NOT NULL,
+                            SIZE     INTEGER NOT NULL,
+                            CREATED  REAL NOT NULL,
+                            ACCESSED REAL NOT NULL)'''
+
+QUERY_CREATE_INDEX  = '''CREATE INDEX IF NOT EXISTS IDX_LOOKUP_CACHE_ACCESSED ON LOOKUP_CACHE (ACCESSED)'''
+
+QUERY_GET_ENTRY     = '''SELECT VALUE, CREATED, ACCESSED FROM LOOKUP_CACHE WHERE KEY = ?'''
+
+QUERY_GET_SIZE      = '''SELECT IFNULL(SUM(SIZE), 0) FROM LOOKUP_CACHE'''
+
+QUERY_TOUCH_ENTRY   = '''UPDATE LOOKUP_CACHE SET ACCESSED = ? WHERE KEY = ?'''
+
+QUERY_PUT_ENTRY     = '''INSERT OR REPLACE INTO LOOKUP_CACHE (KEY, VALUE, SIZE, CREATED, ACCESSED)
+                         VALUES (?, ?, ?, ?, ?)'''
+
+QUERY_EVICT_ENTRIES = '''DELETE FROM LOOKUP_CACHE
+                         WHERE KEY IN (SELECT KEY
+                                       FROM (SELECT KEY, SUM(SIZE) OVER (ORDER BY ACCESSED DESC, KEY) AS TOTAL
+                                             FROM LOOKUP_CACHE)
+                                       WHERE TOTAL > ?)'''
+
+QUERY_CLEAR_CACHE   = '''DELETE FROM LOOKUP_CACHE'''
+
+_offline = None
+
+''' Size of the entries per cache file, counted from the file when it is first opened then increased
+    by every put, so that the eviction only runs once the cap is exceeded. Replaced entries are
+    counted twice, which only brings the next eviction forward, that resets the count '''
+_sizes   = {}
+_lock    = threading.Lock()
+
+#=======================================================================
+def is_offline() -> bool:
+    """
+    Checks whether lookups are restricted to the cache, either set through set_offline
+    or through the PMM_OFFLINE environment variable.
+
+    Returns:
+    bool: True if lookups must be served from the cache only.
+    """
+    if _offline is not None:
+        return _offline
+
+    return os.environ.get(LOOKUP_OFFLINE_ENV, '') not in ['', '0']
+
+
+def set_offline(offline : bool) -> None:
+    """
+    Switches the offline mode on or off, overriding the PMM_OFFLINE environment variable.
+
+    Parameters:
+    offline (bool): True to serve lookups from the cache only.
+    """
+    global _offline
+    _offline = offline
+
+
+def get_connection() -> sqlite3.Connection:
+    """
+    Opens a connection to the cache database. The first connection of the process to a cache
+    file creates the cache table and its index, switches the file to WAL mode and counts the
+    size of its entries.
+
+    Returns:
+    sqlite3.Connection: The connection to the cache database.
+    """
+    connection = sqlite3.connect(LOOKUP_CACHE_PATH, timeout=DB_BUSY_TIMEOUT / 1000)
+    connection.execute(f'PRAGMA synchronous = {DB_SYNCHRONOUS}')
+
+    with _lock:
+        if LOOKUP_CACHE_PATH not in _sizes:
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute(QUERY_CREATE_CACHE)
+            connection.execute(QUERY_CREATE_INDEX)
+            connection.commit()
+
+            _sizes[LOOKUP_CACHE_PATH] = connection.execute(QUERY_GET_SIZE).fetchone()[0]
+
+    return connection
+
+
+def get(key : str, ttl : int = LOOKUP_CACHE_TTL) -> bytes:
+    """
+    Retrieves a cached value and marks it as recently used. The access time is only written
+    when the last one is older than LOOKUP_CACHE_TOUCH_INTERVAL, so most hits are plain reads.
+
+    Parameters:
+    key (str): The cache key.
+    ttl (int, optional): The maximum age of the entry in seconds, ignored in offline mode.
+
+    Returns:
+    bytes: The cached value, or None if it is not cached or has expired.
+    """
+    connection = get_connection()
+
+    try:
+        entry = connection.execute(QUERY_GET_ENTRY, (key,)).fetchone()
+
+        now = time.time()
+
+        if entry is None or (not is_offline() and now - entry[1] > ttl):
+            return None
+
+        if now - entry[2] > LOOKUP_CACHE_TOUCH_INTERVAL:
+            connection.execute(QUERY_TOUCH_ENTRY, (now, key))
+            connection.commit()
+
+        return entry[0]
+    except sqlite3.Error as error:
+        print(error)
+        return None
+    finally:
+        connection.close()
+
+
+def put(key : str, value : bytes) -> None:
+    """
+    Stores a value in the cache and, once the cache exceeds its size cap, evicts the least
+    recently used entries beyond it.
+
+    Parameters:
+    key (str): The cache key.
+    value (bytes): The value to be cached.
+    """
+    connection = get_connection()
+
+    try:
+        now = time.time()
+        connection.execute(QUERY_PUT_ENTRY, (key, value, len(value), now, now))
+        connection.commit()
+
+        with _lock:
+            _sizes[LOOKUP_CACHE_PATH] += len(value)
+            evict = _sizes[LOOKUP_CACHE_PATH] > LOOKUP_CACHE_MAX_BYTES
+
+        if evict:
+            connection.execute(QUERY_EVICT_ENTRIES, (LOOKUP_CACHE_MAX_BYTES,))
+            connection.commit()
+
+            with _lock:
+                _sizes[LOOKUP_CACHE_PATH] = connection.execute(QUERY_GET_SIZE).fetchone()[0]
+    except sqlite3.Error as error:
+        print(error)
+        connection.rollback()
+    finally:
+        connection.close()
+
+
+def cached(key : str, loader, ttl : int = LOOKUP_CACHE_TTL, validate=None):
+    """
+    Returns the cached result for a key, calling the loader and caching its result on a miss.
+    This is the helper lookup templates wrap their online calls with, e.g.
+    cached(f'imdb:details:{online_id}', lambda: fetch_details(online_id)).
+    Only successful results are cached: a loader that raises caches nothing, and results
+    rejected by the validate function are returned but loaded again on the next call, so
+    a transient failure is not served until the entry expires.
+
+    Parameters:
+    key (str): The cache key, a URL or a template specific key.
+    loader (callable): Function without arguments returning the value to be cached, any picklable object.
+    ttl (int, optional): The maximum age of a cached result in seconds.
+    validate (callable, optional): Function returning whether a loaded result is valid and can be cached.
+
+    Returns:
+    any: The cached or freshly loaded result.
+
+    Exceptions:
+    LookupError: Raised in offline mode when the key is not cached.
+    """
+    value = get(key, ttl)
+
+    if value is not None:
+        return pickle.loads(value)
+
+    if is_offline():
+        raise LookupError(f'Offline mode: {key} is not in the lookup cache')
+
+    result = loader()
+
+    if validate is None or validate(result):
+        put(key, pickle.dumps(result))
+
+    return result
+
+
+def clear() -> None:
+    """
+    Removes all entries from the cache.
+    """
+    connection = get_connection()
+
+    try:
+        connection.execute(QUERY_CLEAR_CACHE)
+        connection.commit()
+
+        with _lock:
+            _sizes[LOOKUP_CACHE_PATH] = 0
+    finally:
+        connection.close()
+
+#=======================================================================
@@ -2,9 +2,13 @@
 # Description: 
 # Utility module to host common functions used across the applciation
 #=======================================================================
+import re
+import math
+
+from datetime          import datetime
 from PySide6.QtCore    import Qt
 from PySide6.QtWidgets import QTableView
-from utils.constants   import MESSAGE_TYPE
+from utils.constants   import MESSAGE_TYPE, TIMESTAMP_FORMAT, RELEASE_DATE_FORMATS, SIZE_UNITS
 
 #=======================================================================
 def getColIndexinTableView(tblView : QTableView, colname : str) -> int:
@@ -25,6 +29,20 @@ def getColIndexinTableView(tblView : QTableView, colname : str) -> int:
     return -1
 
 
+def getSourceModel(tblView : QTableView):
+    """
+    Retrieves the model holding the data of a QTableView, behind its sort / filter proxy if any.
+
+    Parameters:
+    - tblView (QTableView): The table view.
+
+    Returns:
+    - QAbstractItemModel: The source model of the table view.
+    """
+    model = tblView.model()
+    return model.sourceModel() if hasattr(model, 'sourceModel') else model
+
+
 def isNumeric(value : object) -> bool:
     """
     Determines if the provided value can be converted to a float, indicating it is numeric.
@@ -61,4 +79,148 @@ def getStatusStyleSheet(message_type=MESSAGE_TYPE.INFO) -> str:
       else 'color: orange;' if message_type == MESSAGE_TYPE.WARNING \
       else 'color: red;'
 
-#=======================================================================
\ No newline at end of file
+#=======================================================================
+def getTimestamp() -> str:
+    """
+    Returns the current local time formatted for storing in the CREATED_DATE /
+    UPDATED_DATE columns, so all writers use the same sortable ISO-8601 format.
+
+    Returns:
+    str: The current timestamp as 'YYYY-MM-DD HH:MM:SS'.
+    """
+    return datetime.now().strftime(TIMESTAMP_FORMAT)
+
+
+def toISODate(value : object) -> str:
+    """
+    Normalizes a free text date, as returned by the lookup templates or entered by the user,
+    to ISO-8601. Dates with only a month or year keep their precision ('YYYY-MM' / 'YYYY'),
+    so they still sort and compare correctly against full dates.
+
+    Parameters:
+    value (any type): The date to normalize e.g. '16 Jul 2010 (USA)', '16-07-2010' or '2010'.
+
+    Returns:
+    str: The ISO formatted date, an empty string for missing values or the original text 
+         if it could not be recognized as a date.
+    """
+    if value is None:
+        return ''
+
+    text = str(value).split('(')[0].strip()
+    if text in ['', 'N/A', 'None', 'nan']:
+        return ''
+
+    for input_format, output_format in RELEASE_DATE_FORMATS.items():
+        try:
+            return datetime.strptime(text, input_format).strftime(output_format)
+        except ValueError:
+            continue
+
+    return str(value).strip()
+
+#=======================================================================
+def parseSize(value : object) -> int:
+    """
+    Parses a free text size such as '4.5 GB', '700MB' or '1,2 TB' into bytes. Values without
+    a unit are interpreted the way they are usually entered: below 100 as GB, below 100000
+    as MB and anything larger as bytes.
+
+    Parameters:
+    value (any type): The size to parse.
+
+    Returns:
+    int: The size in bytes, or None if the value is empty or not a size.
+    """
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+
+    match = re.match(r'^\s*([\d.,]+)\s*([a-zA-Z]*)\s*$', str(value))
+    if not match:
+        return None
+
+    number, unit = match.group(1), match.group(2).upper().replace('I', '')
+    if ',' in number:
+        number = number.replace(',', '') if '.' in number or re.search(r',\d{3}$', number) \
+            else number.replace(',', '.')
+
+    try:
+        number = float(number)
+    except ValueError:
+        return None
+
+    if unit == '':
+        unit = 'GB' if number < 100 else 'MB' if number < 100000 else 'B'
+    elif unit in ['K', 'M', 'G', 'T']:
+        unit = unit + 'B'
+
+    return int(round(number * SIZE_UNITS[unit])) if unit in SIZE_UNITS else None
+
+
+def parseRuntime(value : object) -> int:
+    """
+    Parses a free text runtime such as '148', '148 min', '2h 28m' or '2:28' into minutes.
+
+    Parameters:
+    value (any type): The runtime to parse.
+
+    Returns:
+    int: The runtime in minutes, or None if the value is empty or not a runtime.
+    """
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+
+    text = str(value).strip().lower()
+
+    match = re.match(r'^(\d+):(\d{1,2})$', text)
+    if match:
+        return int(match.group(1)) * 60 + int(match.group(2))
+
+    hours   = re.search(r'(\d+(?:\.\d+)?)\s*h', text)
+    minutes = re.search(r'(\d+)\s*m', text)
+    if hours or minutes:
+        return int(round(float(hours.group(1)) * 60 if hours else 0)) + (int(minutes.group(1)) if minutes else 0)
+
+    match = re.match(r'^(\d+(?:\.\d+)?)$', text)
+    return int(round(float(match.group(1)))) if match else None
+
+
+def formatSize(value : object) -> str:
+    """
+    Formats a size in bytes for display, e.g. 4831838208 as '4.5 GB'.
+
+    Parameters:
+    value (any type): The size in bytes.
+
+    Returns:
+    str: The formatted size, or an empty string if the size is unknown.
+    """
+    if value is None or value == '' or (isinstance(value, float) and math.isnan(value)):
+        return ''
+
+    size = float(value)
+    for unit in ['TB', 'GB', 'MB', 'KB']:
+        if size >= SIZE_UNITS[unit]:
+            return f'{size / SIZE_UNITS[unit]:.1f} {unit}' if unit in ['TB', 'GB'] \
+              else f'{size / SIZE_UNITS[unit]:.0f} {unit}'
+
+    return f'{size:.0f} B'
+
+
+def formatRuntime(value : object) -> str:
+    """
+    Formats a runtime in minutes for display, e.g. 148 as '2h 28m'.
+
+    Parameters:
+    value (any type): The runtime in minutes.
+
+    Returns:
+    str: The formatted runtime, or an empty string if the runtime is unknown.
+    """
+    if value is None or value == '' or (isinstance(value, float) and math.isnan(value)):
+        return ''
+
+    hours, minutes = divmod(int(value), 60)
+    return f'{hours}h {minutes:02d}m' if hours else f'{minutes}m'
+
+#=======================================================================
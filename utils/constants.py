@@ -9,6 +9,7 @@ class MEDIA_TYPE:
    '''
    MOVIE          = 'MOVIE'
    SERIES         = 'SERIES'
+   EPISODE        = 'EPISODE'
 
 
 class MEDIA_COLUMNS:
@@ -45,6 +46,7 @@ class MEDIA_COLUMNS:
    POSTER_URL     = 'POSTER_URL'
    UPDATED_DATE   = 'UPDATED_DATE'
    ONLINE_ID      = 'ONLINE_ID'
+   SIZE_BYTES     = 'SIZE_BYTES'
 
 
 class MOVIE_COLUMNS:
@@ -59,6 +61,8 @@ class MOVIE_COLUMNS:
    DISC_COUNT     = 'DISC_COUNT'
    SOURCE_ID      = 'SOURCE_ID'
    EDITION_ID     = 'EDITION_ID'
+   RUNTIME_MINUTES = 'RUNTIME_MINUTES'
+   AVG_RUNTIME_MINUTES = 'AVG_RUNTIME_MINUTES'
 
 
 class SERIES_COLUMNS:
@@ -86,6 +90,7 @@ class EPISODE_COLUMNS:
    BACKUP_DISC    = 'BACKUP_DISC'
    TAG            = 'TAG'
    SIZE           = 'SIZE'
+   SIZE_BYTES     = 'SIZE_BYTES'
    CREATED_DATE   = 'CREATED_DATE'
    UPDATED_DATE   = 'UPDATED_DATE'
 
@@ -106,6 +111,9 @@ class FILTER_COLUMNS:
    YEAR           = 'YEAR'
    ACTOR          = 'ACTOR'
    LANGUAGE       = 'LANGUAGE'
+   ADDED_SINCE    = 'ADDED_SINCE'
+   RELEASED_FROM  = 'RELEASED_FROM'
+   RELEASED_TO    = 'RELEASED_TO'
 
 
 class MEDIA_DETAILS:
@@ -132,6 +140,31 @@ class META_COLUMNS:
    CAST           = 'CAST'
 
 
+class STATS_DIMENSION:
+   '''
+   Dimensions the library statistics are aggregated on in MEDIA_STATS
+   '''
+   TOTAL          = 'TOTAL'
+   GENRE          = 'GENRE'
+   QUALITY        = 'QUALITY'
+   SOURCE         = 'SOURCE'
+   YEAR           = 'YEAR'
+   DECADE         = 'DECADE'
+   DISC           = 'DISC'
+   SERIES         = 'SERIES'
+
+
+class ENRICH_STATUS:
+   '''
+   Status of the items in the batch enrichment queue
+   '''
+   PENDING        = 'PENDING'
+   RUNNING        = 'RUNNING'
+   DONE           = 'DONE'
+   NOT_FOUND      = 'NOT_FOUND'
+   FAILED         = 'FAILED'
+
+
 class MESSAGE_TYPE:
    '''
    Type of message to identify and display accodingly in the UI
@@ -165,29 +198,164 @@ DEFAULT_IMPORT_TEMPLATES_PATH  = DEFAULT_TEMPLATES_PATH + '/importdata'
 DEFAULT_LOOKUP_TEMPLATES_PATH  = DEFAULT_TEMPLATES_PATH + '/lookup'
 DEFAULT_PUBLISH_TEMPLATES_PATH = DEFAULT_TEMPLATES_PATH + '/publish'
 
+#=======================================================================
+# DATABASE SETTINGS
+#=======================================================================
+''' Connection policy of the application database: write-ahead logging so readers never wait for
+    a writer, synchronous NORMAL which only syncs at checkpoints yet never corrupts the database,
+    milliseconds a connection waits for a lock before failing, WAL pages after which a commit
+    checkpoints, bytes the WAL is truncated to after a checkpoint and seconds between the passive
+    checkpoints of the checkpoint scheduler '''
+DB_JOURNAL_MODE                = 'WAL'
+DB_SYNCHRONOUS                 = 'NORMAL'
+DB_BUSY_TIMEOUT                = 5000
+DB_WAL_AUTOCHECKPOINT          = 1000
+DB_JOURNAL_SIZE_LIMIT          = 64 * 1024 ** 2
+DB_CHECKPOINT_INTERVAL         = 60
+
+''' Instrumentation of the statements run through dbhelper: whether they are recorded, number of most
+    recent durations per statement fingerprint the percentiles and histograms are computed over, upper
+    bounds in milliseconds of the histogram buckets and number of most recent statements kept '''
+DB_INSTRUMENTATION             = True
+DB_QUERY_SAMPLES               = 1000
+DB_HISTOGRAM_BUCKETS           = [ 1, 5, 10, 50, 100, 500, 1000 ]
+DB_RECENT_QUERIES              = 500
+
+''' Slow query log: milliseconds from which a statement is logged with its query plan, the log file,
+    its size in bytes before it is rotated and the number of slow statements kept in memory '''
+DB_SLOW_QUERY_MS               = 100
+DB_SLOW_QUERY_LOG              = 'data/slowqueries.log'
+DB_SLOW_QUERY_LOG_SIZE         = 1024 ** 2
+DB_SLOW_QUERIES                = 100
+
+''' Milliseconds between the refreshes of the DB activity panel '''
+DB_ACTIVITY_REFRESH            = 1000
+
+#=======================================================================
+# HTTP SETTINGS
+#=======================================================================
+''' Outbound requests of the lookup templates: timeout in seconds, retries with exponential backoff 
+    on connection errors and the listed status codes, worker threads and connections per host '''
+HTTP_TIMEOUT                   = 15
+HTTP_RETRIES                   = 3
+HTTP_BACKOFF                   = 0.5
+HTTP_RETRY_STATUSES            = [ 429, 500, 502, 503, 504 ]
+HTTP_MAX_WORKERS               = 8
+HTTP_HOST_CONNECTIONS          = 4
+
+''' Number of most recent requests per host the latency metrics of the HTTP client are computed over '''
+HTTP_LATENCY_SAMPLES           = 1000
+
+''' On-disk cache of lookup responses: location, time to live in seconds, size cap in bytes
+    after which the least recently used entries are evicted, the number of seconds a hit waits
+    before its last access time is written again, and the environment variable that switches
+    the lookups to offline mode, serving only from the cache '''
+LOOKUP_CACHE_PATH              = 'data/lookupcache.db'
+LOOKUP_CACHE_TTL               = 7 * 24 * 60 * 60
+LOOKUP_CACHE_MAX_BYTES         = 200 * 1024 ** 2
+LOOKUP_CACHE_TOUCH_INTERVAL    = 60 * 60
+LOOKUP_OFFLINE_ENV             = 'PMM_OFFLINE'
+
+''' Poster downloads: chunk size of the streamed writes, posters larger than POSTER_MAX_BYTES are
+    fetched in a smaller rendition where the source offers one, posters larger than POSTER_MAX_DIMENSION
+    pixels on either side are downscaled (0 keeps the original size) and identical posters are stored
+    once under POSTER_STORE_DIR of the poster folder, hard linked to each media using them '''
+POSTER_CHUNK_SIZE              = 64 * 1024
+POSTER_MAX_BYTES               = 4_000_000
+POSTER_MAX_DIMENSION           = 2000
+POSTER_STORE_DIR               = '.store'
+
+''' Batch enrichment: parallel lookups, lookups started per second across all workers, items
+    saved per transaction, attempts before an item is left FAILED and the minimum similarity
+    between the library title and a search result for the result to be accepted '''
+ENRICH_MAX_WORKERS             = 4
+ENRICH_RATE                    = 2.0
+ENRICH_BATCH_SIZE              = 20
+ENRICH_MAX_ATTEMPTS            = 3
+ENRICH_MIN_SCORE               = 0.75
+
+''' Publishing: worker threads encoding and writing the generated files of the publishers '''
+PUBLISH_MAX_WORKERS            = 8
+
+''' Bulk updates: number of selected rows updated per step, the progress is reported after every step '''
+BULK_CHUNK_SIZE                = 500
+
+''' Database backups: pages copied per step of the online backup, writers can proceed between steps,
+    bytes streamed at a time through the compression, which is zstd when the zstandard package is 
+    installed and gzip otherwise, and the folder and number of timestamped snapshots kept '''
+BACKUP_PAGES_PER_STEP          = 256
+BACKUP_CHUNK_SIZE              = 1024 * 1024
+BACKUP_COMPRESSION             = 'zstd'
+BACKUP_FOLDER                  = 'data/backups'
+BACKUP_RETENTION               = 10
+
+#=======================================================================
+# DATE FORMATS
+#=======================================================================
+''' ISO-8601 formats used to store timestamps and dates so they sort and range-filter as text '''
+TIMESTAMP_FORMAT               = '%Y-%m-%d %H:%M:%S'
+DATE_FORMAT                    = '%Y-%m-%d'
+
+''' Accepted input formats for release dates mapped to the ISO format they are stored in '''
+RELEASE_DATE_FORMATS           = { '%Y-%m-%d' : '%Y-%m-%d',
+                                   '%d %b %Y' : '%Y-%m-%d',
+                                   '%d %B %Y' : '%Y-%m-%d',
+                                   '%d-%m-%Y' : '%Y-%m-%d',
+                                   '%d/%m/%Y' : '%Y-%m-%d',
+                                   '%Y-%m'    : '%Y-%m',
+                                   '%b %Y'    : '%Y-%m',
+                                   '%B %Y'    : '%Y-%m',
+                                   '%Y'       : '%Y' }
+
+#=======================================================================
+# SIZE UNITS
+#=======================================================================
+''' Multipliers for the unit suffixes accepted in SIZE values, binary as shown by file managers '''
+SIZE_UNITS                     = { 'B'  : 1,
+                                   'KB' : 1024,
+                                   'MB' : 1024 ** 2,
+                                   'GB' : 1024 ** 3,
+                                   'TB' : 1024 ** 4 }
+
+''' Recordable disc capacities in bytes offered by the disc planner '''
+DISC_CAPACITIES                = { 'DVD (4.7 GB)'        : 4_700_000_000,
+                                   'DVD DL (8.5 GB)'     : 8_500_000_000,
+                                   'Blu-Ray (25 GB)'     : 25_000_000_000,
+                                   'Blu-Ray DL (50 GB)'  : 50_000_000_000,
+                                   'Blu-Ray XL (100 GB)' : 100_000_000_000 }
+
+''' Prefix of the disc labels generated by the disc planner, followed by the disc number '''
+DEFAULT_DISC_PREFIX            = 'DISC-'
+
 #=======================================================================
 # UI RELATED CONSTANTS
 #=======================================================================
 ''' UI filter to DB column mapping based on media type '''
 MEDIA_FILTER_COLUMNS           = { MEDIA_TYPE.MOVIE : {
-                                       FILTER_COLUMNS.BACKUP_DISC : 'm.BACKUP_DISC',
-                                       FILTER_COLUMNS.SOURCE      : 'm.SOURCE_ID',
-                                       FILTER_COLUMNS.QUALITY     : 'm.QUALITY_ID',
-                                       FILTER_COLUMNS.EDITION     : 'm.EDITION_ID',
-                                       FILTER_COLUMNS.TO_BURN     : 'm.TO_BURN',
-                                       FILTER_COLUMNS.WATCHED     : 'm.WATCHED',
-                                       FILTER_COLUMNS.TITLE       : 'm.TITLE',
-                                       FILTER_COLUMNS.DIRECTOR    : 'm.DIRECTOR',
-                                       FILTER_COLUMNS.YEAR        : 'm.YEAR'
+                                       FILTER_COLUMNS.BACKUP_DISC   : 'm.BACKUP_DISC',
+                                       FILTER_COLUMNS.SOURCE        : 'm.SOURCE_ID',
+                                       FILTER_COLUMNS.QUALITY       : 'm.QUALITY_ID',
+                                       FILTER_COLUMNS.EDITION       : 'm.EDITION_ID',
+                                       FILTER_COLUMNS.TO_BURN       : 'm.TO_BURN',
+                                       FILTER_COLUMNS.WATCHED       : 'm.WATCHED',
+                                       FILTER_COLUMNS.TITLE         : 'm.TITLE',
+                                       FILTER_COLUMNS.DIRECTOR      : 'm.DIRECTOR',
+                                       FILTER_COLUMNS.YEAR          : 'm.YEAR',
+                                       FILTER_COLUMNS.ADDED_SINCE   : 'm.CREATED_DATE',
+                                       FILTER_COLUMNS.RELEASED_FROM : 'm.RELEASE_DATE',
+                                       FILTER_COLUMNS.RELEASED_TO   : 'm.RELEASE_DATE'
                                    },
                                    MEDIA_TYPE.SERIES : {
-                                       FILTER_COLUMNS.BACKUP_DISC : 'BACKUP_DISC',
-                                       FILTER_COLUMNS.SOURCE      : 't.SOURCE_ID',
-                                       FILTER_COLUMNS.TO_BURN     : 'TO_BURN',
-                                       FILTER_COLUMNS.WATCHED     : 't.WATCHED',
-                                       FILTER_COLUMNS.TITLE       : 't.TITLE',
-                                       FILTER_COLUMNS.DIRECTOR    : 't.DIRECTOR',
-                                       FILTER_COLUMNS.YEAR        : 't.YEAR'
+                                       FILTER_COLUMNS.BACKUP_DISC   : 'BACKUP_DISC',
+                                       FILTER_COLUMNS.SOURCE        : 't.SOURCE_ID',
+                                       FILTER_COLUMNS.TO_BURN       : 'TO_BURN',
+                                       FILTER_COLUMNS.WATCHED       : 't.WATCHED',
+                                       FILTER_COLUMNS.TITLE         : 't.TITLE',
+                                       FILTER_COLUMNS.DIRECTOR      : 't.DIRECTOR',
+                                       FILTER_COLUMNS.YEAR          : 't.YEAR',
+                                       FILTER_COLUMNS.ADDED_SINCE   : 't.CREATED_DATE',
+                                       FILTER_COLUMNS.RELEASED_FROM : 't.RELEASE_DATE',
+                                       FILTER_COLUMNS.RELEASED_TO   : 't.RELEASE_DATE'
                                    }
                                  }
 
@@ -254,4 +422,17 @@ EPISODES_CUSTOM_COL_WIDTHS    = { EPISODE_COLUMNS.SEASON      : 60,
 ''' Columns to be hidden for the Cast Tab in Details section '''
 CAST_HIDE_COLUMNS             = [ MEDIA_COLUMNS.ID ]
 
+''' Breakdowns offered in the Statistics dialog with the dimension and media types they aggregate '''
+STATS_VIEWS                   = { 'Movies by Genre'      : (STATS_DIMENSION.GENRE,   [MEDIA_TYPE.MOVIE]),
+                                  'Movies by Quality'    : (STATS_DIMENSION.QUALITY, [MEDIA_TYPE.MOVIE]),
+                                  'Movies by Source'     : (STATS_DIMENSION.SOURCE,  [MEDIA_TYPE.MOVIE]),
+                                  'Movies by Year'       : (STATS_DIMENSION.YEAR,    [MEDIA_TYPE.MOVIE]),
+                                  'Movies by Decade'     : (STATS_DIMENSION.DECADE,  [MEDIA_TYPE.MOVIE]),
+                                  'TV Series by Genre'   : (STATS_DIMENSION.GENRE,   [MEDIA_TYPE.SERIES]),
+                                  'TV Series by Source'  : (STATS_DIMENSION.SOURCE,  [MEDIA_TYPE.SERIES]),
+                                  'TV Series by Decade'  : (STATS_DIMENSION.DECADE,  [MEDIA_TYPE.SERIES]),
+                                  'Episodes by Quality'  : (STATS_DIMENSION.QUALITY, [MEDIA_TYPE.EPISODE]),
+                                  'Episodes per Series'  : (STATS_DIMENSION.SERIES,  [MEDIA_TYPE.EPISODE]),
+                                  'Size per Disc'        : (STATS_DIMENSION.DISC,    [MEDIA_TYPE.MOVIE, MEDIA_TYPE.EPISODE]) }
+
 #=======================================================================
\ No newline at end of file
@@ -2,12 +2,475 @@
 # Description:
 # Data Access Layer implementation for the application to interact with
 # the backend SQLite database
+#
+# The database runs in WAL mode so readers never wait for a writer and
+# background jobs do not lock the UI out. Every connection waits for
+# locks up to a busy timeout instead of failing, syncs at checkpoints
+# only and checkpoints automatically past a WAL size; a scheduler thread
+# additionally checkpoints passively at a fixed interval, when the app
+# is idle, and truncates the WAL when stopped
+#
+# Every statement run through the execute_ functions is recorded under
+# its fingerprint, the statement with its literals replaced by ?, with
+# its duration, the rows it returned or changed and the application code
+# it was run from. Percentiles and histograms are computed over a rolling
+# window of the most recent durations of each fingerprint. Statements
+# slower than a threshold are logged with their EXPLAIN QUERY PLAN
 #=======================================================================
+import os
+import re
+import sys
+import json
+import time
 import sqlite3
+import datetime
+import functools
+import threading
+import numpy  as np
 import pandas as pd
 import utils.constants as constants
+import utils.dbqueries as dbqueries
+
+from collections import Counter, deque
+from contextlib  import contextmanager
 
 #=======================================================================
+''' Patterns replacing the literals of a statement once its whitespace is collapsed, applied in order:
+    strings and numbers, then lists of placeholders, so statements differing only by their values share
+    a fingerprint. One pass per pattern, the statements of the model inline their values '''
+FINGERPRINT_PATTERNS = [ (re.compile(r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|\b\d+(?:\.\d+)?\b"""), '?'),
+                         (re.compile(r'\( ?\?(?: ?, ?\?)+ ?\)'),                          '(?+)') ]
+
+''' Root folder of the application, the frames of its code are reported as the callers of statements '''
+APP_ROOT             = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+
+#=======================================================================
+_checkpoint_thread = None
+_checkpoint_stop   = threading.Event()
+
+_jobs_lock         = threading.Lock()
+_jobs              = Counter()
+_exclusive_job     = None
+
+_query_lock        = threading.Lock()
+_query_stats       = {}
+_recent_queries    = deque(maxlen=constants.DB_RECENT_QUERIES)
+_slow_queries      = deque(maxlen=constants.DB_SLOW_QUERIES)
+
+#=======================================================================
+def get_connection(db_path : str = None, **kwargs) -> sqlite3.Connection:
+    """
+    Opens a connection to the database with the connection policy of the application:
+    busy timeout, synchronous mode, WAL auto-checkpoint and journal size limit.
+
+    Parameters:
+    db_path (str, optional): Path to the database. Defaults to the application database.
+    kwargs: Additional arguments of sqlite3.connect, e.g. isolation_level.
+
+    Returns:
+    sqlite3.Connection: The open connection.
+    """
+    connection = sqlite3.connect(db_path or constants.DEFAULT_DB_PATH, 
+                                 timeout=constants.DB_BUSY_TIMEOUT / 1000, **kwargs)
+
+    connection.execute(f'PRAGMA busy_timeout = {constants.DB_BUSY_TIMEOUT}')
+    connection.execute(f'PRAGMA synchronous = {constants.DB_SYNCHRONOUS}')
+    connection.execute(f'PRAGMA wal_autocheckpoint = {constants.DB_WAL_AUTOCHECKPOINT}')
+    connection.execute(f'PRAGMA journal_size_limit = {constants.DB_JOURNAL_SIZE_LIMIT}')
+
+    return connection
+
+
+def enable_wal(db_path : str = None) -> str:
+    """
+    Switches the database to the journal mode of the application, WAL by default.
+    The mode is persistent, so this only needs to run once per database, e.g. at startup.
+
+    Parameters:
+    db_path (str, optional): Path to the database. Defaults to the application database.
+
+    Returns:
+    str: The journal mode in effect, which stays unchanged if the database is locked.
+    """
+    connection = get_connection(db_path, isolation_level=None)
+
+    try:
+        return connection.execute(f'PRAGMA journal_mode = {constants.DB_JOURNAL_MODE}').fetchone()[0]
+    finally:
+        connection.close()
+
+
+def checkpoint(mode : str = 'PASSIVE', db_path : str = None) -> tuple:
+    """
+    Checkpoints the write-ahead log into the database. PASSIVE copies what it can without
+    waiting for readers or writers, TRUNCATE waits for them and empties the log.
+
+    Parameters:
+    mode (str, optional): PASSIVE, FULL, RESTART or TRUNCATE. Defaults to PASSIVE.
+    db_path (str, optional): Path to the database. Defaults to the application database.
+
+    Returns:
+    tuple: (busy, log, checkpointed) - 1 if the checkpoint could not complete, the number of
+           frames in the log and the number of frames copied, -1 for both when not in WAL mode.
+    """
+    connection = get_connection(db_path, isolation_level=None)
+
+    try:
+        return tuple(connection.execute(f'PRAGMA wal_checkpoint({mode})').fetchone())
+    finally:
+        connection.close()
+
+
+def run_checkpoints(interval : float) -> None:
+    """
+    Body of the checkpoint scheduler thread: checkpoints passively every interval until stopped.
+
+    Parameters:
+    interval (float): The number of seconds between checkpoints.
+    """
+    while not _checkpoint_stop.wait(interval):
+        try:
+            checkpoint('PASSIVE')
+        except sqlite3.Error as error:
+            print(f'checkpoint: {error}')
+
+
+def start_checkpoint_scheduler(interval : float = constants.DB_CHECKPOINT_INTERVAL) -> None:
+    """
+    Starts the background thread checkpointing the write-ahead log at a fixed interval, so the
+    log is folded back into the database while the app is idle rather than by the commit that
+    crosses the auto-checkpoint size. Does nothing if the scheduler is already running.
+
+    Parameters:
+    interval (float, optional): The number of seconds between checkpoints. Defaults to DB_CHECKPOINT_INTERVAL.
+    """
+    global _checkpoint_thread
+
+    if _checkpoint_thread and _checkpoint_thread.is_alive():
+        return
+
+    _checkpoint_stop.clear()
+    _checkpoint_thread = threading.Thread(target=run_checkpoints, args=(interval,), 
+                                          name='checkpoint-scheduler', daemon=True)
+    _checkpoint_thread.start()
+
+
+def stop_checkpoint_scheduler() -> bool:
+    """
+    Stops the checkpoint scheduler and truncates the write-ahead log, e.g. when the app exits.
+
+    Returns:
+    bool: True if the scheduler was running, False otherwise.
+    """
+    global _checkpoint_thread
+
+    running = _checkpoint_thread is not None
+
+    if _checkpoint_thread:
+        _checkpoint_stop.set()
+        _checkpoint_thread.join()
+        _checkpoint_thread = None
+
+    try:
+        checkpoint('TRUNCATE')
+    except sqlite3.Error as error:
+        print(f'checkpoint: {error}')
+
+    return running
+
+
+@contextmanager
+def background_job(name : str, exclusive : bool = False):
+    """
+    Context manager registering a job writing to the database outside of the UI thread, e.g. an
+    enrichment run. An exclusive job, e.g. a restore, only starts when no other job is running,
+    and no job starts while it runs.
+
+    Parameters:
+    name (str): The name of the job, as reported to the user.
+    exclusive (bool, optional): Whether the job must run alone. Defaults to False.
+
+    Exceptions:
+    RuntimeError: Raised if the job cannot start because of the jobs running.
+    """
+    global _exclusive_job
+
+    with _jobs_lock:
+        if _exclusive_job:
+            raise RuntimeError(f'Cannot start {name} while {_exclusive_job} is running')
+
+        if exclusive and +_jobs:
+            raise RuntimeError(f'Cannot start {name} while {", ".join(sorted(+_jobs))} is running')
+
+        if exclusive:
+            _exclusive_job = name
+        else:
+            _jobs[name] += 1
+
+    try:
+        yield
+    finally:
+        with _jobs_lock:
+            if exclusive:
+                _exclusive_job = None
+            else:
+                _jobs[name] -= 1
+
+
+@functools.lru_cache(maxsize=4096)
+def get_fingerprint(query : str) -> str:
+    """
+    Returns the fingerprint of a statement: the statement with its whitespace collapsed, its string
+    and number literals replaced by ? and lists of placeholders collapsed to (?+).
+
+    Parameters:
+    query (str): The SQL statement.
+
+    Returns:
+    str: The fingerprint of the statement.
+    """
+    query = ' '.join(query.split())
+
+    for pattern, replacement in FINGERPRINT_PATTERNS:
+        query = pattern.sub(replacement, query)
+
+    return query
+
+
+def get_callers() -> tuple:
+    """
+    Returns the application code the current statement is run from, as module.function:line.
+
+    Returns:
+    tuple: The nearest frame outside of dbhelper, e.g. a function of the model, and the outermost
+           frame of the application, e.g. the UI slot or worker of the action running the statement.
+    """
+    frame, caller, origin = sys._getframe(1), '', ''
+
+    while frame:
+        module   = frame.f_globals.get('__name__', '')
+        filename = frame.f_code.co_filename
+
+        if filename.startswith(APP_ROOT) and 'site-packages' not in filename and module not in (__name__, '__main__'):
+            origin = f'{module}.{getattr(frame.f_code, "co_qualname", frame.f_code.co_name)}:{frame.f_lineno}'
+            caller = caller or origin
+
+        frame = frame.f_back
+
+    return caller, origin
+
+
+def explain_query(connection : sqlite3.Connection, query : str, params = None) -> str:
+    """
+    Returns the query plan of a statement as an indented tree, from EXPLAIN QUERY PLAN.
+
+    Parameters:
+    connection (sqlite3.Connection): The connection the statement ran on, e.g. for its temporary tables.
+    query (str): The SQL statement.
+    params (optional): The values bound to the ? placeholders of the statement.
+
+    Returns:
+    str: One line per step of the plan.
+    """
+    depths = { 0 : -1 }
+    lines  = []
+
+    for id, parent, _, detail in connection.execute(f'EXPLAIN QUERY PLAN {query}', params or ()).fetchall():
+        depths[id] = depths.get(parent, -1) + 1
+        lines.append('  ' * depths[id] + detail)
+
+    return '\n'.join(lines)
+
+
+def write_slow_query(entry : dict) -> None:
+    """
+    Appends a slow statement to the slow query log as a JSON line, rotating the log
+    to a .1 file once it exceeds DB_SLOW_QUERY_LOG_SIZE.
+
+    Parameters:
+    entry (dict): The slow statement, see get_slow_queries.
+    """
+    path = constants.DB_SLOW_QUERY_LOG
+
+    try:
+        if os.path.exists(path) and os.path.getsize(path) > constants.DB_SLOW_QUERY_LOG_SIZE:
+            os.replace(path, f'{path}.1')
+
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+    except OSError as error:
+        print(f'write_slow_query: {error}')
+
+
+def record_query(function : str, query : str, elapsed : float, rows : int, error : Exception = None,
+                 params = None) -> tuple:
+    """
+    Records a statement in the query statistics, see get_query_stats. A successful statement slower
+    than DB_SLOW_QUERY_MS is returned to the caller, to be explained and logged by log_slow_queries
+    once its transaction is committed, so that neither holds the write lock.
+    Recording never raises, a failure is printed and the statement left unrecorded.
+
+    Parameters:
+    function (str): The dbhelper function the statement ran through.
+    query (str): The SQL statement.
+    elapsed (float): The duration of the statement in seconds.
+    rows (int): The number of rows returned or changed, negative when unknown.
+    error (Exception, optional): The error the statement failed with.
+    params (optional): The values bound to the ? placeholders of the statement.
+
+    Returns:
+    tuple: The slow statement entry and its params, None for a statement that is not slow.
+    """
+    if not constants.DB_INSTRUMENTATION:
+        return None
+
+    try:
+        fingerprint      = get_fingerprint(query)
+        caller, origin   = get_callers()
+        duration         = elapsed * 1000
+        rows             = max(rows, 0)
+        timestamp        = datetime.datetime.now().isoformat(sep=' ', timespec='milliseconds')
+
+        with _query_lock:
+            if fingerprint not in _query_stats:
+                _query_stats[fingerprint] = { 'FUNCTION'  : function,  'COUNT'   : 0, 'ERRORS'  : 0,
+                                              'ROWS'      : 0,         'TOTAL'   : 0, 'MAX'     : 0,
+                                              'DURATIONS' : deque(maxlen=constants.DB_QUERY_SAMPLES),
+                                              'CALLERS'   : Counter(), 'ORIGINS' : Counter() }
+
+            stats            = _query_stats[fingerprint]
+            stats['COUNT']  += 1
+            stats['ERRORS'] += int(error is not None)
+            stats['ROWS']   += rows
+            stats['TOTAL']  += duration
+            stats['MAX']     = max(stats['MAX'], duration)
+            stats['DURATIONS'].append(duration)
+            stats['CALLERS'][caller] += 1
+            stats['ORIGINS'][origin] += 1
+
+            _recent_queries.append({ 'TIMESTAMP'   : timestamp,          'FUNCTION' : function,
+                                     'DURATION_MS' : round(duration, 3), 'ROWS'     : rows,
+                                     'ERROR'       : str(error) if error is not None else '',
+                                     'CALLER'      : caller,             'ORIGIN'   : origin,
+                                     'FINGERPRINT' : fingerprint })
+
+        if duration >= constants.DB_SLOW_QUERY_MS and error is None:
+            return ({ 'TIMESTAMP' : timestamp, 'DURATION_MS' : round(duration, 3), 'ROWS'  : rows,
+                      'CALLER'    : caller,    'ORIGIN'      : origin,             'QUERY' : query.strip(),
+                      'PLAN'      : '' }, params)
+    except Exception as record_error:
+        print(f'record_query: {record_error}')
+
+    return None
+
+
+def log_slow_queries(connection : sqlite3.Connection, slow : list) -> None:
+    """
+    Explains the slow statements returned by record_query on the connection they ran on, after
+    its transaction is committed and before it is closed, and keeps and logs them.
+    Logging never raises, a failure is printed and the statement left unlogged.
+
+    Parameters:
+    connection (sqlite3.Connection): The connection the statements ran on, e.g. for its temporary tables.
+    slow (list): The values returned by record_query, None for the statements that were not slow.
+    """
+    for entry, params in filter(None, slow):
+        try:
+            try:
+                entry['PLAN'] = explain_query(connection, entry['QUERY'], params)
+            except sqlite3.Error as explain_error:
+                entry['PLAN'] = f'EXPLAIN QUERY PLAN failed: {explain_error}'
+
+            with _query_lock:
+                _slow_queries.append(entry)
+
+            write_slow_query(entry)
+        except Exception as log_error:
+            print(f'log_slow_queries: {log_error}')
+
+
+def get_query_stats() -> pd.DataFrame:
+    """
+    Returns the statistics of the statements run so far, per fingerprint, the most time consuming
+    first. Counts, rows, total and maximum durations cover all the statements, the average, the
+    percentiles and the histogram cover the DB_QUERY_SAMPLES most recent ones of each fingerprint.
+
+    Returns:
+    pd.DataFrame: FINGERPRINT, FUNCTION, COUNT, ERRORS, ROWS, TOTAL_MS, AVG_MS, P50_MS, P95_MS, MAX_MS,
+                  one column per histogram bucket counting the durations up to its bound (<=1ms, ...,
+                  >1000ms), and the CALLER and ORIGIN the fingerprint is most often run from.
+    """
+    bounds  = constants.DB_HISTOGRAM_BUCKETS
+    buckets = [f'<={bound}ms' for bound in bounds] + [f'>{bounds[-1]}ms']
+
+    with _query_lock:
+        stats = [(fingerprint, dict(stat, DURATIONS=np.array(stat['DURATIONS']),
+                                          CALLER=stat['CALLERS'].most_common(1)[0][0],
+                                          ORIGIN=stat['ORIGINS'].most_common(1)[0][0]))
+                 for fingerprint, stat in _query_stats.items()]
+
+    rows = []
+    for fingerprint, stat in stats:
+        durations = stat['DURATIONS']
+        histogram = np.bincount(np.searchsorted(bounds, durations, side='left'), minlength=len(buckets))
+
+        rows.append({ 'FINGERPRINT' : fingerprint,
+                      'FUNCTION'    : stat['FUNCTION'],
+                      'COUNT'       : stat['COUNT'],
+                      'ERRORS'      : stat['ERRORS'],
+                      'ROWS'        : stat['ROWS'],
+                      'TOTAL_MS'    : round(stat['TOTAL'], 1),
+                      'AVG_MS'      : round(durations.mean(), 3),
+                      'P50_MS'      : round(np.percentile(durations, 50), 3),
+                      'P95_MS'      : round(np.percentile(durations, 95), 3),
+                      'MAX_MS'      : round(stat['MAX'], 3),
+                      **dict(zip(buckets, histogram.tolist())),
+                      'CALLER'      : stat['CALLER'],
+                      'ORIGIN'      : stat['ORIGIN'] })
+
+    columns = ['FINGERPRINT', 'FUNCTION', 'COUNT', 'ERRORS', 'ROWS', 'TOTAL_MS', 'AVG_MS', 'P50_MS', 'P95_MS', 'MAX_MS'] \
+            + buckets + ['CALLER', 'ORIGIN']
+
+    return pd.DataFrame(rows, columns=columns).sort_values('TOTAL_MS', ascending=False, ignore_index=True)
+
+
+def get_recent_queries() -> pd.DataFrame:
+    """
+    Returns the DB_RECENT_QUERIES most recent statements, the latest first.
+
+    Returns:
+    pd.DataFrame: TIMESTAMP, FUNCTION, DURATION_MS, ROWS, ERROR, CALLER, ORIGIN and FINGERPRINT per statement.
+    """
+    with _query_lock:
+        recent = list(_recent_queries)[::-1]
+
+    return pd.DataFrame(recent, columns=['TIMESTAMP', 'FUNCTION', 'DURATION_MS', 'ROWS', 'ERROR', 'CALLER', 'ORIGIN', 'FINGERPRINT'])
+
+
+def get_slow_queries() -> pd.DataFrame:
+    """
+    Returns the DB_SLOW_QUERIES most recent slow statements, the latest first.
+
+    Returns:
+    pd.DataFrame: TIMESTAMP, DURATION_MS, ROWS, CALLER, ORIGIN, QUERY and its query PLAN per statement.
+    """
+    with _query_lock:
+        slow = list(_slow_queries)[::-1]
+
+    return pd.DataFrame(slow, columns=['TIMESTAMP', 'DURATION_MS', 'ROWS', 'CALLER', 'ORIGIN', 'QUERY', 'PLAN'])
+
+
+def reset_query_stats() -> None:
+    """
+    Clears the query statistics, the recent statements and the slow statements kept in memory.
+    The slow query log is left untouched.
+    """
+    with _query_lock:
+        _query_stats.clear()
+        _recent_queries.clear()
+        _slow_queries.clear()
+
+
 def execute_query(query : str) -> bool:
     """
     Executes a given SQL query on the default database.
@@ -21,14 +484,201 @@ def execute_query(query : str) -> bool:
     Exceptions:
     sqlite3.Error: Raised if there is an error executing the query, in which case the transaction is rolled back.
     """
-    connection = sqlite3.connect(constants.DEFAULT_DB_PATH)
+    connection = get_connection()
     cursor     = connection.cursor()
+    start      = time.perf_counter()
 
     try:
         cursor.execute(query)
+        slow = record_query('execute_query', query, time.perf_counter() - start, cursor.rowcount)
+        connection.commit()
+        cursor.close()
+        log_slow_queries(connection, [slow])
+    except sqlite3.Error as error:
+        record_query('execute_query', query, time.perf_counter() - start, 0, error)
+        print(error)
+        connection.rollback()
+        return False
+    finally:
+        if connection:
+            connection.close()
+    
+    return True
+
+
+def execute_many(statements : list) -> bool:
+    """
+    Executes a batch of parameterized SQL statements on the default database in a single transaction.
+
+    Parameters:
+    statements (list): Tuples of (query, params), where params is a list of parameter tuples
+                       the query is executed with through executemany.
+
+    Returns:
+    bool: True if all statements were executed successfully and committed, False if an error occurred.
+
+    Exceptions:
+    sqlite3.Error: Raised if there is an error executing a statement, in which case the whole batch is rolled back.
+    """
+    connection = get_connection()
+    cursor     = connection.cursor()
+    slow       = []
+
+    try:
+        for query, params in statements:
+            start = time.perf_counter()
+            cursor.executemany(query, params)
+            slow.append(record_query('execute_many', query, time.perf_counter() - start, cursor.rowcount,
+                                     params=params[0] if params else None))
+        connection.commit()
+        cursor.close()
+        log_slow_queries(connection, slow)
+    except sqlite3.Error as error:
+        record_query('execute_many', query, time.perf_counter() - start, 0, error)
+        print(error)
+        connection.rollback()
+        return False
+    finally:
+        if connection:
+            connection.close()
+    
+    return True
+
+
+def execute_insert(query : str, params : tuple = ()) -> int:
+    """
+    Executes a parameterized INSERT statement on the default database.
+
+    Parameters:
+    query (str): The INSERT statement to be executed.
+    params (tuple, optional): The values bound to the ? placeholders of the statement.
+
+    Returns:
+    int: The ID (rowid) of the inserted row as reported by the inserting statement, -1 if an error occurred.
+
+    Exceptions:
+    sqlite3.Error: Raised if there is an error executing the statement, in which case the transaction is rolled back.
+    """
+    connection = get_connection()
+    cursor     = connection.cursor()
+    start      = time.perf_counter()
+
+    try:
+        cursor.execute(query, params)
+        row_id = cursor.lastrowid
+        slow   = record_query('execute_insert', query, time.perf_counter() - start, cursor.rowcount, params=params)
+        connection.commit()
+        cursor.close()
+        log_slow_queries(connection, [slow])
+    except sqlite3.Error as error:
+        record_query('execute_insert', query, time.perf_counter() - start, 0, error)
+        print(error)
+        connection.rollback()
+        return -1
+    finally:
+        if connection:
+            connection.close()
+    
+    return row_id
+
+
+def execute_insert_many(query : str, params : list) -> list:
+    """
+    Executes a parameterized INSERT statement for a batch of rows on the default database in a single
+    transaction. The rows are inserted while the transaction holds the write lock, so they receive
+    consecutive IDs ending with the last inserted rowid.
+
+    Parameters:
+    query (str): The INSERT statement to be executed.
+    params (list): The parameter tuples, one per row to insert.
+
+    Returns:
+    list: The IDs of the inserted rows in the order of the parameters, empty if an error occurred.
+
+    Exceptions:
+    sqlite3.Error: Raised if there is an error executing the statement, in which case the whole batch is rolled back.
+    """
+    if not params:
+        return []
+
+    connection = get_connection()
+    cursor     = connection.cursor()
+    start      = time.perf_counter()
+
+    try:
+        cursor.executemany(query, params)
+        slow    = record_query('execute_insert_many', query, time.perf_counter() - start, cursor.rowcount, params=params[0])
+        last_id = cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+        connection.commit()
+        cursor.close()
+        log_slow_queries(connection, [slow])
+    except sqlite3.Error as error:
+        record_query('execute_insert_many', query, time.perf_counter() - start, 0, error)
+        print(error)
+        connection.rollback()
+        return []
+    finally:
+        if connection:
+            connection.close()
+    
+    return list(range(last_id - len(params) + 1, last_id + 1))
+
+
+def execute_bulk(ids : list, statements : list, progress = None, chunk_size : int = constants.BULK_CHUNK_SIZE) -> bool:
+    """
+    Applies a set of statements to a selection of rows of the default database in a single transaction.
+    The selected IDs are loaded into a temporary table instead of being inlined in the statements, which
+    are then run over the selection chunk by chunk so the progress can be reported.
+
+    Parameters:
+    ids (list): The IDs of the selected rows.
+    statements (list): Tuples of (query, params), where the query contains a {selection} placeholder 
+                       replaced by a subquery returning the IDs of the current chunk.
+    progress (callable, optional): Called with (processed, total) rows after every chunk.
+    chunk_size (int, optional): The number of rows per chunk. Defaults to BULK_CHUNK_SIZE.
+
+    Returns:
+    bool: True if all statements were executed successfully and committed, False if an error occurred.
+
+    Exceptions:
+    sqlite3.Error: Raised if there is an error executing a statement, in which case the whole update is rolled back.
+    """
+    ids        = list(dict.fromkeys(int(id) for id in ids))
+    connection = get_connection()
+    cursor     = connection.cursor()
+    timings    = { query : [0, 0] for query, _ in statements }
+    slow       = []
+    query      = dbqueries.QUERY_INSERT_BULK_SELECTION
+    started    = time.perf_counter()
+
+    try:
+        cursor.execute(dbqueries.QUERY_CREATE_BULK_SELECTION)
+        cursor.executemany(dbqueries.QUERY_INSERT_BULK_SELECTION, [(id,) for id in ids])
+        record_query('execute_bulk', query, time.perf_counter() - started, cursor.rowcount)
+
+        # Each statement is recorded once, over all the chunks
+        for start in range(0, len(ids), chunk_size):
+            end       = min(start + chunk_size, len(ids))
+            selection = dbqueries.QUERY_GET_BULK_SELECTION.format(start=start, end=end)
+
+            for query, params in statements:
+                started = time.perf_counter()
+                cursor.execute(query.format(selection=selection), params)
+                timings[query][0] += time.perf_counter() - started
+                timings[query][1] += max(cursor.rowcount, 0)
+
+            if progress:
+                progress(end, len(ids))
+
+        for query, params in statements:
+            slow.append(record_query('execute_bulk', query.format(selection=dbqueries.QUERY_GET_BULK_SELECTION.format(start=0, end=len(ids))),
+                                     timings[query][0], timings[query][1], params=params))
+
         connection.commit()
         cursor.close()
+        log_slow_queries(connection, slow)
     except sqlite3.Error as error:
+        record_query('execute_bulk', query, time.perf_counter() - started, 0, error)
         print(error)
         connection.rollback()
         return False
@@ -39,12 +689,13 @@ def execute_query(query : str) -> bool:
     return True
 
 
-def execute_read(query : str) -> pd.DataFrame:
+def execute_read(query : str, params : list = None) -> pd.DataFrame:
     """
     Executes a read operation on a SQLite database using the provided SQL query.
 
     Parameters:
     query (str): A SQL query string to be executed on the database.
+    params (list, optional): The values bound to the ? placeholders of the query.
 
     Returns:
     pd.DataFrame: A DataFrame containing the results of the SQL query.
@@ -54,12 +705,16 @@ def execute_read(query : str) -> pd.DataFrame:
     which is caught and printed to the console. The database connection is closed 
     in the 'finally' block to ensure resources are released.
     """
-    connection = sqlite3.connect(constants.DEFAULT_DB_PATH)
+    connection = get_connection()
     result_df  = pd.DataFrame()
+    start      = time.perf_counter()
     
     try:
-        result_df  = pd.read_sql_query(query, connection)
+        result_df  = pd.read_sql_query(query, connection, params=params)
+        slow       = record_query('execute_read', query, time.perf_counter() - start, len(result_df), params=params)
+        log_slow_queries(connection, [slow])
     except Exception as error:
+        record_query('execute_read', query, time.perf_counter() - start, 0, error)
         print(error)
     finally:
         if connection:
@@ -6,9 +6,13 @@
 # META DATA QUERIES
 #=======================================================================
 QUERY_GET_ACTORS                = 'SELECT ID, NAME, SOURCE_URL FROM ACTORS'
-QUERY_GET_ACTOR                 = 'SELECT ID FROM ACTORS WHERE NAME = "{name}" OR ONLINE_ID = "{online_id}"'
-QUERY_ADD_ACTOR                 = '''INSERT INTO ACTORS (NAME, ONLINE_ID, LOOKUP_SOURCE, SOURCE_URL, CREATED_DATE)
-                                     VALUES ("{name}", "{online_id}", "{lookup_source}", "{source_url}", "{created_date}")'''
+QUERY_RESOLVE_ACTORS            = '''SELECT ID, NAME, ONLINE_ID 
+                                     FROM ACTORS 
+                                     WHERE ONLINE_ID IN ({online_ids}) 
+                                        OR (ONLINE_ID IS NULL AND NAME IN ({names}))
+                                     ORDER BY ID'''
+QUERY_INSERT_ACTORS             = '''INSERT OR IGNORE INTO ACTORS (NAME, ONLINE_ID, LOOKUP_SOURCE, SOURCE_URL, CREATED_DATE)
+                                     VALUES (?, ?, ?, ?, ?)'''
 
 QUERY_GET_APP_CONFIG            = '''SELECT ID,
                                             EXPORT_TEMPLATES,
@@ -29,37 +33,50 @@ QUERY_UPDATE_APP_CONFIG         = '''UPDATE APP_CONFIG
                                            DEFAULT_POSTER_PATH = "{default_poster}"'''
 
 QUERY_GET_GENRES                = 'SELECT ID, GENRE FROM GENRES ORDER BY GENRE'
-QUERY_ADD_GENRE                 = 'INSERT INTO GENRES (GENRE, CREATED_DATE) VALUES ("{}", "{}")'
-QUERY_GET_MAX_GENRE_ID          = 'SELECT MAX(ID) AS ID FROM GENRES'
-QUERY_REMOVE_GENRE_MOVIES       = 'DELETE FROM MOVIE_GENRES WHERE GENRE_ID={id}'
-QUERY_REMOVE_GENRE_SERIES       = 'DELETE FROM TV_SERIES_GENRES WHERE GENRE_ID={id}'
-QUERY_REMOVE_GENRE              = 'DELETE FROM GENRES WHERE ID={id}'
+QUERY_ADD_GENRE                 = 'INSERT INTO GENRES (GENRE, CREATED_DATE) VALUES (?, ?)'
+QUERY_REMOVE_GENRE_MOVIES       = 'DELETE FROM MOVIE_GENRES WHERE GENRE_ID = ?'
+QUERY_REMOVE_GENRE_SERIES       = 'DELETE FROM TV_SERIES_GENRES WHERE GENRE_ID = ?'
+QUERY_REMOVE_GENRE              = 'DELETE FROM GENRES WHERE ID = ?'
 
 QUERY_GET_LANGUAGES             = 'SELECT ID, LANGUAGE FROM LANGUAGES ORDER BY LANGUAGE'
-QUERY_ADD_LANGUAGE              = 'INSERT INTO LANGUAGES (LANGUAGE, CREATED_DATE) VALUES ("{}", "{}")'
-QUERY_GET_MAX_LANGUAGE_ID       = 'SELECT MAX(ID) AS ID FROM LANGUAGES'
+QUERY_ADD_LANGUAGE              = 'INSERT INTO LANGUAGES (LANGUAGE, CREATED_DATE) VALUES (?, ?)'
 
 QUERY_GET_MEDIA_EDITION         = 'SELECT ID, EDITION FROM MEDIA_EDITION'
-QUERY_ADD_MEDIA_EDITION         = 'INSERT INTO MEDIA_EDITION (EDITION, CREATED_DATE) VALUES ("{}", "{}")'
-QUERY_REMOVE_EDITION_MOVIES     = 'UPDATE MOVIES SET EDITION_ID = NULL WHERE EDITION_ID={id}'
-QUERY_REMOVE_EDITION            = 'DELETE FROM MEDIA_EDITION WHERE ID={id}'
+QUERY_ADD_MEDIA_EDITION         = 'INSERT INTO MEDIA_EDITION (EDITION, CREATED_DATE) VALUES (?, ?)'
+QUERY_REMOVE_EDITION_MOVIES     = 'UPDATE MOVIES SET EDITION_ID = NULL WHERE EDITION_ID = ?'
+QUERY_REMOVE_EDITION            = 'DELETE FROM MEDIA_EDITION WHERE ID = ?'
 
 QUERY_GET_MEDIA_QUALITY         = 'SELECT ID, QUALITY FROM MEDIA_QUALITY'
-QUERY_ADD_MEDIA_QUALITY         = 'INSERT INTO MEDIA_QUALITY (QUALITY, CREATED_DATE) VALUES ("{}", "{}")'
-QUERY_REMOVE_QUALITY_MOVIES     = 'UPDATE MOVIES SET QUALITY_ID = NULL WHERE QUALITY_ID={id}'
-QUERY_REMOVE_QUALITY            = 'DELETE FROM MEDIA_QUALITY WHERE ID={id}'
+QUERY_ADD_MEDIA_QUALITY         = 'INSERT INTO MEDIA_QUALITY (QUALITY, CREATED_DATE) VALUES (?, ?)'
+QUERY_REMOVE_QUALITY_MOVIES     = 'UPDATE MOVIES SET QUALITY_ID = NULL WHERE QUALITY_ID = ?'
+QUERY_REMOVE_QUALITY            = 'DELETE FROM MEDIA_QUALITY WHERE ID = ?'
 
 QUERY_GET_MEDIA_SOURCE          = 'SELECT ID, SOURCE FROM MEDIA_SOURCE'
-QUERY_ADD_MEDIA_SOURCE          = 'INSERT INTO MEDIA_SOURCE (SOURCE, CREATED_DATE) VALUES ("{}", "{}")'
-QUERY_REMOVE_SOURCE_MOVIES      = 'UPDATE MOVIES SET SOURCE_ID = NULL WHERE SOURCE_ID={id}'
-QUERY_REMOVE_SOURCE_SERIES      = 'UPDATE TV_SERIES SET SOURCE_ID = NULL WHERE SOURCE_ID={id}'
-QUERY_REMOVE_SOURCE             = 'DELETE FROM MEDIA_SOURCE WHERE ID={id}'
+QUERY_ADD_MEDIA_SOURCE          = 'INSERT INTO MEDIA_SOURCE (SOURCE, CREATED_DATE) VALUES (?, ?)'
+QUERY_REMOVE_SOURCE_MOVIES      = 'UPDATE MOVIES SET SOURCE_ID = NULL WHERE SOURCE_ID = ?'
+QUERY_REMOVE_SOURCE_SERIES      = 'UPDATE TV_SERIES SET SOURCE_ID = NULL WHERE SOURCE_ID = ?'
+QUERY_REMOVE_SOURCE             = 'DELETE FROM MEDIA_SOURCE WHERE ID = ?'
+
+#=======================================================================
+# DATE FILTER QUERIES
+#=======================================================================
+''' Dates are stored as ISO-8601 text, release dates possibly with a reduced precision
+    of 'YYYY-MM' or 'YYYY'. The '~' sorts after any date character, so an upper bound 
+    of '2010~' includes all of 2010 and non date text like 'Unknown' stays excluded '''
+QUERY_FILTER_ADDED_SINCE        = '''{column} >= "{date}"'''
+QUERY_FILTER_RELEASED_FROM      = '''{column} BETWEEN "{date}" AND "9999~"'''
+QUERY_FILTER_RELEASED_TO        = '''{column} BETWEEN "0" AND "{date}~"'''
 
 #=======================================================================
 # MOVIE QUERIES
 #=======================================================================
 QUERY_GET_TOTAL_MOVIE_COUNT     = '''SELECT COUNT(*) AS COUNT FROM MOVIES'''
-QUERY_GET_MAX_MOVIE_ID          = '''SELECT MAX(ID) AS ID FROM MOVIES'''
+
+QUERY_GET_MOVIE_TOTALS          = '''SELECT COUNT(*) AS COUNT,
+                                            IFNULL(SUM(SIZE_BYTES), 0) AS SIZE_BYTES,
+                                            IFNULL(SUM(RUNTIME_MINUTES), 0) AS RUNTIME_MINUTES,
+                                            AVG(RUNTIME_MINUTES) AS AVG_RUNTIME_MINUTES
+                                     FROM MOVIES'''
 
 QUERY_GET_MOVIES                = '''SELECT m.ID,
                                             m.TITLE, 
@@ -67,7 +84,7 @@ QUERY_GET_MOVIES                = '''SELECT m.ID,
                                             m.WATCHED,
                                             m.TO_BURN,
                                             m.RATING,
-                                            IFNULL (m.SIZE, '') AS SIZE,
+                                            m.SIZE_BYTES AS SIZE,
                                             m.CREATED_DATE
                                      FROM MOVIES m
                                         LEFT JOIN MEDIA_SOURCE s ON m.SOURCE_ID = s.ID
@@ -156,7 +173,7 @@ QUERY_GET_MOVIE_DISCS           = '''SELECT DISTINCT BACKUP_DISC
                                      ORDER BY BACKUP_DISC'''
 
 QUERY_ADD_NEW_MOVIE             = '''INSERT INTO MOVIES (TITLE, SOURCE_ID, QUALITY_ID, EDITION_ID, CREATED_DATE, UPDATED_DATE)
-                                     VALUES ("{0}", 1, 1, 1, "{1}", "{2}")'''
+                                     VALUES (?, 1, 1, 1, ?, ?)'''
 
 QUERY_DELETE_MOVIE_CAST         = '''DELETE FROM MOVIE_CAST WHERE MOVIE_ID={id}'''
 QUERY_DELETE_MOVIE_LANGUAGES    = '''DELETE FROM MOVIE_LANGUAGES WHERE MOVIE_ID={id}'''
@@ -164,7 +181,6 @@ QUERY_DELETE_MOVIE_GENRES       = '''DELETE FROM MOVIE_GENRES WHERE MOVIE_ID={id
 QUERY_DELETE_MOVIE              = '''DELETE FROM MOVIES WHERE ID={id}'''
 
 QUERY_UPDATE_MOVIE              = '''UPDATE MOVIES SET {updates} WHERE ID = {id}'''
-QUERY_UPDATE_MOVIE_BULK         = '''UPDATE MOVIES SET {updates} WHERE ID IN ({id})'''
 
 QUERY_UPDATE_MOVIE_SOURCE       = '''UPDATE MOVIES
                                      SET LOOKUP_SOURCE = "{source}",
@@ -172,25 +188,20 @@ QUERY_UPDATE_MOVIE_SOURCE       = '''UPDATE MOVIES
                                      WHERE ID = {id}'''
 
 QUERY_ADD_MOVIE_GENRE           = '''INSERT INTO MOVIE_GENRES (MOVIE_ID, GENRE_ID, CREATED_DATE)
-                                     VALUES ({}, {}, "{}")'''
+                                     VALUES (?, ?, ?)'''
 
-QUERY_REMOVE_MOVIE_GENRE        = '''DELETE FROM MOVIE_GENRES 
-                                     WHERE GENRE_ID = (SELECT ID 
-                                                       FROM GENRES 
-                                                       WHERE GENRE = "{}") 
-                                       AND MOVIE_ID = {}'''
+QUERY_REMOVE_MOVIE_GENRE        = '''DELETE FROM MOVIE_GENRES WHERE MOVIE_ID = ? AND GENRE_ID = ?'''
 
 QUERY_ADD_MOVIE_LANGUAGE        = '''INSERT INTO MOVIE_LANGUAGES (MOVIE_ID, LANGUAGE_ID, CREATED_DATE)
-                                     VALUES ({}, {}, "{}")'''
+                                     VALUES (?, ?, ?)'''
 
-QUERY_REMOVE_MOVIE_LANGUAGE     = '''DELETE FROM MOVIE_LANGUAGES 
-                                     WHERE LANGUAGE_ID = (SELECT ID 
-                                                          FROM LANGUAGES 
-                                                          WHERE LANGUAGE = "{}") 
-                                       AND MOVIE_ID = {}'''
+QUERY_REMOVE_MOVIE_LANGUAGE     = '''DELETE FROM MOVIE_LANGUAGES WHERE MOVIE_ID = ? AND LANGUAGE_ID = ?'''
 
-QUERY_ADD_MOVIE_CAST            = '''INSERT INTO MOVIE_CAST (MOVIE_ID, ACTOR_ID, CHARACTER, CREATED_DATE)
-                                     VALUES ({}, {}, "{}", "{}")'''
+QUERY_INSERT_MOVIE_CAST         = '''INSERT INTO MOVIE_CAST (MOVIE_ID, ACTOR_ID, CHARACTER, CREATED_DATE)
+                                     VALUES (?, ?, ?, ?)'''
+
+QUERY_INSERT_MOVIE_CAST_BY_ONLINE_ID = '''INSERT INTO MOVIE_CAST (MOVIE_ID, ACTOR_ID, CHARACTER, CREATED_DATE)
+                                          SELECT ?, ID, ?, ? FROM ACTORS WHERE ONLINE_ID = ?'''
 
 QUERY_REMOVE_MOVIE_CAST         = '''DELETE FROM MOVIE_CAST WHERE ID = {id}'''
 
@@ -198,8 +209,11 @@ QUERY_REMOVE_MOVIE_CAST         = '''DELETE FROM MOVIE_CAST WHERE ID = {id}'''
 # TV SERIES QUERIES
 #=======================================================================
 QUERY_GET_TOTAL_SERIES_COUNT    = '''SELECT COUNT(*) AS COUNT FROM TV_SERIES'''
-QUERY_GET_MAX_SERIES_ID         = '''SELECT MAX(ID) AS ID FROM TV_SERIES'''
-QUERY_GET_MAX_EPISODE_ID        = '''SELECT MAX(ID) AS ID FROM TV_SERIES_EPISODES'''
+
+QUERY_GET_SERIES_TOTALS         = '''SELECT COUNT(*) AS COUNT,
+                                            IFNULL(SUM(SIZE_BYTES), 0) AS SIZE_BYTES,
+                                            AVG(SIZE_BYTES) AS AVG_SIZE_BYTES
+                                     FROM TV_SERIES_EPISODES'''
 
 QUERY_GET_SERIES                = '''SELECT t.ID,
                                             t.TITLE,
@@ -256,7 +270,7 @@ QUERY_GET_SERIES_EPISODES       = '''SELECT t.ID,
                                             t.TITLE,
                                             t.WATCHED,
                                             IFNULL(t.BACKUP_DISC, '') AS BACKUP_DISC,
-                                            IFNULL(t.SIZE, '') AS SIZE
+                                            t.SIZE_BYTES AS SIZE
                                      FROM TV_SERIES_EPISODES t
                                      WHERE t.SERIES_ID = {id}
                                      {where_clause}
@@ -318,10 +332,10 @@ QUERY_GET_SERIES_DISCS          = '''SELECT DISTINCT BACKUP_DISC
                                      ORDER BY BACKUP_DISC'''
 
 QUERY_ADD_NEW_SERIES            = '''INSERT INTO TV_SERIES (TITLE, SOURCE_ID, CREATED_DATE, UPDATED_DATE)
-                                     VALUES ("{0}", 1, "{1}", "{2}")'''
+                                     VALUES (?, 1, ?, ?)'''
 
 QUERY_ADD_NEW_EPISODE            = '''INSERT INTO TV_SERIES_EPISODES (SEASON, EPISODE, TITLE, SERIES_ID, PLOT, RELEASE_DATE, QUALITY_ID, CREATED_DATE, UPDATED_DATE)
-                                     VALUES ({0}, {1}, "{2}", {3}, "{4}", "{5}", 1, "{6}", "{7}")'''
+                                     VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?)'''
 
 QUERY_DELETE_SERIES_CAST        = '''DELETE FROM TV_SERIES_CAST WHERE SERIES_ID={id}'''
 QUERY_DELETE_SERIES_LANGUAGES   = '''DELETE FROM TV_SERIES_LANGUAGES WHERE SERIES_ID={id}'''
@@ -333,32 +347,216 @@ QUERY_DELETE_SERIES             = '''DELETE FROM TV_SERIES WHERE ID={id}'''
 QUERY_UPDATE_SERIES             = '''UPDATE TV_SERIES SET {updates} WHERE ID = {id}'''
 QUERY_UPDATE_SERIES_EPISODE     = '''UPDATE TV_SERIES_EPISODES SET {updates} WHERE ID = {id}'''
 
+QUERY_UPDATE_EPISODE_STATE      = '''UPDATE TV_SERIES_EPISODES SET {updates}, UPDATED_DATE = ?
+                                     WHERE SERIES_ID = ? {where_clause} AND NOT ({unchanged})'''
+
+QUERY_SET_SERIES_WATCHED        = '''UPDATE TV_SERIES 
+                                     SET WATCHED      = NOT EXISTS (SELECT 1 FROM TV_SERIES_EPISODES 
+                                                                    WHERE SERIES_ID = TV_SERIES.ID AND IFNULL(WATCHED, 0) = 0),
+                                         UPDATED_DATE = ?
+                                     WHERE ID = ?
+                                       AND EXISTS (SELECT 1 FROM TV_SERIES_EPISODES WHERE SERIES_ID = TV_SERIES.ID)
+                                       AND IFNULL(WATCHED, 0) = EXISTS (SELECT 1 FROM TV_SERIES_EPISODES 
+                                                                        WHERE SERIES_ID = TV_SERIES.ID AND IFNULL(WATCHED, 0) = 0)'''
+
+QUERY_GET_EPISODE_KEYS          = '''SELECT ID, SEASON, EPISODE FROM TV_SERIES_EPISODES WHERE SERIES_ID = {id}'''
+
+QUERY_INSERT_SERIES_EPISODES    = '''INSERT INTO TV_SERIES_EPISODES (SEASON, EPISODE, TITLE, SERIES_ID, PLOT, RELEASE_DATE, QUALITY_ID, CREATED_DATE, UPDATED_DATE)
+                                     VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?)'''
+
+QUERY_UPDATE_EPISODE_DETAILS    = '''UPDATE TV_SERIES_EPISODES SET TITLE = ?, PLOT = ?, RELEASE_DATE = ?, UPDATED_DATE = ? WHERE ID = ?'''
+
 QUERY_UPDATE_SERIES_SOURCE      = '''UPDATE TV_SERIES
                                      SET LOOKUP_SOURCE = "{source}",
                                          SOURCE_URL    = "{source_url}"
                                      WHERE ID = {id}'''
 
 QUERY_ADD_SERIES_GENRE           = '''INSERT INTO TV_SERIES_GENRES (SERIES_ID, GENRE_ID, CREATED_DATE)
-                                     VALUES ({}, {}, "{}")'''
+                                     VALUES (?, ?, ?)'''
 
-QUERY_REMOVE_SERIES_GENRE        = '''DELETE FROM TV_SERIES_GENRES 
-                                      WHERE GENRE_ID = (SELECT ID 
-                                                        FROM GENRES 
-                                                        WHERE GENRE = "{}") 
-                                       AND SERIES_ID = {}'''
+QUERY_REMOVE_SERIES_GENRE        = '''DELETE FROM TV_SERIES_GENRES WHERE SERIES_ID = ? AND GENRE_ID = ?'''
 
 QUERY_ADD_SERIES_LANGUAGE       = '''INSERT INTO TV_SERIES_LANGUAGES (SERIES_ID, LANGUAGE_ID, CREATED_DATE)
-                                     VALUES ({}, {}, "{}")'''
+                                     VALUES (?, ?, ?)'''
+
+QUERY_REMOVE_SERIES_LANGUAGE    = '''DELETE FROM TV_SERIES_LANGUAGES WHERE SERIES_ID = ? AND LANGUAGE_ID = ?'''
 
-QUERY_REMOVE_SERIES_LANGUAGE    = '''DELETE FROM TV_SERIES_LANGUAGES 
-                                     WHERE LANGUAGE_ID = (SELECT ID 
-                                                          FROM LANGUAGES 
-                                                          WHERE LANGUAGE = "{}") 
-                                       AND SERIES_ID = {}'''
+QUERY_INSERT_SERIES_CAST        = '''INSERT INTO TV_SERIES_CAST (SERIES_ID, ACTOR_ID, CHARACTER, EPISODES, CREATED_DATE)
+                                     VALUES (?, ?, ?, ?, ?)'''
 
-QUERY_ADD_SERIES_CAST           = '''INSERT INTO TV_SERIES_CAST (SERIES_ID, ACTOR_ID, CHARACTER, EPISODES, CREATED_DATE)
-                                     VALUES ({}, {}, "{}", "{}", "{}")'''
+QUERY_INSERT_SERIES_CAST_BY_ONLINE_ID = '''INSERT INTO TV_SERIES_CAST (SERIES_ID, ACTOR_ID, CHARACTER, EPISODES, CREATED_DATE)
+                                           SELECT ?, ID, ?, ?, ? FROM ACTORS WHERE ONLINE_ID = ?'''
 
 QUERY_REMOVE_SERIES_CAST        = '''DELETE FROM SERIES_CAST WHERE ID = {id}'''
 
-#=======================================================================
\ No newline at end of file
+#=======================================================================
+# BACKUP DISC QUERIES
+#=======================================================================
+QUERY_GET_DISC_SIZES            = '''SELECT BACKUP_DISC,
+                                            COUNT(*) AS COUNT,
+                                            IFNULL(SUM(SIZE_BYTES), 0) AS SIZE_BYTES
+                                     FROM (SELECT BACKUP_DISC, SIZE_BYTES 
+                                           FROM MOVIES 
+                                           WHERE BACKUP_DISC IS NOT NULL
+                                           UNION ALL
+                                           SELECT BACKUP_DISC, SIZE_BYTES 
+                                           FROM TV_SERIES_EPISODES 
+                                           WHERE BACKUP_DISC IS NOT NULL)
+                                     GROUP BY BACKUP_DISC
+                                     ORDER BY BACKUP_DISC'''
+
+QUERY_GET_BURN_ITEMS            = '''SELECT 'MOVIE' AS MEDIA_TYPE,
+                                            m.ID,
+                                            NULL AS SERIES_ID,
+                                            NULL AS SEASON,
+                                            NULL AS EPISODE,
+                                            m.TITLE,
+                                            IFNULL(m.SIZE_BYTES, 0) AS SIZE_BYTES
+                                     FROM MOVIES m
+                                     WHERE m.TO_BURN = 1
+                                     UNION ALL
+                                     SELECT 'EPISODE' AS MEDIA_TYPE,
+                                            e.ID,
+                                            e.SERIES_ID,
+                                            e.SEASON,
+                                            e.EPISODE,
+                                            t.TITLE,
+                                            IFNULL(e.SIZE_BYTES, 0) AS SIZE_BYTES
+                                     FROM TV_SERIES_EPISODES e
+                                     INNER JOIN TV_SERIES t ON t.ID = e.SERIES_ID
+                                     WHERE e.TO_BURN = 1'''
+
+QUERY_GET_BURNT_DISCS           = '''SELECT BACKUP_DISC FROM MOVIES 
+                                     WHERE BACKUP_DISC IS NOT NULL AND TO_BURN = 0
+                                     UNION
+                                     SELECT BACKUP_DISC FROM TV_SERIES_EPISODES 
+                                     WHERE BACKUP_DISC IS NOT NULL AND TO_BURN = 0'''
+
+QUERY_SET_MOVIE_DISC            = '''UPDATE MOVIES SET BACKUP_DISC = ?, UPDATED_DATE = ? WHERE ID = ?'''
+
+QUERY_SET_EPISODE_DISC          = '''UPDATE TV_SERIES_EPISODES SET BACKUP_DISC = ?, UPDATED_DATE = ? WHERE ID = ?'''
+
+#=======================================================================
+# STATISTICS QUERIES
+#=======================================================================
+QUERY_GET_MEDIA_STATS           = '''SELECT s.MEDIA_TYPE,
+                                            s.DIMENSION,
+                                            s.KEY,
+                                            IFNULL(CASE s.DIMENSION
+                                                       WHEN 'GENRE'   THEN g.GENRE
+                                                       WHEN 'QUALITY' THEN q.QUALITY
+                                                       WHEN 'SOURCE'  THEN o.SOURCE
+                                                       WHEN 'SERIES'  THEN t.TITLE
+                                                       ELSE NULLIF(s.KEY, '')
+                                                   END, 'Unknown') AS NAME,
+                                            s.COUNT,
+                                            s.WATCHED,
+                                            s.TO_BURN,
+                                            s.SIZE_BYTES
+                                     FROM MEDIA_STATS s
+                                     LEFT JOIN GENRES g        ON s.DIMENSION = 'GENRE'   AND g.ID = s.KEY
+                                     LEFT JOIN MEDIA_QUALITY q ON s.DIMENSION = 'QUALITY' AND q.ID = s.KEY
+                                     LEFT JOIN MEDIA_SOURCE o  ON s.DIMENSION = 'SOURCE'  AND o.ID = s.KEY
+                                     LEFT JOIN TV_SERIES t     ON s.DIMENSION = 'SERIES'  AND t.ID = s.KEY
+                                     WHERE s.COUNT > 0
+                                     ORDER BY s.MEDIA_TYPE, s.DIMENSION, s.KEY'''
+
+#=======================================================================
+# ENRICHMENT QUEUE QUERIES
+#=======================================================================
+QUERY_ENQUEUE_UNENRICHED        = '''INSERT OR IGNORE INTO ENRICH_QUEUE (MEDIA_TYPE, MEDIA_ID, SOURCE, STATUS, CREATED_DATE, UPDATED_DATE)
+                                     SELECT 'MOVIE', ID, "{source}", 'PENDING', "{timestamp}", "{timestamp}" 
+                                     FROM MOVIES WHERE IFNULL(LOOKUP_SOURCE, '') = ''
+                                     UNION ALL
+                                     SELECT 'SERIES', ID, "{source}", 'PENDING', "{timestamp}", "{timestamp}" 
+                                     FROM TV_SERIES WHERE IFNULL(LOOKUP_SOURCE, '') = '' '''
+
+QUERY_DELETE_ENRICH_ORPHANS     = '''DELETE FROM ENRICH_QUEUE
+                                     WHERE (MEDIA_TYPE = 'MOVIE'  AND MEDIA_ID NOT IN (SELECT ID FROM MOVIES))
+                                        OR (MEDIA_TYPE = 'SERIES' AND MEDIA_ID NOT IN (SELECT ID FROM TV_SERIES))'''
+
+QUERY_DELETE_ENRICHED_PENDING   = '''DELETE FROM ENRICH_QUEUE
+                                     WHERE STATUS = 'PENDING'
+                                       AND ((MEDIA_TYPE = 'MOVIE'  AND MEDIA_ID IN (SELECT ID FROM MOVIES    WHERE IFNULL(LOOKUP_SOURCE, '') <> ''))
+                                         OR (MEDIA_TYPE = 'SERIES' AND MEDIA_ID IN (SELECT ID FROM TV_SERIES WHERE IFNULL(LOOKUP_SOURCE, '') <> '')))'''
+
+QUERY_RESUME_ENRICH_QUEUE       = '''UPDATE ENRICH_QUEUE SET STATUS = 'PENDING', UPDATED_DATE = "{timestamp}"
+                                     WHERE STATUS = 'RUNNING'
+                                        OR (STATUS = 'FAILED' AND ATTEMPTS < {max_attempts})'''
+
+QUERY_GET_ENRICH_ITEMS          = '''SELECT q.ID,
+                                            q.MEDIA_TYPE,
+                                            q.MEDIA_ID,
+                                            q.ATTEMPTS,
+                                            m.TITLE,
+                                            m.YEAR
+                                     FROM ENRICH_QUEUE q
+                                     INNER JOIN (SELECT 'MOVIE' AS MEDIA_TYPE, ID, TITLE, YEAR FROM MOVIES
+                                                 UNION ALL
+                                                 SELECT 'SERIES', ID, TITLE, YEAR FROM TV_SERIES) m
+                                             ON m.MEDIA_TYPE = q.MEDIA_TYPE AND m.ID = q.MEDIA_ID
+                                     WHERE q.STATUS = 'PENDING' AND q.SOURCE = "{source}"
+                                     ORDER BY q.ID
+                                     LIMIT {limit}'''
+
+QUERY_SET_ENRICH_RUNNING        = '''UPDATE ENRICH_QUEUE SET STATUS = 'RUNNING', UPDATED_DATE = ? WHERE ID = ?'''
+
+QUERY_SET_ENRICH_STATUS         = '''UPDATE ENRICH_QUEUE 
+                                     SET STATUS       = ?, 
+                                         ATTEMPTS     = ATTEMPTS + ?,
+                                         ONLINE_ID    = ?,
+                                         SCORE        = ?,
+                                         DURATION     = ?,
+                                         MESSAGE      = ?,
+                                         UPDATED_DATE = ?
+                                     WHERE ID = ?'''
+
+QUERY_GET_ENRICH_SUMMARY        = '''SELECT SOURCE,
+                                            STATUS,
+                                            COUNT(*) AS COUNT,
+                                            SUM(CASE WHEN MEDIA_TYPE = 'MOVIE' THEN 1 ELSE 0 END) AS MOVIES,
+                                            SUM(CASE WHEN MEDIA_TYPE = 'SERIES' THEN 1 ELSE 0 END) AS SERIES,
+                                            ROUND(AVG(DURATION), 2) AS AVG_SECONDS
+                                     FROM ENRICH_QUEUE
+                                     GROUP BY SOURCE, STATUS
+                                     ORDER BY SOURCE, STATUS'''
+
+QUERY_GET_ENRICH_ITEM_STATUS    = '''SELECT q.ID,
+                                            q.MEDIA_TYPE,
+                                            q.MEDIA_ID,
+                                            IFNULL(m.TITLE, '') AS TITLE,
+                                            q.STATUS,
+                                            q.ATTEMPTS,
+                                            q.ONLINE_ID,
+                                            q.SCORE,
+                                            q.DURATION,
+                                            q.MESSAGE,
+                                            q.UPDATED_DATE
+                                     FROM ENRICH_QUEUE q
+                                     LEFT JOIN (SELECT 'MOVIE' AS MEDIA_TYPE, ID, TITLE FROM MOVIES
+                                                UNION ALL
+                                                SELECT 'SERIES', ID, TITLE FROM TV_SERIES) m
+                                            ON m.MEDIA_TYPE = q.MEDIA_TYPE AND m.ID = q.MEDIA_ID
+                                     WHERE q.STATUS IN ({statuses})
+                                     ORDER BY q.UPDATED_DATE DESC, q.ID'''
+
+#=======================================================================
+# BULK UPDATE QUERIES
+#=======================================================================
+QUERY_CREATE_BULK_SELECTION     = '''CREATE TEMP TABLE IF NOT EXISTS BULK_SELECTION (
+                                        "SEQ" INTEGER PRIMARY KEY,
+                                        "ID"  INTEGER NOT NULL)'''
+
+QUERY_INSERT_BULK_SELECTION     = '''INSERT INTO temp.BULK_SELECTION (ID) VALUES (?)'''
+
+QUERY_GET_BULK_SELECTION        = '''SELECT ID FROM temp.BULK_SELECTION WHERE SEQ > {start} AND SEQ <= {end}'''
+
+QUERY_BULK_UPDATE               = '''UPDATE {table} SET {updates}, UPDATED_DATE = ? WHERE ID IN ({{selection}})'''
+
+QUERY_BULK_ADD_MOVIE_GENRE      = '''INSERT OR IGNORE INTO MOVIE_GENRES (MOVIE_ID, GENRE_ID, CREATED_DATE)
+                                     SELECT ID, ?, ? FROM ({selection})'''
+
+QUERY_BULK_ADD_SERIES_GENRE     = '''INSERT OR IGNORE INTO TV_SERIES_GENRES (SERIES_ID, GENRE_ID, CREATED_DATE)
+                                     SELECT ID, ?, ? FROM ({selection})'''
+
+#=======================================================================
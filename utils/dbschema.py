@@ -0,0 +1,484 @@
+#=======================================================================
+# Description:
+# Versioned schema upgrades for the application database. Every entry
+# in SCHEMA_MIGRATIONS moves the database up by one version, tracked
+# in SQLite's user_version pragma, so that databases restored from an
+# older release of the app are brought up to date on startup
+#=======================================================================
+import re
+import sqlite3
+import utils.dbhelper as dbhelper
+import utils.metahelper as metahelper
+
+from utils.common import toISODate, parseSize, parseRuntime
+
+#=======================================================================
+def journal_trigger(table : str, event : str, media_type : str, media_id : str, operation : str) -> str:
+    """
+    Builds the DDL for a trigger that records a change of a table in the CHANGE_JOURNAL.
+
+    Parameters:
+    table (str): The table the trigger is attached to.
+    event (str): The triggering event (INSERT, UPDATE or DELETE).
+    media_type (str): The media type recorded in the journal (MOVIE or SERIES).
+    media_id (str): Expression resolving to the media ID, e.g. NEW.ID or OLD.SERIES_ID.
+    operation (str): The journaled operation, I (insert), U (update) or D (delete).
+
+    Returns:
+    str: The CREATE TRIGGER statement.
+    """
+    return f'''CREATE TRIGGER IF NOT EXISTS TRG_JOURNAL_{table}_{event} AFTER {event} ON {table}
+               BEGIN
+                   INSERT INTO CHANGE_JOURNAL (MEDIA_TYPE, MEDIA_ID, OPERATION, CHANGED_DATE)
+                   VALUES ('{media_type}', {media_id}, '{operation}', datetime('now', 'localtime'));
+               END'''
+
+#=======================================================================
+# VERSION 1 - CHANGE JOURNAL FOR DELTA EXPORTS
+#=======================================================================
+MIGRATION_CHANGE_JOURNAL = [
+    '''CREATE TABLE IF NOT EXISTS "CHANGE_JOURNAL" (
+        "SEQ"          INTEGER NOT NULL,
+        "MEDIA_TYPE"   TEXT NOT NULL,
+        "MEDIA_ID"     INTEGER NOT NULL,
+        "OPERATION"    TEXT NOT NULL,
+        "CHANGED_DATE" TEXT NOT NULL,
+        PRIMARY KEY("SEQ" AUTOINCREMENT))''',
+
+    '''CREATE INDEX IF NOT EXISTS "IDX_CHANGE_JOURNAL_MEDIA" ON "CHANGE_JOURNAL" ("MEDIA_TYPE", "SEQ")''',
+
+    '''CREATE TABLE IF NOT EXISTS "EXPORT_WATERMARKS" (
+        "ID"           INTEGER NOT NULL,
+        "EXPORTER"     TEXT NOT NULL UNIQUE,
+        "LAST_SEQ"     INTEGER NOT NULL DEFAULT 0,
+        "UPDATED_DATE" TEXT NOT NULL,
+        PRIMARY KEY("ID" AUTOINCREMENT))''',
+
+    # Movies and series journal their own inserts / updates / deletes, while
+    # episodes, genres and languages are part of the exported media row so
+    # any change to them is journaled as an update of the parent media
+    journal_trigger('MOVIES',              'INSERT', 'MOVIE',  'NEW.ID',        'I'),
+    journal_trigger('MOVIES',              'UPDATE', 'MOVIE',  'NEW.ID',        'U'),
+    journal_trigger('MOVIES',              'DELETE', 'MOVIE',  'OLD.ID',        'D'),
+    journal_trigger('TV_SERIES',           'INSERT', 'SERIES', 'NEW.ID',        'I'),
+    journal_trigger('TV_SERIES',           'UPDATE', 'SERIES', 'NEW.ID',        'U'),
+    journal_trigger('TV_SERIES',           'DELETE', 'SERIES', 'OLD.ID',        'D'),
+    journal_trigger('TV_SERIES_EPISODES',  'INSERT', 'SERIES', 'NEW.SERIES_ID', 'U'),
+    journal_trigger('TV_SERIES_EPISODES',  'UPDATE', 'SERIES', 'NEW.SERIES_ID', 'U'),
+    journal_trigger('TV_SERIES_EPISODES',  'DELETE', 'SERIES', 'OLD.SERIES_ID', 'U'),
+    journal_trigger('MOVIE_GENRES',        'INSERT', 'MOVIE',  'NEW.MOVIE_ID',  'U'),
+    journal_trigger('MOVIE_GENRES',        'DELETE', 'MOVIE',  'OLD.MOVIE_ID',  'U'),
+    journal_trigger('MOVIE_LANGUAGES',     'INSERT', 'MOVIE',  'NEW.MOVIE_ID',  'U'),
+    journal_trigger('MOVIE_LANGUAGES',     'DELETE', 'MOVIE',  'OLD.MOVIE_ID',  'U'),
+    journal_trigger('TV_SERIES_GENRES',    'INSERT', 'SERIES', 'NEW.SERIES_ID', 'U'),
+    journal_trigger('TV_SERIES_GENRES',    'DELETE', 'SERIES', 'OLD.SERIES_ID', 'U'),
+    journal_trigger('TV_SERIES_LANGUAGES', 'INSERT', 'SERIES', 'NEW.SERIES_ID', 'U'),
+    journal_trigger('TV_SERIES_LANGUAGES', 'DELETE', 'SERIES', 'OLD.SERIES_ID', 'U')
+]
+
+#=======================================================================
+# VERSION 2 - ISO-8601 DATES
+#=======================================================================
+def migrate_iso_dates(cursor : sqlite3.Cursor) -> None:
+    """
+    Converts the 'DD-MM-YYYY HH:MM:SS' timestamps in the CREATED_DATE / UPDATED_DATE columns
+    of all tables to ISO-8601 and normalizes the free text release dates of movies, series
+    and episodes so both can be range-filtered through an index.
+
+    Parameters:
+    cursor (sqlite3.Cursor): Cursor of the connection running the migration.
+    """
+    tables = [row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()]
+
+    for table in tables:
+        columns = [row[1] for row in cursor.execute(f'PRAGMA table_info("{table}")').fetchall()]
+
+        for column in [col for col in ['CREATED_DATE', 'UPDATED_DATE'] if col in columns]:
+            cursor.execute(f'''UPDATE "{table}"
+                               SET {column} = substr({column}, 7, 4) || '-' ||
+                                              substr({column}, 4, 2) || '-' ||
+                                              substr({column}, 1, 2) ||
+                                              substr({column}, 11)
+                               WHERE {column} GLOB '[0-9][0-9]-[0-9][0-9]-[0-9][0-9][0-9][0-9]*' ''')
+
+        if 'RELEASE_DATE' in columns:
+            release_dates = cursor.execute(f'SELECT ID, RELEASE_DATE FROM "{table}" WHERE RELEASE_DATE IS NOT NULL').fetchall()
+            updates       = [(toISODate(release) or None, media_id) for media_id, release in release_dates 
+                             if (toISODate(release) or None) != release]
+            cursor.executemany(f'UPDATE "{table}" SET RELEASE_DATE = ? WHERE ID = ?', updates)
+
+
+MIGRATION_ISO_DATES = [
+    migrate_iso_dates,
+    '''CREATE INDEX IF NOT EXISTS "IDX_MOVIES_CREATED_DATE"    ON "MOVIES" ("CREATED_DATE")''',
+    '''CREATE INDEX IF NOT EXISTS "IDX_MOVIES_RELEASE_DATE"    ON "MOVIES" ("RELEASE_DATE")''',
+    '''CREATE INDEX IF NOT EXISTS "IDX_TV_SERIES_CREATED_DATE" ON "TV_SERIES" ("CREATED_DATE")''',
+    '''CREATE INDEX IF NOT EXISTS "IDX_TV_SERIES_RELEASE_DATE" ON "TV_SERIES" ("RELEASE_DATE")'''
+]
+
+#=======================================================================
+# VERSION 3 - NUMERIC SIZE AND RUNTIME
+#=======================================================================
+def migrate_numeric_sizes(cursor : sqlite3.Cursor) -> None:
+    """
+    Populates the numeric SIZE_BYTES / RUNTIME_MINUTES columns from the unit-suffixed
+    free text in the SIZE / RUNTIME columns of movies and episodes.
+
+    Parameters:
+    cursor (sqlite3.Cursor): Cursor of the connection running the migration.
+    """
+    for table, text_column, numeric_column, parser in [('MOVIES',             'SIZE',    'SIZE_BYTES',      parseSize),
+                                                       ('MOVIES',             'RUNTIME', 'RUNTIME_MINUTES', parseRuntime),
+                                                       ('TV_SERIES_EPISODES', 'SIZE',    'SIZE_BYTES',      parseSize)]:
+        values  = cursor.execute(f'SELECT ID, {text_column} FROM {table} WHERE {text_column} IS NOT NULL').fetchall()
+        updates = [(parser(value), media_id) for media_id, value in values]
+        cursor.executemany(f'UPDATE {table} SET {numeric_column} = ? WHERE ID = ?', updates)
+
+
+MIGRATION_NUMERIC_SIZES = [
+    '''ALTER TABLE "MOVIES" ADD COLUMN "SIZE_BYTES" INTEGER''',
+    '''ALTER TABLE "MOVIES" ADD COLUMN "RUNTIME_MINUTES" INTEGER''',
+    '''ALTER TABLE "TV_SERIES_EPISODES" ADD COLUMN "SIZE_BYTES" INTEGER''',
+    migrate_numeric_sizes
+]
+
+#=======================================================================
+# VERSION 4 - LIBRARY STATISTICS
+#=======================================================================
+''' Aggregates maintained in MEDIA_STATS per source table: the media type recorded, the
+    dimensions with their key expression ({r} is replaced by NEW. / OLD. or nothing) and 
+    the measures summed up besides the row count '''
+STATS_DIMENSIONS = {
+    'MOVIES'             : ('MOVIE',   { 'TOTAL'   : "''",
+                                         'QUALITY' : '{r}QUALITY_ID',
+                                         'SOURCE'  : '{r}SOURCE_ID',
+                                         'YEAR'    : '{r}YEAR',
+                                         'DECADE'  : '({r}YEAR / 10) * 10',
+                                         'DISC'    : '{r}BACKUP_DISC' },
+                                       [ 'WATCHED', 'TO_BURN', 'SIZE_BYTES' ]),
+    'TV_SERIES'          : ('SERIES',  { 'TOTAL'   : "''",
+                                         'SOURCE'  : '{r}SOURCE_ID',
+                                         'YEAR'    : '{r}YEAR',
+                                         'DECADE'  : '({r}YEAR / 10) * 10' },
+                                       [ 'WATCHED' ]),
+    'TV_SERIES_EPISODES' : ('EPISODE', { 'TOTAL'   : "''",
+                                         'QUALITY' : '{r}QUALITY_ID',
+                                         'DISC'    : '{r}BACKUP_DISC',
+                                         'SERIES'  : '{r}SERIES_ID' },
+                                       [ 'WATCHED', 'TO_BURN', 'SIZE_BYTES' ]),
+    'MOVIE_GENRES'       : ('MOVIE',   { 'GENRE'   : '{r}GENRE_ID' }, []),
+    'TV_SERIES_GENRES'   : ('SERIES',  { 'GENRE'   : '{r}GENRE_ID' }, [])
+}
+
+STATS_MEASURES = [ 'WATCHED', 'TO_BURN', 'SIZE_BYTES' ]
+
+
+def stats_upsert(table : str, row : str, sign : int, dimension_names : list = None) -> str:
+    """
+    Builds the statements adding (or removing) a row of a table to its aggregates in MEDIA_STATS.
+
+    Parameters:
+    table (str): The source table, one of STATS_DIMENSIONS.
+    row (str): The trigger row reference, NEW or OLD.
+    sign (int): 1 to add the row to the aggregates, -1 to remove it.
+    dimension_names (list, optional): Restricts the statements to these dimensions, all by default.
+
+    Returns:
+    str: The UPSERT statements, one per dimension, to be used inside a trigger body.
+    """
+    media_type, dimensions, measures = STATS_DIMENSIONS[table]
+
+    values     = [f'{sign} * IFNULL({row}.{col}, 0)' if col in measures else '0' for col in STATS_MEASURES]
+    statements = []
+
+    for dimension, key in dimensions.items():
+        if dimension_names and dimension not in dimension_names:
+            continue
+
+        statements.append(f'''INSERT INTO MEDIA_STATS (MEDIA_TYPE, DIMENSION, KEY, COUNT, {', '.join(STATS_MEASURES)})
+                    VALUES ('{media_type}', '{dimension}', IFNULL({key.format(r=row + '.')}, ''), {sign}, {', '.join(values)})
+                    ON CONFLICT (MEDIA_TYPE, DIMENSION, KEY) DO UPDATE 
+                    SET COUNT = COUNT + excluded.COUNT, 
+                        {', '.join(f'{col} = {col} + excluded.{col}' for col in STATS_MEASURES)};''')
+
+    return '\n'.join(statements)
+
+
+def stats_triggers(table : str) -> list:
+    """
+    Builds the triggers keeping MEDIA_STATS up to date with inserts, updates and deletes of a table.
+    Updates only fire when one of the aggregated or key columns changes.
+
+    Parameters:
+    table (str): The source table, one of STATS_DIMENSIONS.
+
+    Returns:
+    list: The CREATE TRIGGER statements.
+    """
+    _, dimensions, measures = STATS_DIMENSIONS[table]
+
+    columns = sorted(set(measures + [col for key in dimensions.values() for col in re.findall(r'\{r\}(\w+)', key)]))
+    return [f'''CREATE TRIGGER IF NOT EXISTS TRG_STATS_{table}_INSERT AFTER INSERT ON {table}
+                BEGIN
+                    {stats_upsert(table, 'NEW', 1)}
+                END''',
+            f'''CREATE TRIGGER IF NOT EXISTS TRG_STATS_{table}_DELETE AFTER DELETE ON {table}
+                BEGIN
+                    {stats_upsert(table, 'OLD', -1)}
+                END''',
+            f'''CREATE TRIGGER IF NOT EXISTS TRG_STATS_{table}_UPDATE AFTER UPDATE OF {', '.join(columns)} ON {table}
+                BEGIN
+                    {stats_upsert(table, 'OLD', -1)}
+                    {stats_upsert(table, 'NEW', 1)}
+                END''']
+
+
+def stats_rebuild() -> list:
+    """
+    Builds the statements recomputing MEDIA_STATS from scratch.
+
+    Returns:
+    list: The DELETE and INSERT ... SELECT statements.
+    """
+    statements = ['DELETE FROM MEDIA_STATS']
+
+    for table, (media_type, dimensions, measures) in STATS_DIMENSIONS.items():
+        values = [f'IFNULL(SUM({col}), 0)' if col in measures else '0' for col in STATS_MEASURES]
+
+        for dimension, key in dimensions.items():
+            statements.append(f'''INSERT INTO MEDIA_STATS (MEDIA_TYPE, DIMENSION, KEY, COUNT, {', '.join(STATS_MEASURES)})
+                                SELECT '{media_type}', '{dimension}', IFNULL({key.format(r='')}, ''), COUNT(*), {', '.join(values)}
+                                FROM {table}
+                                GROUP BY 3''')
+
+    return statements
+
+
+MIGRATION_MEDIA_STATS = [
+    '''CREATE TABLE IF NOT EXISTS "MEDIA_STATS" (
+        "MEDIA_TYPE"   TEXT NOT NULL,
+        "DIMENSION"    TEXT NOT NULL,
+        "KEY"          TEXT NOT NULL,
+        "COUNT"        INTEGER NOT NULL DEFAULT 0,
+        "WATCHED"      INTEGER NOT NULL DEFAULT 0,
+        "TO_BURN"      INTEGER NOT NULL DEFAULT 0,
+        "SIZE_BYTES"   INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY("MEDIA_TYPE", "DIMENSION", "KEY")) WITHOUT ROWID'''
+] + stats_rebuild() + [trigger for table in STATS_DIMENSIONS for trigger in stats_triggers(table)]
+
+#=======================================================================
+# VERSION 5 - PER DIMENSION STATISTICS UPDATE TRIGGERS
+#=======================================================================
+def stats_update_triggers(table : str) -> list:
+    """
+    Builds one update trigger per dimension of a table, firing only when the key column of
+    the dimension or one of the measures changes. Bulk updates of a single column, such as
+    assigning backup discs, then only touch the aggregates of the affected dimension.
+
+    Parameters:
+    table (str): The source table, one of STATS_DIMENSIONS.
+
+    Returns:
+    list: The CREATE TRIGGER statements.
+    """
+    _, dimensions, measures = STATS_DIMENSIONS[table]
+
+    triggers = []
+    for dimension, key in dimensions.items():
+        columns = sorted(set(measures + re.findall(r'\{r\}(\w+)', key)))
+
+        triggers.append(f'''CREATE TRIGGER IF NOT EXISTS TRG_STATS_{table}_{dimension}_UPDATE AFTER UPDATE OF {', '.join(columns)} ON {table}
+                BEGIN
+                    {stats_upsert(table, 'OLD', -1, [dimension])}
+                    {stats_upsert(table, 'NEW', 1, [dimension])}
+                END''')
+
+    return triggers
+
+
+MIGRATION_STATS_UPDATE_TRIGGERS = [f'DROP TRIGGER IF EXISTS TRG_STATS_{table}_UPDATE' for table in STATS_DIMENSIONS] + \
+                                  [trigger for table in STATS_DIMENSIONS for trigger in stats_update_triggers(table)]
+
+#=======================================================================
+# VERSION 6 - BATCH ENRICHMENT QUEUE
+#=======================================================================
+MIGRATION_ENRICH_QUEUE = [
+    '''CREATE TABLE IF NOT EXISTS "ENRICH_QUEUE" (
+        "ID"           INTEGER NOT NULL,
+        "MEDIA_TYPE"   TEXT NOT NULL,
+        "MEDIA_ID"     INTEGER NOT NULL,
+        "SOURCE"       TEXT NOT NULL,
+        "STATUS"       TEXT NOT NULL DEFAULT 'PENDING',
+        "ATTEMPTS"     INTEGER NOT NULL DEFAULT 0,
+        "ONLINE_ID"    TEXT,
+        "SCORE"        REAL,
+        "DURATION"     REAL,
+        "MESSAGE"      TEXT,
+        "CREATED_DATE" TEXT NOT NULL,
+        "UPDATED_DATE" TEXT NOT NULL,
+        PRIMARY KEY("ID" AUTOINCREMENT),
+        UNIQUE("MEDIA_TYPE", "MEDIA_ID"))''',
+    '''CREATE INDEX IF NOT EXISTS IDX_ENRICH_QUEUE_STATUS ON ENRICH_QUEUE (STATUS)'''
+]
+
+#=======================================================================
+# VERSION 7 - UNIQUE ACTOR ONLINE IDS
+#=======================================================================
+MIGRATION_UNIQUE_ACTORS = [
+    # Actors saved without an online id used to get an empty string or 'None'
+    '''UPDATE ACTORS SET ONLINE_ID = NULL WHERE TRIM(IFNULL(ONLINE_ID, '')) IN ('', 'None')''',
+
+    # Duplicates of an online id are merged into the oldest actor, cast links included
+    '''CREATE TEMP TABLE ACTOR_DUPLICATES AS
+        SELECT a.ID, k.KEEP_ID
+        FROM ACTORS a
+            INNER JOIN (SELECT ONLINE_ID, MIN(ID) AS KEEP_ID
+                        FROM ACTORS
+                        WHERE ONLINE_ID IS NOT NULL
+                        GROUP BY ONLINE_ID
+                        HAVING COUNT(*) > 1) k ON k.ONLINE_ID = a.ONLINE_ID
+        WHERE a.ID <> k.KEEP_ID''',
+    '''UPDATE MOVIE_CAST
+        SET ACTOR_ID = (SELECT KEEP_ID FROM temp.ACTOR_DUPLICATES d WHERE d.ID = MOVIE_CAST.ACTOR_ID)
+        WHERE ACTOR_ID IN (SELECT ID FROM temp.ACTOR_DUPLICATES)''',
+    '''UPDATE TV_SERIES_CAST
+        SET ACTOR_ID = (SELECT KEEP_ID FROM temp.ACTOR_DUPLICATES d WHERE d.ID = TV_SERIES_CAST.ACTOR_ID)
+        WHERE ACTOR_ID IN (SELECT ID FROM temp.ACTOR_DUPLICATES)''',
+    '''DELETE FROM ACTORS WHERE ID IN (SELECT ID FROM temp.ACTOR_DUPLICATES)''',
+    '''DROP TABLE temp.ACTOR_DUPLICATES''',
+
+    '''CREATE UNIQUE INDEX IF NOT EXISTS IDX_ACTORS_ONLINE_ID ON ACTORS (ONLINE_ID)'''
+]
+
+#=======================================================================
+# VERSION 8 - UNIQUE GENRE LINKS
+#=======================================================================
+MIGRATION_UNIQUE_GENRES = [
+    # Bulk updates could link a genre to the same media more than once
+    '''DELETE FROM MOVIE_GENRES 
+        WHERE ID NOT IN (SELECT MIN(ID) FROM MOVIE_GENRES GROUP BY MOVIE_ID, GENRE_ID)''',
+    '''DELETE FROM TV_SERIES_GENRES 
+        WHERE ID NOT IN (SELECT MIN(ID) FROM TV_SERIES_GENRES GROUP BY SERIES_ID, GENRE_ID)''',
+
+    '''CREATE UNIQUE INDEX IF NOT EXISTS IDX_MOVIE_GENRES_MEDIA ON MOVIE_GENRES (MOVIE_ID, GENRE_ID)''',
+    '''CREATE UNIQUE INDEX IF NOT EXISTS IDX_TV_SERIES_GENRES_MEDIA ON TV_SERIES_GENRES (SERIES_ID, GENRE_ID)'''
+]
+
+#=======================================================================
+# VERSION 9 - EPISODE INDEX
+#=======================================================================
+MIGRATION_EPISODE_INDEX = [
+    # Episodes are listed and updated by series and season
+    '''CREATE INDEX IF NOT EXISTS IDX_TV_SERIES_EPISODES_SERIES ON TV_SERIES_EPISODES (SERIES_ID, SEASON, EPISODE)'''
+]
+
+#=======================================================================
+# VERSION 10 - ENRICHMENT QUEUE PER LOOKUP SOURCE
+#=======================================================================
+MIGRATION_ENRICH_QUEUE_SOURCE = [
+    # Items are queued once per lookup source, so an item queued or not found under one
+    # source can still be looked up from another. SQLite cannot alter a constraint, the
+    # table is rebuilt with the new unique key
+    '''CREATE TABLE "ENRICH_QUEUE_NEW" (
+        "ID"           INTEGER NOT NULL,
+        "MEDIA_TYPE"   TEXT NOT NULL,
+        "MEDIA_ID"     INTEGER NOT NULL,
+        "SOURCE"       TEXT NOT NULL,
+        "STATUS"       TEXT NOT NULL DEFAULT 'PENDING',
+        "ATTEMPTS"     INTEGER NOT NULL DEFAULT 0,
+        "ONLINE_ID"    TEXT,
+        "SCORE"        REAL,
+        "DURATION"     REAL,
+        "MESSAGE"      TEXT,
+        "CREATED_DATE" TEXT NOT NULL,
+        "UPDATED_DATE" TEXT NOT NULL,
+        PRIMARY KEY("ID" AUTOINCREMENT),
+        UNIQUE("MEDIA_TYPE", "MEDIA_ID", "SOURCE"))''',
+    '''INSERT INTO ENRICH_QUEUE_NEW (ID, MEDIA_TYPE, MEDIA_ID, SOURCE, STATUS, ATTEMPTS, ONLINE_ID, SCORE,
+                                   DURATION, MESSAGE, CREATED_DATE, UPDATED_DATE)
+        SELECT ID, MEDIA_TYPE, MEDIA_ID, SOURCE, STATUS, ATTEMPTS, ONLINE_ID, SCORE,
+               DURATION, MESSAGE, CREATED_DATE, UPDATED_DATE
+        FROM ENRICH_QUEUE''',
+    '''DROP TABLE ENRICH_QUEUE''',
+    '''ALTER TABLE ENRICH_QUEUE_NEW RENAME TO ENRICH_QUEUE''',
+    '''CREATE INDEX IF NOT EXISTS IDX_ENRICH_QUEUE_STATUS ON ENRICH_QUEUE (STATUS)'''
+]
+
+#=======================================================================
+# SCHEMA VERSIONS
+#=======================================================================
+''' Ordered list of migrations, position + 1 is the resulting schema version.
+    A step is either a SQL statement or a callable receiving the open cursor '''
+SCHEMA_MIGRATIONS = [ MIGRATION_CHANGE_JOURNAL,
+                      MIGRATION_ISO_DATES,
+                      MIGRATION_NUMERIC_SIZES,
+                      MIGRATION_MEDIA_STATS,
+                      MIGRATION_STATS_UPDATE_TRIGGERS,
+                      MIGRATION_ENRICH_QUEUE,
+                      MIGRATION_UNIQUE_ACTORS,
+                      MIGRATION_UNIQUE_GENRES,
+                      MIGRATION_EPISODE_INDEX,
+                      MIGRATION_ENRICH_QUEUE_SOURCE ]
+
+#=======================================================================
+def get_schema_version(db_path=None) -> int:
+    """
+    Retrieves the schema version currently stored in the database.
+
+    Parameters:
+    db_path (str, optional): Path to the database. Defaults to the application database.
+
+    Returns:
+    int: The value of the user_version pragma.
+    """
+    connection = dbhelper.get_connection(db_path)
+
+    try:
+        return connection.execute('PRAGMA user_version').fetchone()[0]
+    finally:
+        connection.close()
+
+
+def upgrade_schema(db_path=None) -> bool:
+    """
+    Applies all pending migrations to the database. Each migration runs in its own
+    transaction together with the user_version bump, so a failed step leaves the
+    database at the last good version. The database is then switched to WAL mode.
+
+    Parameters:
+    db_path (str, optional): Path to the database. Defaults to the application database.
+
+    Returns:
+    bool: True if the database is at the latest version, False if a migration failed.
+    """
+    connection = dbhelper.get_connection(db_path, isolation_level=None)
+    cursor     = connection.cursor()
+
+    try:
+        version = cursor.execute('PRAGMA user_version').fetchone()[0]
+
+        for new_version in range(version + 1, len(SCHEMA_MIGRATIONS) + 1):
+            cursor.execute('BEGIN')
+
+            for step in SCHEMA_MIGRATIONS[new_version - 1]:
+                if callable(step):
+                    step(cursor)
+                else:
+                    cursor.execute(step)
+
+            cursor.execute(f'PRAGMA user_version = {new_version}')
+            cursor.execute('COMMIT')
+    except Exception as error:
+        print(f'upgrade_schema: {error}')
+        if connection.in_transaction:
+            cursor.execute('ROLLBACK')
+        return False
+    finally:
+        connection.close()
+        metahelper.clear_meta_ids(db_path=db_path)
+
+    dbhelper.enable_wal(db_path)
+
+    return True
+
+#=======================================================================
@@ -0,0 +1,210 @@
+#=======================================================================
+# Description:
+# Backup disc planner packing all media flagged TO_BURN onto discs of a
+# given capacity. Items are packed largest first into the fullest disc
+# they still fit on (best-fit decreasing), keeping all episodes of a
+# series, or failing that of a season, together on the same disc
+#=======================================================================
+import re
+import numpy  as np
+import pandas as pd
+
+from bisect            import bisect_left, insort
+from utils.common      import getTimestamp
+from utils.dbhelper    import execute_read, execute_many
+from utils.constants   import MEDIA_TYPE, DEFAULT_DISC_PREFIX
+
+import utils.dbqueries as dbqueries
+
+#=======================================================================
+def get_burn_items() -> pd.DataFrame:
+    """
+    Retrieves the movies and episodes flagged TO_BURN along with their numeric sizes.
+
+    Returns:
+    pd.DataFrame: MEDIA_TYPE, ID, SERIES_ID, SEASON, EPISODE, TITLE and SIZE_BYTES of each item.
+    """
+    return execute_read(dbqueries.QUERY_GET_BURN_ITEMS)
+
+
+def get_next_disc_number(prefix : str = DEFAULT_DISC_PREFIX) -> int:
+    """
+    Returns the number of the next disc to be labelled with the prefix, after the discs
+    already burnt, i.e. holding media that is no longer flagged TO_BURN.
+
+    Parameters:
+    prefix (str): The prefix of the disc labels.
+
+    Returns:
+    int: The next free disc number, starting at 1.
+    """
+    discs   = execute_read(dbqueries.QUERY_GET_BURNT_DISCS)
+
+    if discs.empty:
+        return 1
+
+    numbers = discs['BACKUP_DISC'].str.extract(rf'^{re.escape(prefix)}(\d+)$')[0].dropna()
+    return int(numbers.astype(int).max()) + 1 if not numbers.empty else 1
+
+
+def get_sized_items(items : pd.DataFrame) -> np.ndarray:
+    """
+    Returns which items have a known size and can be packed.
+
+    Parameters:
+    items (pd.DataFrame): The items to be packed, as returned by get_burn_items.
+
+    Returns:
+    np.ndarray: True for every item with a SIZE_BYTES above zero.
+    """
+    return (items['SIZE_BYTES'].fillna(0) > 0).to_numpy()
+
+
+def get_pack_units(items : pd.DataFrame, capacity : int) -> np.ndarray:
+    """
+    Groups the items into the units placed on a disc as a whole. Each movie is a unit of its own,
+    the episodes of a series form one unit if the series fits on a single disc, else one unit per
+    season if the season fits, else every episode is placed individually.
+
+    Parameters:
+    items (pd.DataFrame): The items to be packed, as returned by get_burn_items.
+    capacity (int): The disc capacity in bytes.
+
+    Returns:
+    np.ndarray: The unit number of every item.
+    """
+    episodes     = (items['MEDIA_TYPE'] == MEDIA_TYPE.EPISODE).to_numpy()
+    series_size  = items.groupby('SERIES_ID')['SIZE_BYTES'].transform('sum').fillna(0).to_numpy()
+    season_size  = items.groupby(['SERIES_ID', 'SEASON'])['SIZE_BYTES'].transform('sum').fillna(0).to_numpy()
+
+    keep_series  = episodes & (series_size <= capacity)
+    keep_season  = episodes & ~keep_series & (season_size <= capacity)
+
+    keys = pd.DataFrame({ 'KIND'   : np.select([keep_series, keep_season, episodes], [1, 2, 3], 0),
+                          'KEY'    : np.where(keep_series | keep_season, items['SERIES_ID'].fillna(0), items['ID']),
+                          'SEASON' : np.where(keep_season, items['SEASON'].fillna(0), 0) })
+
+    return keys.groupby(['KIND', 'KEY', 'SEASON'], sort=False).ngroup().to_numpy()
+
+
+def pack_items(items : pd.DataFrame, capacity : int) -> np.ndarray:
+    """
+    Packs the items onto discs using best-fit decreasing: units are placed largest first onto
+    the disc with the least free space they still fit on, a new disc being opened when none fits.
+    Free space is kept in a sorted list so every placement is a binary search, which keeps the
+    planner fast for tens of thousands of items.
+
+    Parameters:
+    items (pd.DataFrame): The items to be packed, as returned by get_burn_items.
+    capacity (int): The disc capacity in bytes.
+
+    Items without a known size, i.e. a missing or zero SIZE_BYTES, are not placed: counting them as
+    empty would let a disc be planned over its real capacity.
+
+    Returns:
+    np.ndarray: The zero based disc index of every item, -1 for items larger than a disc or without a size.
+    """
+    item_discs = np.full(len(items), -1, dtype=int)
+    sized      = get_sized_items(items)
+
+    if not sized.any():
+        return item_discs
+
+    items      = items[sized]
+    units      = get_pack_units(items, capacity)
+    unit_sizes = np.bincount(units, weights=items['SIZE_BYTES'].to_numpy(dtype=float)).astype(np.int64)
+    unit_discs = np.full(len(unit_sizes), -1, dtype=int)
+
+    free_space = []
+    disc_count = 0
+
+    for unit in np.argsort(-unit_sizes, kind='stable'):
+        size = int(unit_sizes[unit])
+
+        if size > capacity:
+            continue
+
+        index = bisect_left(free_space, (size, -1))
+
+        if index < len(free_space):
+            remaining, disc = free_space.pop(index)
+        else:
+            remaining, disc = capacity, disc_count
+            disc_count += 1
+
+        unit_discs[unit] = disc
+        insort(free_space, (remaining - size, disc))
+
+    item_discs[sized] = unit_discs[units]
+    return item_discs
+
+
+def plan_discs(capacity : int, prefix : str = DEFAULT_DISC_PREFIX) -> pd.DataFrame:
+    """
+    Plans the discs for all the items flagged TO_BURN. Discs are numbered after the discs
+    already burnt with the same prefix.
+
+    Parameters:
+    capacity (int): The disc capacity in bytes.
+    prefix (str): The prefix of the disc labels.
+
+    Returns:
+    pd.DataFrame: The items with the planned BACKUP_DISC, None for items larger than a disc or without a size.
+    """
+    items = get_burn_items()
+
+    if items.empty:
+        items['BACKUP_DISC'] = None
+        return items
+
+    discs = pack_items(items, capacity)
+    start = get_next_disc_number(prefix)
+
+    items['BACKUP_DISC'] = [f'{prefix}{start + disc:03d}' if disc >= 0 else None for disc in discs]
+    return items
+
+
+def get_plan_summary(plan : pd.DataFrame, capacity : int) -> pd.DataFrame:
+    """
+    Summarizes a disc plan per disc.
+
+    Parameters:
+    plan (pd.DataFrame): The disc plan as returned by plan_discs.
+    capacity (int): The disc capacity in bytes.
+
+    Returns:
+    pd.DataFrame: BACKUP_DISC, MOVIES, EPISODES, SIZE and FREE per planned disc.
+    """
+    planned = plan.dropna(subset=['BACKUP_DISC']).assign(
+                    MOVIES   = lambda x: x['MEDIA_TYPE'] == MEDIA_TYPE.MOVIE,
+                    EPISODES = lambda x: x['MEDIA_TYPE'] == MEDIA_TYPE.EPISODE)
+
+    summary = planned.groupby('BACKUP_DISC', as_index=False)[['MOVIES', 'EPISODES', 'SIZE_BYTES']].sum() \
+                     .rename(columns={ 'SIZE_BYTES' : 'SIZE' })
+
+    summary['FREE'] = capacity - summary['SIZE']
+    return summary
+
+
+def apply_plan(plan : pd.DataFrame) -> bool:
+    """
+    Stores the planned BACKUP_DISC of all the items in a single transaction.
+
+    Parameters:
+    plan (pd.DataFrame): The disc plan as returned by plan_discs.
+
+    Returns:
+    bool: True if the plan was saved, False otherwise.
+    """
+    planned    = plan.dropna(subset=['BACKUP_DISC'])
+    timestamp  = getTimestamp()
+
+    statements = []
+    for media_type, query in [(MEDIA_TYPE.MOVIE,   dbqueries.QUERY_SET_MOVIE_DISC),
+                              (MEDIA_TYPE.EPISODE, dbqueries.QUERY_SET_EPISODE_DISC)]:
+        rows = planned[planned['MEDIA_TYPE'] == media_type]
+        statements.append((query, [(disc, timestamp, int(id)) for disc, id in zip(rows['BACKUP_DISC'], rows['ID'])]))
+
+    return execute_many(statements)
+
+#=======================================================================
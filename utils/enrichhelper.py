@@ -0,0 +1,421 @@
+#=======================================================================
+# Description:
+# Batch enrichment of the library from a lookup template. Movies and
+# series without a lookup source are queued in ENRICH_QUEUE, then looked
+# up by a rate limited pool of workers (search, best match, details and
+# episodes) while a single writer saves the results in batches through
+# the bulk write path of the model. The queue is persisted with a status
+# per item so an interrupted run resumes where it stopped
+#=======================================================================
+import re
+import time
+import threading
+import numpy  as np
+import pandas as pd
+import utils.dbqueries  as dbqueries
+import utils.httphelper as httphelper
+import utils.posterhelper as posterhelper
+import model
+
+from difflib            import SequenceMatcher
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from utils.common       import getTimestamp
+from utils.dbhelper     import execute_read, execute_query, execute_many, background_job
+from utils.constants    import (
+    MEDIA_TYPE,
+    MEDIA_COLUMNS,
+    MEDIA_DETAILS,
+    SERIES_COLUMNS,
+    ENRICH_STATUS,
+    ENRICH_MAX_WORKERS,
+    ENRICH_RATE,
+    ENRICH_BATCH_SIZE,
+    ENRICH_MAX_ATTEMPTS,
+    ENRICH_MIN_SCORE
+)
+
+#=======================================================================
+class RateLimiter:
+    """
+    Spaces out the calls of several threads so that no more than `rate` calls start per second.
+
+    Methods:
+    --------
+    wait():
+        Blocks the calling thread until its next slot.
+    """
+
+    def __init__(self, rate : float):
+        """
+        Parameters:
+        rate (float): The maximum number of calls per second, 0 or None for no limit.
+        """
+        self.interval  = 1.0 / rate if rate else 0.0
+        self.next_slot = 0.0
+        self.lock      = threading.Lock()
+
+
+    def wait(self) -> None:
+        """
+        Blocks the calling thread until its next slot.
+        """
+        with self.lock:
+            now            = time.monotonic()
+            slot           = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+#=======================================================================
+def enqueue_unenriched(source : str) -> int:
+    """
+    Queues all the movies and series without a lookup source, dropping queued items whose media
+    has been deleted since, and pending items enriched since from another source. Items are queued
+    once per lookup source: items already queued for the source keep their status, items queued
+    or not found under another source are queued anew.
+
+    Parameters:
+    source (str): The lookup source the items are queued for, as registered in the lookup templates.
+
+    Returns:
+    int: The number of items pending in the queue of the source.
+    """
+    execute_query(dbqueries.QUERY_DELETE_ENRICH_ORPHANS)
+    execute_query(dbqueries.QUERY_DELETE_ENRICHED_PENDING)
+    execute_query(dbqueries.QUERY_ENQUEUE_UNENRICHED.format(source=source, timestamp=getTimestamp()))
+
+    summary = get_queue_summary()
+    return int(summary.loc[(summary['SOURCE'] == source) & (summary['STATUS'] == ENRICH_STATUS.PENDING), 'COUNT'].sum())
+
+
+def get_queue_summary() -> pd.DataFrame:
+    """
+    Summarizes the queue per lookup source and status.
+
+    Returns:
+    pd.DataFrame: SOURCE, STATUS, COUNT, MOVIES, SERIES and AVG_SECONDS.
+    """
+    return execute_read(dbqueries.QUERY_GET_ENRICH_SUMMARY)
+
+
+def get_queue_items(statuses : list) -> pd.DataFrame:
+    """
+    Retrieves the queued items with the given statuses, most recently updated first.
+
+    Parameters:
+    statuses (list): The ENRICH_STATUS values to include.
+
+    Returns:
+    pd.DataFrame: The items with their media title, status, attempts, matched online id, score, duration and message.
+    """
+    return execute_read(dbqueries.QUERY_GET_ENRICH_ITEM_STATUS.format(
+                            statuses=', '.join(f"'{status}'" for status in statuses)))
+
+
+def normalize_title(title : str) -> str:
+    """
+    Normalizes a title for comparison: lower case, alphanumeric words only.
+
+    Parameters:
+    title (str): The title.
+
+    Returns:
+    str: The normalized title.
+    """
+    return ' '.join(re.findall(r'[a-z0-9]+', str(title).lower()))
+
+
+def best_match(results : pd.DataFrame, title : str, year) -> tuple:
+    """
+    Picks the search result matching a library title best. Results are scored on the similarity
+    of their normalized title, scaled down when the year is known on both sides and differs. Ties
+    keep the order of the lookup source, which lists the most relevant results first.
+
+    Parameters:
+    results (pd.DataFrame): The search results with TITLE, YEAR and ONLINE_ID columns.
+    title (str): The title in the library.
+    year (int or None): The year in the library.
+
+    Returns:
+    tuple: (online_id, score) of the best result, (None, 0.0) if there are no results.
+    """
+    if results is None or results.empty:
+        return None, 0.0
+
+    target = normalize_title(title)
+    year   = pd.to_numeric(year, errors='coerce')
+    years  = pd.to_numeric(results[MEDIA_COLUMNS.YEAR], errors='coerce').to_numpy(dtype=float)
+
+    scores = np.array([SequenceMatcher(None, target, normalize_title(result)).ratio()
+                       for result in results[MEDIA_COLUMNS.TITLE]])
+
+    if pd.notna(year):
+        distance = np.abs(years - year)
+        scores  *= np.where(np.isnan(distance) | (distance == 0), 1.0, np.where(distance <= 1, 0.9, 0.5))
+
+    best = int(np.argmax(scores))
+    return str(results[MEDIA_COLUMNS.ONLINE_ID].iloc[best]), round(float(scores[best]), 3)
+
+
+def get_template_episodes(scraper, online_id : str, seasons : int) -> pd.DataFrame:
+    """
+    Fetches the episodes of all the seasons of a series from a lookup template, at once when the
+    template implements get_series_episodes, else season by season.
+
+    Parameters:
+    scraper (module): The lookup template.
+    online_id (str): The identifier of the series at the lookup source.
+    seasons (int): The number of seasons.
+
+    Returns:
+    pd.DataFrame: The episodes as returned by the template.
+    """
+    if hasattr(scraper, 'get_series_episodes'):
+        return scraper.get_series_episodes(online_id, seasons)
+
+    return pd.concat([scraper.get_season_episodes(online_id, season) for season in range(1, seasons + 1)],
+                     ignore_index=True)
+
+
+def lookup_item(scraper, item : dict, limiter : RateLimiter = None, cancelled = None) -> dict:
+    """
+    Looks up a queued item: searches the title, picks the best match, fetches its details
+    and the episodes of a series. Runs on the worker threads.
+
+    Parameters:
+    scraper (module): The lookup template.
+    item (dict): The queued item as returned by QUERY_GET_ENRICH_ITEMS.
+    limiter (RateLimiter, optional): Limits the rate the lookups start at.
+    cancelled (callable, optional): Returns True once the run is cancelled, the item is then left pending.
+
+    Returns:
+    dict: The item with its resulting STATUS, ONLINE_ID, SCORE, DURATION, MESSAGE, DETAILS and EPISODES.
+    """
+    result = dict(item, STATUS=ENRICH_STATUS.PENDING, ONLINE_ID=None, SCORE=None, DURATION=None,
+                  MESSAGE=None, DETAILS=None, EPISODES=None)
+
+    if limiter:
+        limiter.wait()
+
+    if cancelled and cancelled():
+        return result
+
+    start = time.perf_counter()
+
+    try:
+        year    = item[MEDIA_COLUMNS.YEAR]
+        search  = item[MEDIA_COLUMNS.TITLE] + (f' {int(year)}' if pd.notna(year) else '')
+        results = scraper.search_media(search)
+
+        online_id, score  = best_match(results, item[MEDIA_COLUMNS.TITLE], year)
+        result['ONLINE_ID'] = online_id
+        result['SCORE']     = score
+
+        if online_id is None or score < ENRICH_MIN_SCORE:
+            result['STATUS']  = ENRICH_STATUS.NOT_FOUND
+            result['MESSAGE'] = 'No search results' if online_id is None else 'No close match'
+        else:
+            details = scraper.get_media_details(online_id)
+
+            if item['MEDIA_TYPE'] == MEDIA_TYPE.SERIES:
+                seasons = details[MEDIA_DETAILS.CONTENT].get(SERIES_COLUMNS.SEASONS, 0)
+                if seasons and seasons > 0:
+                    result['EPISODES'] = get_template_episodes(scraper, online_id, seasons)
+
+            result['STATUS']  = ENRICH_STATUS.DONE
+            result['DETAILS'] = details
+    except Exception as e:
+        result['STATUS']  = ENRICH_STATUS.FAILED
+        result['MESSAGE'] = str(e)
+
+    result['DURATION'] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def save_results(results : list, source : str) -> None:
+    """
+    Saves a batch of lookup results: the details of the matched media through the bulk write path
+    of the model, then the status of every item of the batch in a single transaction. Items whose
+    details could not be saved, fully or in part, are marked FAILED and retried by a later run.
+
+    Parameters:
+    results (list): The results as returned by lookup_item.
+    source (str): The name of the lookup source.
+    """
+    for media_type in [MEDIA_TYPE.MOVIE, MEDIA_TYPE.SERIES]:
+        done = [result for result in results
+                if result['STATUS'] == ENRICH_STATUS.DONE and result['MEDIA_TYPE'] == media_type]
+
+        if not done:
+            continue
+
+        failed = set(model.save_media_details(media_type,
+                                              [(result['MEDIA_ID'], result['DETAILS'], result['EPISODES']) for result in done],
+                                              source))
+
+        for result in done:
+            if result['MEDIA_ID'] in failed:
+                result['STATUS']  = ENRICH_STATUS.FAILED
+                result['MESSAGE'] = 'Saving the details failed'
+
+    timestamp = getTimestamp()
+    execute_many([(dbqueries.QUERY_SET_ENRICH_STATUS,
+                   [(result['STATUS'],
+                     int(result['STATUS'] != ENRICH_STATUS.PENDING),
+                     result['ONLINE_ID'],
+                     result['SCORE'],
+                     result['DURATION'],
+                     result['MESSAGE'],
+                     timestamp,
+                     int(result['ID'])) for result in results])])
+
+
+def run_queue(module : str,
+              source      : str,
+              max_workers : int   = ENRICH_MAX_WORKERS,
+              rate        : float = ENRICH_RATE,
+              batch_size  : int   = ENRICH_BATCH_SIZE,
+              progress    = None,
+              cancelled   = None) -> dict:
+    """
+    Processes the pending items queued for a lookup source until the queue is drained or the run
+    is cancelled. Items left RUNNING by an interrupted run and FAILED items with attempts left are
+    picked up again. Lookups run on a pool of workers, rate limited across the pool, while the
+    results are saved in batches from the calling thread. The posters of every saved batch are
+    downloaded concurrently in the background.
+
+    Parameters:
+    module (str): The module path of the lookup template.
+    source (str): The name of the lookup source.
+    max_workers (int, optional): The number of parallel lookups. Defaults to ENRICH_MAX_WORKERS.
+    rate (float, optional): The maximum number of lookups started per second. Defaults to ENRICH_RATE.
+    batch_size (int, optional): The number of results saved per transaction. Defaults to ENRICH_BATCH_SIZE.
+    progress (callable, optional): Called with (processed, total, report) after every saved batch.
+    cancelled (callable, optional): Returns True to stop the run, pending lookups are then left in the queue.
+
+    Returns:
+    dict: The throughput report of the run, see get_report.
+
+    Exceptions:
+    RuntimeError: Raised if the database is being restored.
+    """
+    with background_job('enrichment'):
+        execute_query(dbqueries.QUERY_RESUME_ENRICH_QUEUE.format(timestamp=getTimestamp(), max_attempts=ENRICH_MAX_ATTEMPTS))
+
+        scraper = httphelper.load_template(module)
+        limiter = RateLimiter(rate)
+        counts  = { status : 0 for status in [ENRICH_STATUS.DONE, ENRICH_STATUS.NOT_FOUND, ENRICH_STATUS.FAILED] }
+        lookups = []
+        start   = time.perf_counter()
+        total   = enqueue_unenriched(source)
+
+        httphelper.get_client().reset_metrics()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, ThreadPoolExecutor(max_workers=1) as poster_executor:
+            while not (cancelled and cancelled()):
+                items = execute_read(dbqueries.QUERY_GET_ENRICH_ITEMS.format(source=source, limit=batch_size * max_workers))
+
+                if items.empty:
+                    break
+
+                execute_many([(dbqueries.QUERY_SET_ENRICH_RUNNING, [(getTimestamp(), int(id)) for id in items['ID']])])
+
+                futures = [executor.submit(lookup_item, scraper, item, limiter, cancelled)
+                           for item in items.to_dict('records')]
+                batch   = []
+
+                for future in as_completed(futures):
+                    batch.append(future.result())
+
+                    if len(batch) >= batch_size:
+                        save_results(batch, source)
+                        poster_executor.submit(save_posters, batch)
+                        record_batch(batch, counts, lookups)
+                        batch = []
+
+                        if progress:
+                            progress(sum(counts.values()), total, get_report(counts, lookups, start))
+
+                if batch:
+                    save_results(batch, source)
+                    poster_executor.submit(save_posters, batch)
+                    record_batch(batch, counts, lookups)
+
+                    if progress:
+                        progress(sum(counts.values()), total, get_report(counts, lookups, start))
+
+        return get_report(counts, lookups, start)
+
+
+def save_posters(results : list) -> None:
+    """
+    Downloads the posters of the media enriched in a batch, concurrently. Failed downloads are
+    reported on the console only, the media can be enriched again to retry them.
+
+    Parameters:
+    results (list): The saved results as returned by lookup_item.
+    """
+    posters = [(result['MEDIA_TYPE'], result['MEDIA_ID'], result['DETAILS'][MEDIA_DETAILS.CONTENT][MEDIA_COLUMNS.POSTER_URL])
+               for result in results
+               if result['STATUS'] == ENRICH_STATUS.DONE and result['DETAILS'][MEDIA_DETAILS.CONTENT].get(MEDIA_COLUMNS.POSTER_URL)]
+
+    for (media_type, media_id), error in posterhelper.save_posters(posters).items():
+        print(f'save_posters: {media_type} {media_id}: {error}')
+
+
+def record_batch(batch : list, counts : dict, lookups : list) -> None:
+    """
+    Adds the outcome of a saved batch to the counters of the run.
+
+    Parameters:
+    batch (list): The saved results.
+    counts (dict): The number of items per final status, updated in place.
+    lookups (list): The lookup durations in seconds, updated in place.
+    """
+    for result in batch:
+        if result['STATUS'] in counts:
+            counts[result['STATUS']] += 1
+            lookups.append(result['DURATION'])
+
+
+def get_report(counts : dict, lookups : list, start : float) -> dict:
+    """
+    Builds the throughput report of a run.
+
+    Parameters:
+    counts (dict): The number of items per final status.
+    lookups (list): The lookup durations in seconds.
+    start (float): The perf_counter value at the start of the run.
+
+    Returns:
+    dict: PROCESSED, DONE, NOT_FOUND, FAILED, ELAPSED (s), ITEMS_PER_MINUTE, AVG_LOOKUP (s),
+          P95_LOOKUP (s) and HTTP, the request metrics of the HTTP client per host.
+    """
+    elapsed   = time.perf_counter() - start
+    processed = sum(counts.values())
+
+    return dict(counts,
+                PROCESSED        = processed,
+                ELAPSED          = round(elapsed, 1),
+                ITEMS_PER_MINUTE = round(processed * 60 / elapsed, 1) if elapsed > 0 else 0.0,
+                AVG_LOOKUP       = round(float(np.mean(lookups)), 2) if lookups else 0.0,
+                P95_LOOKUP       = round(float(np.percentile(lookups, 95)), 2) if lookups else 0.0,
+                HTTP             = httphelper.get_client().get_metrics())
+
+
+def format_report(report : dict) -> str:
+    """
+    Formats a throughput report as a single status line.
+
+    Parameters:
+    report (dict): The report as returned by get_report.
+
+    Returns:
+    str: The formatted report.
+    """
+    return (f"{report['PROCESSED']} processed in {report['ELAPSED']}s ({report['ITEMS_PER_MINUTE']}/min): "
+            f"{report[ENRICH_STATUS.DONE]} enriched, {report[ENRICH_STATUS.NOT_FOUND]} not found, "
+            f"{report[ENRICH_STATUS.FAILED]} failed - lookup avg {report['AVG_LOOKUP']}s, p95 {report['P95_LOOKUP']}s")
+
+#=======================================================================
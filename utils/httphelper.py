@@ -0,0 +1,398 @@
+#=======================================================================
+# Description:
+# Shared HTTP client for outbound requests of the lookup templates. All
+# requests go through one keep-alive session with retries and backoff,
+# and batches of URLs are fetched concurrently on a bounded thread pool
+# while limiting the number of parallel connections per host. JSON and
+# content downloads are served from the lookup cache when possible.
+# The application creates a single client which is injected into every
+# lookup template loaded through load_template, and which keeps count of
+# the requests and their latency per host
+#=======================================================================
+import time
+import threading
+import importlib
+import requests
+import numpy  as np
+import pandas as pd
+import utils.cachehelper as cachehelper
+
+from collections        import deque
+from contextlib         import contextmanager
+from urllib.parse       import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters  import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.constants    import (
+    HTTP_TIMEOUT,
+    HTTP_RETRIES,
+    HTTP_BACKOFF,
+    HTTP_RETRY_STATUSES,
+    HTTP_MAX_WORKERS,
+    HTTP_HOST_CONNECTIONS,
+    HTTP_LATENCY_SAMPLES,
+    LOOKUP_CACHE_TTL
+)
+
+#=======================================================================
+_client = None
+_lock   = threading.Lock()
+
+#=======================================================================
+def is_valid_json(data) -> bool:
+    """
+    Checks whether a decoded JSON response holds a result. OMDb answers failed lookups, including
+    its rate limit, with a 200 status and a body like {"Response": "False", "Error": "..."}.
+
+    Parameters:
+    data (any type): The decoded JSON response.
+
+    Returns:
+    bool: False for empty responses and failed OMDb payloads, True otherwise.
+    """
+    if isinstance(data, dict):
+        return bool(data) and str(data.get('Response', 'True')).lower() != 'false'
+
+    return data is not None
+
+#=======================================================================
+class HttpClient:
+    """
+    Application level HTTP client holding a pooled keep-alive session, the connection limits per host,
+    one Cinemagoer instance per thread and the request metrics.
+
+    Methods:
+    --------
+    get_session():
+        Returns the session of the client, creating it on first use.
+
+    get_host_limit(url):
+        Returns the semaphore limiting the number of parallel requests to the host of a URL.
+
+    measure(host):
+        Context manager recording the duration and outcome of a request in the metrics of the host.
+
+    request(method, url, **kwargs):
+        Sends a request through the session, within the connection limit of the host.
+
+    get(url, **kwargs) / head(url, **kwargs):
+        Sends a GET / HEAD request.
+
+    get_json(url, ttl) / get_content(url, ttl):
+        Returns the decoded JSON / the body of a URL, served from the lookup cache when possible.
+
+    get_json_all(urls, max_workers):
+        Fetches the JSON of several URLs concurrently.
+
+    get_cinemagoer():
+        Returns the Cinemagoer instance of the calling thread.
+
+    get_metrics():
+        Returns the request count, errors and latency per host.
+
+    reset_metrics():
+        Clears the request metrics.
+    """
+
+    def __init__(self,
+                 timeout          : float = HTTP_TIMEOUT,
+                 retries          : int   = HTTP_RETRIES,
+                 backoff          : float = HTTP_BACKOFF,
+                 max_workers      : int   = HTTP_MAX_WORKERS,
+                 host_connections : int   = HTTP_HOST_CONNECTIONS):
+        """
+        Initializes the client. The session is only created with the first request.
+
+        Parameters:
+        timeout (float, optional): Timeout of a request in seconds. Defaults to HTTP_TIMEOUT.
+        retries (int, optional): Number of retries of a failed request. Defaults to HTTP_RETRIES.
+        backoff (float, optional): Backoff factor between retries in seconds. Defaults to HTTP_BACKOFF.
+        max_workers (int, optional): Size of the connection pool and of the thread pool. Defaults to HTTP_MAX_WORKERS.
+        host_connections (int, optional): Parallel requests allowed per host. Defaults to HTTP_HOST_CONNECTIONS.
+        """
+        self.timeout          = timeout
+        self.retries          = retries
+        self.backoff          = backoff
+        self.max_workers      = max_workers
+        self.host_connections = host_connections
+
+        self._session         = None
+        self._host_limits     = {}
+        self._metrics         = {}
+        self._local           = threading.local()
+        self._lock            = threading.Lock()
+
+
+    def get_session(self) -> requests.Session:
+        """
+        Returns the session of the client, creating it on first use. The session keeps connections
+        alive between requests and retries failed requests with exponential backoff.
+
+        Returns:
+        requests.Session: The shared session.
+        """
+        with self._lock:
+            if self._session is None:
+                retry   = Retry(total            = self.retries,
+                                backoff_factor   = self.backoff,
+                                status_forcelist = HTTP_RETRY_STATUSES,
+                                allowed_methods  = ['GET', 'HEAD'])
+                adapter = HTTPAdapter(pool_maxsize=self.max_workers, max_retries=retry)
+
+                self._session = requests.Session()
+                self._session.mount('http://', adapter)
+                self._session.mount('https://', adapter)
+
+        return self._session
+
+
+    def get_host_limit(self, url : str) -> threading.BoundedSemaphore:
+        """
+        Returns the semaphore limiting the number of parallel requests to the host of a URL.
+
+        Parameters:
+        url (str): The URL being requested.
+
+        Returns:
+        threading.BoundedSemaphore: The semaphore of the host.
+        """
+        host = urlsplit(url).netloc
+
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.host_connections)
+
+            return self._host_limits[host]
+
+
+    @contextmanager
+    def measure(self, host : str):
+        """
+        Context manager recording the duration of the enclosed request in the metrics of the host,
+        counting it as an error if it raises or if the enclosed code sets the ERROR key of the
+        yielded outcome, e.g. for a response with an error status. Also used for requests not
+        sent through the session, e.g. the calls of the Cinemagoer library.
+
+        Parameters:
+        host (str): The host, or any label, the request is recorded under.
+        """
+        start   = time.perf_counter()
+        outcome = { 'ERROR' : False }
+        error   = False
+
+        try:
+            yield outcome
+        except Exception:
+            error = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                if host not in self._metrics:
+                    self._metrics[host] = {'REQUESTS' : 0, 'ERRORS' : 0,
+                                           'LATENCIES' : deque(maxlen=HTTP_LATENCY_SAMPLES)}
+
+                self._metrics[host]['REQUESTS'] += 1
+                self._metrics[host]['ERRORS']   += int(error or outcome['ERROR'])
+                self._metrics[host]['LATENCIES'].append(elapsed)
+
+
+    def request(self, method : str, url : str, **kwargs) -> requests.Response:
+        """
+        Sends a request through the session, within the connection limit of the host.
+        Responses with an error status are counted as errors in the metrics.
+
+        Parameters:
+        method (str): The HTTP method, e.g. GET or HEAD.
+        url (str): The URL to request.
+        **kwargs: Additional arguments passed to requests, e.g. stream or headers.
+
+        Returns:
+        requests.Response: The response of the request.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlsplit(url).netloc
+
+        with self.get_host_limit(url), self.measure(host) as outcome:
+            response         = self.get_session().request(method, url, **kwargs)
+            outcome['ERROR'] = not response.ok
+
+        return response
+
+
+    def get(self, url : str, **kwargs) -> requests.Response:
+        """
+        Sends a GET request. See request.
+
+        Parameters:
+        url (str): The URL to request.
+        **kwargs: Additional arguments passed to requests, e.g. stream or headers.
+
+        Returns:
+        requests.Response: The response of the request.
+        """
+        return self.request('GET', url, **kwargs)
+
+
+    def head(self, url : str, **kwargs) -> requests.Response:
+        """
+        Sends a HEAD request, following redirects. See request.
+
+        Parameters:
+        url (str): The URL to request.
+        **kwargs: Additional arguments passed to requests, e.g. headers.
+
+        Returns:
+        requests.Response: The response of the request.
+        """
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('HEAD', url, **kwargs)
+
+
+    def get_json(self, url : str, ttl : int = LOOKUP_CACHE_TTL) -> dict:
+        """
+        Sends a GET request and returns the decoded JSON body, served from the lookup cache
+        if the URL was fetched within the time to live. Error statuses raise and failed
+        payloads, as OMDb returns them with a 200 status, are returned without being cached.
+
+        Parameters:
+        url (str): The URL to request.
+        ttl (int, optional): The maximum age of a cached response in seconds.
+
+        Returns:
+        dict: The decoded JSON response.
+        """
+        def fetch() -> dict:
+            response = self.get(url)
+            response.raise_for_status()
+            return response.json()
+
+        return cachehelper.cached(url, fetch, ttl, validate=is_valid_json)
+
+
+    def get_content(self, url : str, ttl : int = LOOKUP_CACHE_TTL) -> bytes:
+        """
+        Downloads the body of a URL, e.g. a poster, served from the lookup cache
+        if the URL was fetched within the time to live.
+
+        Parameters:
+        url (str): The URL to request.
+        ttl (int, optional): The maximum age of a cached response in seconds.
+
+        Returns:
+        bytes: The content of the response.
+        """
+        def fetch() -> bytes:
+            response = self.get(url)
+            response.raise_for_status()
+            return response.content
+
+        return cachehelper.cached(url, fetch, ttl, validate=bool)
+
+
+    def get_json_all(self, urls : list, max_workers : int = None) -> list:
+        """
+        Fetches the JSON of several URLs concurrently on a bounded thread pool.
+
+        Parameters:
+        urls (list): The URLs to request.
+        max_workers (int, optional): The maximum number of parallel requests. Defaults to the pool size of the client.
+
+        Returns:
+        list: The decoded JSON responses in the order of the URLs, None for requests that failed.
+        """
+        def fetch(url : str):
+            try:
+                return self.get_json(url)
+            except Exception as e:
+                print(f'get_json_all: {url}: {e}')
+                return None
+
+        if not urls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers or self.max_workers, len(urls))) as executor:
+            return list(executor.map(fetch, urls))
+
+
+    def get_cinemagoer(self):
+        """
+        Returns the Cinemagoer instance of the calling thread, creating it on first use.
+        Instances are reused across lookups but not shared between threads.
+
+        Returns:
+        imdb.Cinemagoer: The Cinemagoer instance.
+        """
+        if getattr(self._local, 'cinemagoer', None) is None:
+            from imdb import Cinemagoer
+            self._local.cinemagoer = Cinemagoer(timeout=self.timeout)
+
+        return self._local.cinemagoer
+
+
+    def get_metrics(self) -> pd.DataFrame:
+        """
+        Returns the metrics of the requests sent so far. Latencies are computed over the
+        most recent requests of each host.
+
+        Returns:
+        pd.DataFrame: HOST, REQUESTS, ERRORS, AVG_MS, P95_MS and MAX_MS per host.
+        """
+        with self._lock:
+            metrics = [(host, metric['REQUESTS'], metric['ERRORS'], np.array(metric['LATENCIES']) * 1000)
+                       for host, metric in self._metrics.items()]
+
+        return pd.DataFrame([{ 'HOST'     : host,
+                               'REQUESTS' : count,
+                               'ERRORS'   : errors,
+                               'AVG_MS'   : round(latencies.mean(), 1),
+                               'P95_MS'   : round(np.percentile(latencies, 95), 1),
+                               'MAX_MS'   : round(latencies.max(), 1) } for host, count, errors, latencies in metrics],
+                            columns=['HOST', 'REQUESTS', 'ERRORS', 'AVG_MS', 'P95_MS', 'MAX_MS'])
+
+
+    def reset_metrics(self) -> None:
+        """
+        Clears the request metrics.
+        """
+        with self._lock:
+            self._metrics = {}
+
+#=======================================================================
+def get_client() -> HttpClient:
+    """
+    Returns the application level HTTP client, creating it on first use.
+
+    Returns:
+    HttpClient: The shared client.
+    """
+    global _client
+
+    with _lock:
+        if _client is None:
+            _client = HttpClient()
+
+    return _client
+
+
+def load_template(module : str, client : HttpClient = None):
+    """
+    Imports a lookup template and injects the HTTP client into it. Templates opt in by declaring
+    a module level `http` variable, which they use for all their outbound requests.
+
+    Parameters:
+    module (str): The module path of the template, e.g. templates.lookup.imdbParser.
+    client (HttpClient, optional): The client to inject. Defaults to the application level client.
+
+    Returns:
+    module: The imported template.
+    """
+    template = importlib.import_module(module)
+
+    if hasattr(template, 'http'):
+        template.http = client or get_client()
+
+    return template
+
+#=======================================================================
@@ -3,14 +3,99 @@
 # Helper class to perform CRUD operations on meta data used for the
 # different media types (Movies / TV Series)
 #=======================================================================
+import threading
 import pandas as pd
 import utils.dbqueries as dbqueries
+import utils.constants as constants
 
-from datetime import datetime
-
-from utils.dbhelper  import execute_read, execute_query
+from utils.common    import getTimestamp
+from utils.dbhelper  import execute_read, execute_query, execute_many, execute_insert
 from utils.constants import META_COLUMNS
 
+#=======================================================================
+''' Queries per meta data type: (get all values, add a value, remove a value from the media then from the table) '''
+META_QUERIES = {
+    META_COLUMNS.GENRE    : (dbqueries.QUERY_GET_GENRES,
+                             dbqueries.QUERY_ADD_GENRE,
+                             [dbqueries.QUERY_REMOVE_GENRE_MOVIES, dbqueries.QUERY_REMOVE_GENRE_SERIES, dbqueries.QUERY_REMOVE_GENRE]),
+    META_COLUMNS.LANGUAGE : (dbqueries.QUERY_GET_LANGUAGES,
+                             dbqueries.QUERY_ADD_LANGUAGE,
+                             []),
+    META_COLUMNS.EDITION  : (dbqueries.QUERY_GET_MEDIA_EDITION,
+                             dbqueries.QUERY_ADD_MEDIA_EDITION,
+                             [dbqueries.QUERY_REMOVE_EDITION_MOVIES, dbqueries.QUERY_REMOVE_EDITION]),
+    META_COLUMNS.QUALITY  : (dbqueries.QUERY_GET_MEDIA_QUALITY,
+                             dbqueries.QUERY_ADD_MEDIA_QUALITY,
+                             [dbqueries.QUERY_REMOVE_QUALITY_MOVIES, dbqueries.QUERY_REMOVE_QUALITY]),
+    META_COLUMNS.SOURCE   : (dbqueries.QUERY_GET_MEDIA_SOURCE,
+                             dbqueries.QUERY_ADD_MEDIA_SOURCE,
+                             [dbqueries.QUERY_REMOVE_SOURCE_MOVIES, dbqueries.QUERY_REMOVE_SOURCE_SERIES, dbqueries.QUERY_REMOVE_SOURCE])
+}
+
+''' Value to ID maps of the meta data per database and type, see get_meta_ids '''
+_meta_ids = {}
+_lock     = threading.Lock()
+
+#=======================================================================
+def get_meta_ids(meta_type : META_COLUMNS, reload : bool = False) -> dict:
+    """
+    Returns the IDs of the values of a meta data type, e.g. the genres. The map is loaded once per
+    database and kept until the values of the type are changed through this module, or the
+    database is restored or upgraded.
+
+    Parameters:
+    meta_type (META_COLUMNS): The type of meta data.
+    reload (bool, optional): Loads the map again from the database. Defaults to False.
+
+    Returns:
+    dict: The ID of each value.
+    """
+    key = (constants.DEFAULT_DB_PATH, meta_type)
+
+    with _lock:
+        if reload or key not in _meta_ids:
+            df             = execute_read(META_QUERIES[meta_type][0])
+            _meta_ids[key] = dict(zip(df[meta_type], df['ID'].astype(int))) if not df.empty else {}
+
+        return _meta_ids[key]
+
+
+def clear_meta_ids(meta_type : META_COLUMNS = None, db_path : str = None) -> None:
+    """
+    Discards the cached IDs of the values of a meta data type, after its values were changed,
+    or of all the types, after the database was restored or its schema upgraded.
+
+    Parameters:
+    meta_type (META_COLUMNS, optional): The type of meta data. Defaults to all the types.
+    db_path (str, optional): The database the IDs were loaded from. Defaults to the application database.
+    """
+    db_path = db_path or constants.DEFAULT_DB_PATH
+
+    with _lock:
+        for key in [key for key in _meta_ids if key[0] == db_path and meta_type in (None, key[1])]:
+            del _meta_ids[key]
+
+
+def add_meta_value(meta_type : META_COLUMNS, meta_value : str) -> int:
+    """
+    Adds a value of a meta data type unless it already exists.
+
+    Parameters:
+    meta_type (META_COLUMNS): The type of meta data.
+    meta_value (str): The value to be added.
+
+    Returns:
+    int: The ID of the value, 0 if it could not be added.
+    """
+    meta_ids = get_meta_ids(meta_type)
+    if meta_value in meta_ids:
+        return meta_ids[meta_value]
+
+    meta_id = execute_insert(META_QUERIES[meta_type][1], (meta_value, getTimestamp()))
+    clear_meta_ids(meta_type)
+
+    return max(meta_id, 0)
+
 #=======================================================================
 def get_actors() -> pd.DataFrame:
     """
@@ -79,30 +164,15 @@ def get_genres() -> pd.DataFrame:
 
 def add_new_genre(genre : str) -> int:
     """
-    Adds a new genre to the database and retrieves the maximum genre ID.
+    Adds a new genre to the database unless it already exists.
 
     Parameters:
     genre (str): The name of the genre to be added.
 
     Returns:
-    int: The maximum genre ID after the new genre is added.
+    int: The ID of the genre, 0 if it could not be added.
     """
-    retry_count = 3
-
-    while retry_count > 0:
-        retry_count -= 1
-
-        df_genres = get_genres()
-        if genre not in df_genres[META_COLUMNS.GENRE].to_list():
-            execute_query(dbqueries.QUERY_ADD_GENRE.format(
-                            genre, 
-                            datetime.now().strftime('%d-%m-%Y %H:%M:%S')))
-    
-        df_genres = get_genres()
-        if genre in df_genres[META_COLUMNS.GENRE].to_list():
-            return int(df_genres.loc[df_genres[META_COLUMNS.GENRE] == genre, 'ID'].values[0])
-        
-    return 0
+    return add_meta_value(META_COLUMNS.GENRE, genre)
 
 
 def get_media_editions() -> pd.DataFrame:
@@ -117,18 +187,15 @@ def get_media_editions() -> pd.DataFrame:
 
 def add_new_media_edition(edition : str) -> int:
     """
-    Adds a new media edition to the database 
+    Adds a new media edition to the database unless it already exists.
 
     Parameters:
-    edition (str): The name of the editionm to be added.
+    edition (str): The name of the edition to be added.
 
     Returns:
-    int: Defaulted to 0 to not break reusable method
+    int: The ID of the edition, 0 if it could not be added.
     """
-    execute_query(dbqueries.QUERY_ADD_MEDIA_EDITION.format(
-                  edition, 
-                  datetime.now().strftime('%d-%m-%Y %H:%M:%S')))
-    return 0
+    return add_meta_value(META_COLUMNS.EDITION, edition)
 
 
 def get_media_sources() -> pd.DataFrame:
@@ -143,18 +210,15 @@ def get_media_sources() -> pd.DataFrame:
 
 def add_new_media_source(source : str) -> int:
     """
-    Adds a new media source to the database 
+    Adds a new media source to the database unless it already exists.
 
     Parameters:
     source (str): The name of the source to be added.
 
     Returns:
-    int: Defaulted to 0 to not break reusable method
+    int: The ID of the source, 0 if it could not be added.
     """
-    execute_query(dbqueries.QUERY_ADD_MEDIA_SOURCE.format(
-                    source, 
-                    datetime.now().strftime('%d-%m-%Y %H:%M:%S')))
-    return 0
+    return add_meta_value(META_COLUMNS.SOURCE, source)
 
 
 def get_media_qualities() -> pd.DataFrame:
@@ -169,18 +233,15 @@ def get_media_qualities() -> pd.DataFrame:
 
 def add_new_media_quality(quality : str) -> int:
     """
-    Adds a new media quality to the database 
+    Adds a new media quality to the database unless it already exists.
 
     Parameters:
     quality (str): The name of the quality to be added.
 
     Returns:
-    int: Defaulted to 0 to not break reusable method
+    int: The ID of the quality, 0 if it could not be added.
     """
-    execute_query(dbqueries.QUERY_ADD_MEDIA_QUALITY.format(
-                    quality, 
-                    datetime.now().strftime('%d-%m-%Y %H:%M:%S')))
-    return 0
+    return add_meta_value(META_COLUMNS.QUALITY, quality)
 
 def get_languages() -> pd.DataFrame:
     """
@@ -194,30 +255,15 @@ def get_languages() -> pd.DataFrame:
 
 def add_new_language(language : str) -> int:
     """
-    Adds a new language to the database and returns the ID of the newly added language.
+    Adds a new language to the database unless it already exists.
 
     Parameters:
     language (str): The name of the language to be added.
 
     Returns:
-    int: The ID of the newly added language.
+    int: The ID of the language, 0 if it could not be added.
     """
-    retry_count = 3
-
-    while retry_count > 0:
-        retry_count -= 1
-
-        df = get_languages()
-        if language not in df[META_COLUMNS.LANGUAGE].to_list():
-            execute_query(dbqueries.QUERY_ADD_LANGUAGE.format(
-                            language, 
-                            datetime.now().strftime('%d-%m-%Y %H:%M:%S')))
-    
-        df = get_languages()
-        if language in df[META_COLUMNS.LANGUAGE].to_list():
-            return int(df.loc[df[META_COLUMNS.LANGUAGE] == language, 'ID'].values[0])
-        
-    return 0
+    return add_meta_value(META_COLUMNS.LANGUAGE, language)
 
 
 def add_meta(meta_type : META_COLUMNS, meta_value : str) -> int:
@@ -242,67 +288,34 @@ def add_meta(meta_type : META_COLUMNS, meta_value : str) -> int:
     return meta_mapping[meta_type](meta_value)
     
 
-def update_meta(meta_type : META_COLUMNS, meta_list) -> None:
+def update_meta(meta_type : META_COLUMNS, meta_list) -> bool:
     """
     Updates the metadata of a specified type by removing obsolete entries and adding new ones.
+    The difference with the cached values is computed with sets and applied in a single transaction,
+    one batched statement per query.
 
     Parameters:
-    - meta_type (META_COLUMNS): The type of metadata to update. It determines which function to call 
-      for retrieving existing metadata and which queries to use for deletion.
+    - meta_type (META_COLUMNS): The type of metadata to update. It determines the queries used
+      for deletion and insertion, see META_QUERIES.
     - meta_list (list): A list of new metadata entries that should be present after the update.
 
-    The function works by:
-    1. Retrieving the existing metadata of the specified type using a function from the meta_mapping.
-    2. Identifying metadata entries that need to be removed (present in the database but not in meta_list).
-    3. Identifying metadata entries that need to be added (present in meta_list but not in the database).
-    4. Removing obsolete metadata entries by executing delete queries.
-    5. Adding new metadata entries using the add_meta function.
+    Returns:
+    - bool: True if the metadata was updated, False otherwise.
     """
-    meta_mapping = {
-        META_COLUMNS.GENRE   : {
-            'func'           : get_genres,
-            'delete_queries' : [ 
-                dbqueries.QUERY_REMOVE_GENRE_MOVIES,
-                dbqueries.QUERY_REMOVE_GENRE_SERIES,
-                dbqueries.QUERY_REMOVE_GENRE
-            ]
-        },
-        META_COLUMNS.SOURCE  : {
-            'func'           : get_media_sources,
-            'delete_queries' : [
-                dbqueries.QUERY_REMOVE_SOURCE_MOVIES,
-                dbqueries.QUERY_REMOVE_SOURCE_SERIES,
-                dbqueries.QUERY_REMOVE_SOURCE
-            ]
-        },
-        META_COLUMNS.QUALITY  : {
-            'func'           : get_media_qualities,
-            'delete_queries' : [
-                dbqueries.QUERY_REMOVE_QUALITY_MOVIES,
-                dbqueries.QUERY_REMOVE_QUALITY
-            ]
-        },
-        META_COLUMNS.EDITION  : {
-            'func'           : get_media_editions,
-            'delete_queries' : [
-                dbqueries.QUERY_REMOVE_QUALITY_MOVIES,
-                dbqueries.QUERY_REMOVE_QUALITY
-            ]
-        }
-    }
+    _, add_query, delete_queries = META_QUERIES[meta_type]
 
-    existing_meta  = meta_mapping[meta_type]['func']()
-    meta_to_remove = [x for x in existing_meta[meta_type].tolist() if x not in meta_list]
-    meta_to_add    = [x for x in meta_list if x not in existing_meta[meta_type].tolist()]
-        
-    for meta in meta_to_remove:
-        meta_id = existing_meta.loc[existing_meta[meta_type] == meta, 'ID'].values(0)
-        for query in meta_mapping[meta_type]['delete_queries']:
-            execute_query(query.format(id=meta_id))
-
-    for meta in meta_to_add:
-        add_meta(meta_type, meta)
-    
+    meta_ids       = get_meta_ids(meta_type, reload=True)
+    meta_values    = list(dict.fromkeys(meta_list))
+    meta_to_remove = [(meta_ids[meta],) for meta in set(meta_ids) - set(meta_values)]
+    meta_to_add    = [(meta, getTimestamp()) for meta in meta_values if meta not in meta_ids]
+
+    if not meta_to_remove and not meta_to_add:
+        return True
+
+    response = execute_many([(query, meta_to_remove) for query in delete_queries] + [(add_query, meta_to_add)])
+    clear_meta_ids(meta_type)
+
+    return response
 
 def get_meta_values(meta_type : META_COLUMNS) -> pd.DataFrame:
     """
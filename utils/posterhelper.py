@@ -0,0 +1,225 @@
+#=======================================================================
+# Description:
+# Poster download pipeline. Posters are streamed in chunks to a temp
+# file while being hashed, optionally downscaled, and moved atomically
+# into a content addressed store in the poster folder, so identical
+# posters are kept once. The poster of a media, {type}/{id}.jpg, is a
+# hard link to its file in the store (a copy where the file system has
+# no hard links) and is replaced atomically as well
+#=======================================================================
+import os
+import hashlib
+import tempfile
+import threading
+import utils.metahelper as metahelper
+import utils.httphelper as httphelper
+
+from concurrent.futures import ThreadPoolExecutor
+from PySide6.QtCore     import Qt
+from PySide6.QtGui      import QImage
+from utils.constants    import (
+    APP_CONFIG,
+    HTTP_MAX_WORKERS,
+    POSTER_CHUNK_SIZE,
+    POSTER_MAX_DIMENSION,
+    POSTER_STORE_DIR
+)
+
+#=======================================================================
+def get_poster_path(media_type : str, media_id : int) -> str:
+    """
+    Returns the path of the poster of a media.
+
+    Parameters:
+    media_type (str): The type of the media, MOVIE or SERIES.
+    media_id (int): The unique identifier of the media.
+
+    Returns:
+    str: The path of the poster, which may not exist.
+    """
+    return f'{metahelper.get_app_config(APP_CONFIG.POSTER_PATH)}/{media_type.lower()}/{str(media_id)}.jpg'
+
+
+def get_store_path() -> str:
+    """
+    Returns the folder of the poster store, creating it if required.
+
+    Returns:
+    str: The path of the poster store.
+    """
+    store = os.path.join(metahelper.get_app_config(APP_CONFIG.POSTER_PATH), POSTER_STORE_DIR)
+    os.makedirs(store, exist_ok=True)
+
+    return store
+
+
+def downscale(path : str, max_dimension : int) -> None:
+    """
+    Downscales an image in place so that neither side exceeds the maximum dimension,
+    keeping its aspect ratio. Images within the limit are left untouched.
+
+    Parameters:
+    path (str): The path of the image.
+    max_dimension (int): The maximum width and height in pixels, 0 to keep the original size.
+    """
+    image = QImage()
+
+    if not max_dimension or not image.load(path) or max(image.width(), image.height()) <= max_dimension:
+        return
+
+    image.scaled(max_dimension, max_dimension,
+                 Qt.AspectRatioMode.KeepAspectRatio,
+                 Qt.TransformationMode.SmoothTransformation).save(path, 'JPG', 90)
+
+
+def store_file(temp_path : str, digest : str, max_dimension : int) -> str:
+    """
+    Moves a downloaded poster into the store under its content hash. If the same poster is
+    already stored the download is discarded, else it is downscaled and renamed atomically.
+
+    Parameters:
+    temp_path (str): The path of the downloaded poster, inside the store folder.
+    digest (str): The SHA-256 of the downloaded content.
+    max_dimension (int): The maximum width and height in pixels, 0 to keep the original size.
+
+    Returns:
+    str: The path of the poster in the store.
+    """
+    blob_path = os.path.join(os.path.dirname(temp_path), f'{digest}.jpg')
+
+    if os.path.exists(blob_path):
+        os.remove(temp_path)
+    else:
+        downscale(temp_path, max_dimension)
+        os.replace(temp_path, blob_path)
+
+    return blob_path
+
+
+def link_poster(blob_path : str, poster_path : str) -> None:
+    """
+    Points the poster of a media to a file of the store. The link is created under a temp name
+    and renamed over the poster, so readers never see a partial file.
+
+    Parameters:
+    blob_path (str): The path of the poster in the store.
+    poster_path (str): The path of the poster of the media.
+    """
+    os.makedirs(os.path.dirname(poster_path), exist_ok=True)
+    temp_path = f'{poster_path}.{threading.get_ident()}.tmp'
+
+    try:
+        os.link(blob_path, temp_path)
+    except OSError:
+        with open(blob_path, 'rb') as source, open(temp_path, 'wb') as target:
+            while chunk := source.read(POSTER_CHUNK_SIZE):
+                target.write(chunk)
+
+    os.replace(temp_path, poster_path)
+
+
+def download_poster(url : str, poster_path : str, content : bytes = None, max_dimension : int = POSTER_MAX_DIMENSION) -> str:
+    """
+    Downloads a poster through the store: the body is streamed in chunks to a temp file while
+    being hashed, then stored once per content and linked to the poster path.
+
+    Parameters:
+    url (str): The URL of the poster.
+    poster_path (str): The path of the poster of the media.
+    content (bytes, optional): The poster when already downloaded, e.g. for a preview, to avoid fetching it again.
+    max_dimension (int, optional): The maximum width and height in pixels. Defaults to POSTER_MAX_DIMENSION.
+
+    Returns:
+    str: The path of the poster in the store.
+    """
+    digest        = hashlib.sha256()
+    fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=get_store_path())
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if content is not None:
+                digest.update(content)
+                f.write(content)
+            else:
+                with httphelper.get_client().get(url, stream=True) as response:
+                    response.raise_for_status()
+
+                    for chunk in response.iter_content(chunk_size=POSTER_CHUNK_SIZE):
+                        digest.update(chunk)
+                        f.write(chunk)
+
+        blob_path = store_file(temp_path, digest.hexdigest(), max_dimension)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    link_poster(blob_path, poster_path)
+    return blob_path
+
+
+def save_poster(media_type : str, media_id : int, url : str, content : bytes = None) -> str:
+    """
+    Downloads the poster of a media. See download_poster.
+
+    Parameters:
+    media_type (str): The type of the media, MOVIE or SERIES.
+    media_id (int): The unique identifier of the media.
+    url (str): The URL of the poster.
+    content (bytes, optional): The poster when already downloaded.
+
+    Returns:
+    str: The path of the poster of the media.
+    """
+    poster_path = get_poster_path(media_type, media_id)
+    download_poster(url, poster_path, content)
+
+    return poster_path
+
+
+def save_posters(posters : list, max_workers : int = HTTP_MAX_WORKERS) -> dict:
+    """
+    Downloads the posters of several media concurrently.
+
+    Parameters:
+    posters (list): Tuples of (media_type, media_id, url).
+    max_workers (int, optional): The maximum number of parallel downloads. Defaults to HTTP_MAX_WORKERS.
+
+    Returns:
+    dict: The error message per (media_type, media_id) for the posters that failed, empty if all succeeded.
+    """
+    def save(poster : tuple):
+        try:
+            save_poster(*poster)
+            return None
+        except Exception as e:
+            return str(e)
+
+    if not posters:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(posters))) as executor:
+        errors = list(executor.map(save, posters))
+
+    return { (media_type, media_id) : error for (media_type, media_id, _), error in zip(posters, errors) if error }
+
+
+def prune_store() -> int:
+    """
+    Removes the posters of the store no longer linked to any media. Where the file system has no
+    hard links the posters of the media are copies, so the store is cleared entirely.
+
+    Returns:
+    int: The number of posters removed.
+    """
+    store   = get_store_path()
+    removed = 0
+
+    for entry in os.scandir(store):
+        if entry.name.endswith('.jpg') and entry.stat().st_nlink == 1:
+            os.remove(entry.path)
+            removed += 1
+
+    return removed
+
+#=======================================================================